@@ -19,7 +19,10 @@ sys.path.append(
 from utils.datahub_metadata_api import DataHubMetadataApiClient
 from utils.urn_utils import get_full_urn_from_name
 from scripts.metadata_tests.entity_relationship_utils import (
+    DEFAULT_SAMPLE_LIMIT,
+    count_entities,
     get_entity_structured_properties,
+    search_criterion,
 )
 
 logger = logging.getLogger(__name__)
@@ -341,6 +344,9 @@ def assert_all_entities_of_type_have_tag(
     tag_urn: str,
     filter_condition: Optional[Callable[[Dict[str, Any]], bool]] = None,
     use_deterministic_urns: bool = True,
+    aggregate: bool = False,
+    sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+    filters: Optional[List[Dict[str, Any]]] = None,
 ) -> AssertionResult:
     """
     Assert that all entities of a specific type have a particular tag.
@@ -349,8 +355,12 @@ def assert_all_entities_of_type_have_tag(
         client: DataHub metadata client
         entity_type: Type of entities to check
         tag_urn: URN of the tag or tag name (if use_deterministic_urns is True)
-        filter_condition: Optional function to filter entities
+        filter_condition: Optional function to filter entities (not available in aggregate mode)
         use_deterministic_urns: Whether to generate deterministic URNs for tag names
+        aggregate: Whether to compute the totals with count-only searches instead
+            of fetching every entity (see assert_aggregate)
+        sample_limit: Number of entities without the tag listed in aggregate mode
+        filters: Search criteria restricting the entities checked in aggregate mode
 
     Returns:
         Assertion result
@@ -359,6 +369,23 @@ def assert_all_entities_of_type_have_tag(
     if use_deterministic_urns and not tag_urn.startswith("urn:li:tag:"):
         tag_urn = get_deterministic_tag_urn(tag_urn)
 
+    if aggregate:
+        if filter_condition:
+            return AssertionResult(
+                False,
+                "filter_condition cannot be evaluated in aggregate mode, use filters instead",
+                {"entityType": entity_type, "tagUrn": tag_urn},
+            )
+        return assert_aggregate(
+            client,
+            entity_type,
+            search_criterion("tags", tag_urn),
+            f"tag {tag_urn}",
+            sample_limit=sample_limit,
+            filters=filters,
+            details={"tagUrn": tag_urn},
+        )
+
     # Get all entities of the specified type
     query = """
     query getEntitiesOfType($type: EntityType!, $start: Int!, $count: Int!) {
@@ -488,6 +515,142 @@ def assert_all_entities_of_type_have_tag(
         )
 
 
+def assert_aggregate(
+    client: DataHubMetadataApiClient,
+    entity_type: str,
+    criterion: Dict[str, Any],
+    requirement: str,
+    sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+    filters: Optional[List[Dict[str, Any]]] = None,
+    details: Optional[Dict[str, Any]] = None,
+) -> AssertionResult:
+    """
+    Assert that all entities of a type meet a search criterion, using two
+    count-only searches: one for the entities of the type and one, with the
+    criterion negated, for the violations. Only up to sample_limit violating
+    URNs are fetched, so the cost does not grow with the number of entities.
+
+    Args:
+        client: DataHub metadata client
+        entity_type: Type of entities to check (e.g. "DATASET")
+        criterion: Criterion every entity must meet (see search_criterion)
+        requirement: Description of the criterion for messages (e.g. "an owner")
+        sample_limit: Number of violating entity URNs to include in the details
+        filters: Search criteria restricting the entities checked
+        details: Extra fields for the result details
+
+    Returns:
+        Assertion result
+    """
+    filters = list(filters or [])
+    details = {"entityType": entity_type, "aggregate": True, **(details or {})}
+
+    try:
+        total, _ = count_entities(client, [entity_type], filters)
+        violations, sample = count_entities(
+            client,
+            [entity_type],
+            filters + [dict(criterion, negated=not criterion.get("negated", False))],
+            sample_limit,
+        )
+    except Exception as e:
+        logger.error(
+            f"Error counting entities of type {entity_type} without {requirement}: {str(e)}"
+        )
+        return AssertionResult(
+            False,
+            f"Error checking if all entities of type {entity_type} have {requirement}: {str(e)}",
+            {**details, "error": str(e)},
+        )
+
+    details.update({"totalEntityCount": total, "missingEntityCount": violations})
+
+    if not total:
+        return AssertionResult(False, f"No entities of type {entity_type} found", details)
+
+    if not violations:
+        return AssertionResult(
+            True,
+            f"All {total} entities of type {entity_type} have {requirement}",
+            details,
+        )
+
+    details.update({"violatingEntities": sample, "sampleLimit": sample_limit})
+    return AssertionResult(
+        False,
+        f"{violations} out of {total} entities of type {entity_type} do not have {requirement}",
+        details,
+    )
+
+
+def assert_all_entities_of_type_have_owner(
+    client: DataHubMetadataApiClient,
+    entity_type: str,
+    sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+    filters: Optional[List[Dict[str, Any]]] = None,
+    use_deterministic_urns: bool = True,
+) -> AssertionResult:
+    """
+    Assert that all entities of a specific type have at least one owner,
+    computed server-side with count-only searches.
+
+    Args:
+        client: DataHub metadata client
+        entity_type: Type of entities to check
+        sample_limit: Number of entities without owners to list
+        filters: Search criteria restricting the entities checked
+        use_deterministic_urns: Unused, accepted for consistency with run_assertions
+
+    Returns:
+        Assertion result
+    """
+    return assert_aggregate(
+        client,
+        entity_type,
+        search_criterion("owners"),
+        "an owner",
+        sample_limit=sample_limit,
+        filters=filters,
+    )
+
+
+def assert_all_entities_of_type_have_glossary_term(
+    client: DataHubMetadataApiClient,
+    entity_type: str,
+    term_urn: str,
+    sample_limit: int = DEFAULT_SAMPLE_LIMIT,
+    filters: Optional[List[Dict[str, Any]]] = None,
+    use_deterministic_urns: bool = True,
+) -> AssertionResult:
+    """
+    Assert that all entities of a specific type have a glossary term,
+    computed server-side with count-only searches.
+
+    Args:
+        client: DataHub metadata client
+        entity_type: Type of entities to check
+        term_urn: URN of the glossary term or term name (if use_deterministic_urns is True)
+        sample_limit: Number of entities without the term to list
+        filters: Search criteria restricting the entities checked
+        use_deterministic_urns: Whether to generate deterministic URNs for term names
+
+    Returns:
+        Assertion result
+    """
+    if use_deterministic_urns and not term_urn.startswith("urn:li:glossaryTerm:"):
+        term_urn = get_deterministic_glossary_term_urn(term_urn)
+
+    return assert_aggregate(
+        client,
+        entity_type,
+        search_criterion("glossaryTerms", term_urn),
+        f"glossary term {term_urn}",
+        sample_limit=sample_limit,
+        filters=filters,
+        details={"termUrn": term_urn},
+    )
+
+
 def run_assertion(assertion_func: Callable, *args, **kwargs) -> Dict[str, Any]:
     """
     Run an assertion function and return the result in a standardized format.
@@ -549,6 +712,8 @@ def run_assertions(
             "entity_has_glossary_term": assert_entity_has_glossary_term,
             "entity_has_structured_property": assert_entity_has_structured_property,
             "all_entities_of_type_have_tag": assert_all_entities_of_type_have_tag,
+            "all_entities_of_type_have_owner": assert_all_entities_of_type_have_owner,
+            "all_entities_of_type_have_glossary_term": assert_all_entities_of_type_have_glossary_term,
         }
 
         if assertion_type in assertion_funcs:
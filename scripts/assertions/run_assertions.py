@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
 """
-Run assertions for a dataset in DataHub.
-This script runs all assertions associated with a specific dataset.
+Run assertions for datasets in DataHub.
+This script runs all assertions associated with one or more datasets, or all
+assertions of the local web UI database (--local-assertions). Datasets are run
+through BatchAssertionRunner, --max-workers at a time.
 """
 
 import argparse
@@ -10,12 +12,15 @@ import logging
 import os
 import sys
 from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 # Add the parent directory to the sys.path
 sys.path.append(
     os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
+from utils.assertion_batch import DEFAULT_ASSERTION_WORKERS, BatchAssertionRunner, group_by_asset
 from utils.datahub_metadata_api import DataHubMetadataApiClient
 from utils.token_utils import get_token_from_env
 from scripts.assertions.assertion_utils import format_assertion_result
@@ -42,7 +47,7 @@ def parse_args():
     Parse command line arguments
     """
     parser = argparse.ArgumentParser(
-        description="Run assertions for a dataset in DataHub"
+        description="Run assertions for datasets in DataHub"
     )
 
     parser.add_argument(
@@ -52,11 +57,26 @@ def parse_args():
         help="DataHub server URL (e.g., http://localhost:8080)",
     )
 
-    parser.add_argument(
+    datasets = parser.add_mutually_exclusive_group(required=True)
+    datasets.add_argument(
         "--dataset-urn",
         "-d",
-        required=True,
-        help="DataHub dataset URN",
+        nargs="+",
+        help="DataHub dataset URN(s)",
+    )
+
+    datasets.add_argument(
+        "--local-assertions",
+        action="store_true",
+        help="Run all assertions of the local web UI database, grouped by dataset",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        "-w",
+        type=int,
+        default=DEFAULT_ASSERTION_WORKERS,
+        help=f"Maximum number of datasets run concurrently (default: {DEFAULT_ASSERTION_WORKERS})",
     )
 
     parser.add_argument(
@@ -100,6 +120,96 @@ def parse_args():
     return parser.parse_args()
 
 
+def load_local_assertions() -> Dict[str, List[str]]:
+    """
+    Get the assertions of the local web UI database, grouped by dataset
+
+    Returns:
+        Dictionary mapping dataset URN to its assertion URNs
+    """
+    import django
+    from django.conf import settings
+
+    if not settings.configured:
+        root_dir = Path(__file__).parent.parent.parent
+        sys.path.insert(0, str(root_dir))
+        sys.path.insert(0, str(root_dir / "web_ui"))
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "web_ui.settings")
+        django.setup()
+
+    from metadata_manager.models import Assertion
+
+    assertions = (
+        Assertion.objects.filter(removed=False, urn__isnull=False, entity_urn__isnull=False)
+        .exclude(urn="")
+        .values_list("urn", "entity_urn")
+    )
+    return dict(group_by_asset(assertions))
+
+
+def summarize_results(results: Dict[str, Dict[str, Any]]) -> Dict[str, int]:
+    """Count the formatted results of some assertions by status"""
+    statuses = [result.get("status", "UNKNOWN") for result in results.values()]
+    return {
+        "total": len(statuses),
+        "succeeded": statuses.count("SUCCESS"),
+        "failed": statuses.count("FAILURE"),
+    }
+
+
+def run_datasets(
+    client: Any,
+    datasets: Dict[str, Optional[List[str]]],
+    max_workers: int = DEFAULT_ASSERTION_WORKERS,
+    tag_urns: Optional[List[str]] = None,
+    save_result: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run the assertions of many datasets
+
+    Args:
+        client: DataHubMetadataApiClient
+        datasets: Dataset URN -> assertion URNs to keep (None keeps every result of the dataset)
+        max_workers: Maximum number of datasets run concurrently
+        tag_urns: Only run the assertions with these tags (optional)
+        save_result: Whether DataHub stores the run results
+
+    Returns:
+        Output with the overall summary and the formatted results of each dataset
+    """
+    output_datasets = {}
+
+    def record(asset_result):
+        results = {
+            assertion_urn: format_assertion_result(result)
+            for assertion_urn, result in asset_result.results.items()
+        }
+        output_datasets[asset_result.asset_urn] = {
+            "summary": summarize_results(results),
+            "error": asset_result.error,
+            "results": results,
+        }
+
+    runner = BatchAssertionRunner(client, max_workers=max_workers, tag_urns=tag_urns, save_result=save_result)
+    batch_summary = runner.run(datasets, on_asset_done=record)
+
+    summaries = [dataset["summary"] for dataset in output_datasets.values()]
+    return {
+        "version": "1.0",
+        "executed_at": datetime.now().isoformat(),
+        "summary": {
+            "datasets": batch_summary.assets,
+            "failed_datasets": batch_summary.failed_assets,
+            "total": sum(summary["total"] for summary in summaries),
+            "succeeded": sum(summary["succeeded"] for summary in summaries),
+            "failed": sum(summary["failed"] for summary in summaries),
+            "seconds": batch_summary.seconds,
+        },
+        # Keep the order the datasets were given in, not the order they completed in
+        "datasets": {urn: output_datasets[urn] for urn in datasets if urn in output_datasets},
+    }
+
+
 def main():
     args = parse_args()
     setup_logging(args.log_level)
@@ -116,6 +226,19 @@ def main():
     else:
         token = get_token_from_env()
 
+    # Get the datasets to run, and the assertions to keep for each
+    if args.local_assertions:
+        try:
+            datasets = load_local_assertions()
+        except Exception as e:
+            logger.error(f"Error loading local assertions: {str(e)}")
+            sys.exit(1)
+        if not datasets:
+            logger.error("No local assertions to run")
+            sys.exit(1)
+    else:
+        datasets = {dataset_urn: None for dataset_urn in args.dataset_urn}
+
     # Initialize the client
     try:
         client = DataHubMetadataApiClient(args.server_url, token)
@@ -124,47 +247,29 @@ def main():
         sys.exit(1)
 
     try:
-        # Run assertions for the dataset
-        logger.info(f"Running assertions for dataset {args.dataset_urn}...")
+        logger.info(f"Running assertions for {len(datasets)} datasets with {args.max_workers} workers...")
 
-        results = client.run_assertions_for_asset(
-            dataset_urn=args.dataset_urn,
+        output = run_datasets(
+            client,
+            datasets,
+            max_workers=args.max_workers,
             tag_urns=args.tag_urns,
             save_result=args.save_results,
         )
 
-        if not results:
-            logger.error(f"Failed to run assertions for dataset {args.dataset_urn}")
-            sys.exit(1)
-
-        # Format the results
-        formatted_results = {}
-        assertion_results = results.get("results", {})
-        for assertion_urn, result in assertion_results.items():
-            formatted_results[assertion_urn] = format_assertion_result(result)
-
-        # Summarize results
-        success_count = 0
-        failure_count = 0
-        for assertion_urn, result in formatted_results.items():
-            status = result.get("status", "UNKNOWN")
-            if status == "SUCCESS":
-                success_count += 1
-            elif status == "FAILURE":
-                failure_count += 1
-
-        # Create the final output
-        output = {
-            "version": "1.0",
-            "executed_at": datetime.now().isoformat(),
-            "dataset_urn": args.dataset_urn,
-            "summary": {
-                "total": len(formatted_results),
-                "succeeded": success_count,
-                "failed": failure_count,
-            },
-            "results": formatted_results,
-        }
+        # A single dataset keeps the output format of one dataset run
+        if len(output["datasets"]) == 1 and not args.local_assertions:
+            dataset_urn, dataset = next(iter(output["datasets"].items()))
+            if dataset["error"]:
+                logger.error(f"Failed to run assertions for dataset {dataset_urn}: {dataset['error']}")
+                sys.exit(1)
+            output = {
+                "version": output["version"],
+                "executed_at": output["executed_at"],
+                "dataset_urn": dataset_urn,
+                "summary": dataset["summary"],
+                "results": dataset["results"],
+            }
 
         # Output results
         if args.output_file:
@@ -181,12 +286,13 @@ def main():
             print(json.dumps(output, indent=4 if args.pretty_print else None))
 
         # Log summary
+        summary = output["summary"]
         logger.info(
-            f"Ran {len(formatted_results)} assertions: {success_count} succeeded, {failure_count} failed"
+            f"Ran {summary['total']} assertions: {summary['succeeded']} succeeded, {summary['failed']} failed"
         )
 
-        # Exit with failure if any assertions failed
-        if failure_count > 0:
+        # Exit with failure if any assertions or datasets failed
+        if summary["failed"] > 0 or summary.get("failed_datasets"):
             sys.exit(1)
 
     except Exception as e:
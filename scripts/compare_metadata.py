@@ -2,23 +2,49 @@
 """
 Compare metadata between two DataHub environments.
 Useful for ensuring that two environments have the same metadata definitions.
+
+Entities are scrolled through sorted by URN and merged, comparing per-aspect
+fingerprints; field-level differences are only computed for entities whose
+fingerprints differ. With a .jsonl output file (or --format jsonl) every
+difference is written as one JSON line as soon as it is found. Either side can
+be read from a local metadata mirror (--source-mirror / --target-mirror).
 """
 
 import argparse
 import json
 import logging
 import os
+import shutil
 import sys
-from typing import Dict, Any, List, Tuple
+import tempfile
+from typing import Dict, Any, Iterator, List, TextIO, Tuple
 
 # Add the parent directory to the sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils._datahub_metadata_client import DataHubMetadataClient
+from utils.json_stream import is_json_lines_path
+from utils.metadata_diff import UnsortedStreamError, entity_fingerprints, iter_entity_diffs
+from utils.metadata_mirror import ENTITY_FIELDS, MetadataMirror, scroll_entities
 from utils.token_utils import get_token_from_env
 
 logger = logging.getLogger(__name__)
 
+# Number of entities fetched per scroll request
+DEFAULT_PAGE_SIZE = 500
+
+# GraphQL fields compared for each entity type: every aspect the manager pushes
+ENTITY_COMPARE_FIELDS = ENTITY_FIELDS
+
+# (section, subsection, entity type) compared for each --compare-type
+COMPARE_SECTIONS = {
+    "domains": [("domains", None, "DOMAIN")],
+    "glossary": [("glossary", "nodes", "GLOSSARY_NODE"), ("glossary", "terms", "GLOSSARY_TERM")],
+    "tags": [("tags", None, "TAG")],
+    "properties": [("structured_properties", None, "STRUCTURED_PROPERTY")],
+    "tests": [("tests", None, "TEST")],
+}
+
 
 def setup_logging(log_level: str):
     """
@@ -44,14 +70,14 @@ def parse_args():
 
     parser.add_argument(
         "--source-url",
-        required=True,
-        help="Source DataHub server URL (e.g., http://source-datahub:8080)",
+        help="Source DataHub server URL (e.g., http://source-datahub:8080); "
+        "required unless --source-mirror is given",
     )
 
     parser.add_argument(
         "--target-url",
-        required=True,
-        help="Target DataHub server URL (e.g., http://target-datahub:8080)",
+        help="Target DataHub server URL (e.g., http://target-datahub:8080); "
+        "required unless --target-mirror is given",
     )
 
     parser.add_argument(
@@ -91,7 +117,45 @@ def parse_args():
         help="Only show summary of differences, not detailed differences",
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        help="Output format (default: jsonl for .jsonl output files, json otherwise)",
+    )
+
+    parser.add_argument(
+        "--urn-replace",
+        action="append",
+        default=[],
+        metavar="OLD=NEW",
+        help="Replace OLD with NEW in source URNs before comparing, e.g. to compare "
+        "against migrated URNs (can be repeated)",
+    )
+
+    parser.add_argument(
+        "--source-mirror",
+        help="Read the source entities from this local metadata mirror (see mirror_metadata.py) "
+        "instead of querying the source DataHub",
+    )
+
+    parser.add_argument(
+        "--target-mirror",
+        help="Read the target entities from this local metadata mirror instead of querying the target DataHub",
+    )
+
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_PAGE_SIZE,
+        help=f"Number of entities fetched per request (default: {DEFAULT_PAGE_SIZE})",
+    )
+
+    args = parser.parse_args()
+    if not args.source_url and not args.source_mirror:
+        parser.error("one of --source-url or --source-mirror is required")
+    if not args.target_url and not args.target_mirror:
+        parser.error("one of --target-url or --target-mirror is required")
+    return args
 
 
 def get_entity_name(entity: Dict[str, Any]) -> str:
@@ -114,6 +178,95 @@ def get_entity_name(entity: Dict[str, Any]) -> str:
         return str(entity)
 
 
+def normalize_entity(entity: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Put set-like lists (owners, relationships) in a stable order, so entities
+    that only differ in the order the server returned them compare equal
+
+    Args:
+        entity: Entity fetched from DataHub
+
+    Returns:
+        The entity, normalized in place
+    """
+    owners = (entity.get("ownership") or {}).get("owners")
+    if owners:
+        owners.sort(key=lambda owner: ((owner.get("owner") or {}).get("urn") or "", owner.get("type") or ""))
+
+    relationships = (entity.get("relationships") or {}).get("relationships")
+    if relationships:
+        relationships.sort(key=lambda rel: (rel.get("type") or "", (rel.get("entity") or {}).get("urn") or ""))
+
+    return entity
+
+
+def iter_entities(
+    client: DataHubMetadataClient,
+    entity_type: str,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    sort_by_urn: bool = True,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Scroll through all entities of a type with the fields that are compared
+
+    Args:
+        client: Metadata client of the environment
+        entity_type: Entity type (e.g. GLOSSARY_TERM)
+        page_size: Number of entities per request
+        sort_by_urn: Ask the server to return the entities sorted by URN
+
+    Yields:
+        Normalized entity dictionaries
+    """
+    entities = scroll_entities(
+        client.client, [entity_type], ENTITY_COMPARE_FIELDS[entity_type], page_size, sort_by_urn=sort_by_urn
+    )
+    for entity in entities:
+        yield normalize_entity(entity)
+
+
+def iter_mirrored_entities(mirror: MetadataMirror, entity_type: str) -> Iterator[Dict[str, Any]]:
+    """
+    All entities of a type from a local metadata mirror, in the order of iter_entities
+
+    Args:
+        mirror: Mirror of the environment
+        entity_type: Entity type (e.g. GLOSSARY_TERM)
+
+    Yields:
+        Normalized entity dictionaries, sorted by URN
+    """
+    if entity_type not in mirror.status():
+        raise RuntimeError(f"{entity_type} entities have not been synced to the mirror {mirror.path}")
+    for entity in mirror.iter_entities(entity_type):
+        yield normalize_entity(entity)
+
+
+def replace_urns(replacements: List[Tuple[str, str]]):
+    """
+    Build a transform that applies URN replacements to every string of an entity
+
+    Args:
+        replacements: (old, new) pairs
+
+    Returns:
+        Callable mapping an entity to a new, replaced entity
+    """
+
+    def replace(value: Any) -> Any:
+        if isinstance(value, str):
+            for old, new in replacements:
+                value = value.replace(old, new)
+            return value
+        if isinstance(value, dict):
+            return {key: replace(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [replace(item) for item in value]
+        return value
+
+    return replace
+
+
 def compare_lists(
     source_list: List[Dict[str, Any]],
     target_list: List[Dict[str, Any]],
@@ -128,34 +281,27 @@ def compare_lists(
         id_field: Field to use as identifier
 
     Returns:
-        Tuple of (missing_in_target, missing_in_source, different_entities)
+        Tuple of (missing_in_target, missing_in_source, different_entities).
+        Different entities carry the differing aspects and field-level differences.
     """
-    source_dict = {item.get(id_field): item for item in source_list if id_field in item}
-    target_dict = {item.get(id_field): item for item in target_list if id_field in item}
-
-    source_ids = set(source_dict.keys())
-    target_ids = set(target_dict.keys())
-
-    missing_in_target_ids = source_ids - target_ids
-    missing_in_source_ids = target_ids - source_ids
-    common_ids = source_ids.intersection(target_ids)
-
-    # Items missing in target
-    missing_in_target = [source_dict[id_] for id_ in missing_in_target_ids]
-
-    # Items missing in source
-    missing_in_source = [target_dict[id_] for id_ in missing_in_source_ids]
-
-    # Items that exist in both but may have differences
+    missing_in_target = []
+    missing_in_source = []
     different_entities = []
-    for id_ in common_ids:
-        source_item = source_dict[id_]
-        target_item = target_dict[id_]
 
-        # Compare simplified versions (ignore timestamps, etc.)
-        if not are_entities_equivalent(source_item, target_item):
+    for diff in iter_entity_diffs(source_list, target_list, key=lambda item: item.get(id_field)):
+        if diff["status"] == "missing_in_target":
+            missing_in_target.append(diff["source"])
+        elif diff["status"] == "missing_in_source":
+            missing_in_source.append(diff["target"])
+        else:
             different_entities.append(
-                {"urn": id_, "source": source_item, "target": target_item}
+                {
+                    "urn": diff["key"],
+                    "source": diff["source"],
+                    "target": diff["target"],
+                    "aspects": diff["aspects"],
+                    "differences": diff["differences"],
+                }
             )
 
     return missing_in_target, missing_in_source, different_entities
@@ -163,7 +309,8 @@ def compare_lists(
 
 def are_entities_equivalent(source: Dict[str, Any], target: Dict[str, Any]) -> bool:
     """
-    Check if two entities are semantically equivalent
+    Check if two entities are semantically equivalent: every aspect has the
+    same canonical fingerprint (audit stamp times and __typename are ignored)
 
     Args:
         source: Source entity
@@ -172,43 +319,68 @@ def are_entities_equivalent(source: Dict[str, Any], target: Dict[str, Any]) -> b
     Returns:
         True if equivalent, False otherwise
     """
-    # Compare core properties like name and description
-    if "properties" in source and "properties" in target:
-        source_props = source["properties"]
-        target_props = target["properties"]
-
-        # Compare name
-        if source_props.get("name") != target_props.get("name"):
-            return False
-
-        # Compare description
-        if source_props.get("description") != target_props.get("description"):
-            return False
-
-    # For tags, compare color
-    if (
-        "properties" in source
-        and "properties" in target
-        and "colorHex" in source["properties"]
-    ):
-        if source["properties"].get("colorHex") != target["properties"].get("colorHex"):
-            return False
+    return entity_fingerprints(source) == entity_fingerprints(target)
 
-    # For structured properties, check definition
-    if "definition" in source and "definition" in target:
-        source_def = source["definition"]
-        target_def = target["definition"]
 
-        if source_def.get("displayName") != target_def.get("displayName"):
-            return False
+def diff_record(section: str, diff: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    JSON Lines record of one difference
+
+    Args:
+        section: Section name (e.g. "glossary.terms")
+        diff: Difference yielded by iter_entity_diffs
 
-        if source_def.get("description") != target_def.get("description"):
-            return False
+    Returns:
+        Record with the section, URN, status and either the missing entity or
+        the differing aspects and field-level differences
+    """
+    record = {"section": section, "urn": diff["key"], "status": diff["status"]}
+    if diff["status"] == "different":
+        record["name"] = get_entity_name(diff["source"])
+        record["aspects"] = diff["aspects"]
+        record["differences"] = diff["differences"]
+    else:
+        entity = diff.get("source") or diff.get("target")
+        record["name"] = get_entity_name(entity)
+        record["entity"] = entity
+    return record
+
+
+def write_section_jsonl(
+    out: TextIO,
+    section: str,
+    source_entities,
+    target_entities,
+    source_transform=None,
+    presorted: bool = True,
+    summary_only: bool = False,
+) -> Dict[str, int]:
+    """
+    Stream the differences of one section to a JSON Lines file, followed by a
+    summary line
 
-        if source_def.get("cardinality") != target_def.get("cardinality"):
-            return False
+    Args:
+        out: Output file
+        section: Section name
+        source_entities: Source entities (iterable)
+        target_entities: Target entities (iterable)
+        source_transform: Transform applied to source entities (e.g. URN replacements)
+        presorted: Whether both sides are sorted by URN
+        summary_only: Only write the summary line
 
-    return True
+    Returns:
+        Counts of missing_in_target, missing_in_source and different entities
+    """
+    counts = {"missing_in_target": 0, "missing_in_source": 0, "different": 0}
+    for diff in iter_entity_diffs(
+        source_entities, target_entities, source_transform=source_transform, presorted=presorted
+    ):
+        counts[diff["status"]] += 1
+        if not summary_only:
+            out.write(json.dumps(diff_record(section, diff)) + "\n")
+    out.write(json.dumps({"section": section, "summary": counts}) + "\n")
+    out.flush()
+    return counts
 
 
 def summarize_differences(comparison_results: Dict[str, Any]) -> Dict[str, Any]:
@@ -325,127 +497,119 @@ def main():
             get_token_from_env("DATAHUB_TARGET_TOKEN") or get_token_from_env()
         )
 
-    # Initialize clients
+    # Initialize clients, or open the local mirrors used instead
     try:
-        source_client = DataHubMetadataClient(args.source_url, source_token)
-        target_client = DataHubMetadataClient(args.target_url, target_token)
+        source_mirror = MetadataMirror(args.source_mirror) if args.source_mirror else None
+        target_mirror = MetadataMirror(args.target_mirror) if args.target_mirror else None
+        source_client = None if source_mirror else DataHubMetadataClient(args.source_url, source_token)
+        target_client = None if target_mirror else DataHubMetadataClient(args.target_url, target_token)
     except Exception as e:
         logger.error(f"Error initializing clients: {str(e)}")
         sys.exit(1)
 
-    # Perform comparison based on type
-    comparison_results = {}
-
-    try:
-        if args.compare_type in ["all", "domains"]:
-            logger.info("Comparing domains...")
-            source_domains = source_client.list_domains()
-            target_domains = target_client.list_domains()
-
-            missing_in_target, missing_in_source, different = compare_lists(
-                source_domains, target_domains
-            )
-
-            comparison_results["domains"] = {
-                "missing_in_target": missing_in_target,
-                "missing_in_source": missing_in_source,
-                "different": different,
-            }
-
-            logger.info(
-                f"Domains comparison complete. Found {len(missing_in_target)} missing in target, {len(missing_in_source)} missing in source, {len(different)} different."
-            )
-
-        if args.compare_type in ["all", "glossary"]:
-            logger.info("Comparing glossary...")
-            # Compare glossary nodes
-            source_nodes = source_client.get_root_glossary_nodes()
-            target_nodes = target_client.get_root_glossary_nodes()
-
-            nodes_missing_in_target, nodes_missing_in_source, nodes_different = (
-                compare_lists(source_nodes, target_nodes)
-            )
-
-            # Compare glossary terms
-            source_terms = source_client.get_root_glossary_terms()
-            target_terms = target_client.get_root_glossary_terms()
-
-            terms_missing_in_target, terms_missing_in_source, terms_different = (
-                compare_lists(source_terms, target_terms)
-            )
-
-            comparison_results["glossary"] = {
-                "nodes": {
-                    "missing_in_target": nodes_missing_in_target,
-                    "missing_in_source": nodes_missing_in_source,
-                    "different": nodes_different,
-                },
-                "terms": {
-                    "missing_in_target": terms_missing_in_target,
-                    "missing_in_source": terms_missing_in_source,
-                    "different": terms_different,
-                },
-            }
-
-            logger.info(
-                f"Glossary comparison complete. Nodes: {len(nodes_missing_in_target)} missing in target, {len(nodes_missing_in_source)} missing in source, {len(nodes_different)} different. Terms: {len(terms_missing_in_target)} missing in target, {len(terms_missing_in_source)} missing in source, {len(terms_different)} different."
-            )
-
-        if args.compare_type in ["all", "tags"]:
-            logger.info("Comparing tags...")
-            source_tags = source_client.list_all_tags()
-            target_tags = target_client.list_all_tags()
-
-            missing_in_target, missing_in_source, different = compare_lists(
-                source_tags, target_tags
-            )
-
-            comparison_results["tags"] = {
-                "missing_in_target": missing_in_target,
-                "missing_in_source": missing_in_source,
-                "different": different,
-            }
-
-            logger.info(
-                f"Tags comparison complete. Found {len(missing_in_target)} missing in target, {len(missing_in_source)} missing in source, {len(different)} different."
-            )
-
-        if args.compare_type in ["all", "properties"]:
-            logger.info("Comparing structured properties...")
-            source_props = source_client.list_structured_properties()
-            target_props = target_client.list_structured_properties()
-
-            missing_in_target, missing_in_source, different = compare_lists(
-                source_props, target_props
-            )
-
-            comparison_results["structured_properties"] = {
-                "missing_in_target": missing_in_target,
-                "missing_in_source": missing_in_source,
-                "different": different,
-            }
+    def source_entities(entity_type: str, sort_by_urn: bool = True) -> Iterator[Dict[str, Any]]:
+        if source_mirror:
+            return iter_mirrored_entities(source_mirror, entity_type)
+        return iter_entities(source_client, entity_type, args.page_size, sort_by_urn)
+
+    def target_entities(entity_type: str, sort_by_urn: bool = True) -> Iterator[Dict[str, Any]]:
+        if target_mirror:
+            return iter_mirrored_entities(target_mirror, entity_type)
+        return iter_entities(target_client, entity_type, args.page_size, sort_by_urn)
+
+    replacements = []
+    for replacement in args.urn_replace:
+        old, separator, new = replacement.partition("=")
+        if not separator or not old:
+            logger.error(f"Invalid --urn-replace value (expected OLD=NEW): {replacement}")
+            sys.exit(1)
+        replacements.append((old, new))
+    source_transform = replace_urns(replacements) if replacements else None
 
-            logger.info(
-                f"Structured properties comparison complete. Found {len(missing_in_target)} missing in target, {len(missing_in_source)} missing in source, {len(different)} different."
-            )
+    output_format = args.format or (
+        "jsonl" if args.output_file and is_json_lines_path(args.output_file) else "json"
+    )
+    compare_types = list(COMPARE_SECTIONS) if args.compare_type == "all" else [args.compare_type]
+    sections = [section for compare_type in compare_types for section in COMPARE_SECTIONS[compare_type]]
 
-        if args.compare_type in ["all", "tests"]:
-            logger.info("Comparing metadata tests...")
-            source_tests = source_client.list_metadata_tests()
-            target_tests = target_client.list_metadata_tests()
+    try:
+        if output_format == "jsonl":
+            out = open(args.output_file, "w") if args.output_file else sys.stdout
+            try:
+                for section, subsection, entity_type in sections:
+                    name = f"{section}.{subsection}" if subsection else section
+                    logger.info(f"Comparing {name}...")
+                    # A section may have to be rewritten, so output that cannot be rewound
+                    # (stdout) gets each section through a temporary file
+                    section_out = out if out.seekable() else tempfile.SpooledTemporaryFile(mode="w+")
+                    position = section_out.tell()
+                    try:
+                        # URN replacements change the order, so the source side is sorted in memory then
+                        counts = write_section_jsonl(
+                            section_out,
+                            name,
+                            source_entities(entity_type),
+                            target_entities(entity_type),
+                            source_transform=source_transform,
+                            presorted=source_transform is None,
+                            summary_only=args.summary_only,
+                        )
+                    except UnsortedStreamError as e:
+                        logger.warning(f"{e}; comparing {name} in memory instead")
+                        section_out.seek(position)
+                        section_out.truncate()
+                        counts = write_section_jsonl(
+                            section_out,
+                            name,
+                            source_entities(entity_type, sort_by_urn=False),
+                            target_entities(entity_type, sort_by_urn=False),
+                            source_transform=source_transform,
+                            presorted=False,
+                            summary_only=args.summary_only,
+                        )
+                    if section_out is not out:
+                        section_out.seek(0)
+                        shutil.copyfileobj(section_out, out)
+                        section_out.close()
+                    logger.info(
+                        f"{name} comparison complete. Found {counts['missing_in_target']} missing in target, "
+                        f"{counts['missing_in_source']} missing in source, {counts['different']} different."
+                    )
+            finally:
+                if out is not sys.stdout:
+                    out.close()
+            if args.output_file:
+                logger.info(f"Comparison results saved to {args.output_file}")
+            logger.info("Comparison completed successfully")
+            return
+
+        # Perform comparison based on type
+        comparison_results = {}
+
+        for section, subsection, entity_type in sections:
+            name = f"{section}.{subsection}" if subsection else section
+            logger.info(f"Comparing {name}...")
+            source_list = list(source_entities(entity_type))
+            target_list = list(target_entities(entity_type))
+            if source_transform:
+                source_list = [source_transform(entity) for entity in source_list]
 
             missing_in_target, missing_in_source, different = compare_lists(
-                source_tests, target_tests
+                source_list, target_list
             )
 
-            comparison_results["tests"] = {
+            section_results = {
                 "missing_in_target": missing_in_target,
                 "missing_in_source": missing_in_source,
                 "different": different,
             }
+            if subsection:
+                comparison_results.setdefault(section, {})[subsection] = section_results
+            else:
+                comparison_results[section] = section_results
 
             logger.info(
-                f"Metadata tests comparison complete. Found {len(missing_in_target)} missing in target, {len(missing_in_source)} missing in source, {len(different)} different."
+                f"{name} comparison complete. Found {len(missing_in_target)} missing in target, {len(missing_in_source)} missing in source, {len(different)} different."
             )
 
         # Generate summary if requested
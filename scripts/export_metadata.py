@@ -2,23 +2,36 @@
 """
 Export metadata from DataHub including domains, business glossaries, tags,
 structured properties, metadata tests and assertions.
+
+Sections are fetched concurrently. With --format jsonl or jsonl.gz each
+section is streamed to its own file next to the output file as soon as it is
+fetched, and the output file is a small manifest listing them.
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
-from datetime import datetime
 
 # Add the parent directory to the sys.path
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils._datahub_metadata_client import DataHubMetadataClient
+from utils.metadata_export import DEFAULT_EXPORT_WORKERS, EXPORT_FORMATS
 from utils.token_utils import get_token_from_env
 
 logger = logging.getLogger(__name__)
 
+# Sections written for each --export-type
+EXPORT_TYPE_SECTIONS = {
+    "all": None,
+    "domains": ["domains"],
+    "glossary": ["glossary_nodes", "glossary_terms"],
+    "tags": ["tags"],
+    "properties": ["structured_properties"],
+    "tests": ["tests"],
+}
+
 
 def setup_logging(log_level: str):
     """
@@ -86,6 +99,21 @@ def parse_args():
         help="Include entities associated with domains (can significantly increase size)",
     )
 
+    parser.add_argument(
+        "--format",
+        choices=EXPORT_FORMATS,
+        default="json",
+        help="Output format: one JSON document, or one JSON Lines file per section "
+        "(optionally gzip-compressed) with the output file as manifest (default: json)",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_EXPORT_WORKERS,
+        help=f"Number of sections fetched concurrently (default: {DEFAULT_EXPORT_WORKERS})",
+    )
+
     return parser.parse_args()
 
 
@@ -118,78 +146,19 @@ def main():
         os.makedirs(output_dir)
 
     # Export metadata based on type
-    try:
-        if args.export_type == "all":
-            result = client.export_all_metadata(args.output_file)
-            if not result:
-                logger.error("Failed to export metadata")
-                sys.exit(1)
-        else:
-            metadata = {}
-            metadata["version"] = "1.0"
-            metadata["exported_at"] = datetime.now().isoformat()
-
-            if args.export_type == "domains":
-                domains = client.list_domains()
-
-                # If include_entities is specified, get entities for each domain
-                if args.include_entities:
-                    enriched_domains = []
-                    for domain in domains:
-                        domain_urn = domain.get("urn")
-                        if domain_urn:
-                            detailed_domain = client.export_domain(
-                                domain_urn, include_entities=True
-                            )
-                            enriched_domains.append(detailed_domain)
-                        else:
-                            enriched_domains.append(domain)
-                    domains = enriched_domains
-
-                metadata["domains"] = domains
-
-            elif args.export_type == "glossary":
-                # Get root nodes and terms
-                root_nodes = client.get_root_glossary_nodes()
-                root_terms = client.get_root_glossary_terms()
-
-                # For each root node, get its children
-                nodes_with_children = []
-                for node in root_nodes:
-                    node_urn = node.get("urn")
-                    if node_urn:
-                        detailed_node = client.get_glossary_node(node_urn)
-                        if detailed_node:
-                            nodes_with_children.append(detailed_node)
-                    else:
-                        nodes_with_children.append(node)
-
-                metadata["glossary"] = {
-                    "nodes": nodes_with_children,
-                    "terms": root_terms,
-                }
-
-            elif args.export_type == "tags":
-                metadata["tags"] = client.list_all_tags()
-
-            elif args.export_type == "properties":
-                metadata["structured_properties"] = client.list_structured_properties()
-
-            elif args.export_type == "tests":
-                metadata["tests"] = client.list_metadata_tests()
-
-            # Write to file
-            with open(args.output_file, "w") as f:
-                json.dump(metadata, f, indent=4 if args.pretty_print else None)
-
-            logger.info(
-                f"Successfully exported {args.export_type} to {args.output_file}"
-            )
-
-    except Exception as e:
-        logger.error(f"Error exporting metadata: {str(e)}")
+    result = client.export_all_metadata(
+        args.output_file,
+        fmt=args.format,
+        max_workers=args.max_workers,
+        include_entities=args.include_entities,
+        indent=2 if args.pretty_print else None,
+        sections=EXPORT_TYPE_SECTIONS[args.export_type],
+    )
+    if not result:
+        logger.error("Failed to export metadata")
         sys.exit(1)
 
+    logger.info(f"Successfully exported {args.export_type} to {args.output_file}")
     logger.info("Export completed successfully")
 
 
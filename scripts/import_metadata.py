@@ -16,6 +16,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from utils._datahub_metadata_client import DataHubMetadataClient
 from utils.token_utils import get_token_from_env
+from utils.mcp_emitter import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS
+from utils.metadata_import import IMPORT_TYPE_SECTIONS, build_import_plan, load_import_sections, topological_levels
 
 logger = logging.getLogger(__name__)
 
@@ -77,13 +79,39 @@ def parse_args():
     parser.add_argument(
         "--dry-run",
         action="store_true",
-        help="Validate the input file but don't perform the import",
+        help="Validate the input file and report its import levels but don't perform the import",
     )
 
     parser.add_argument(
         "--overwrite",
         action="store_true",
-        help="Overwrite existing metadata if it exists",
+        help="Overwrite existing metadata if it exists (otherwise existing entities are left untouched)",
+    )
+
+    parser.add_argument(
+        "--replay-failures",
+        action="store_true",
+        help="Treat the input file as a failed MCPs file (or a JSON list of MCPs) and emit its MCPs again",
+    )
+
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"Number of MCPs per batch ingest request (default: {DEFAULT_BATCH_SIZE})",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Number of batches emitted concurrently (default: {DEFAULT_MAX_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--failures-file",
+        default="failed_mcps.jsonl",
+        help="JSON Lines file MCPs that still fail are written to (default: failed_mcps.jsonl)",
     )
 
     return parser.parse_args()
@@ -105,6 +133,13 @@ def validate_metadata(metadata: Dict[str, Any], import_type: str) -> bool:
         logger.error("Invalid metadata format: missing version field")
         return False
 
+    if isinstance(metadata.get("sections"), dict):
+        # JSON Lines export manifest: the sections are listed with their files
+        sections = metadata["sections"]
+        metadata = {key: True for key in sections if key not in ("glossary_nodes", "glossary_terms")}
+        if "glossary_nodes" in sections or "glossary_terms" in sections:
+            metadata["glossary"] = {"nodes": [], "terms": []}
+
     # Validate based on import type
     if import_type == "all":
         # Minimal validation for a complete metadata package
@@ -162,10 +197,66 @@ def validate_metadata(metadata: Dict[str, Any], import_type: str) -> bool:
     return True
 
 
+def get_token(args) -> str:
+    """
+    Get the DataHub token from the token file or the environment
+    """
+    if args.token_file:
+        try:
+            with open(args.token_file, "r") as f:
+                return f.read().strip()
+        except Exception as e:
+            logger.error(f"Error reading token file: {str(e)}")
+            sys.exit(1)
+    return get_token_from_env()
+
+
+def replay_failed_mcps(args):
+    """
+    Emit the MCPs of a failures file again using the batched emitter
+    """
+    from utils.datahub_metadata_api import DataHubMetadataApiClient
+    from utils.mcp_emitter import load_failed_mcps
+
+    try:
+        mcps = load_failed_mcps(args.input_file)
+    except Exception as e:
+        logger.error(f"Error reading failed MCPs file: {str(e)}")
+        sys.exit(1)
+
+    logger.info(f"Loaded {len(mcps)} MCPs to replay from {args.input_file}")
+    if args.dry_run:
+        logger.info("Dry run completed. Failed MCPs file is valid.")
+        sys.exit(0)
+
+    failures_file = args.failures_file
+    if os.path.abspath(failures_file) == os.path.abspath(args.input_file):
+        # Do not overwrite the file being replayed
+        root, ext = os.path.splitext(failures_file)
+        failures_file = f"{root}.retry{ext}"
+
+    client = DataHubMetadataApiClient(args.server_url, get_token(args))
+    result = client.emit_mcps(
+        mcps,
+        batch_size=args.batch_size,
+        max_workers=args.max_workers,
+        failures_file=failures_file,
+    )
+    if not result.success:
+        logger.error(f"{result.failed} MCPs failed again, see {failures_file}")
+        sys.exit(1)
+
+    logger.info(f"Replayed {result.emitted} MCPs successfully")
+
+
 def main():
     args = parse_args()
     setup_logging(args.log_level)
 
+    if args.replay_failures:
+        replay_failed_mcps(args)
+        return
+
     # Read input file
     try:
         with open(args.input_file, "r") as f:
@@ -179,22 +270,26 @@ def main():
         logger.error("Invalid metadata. Import aborted.")
         sys.exit(1)
 
-    # If dry run, exit after validation
-    if args.dry_run:
-        logger.info("Dry run completed. Input file is valid.")
-        sys.exit(0)
+    sections = None if args.import_type == "all" else list(IMPORT_TYPE_SECTIONS[args.import_type])
 
-    # Get token from file or environment
-    token = None
-    if args.token_file:
+    # If dry run, report the import levels and exit after validation
+    if args.dry_run:
         try:
-            with open(args.token_file, "r") as f:
-                token = f.read().strip()
+            plan = build_import_plan(load_import_sections(args.input_file, sections))
         except Exception as e:
-            logger.error(f"Error reading token file: {str(e)}")
+            logger.error(f"Error building the import plan: {str(e)}")
             sys.exit(1)
-    else:
-        token = get_token_from_env()
+        levels, cyclic = topological_levels(plan)
+        for number, level in enumerate(levels, start=1):
+            logger.info(f"Level {number}: {len(level)} entities")
+        if cyclic:
+            logger.error(f"{len(cyclic)} entities are part of a dependency cycle: {', '.join(cyclic)}")
+            sys.exit(1)
+        logger.info(f"Dry run completed. Input file is valid ({len(plan)} entities in {len(levels)} levels).")
+        sys.exit(0)
+
+    # Get token from file or environment
+    token = get_token(args)
 
     # Initialize the client
     try:
@@ -203,72 +298,22 @@ def main():
         logger.error(f"Error initializing client: {str(e)}")
         sys.exit(1)
 
-    # Import metadata based on type
-    if args.import_type == "all":
-        try:
-            result = client.import_metadata_from_file(args.input_file)
-            if not result:
-                logger.error("Failed to import metadata")
-                sys.exit(1)
-        except Exception as e:
-            logger.error(f"Error importing metadata: {str(e)}")
-            sys.exit(1)
-    else:
-        # Import specific sections
-        try:
-            if args.import_type == "domains":
-                domains = metadata.get("domains", [])
-                logger.info(f"Importing {len(domains)} domains")
-
-                # TODO: Complete domain import logic
-                # This would need to be implemented in the client
-                logger.error("Domain import not yet fully implemented")
-                sys.exit(1)
-
-            elif args.import_type == "glossary":
-                glossary = metadata.get("glossary", {})
-                nodes = glossary.get("nodes", [])
-                terms = glossary.get("terms", [])
-
-                logger.info(
-                    f"Importing {len(nodes)} glossary nodes and {len(terms)} glossary terms"
-                )
-
-                # TODO: Complete glossary import logic
-                # This would need to be implemented in the client
-                logger.error("Glossary import not yet fully implemented")
-                sys.exit(1)
-
-            elif args.import_type == "tags":
-                tags = metadata.get("tags", [])
-                logger.info(f"Importing {len(tags)} tags")
-
-                # TODO: Complete tag import logic
-                # This would need to be implemented in the client
-                logger.error("Tag import not yet fully implemented")
-                sys.exit(1)
-
-            elif args.import_type == "properties":
-                properties = metadata.get("structured_properties", [])
-                logger.info(f"Importing {len(properties)} structured properties")
-
-                # TODO: Complete properties import logic
-                # This would need to be implemented in the client
-                logger.error("Structured properties import not yet fully implemented")
-                sys.exit(1)
-
-            elif args.import_type == "tests":
-                tests = metadata.get("tests", [])
-                logger.info(f"Importing {len(tests)} metadata tests")
-
-                # TODO: Complete tests import logic
-                # This would need to be implemented in the client
-                logger.error("Metadata tests import not yet fully implemented")
-                sys.exit(1)
-
-        except Exception as e:
-            logger.error(f"Error importing {args.import_type}: {str(e)}")
+    # Import all sections, or only those of the requested type, in dependency levels
+    try:
+        result = client.import_metadata_from_file(
+            args.input_file,
+            sections=sections,
+            overwrite=args.overwrite,
+            batch_size=args.batch_size,
+            max_workers=args.max_workers,
+            failures_file=args.failures_file,
+        )
+        if not result:
+            logger.error(f"Failed to import {args.import_type} metadata")
             sys.exit(1)
+    except Exception as e:
+        logger.error(f"Error importing {args.import_type}: {str(e)}")
+        sys.exit(1)
 
     logger.info("Import completed successfully")
 
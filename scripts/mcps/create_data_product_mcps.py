@@ -9,7 +9,7 @@ import logging
 import os
 import sys
 import time
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, Iterable, List
 
 # Add parent directory to sys.path
 sys.path.append(
@@ -52,6 +52,7 @@ except ImportError as e:
 
 # Import local utilities
 from utils.urn_utils import generate_deterministic_urn, extract_name_from_properties
+from scripts.mcps.staging_utils import include_aspect
 
 logger = logging.getLogger(__name__)
 
@@ -439,6 +440,7 @@ def create_data_product_staged_changes(
     deprecation_note: str = "",
     include_all_aspects: bool = True,
     custom_aspects: Optional[Dict[str, Any]] = None,
+    aspects: Optional[Iterable[str]] = None,
     **kwargs
 ) -> List[MetadataChangeProposalWrapper]:
     """
@@ -461,6 +463,7 @@ def create_data_product_staged_changes(
         deprecation_note: Deprecation note
         include_all_aspects: Include all aspects
         custom_aspects: Custom aspects
+        aspects: Optional names of the aspects to create (default: all)
         **kwargs: Additional arguments
     
     Returns:
@@ -469,23 +472,24 @@ def create_data_product_staged_changes(
     mcps = []
     
     # Core data product properties (always included)
-    properties_mcp = create_data_product_properties_mcp(
-        data_product_urn=data_product_urn,
-        name=name,
-        description=description,
-        external_url=external_url,
-        custom_properties=custom_properties,
-        **kwargs
-    )
-    if properties_mcp:
-        mcps.append(properties_mcp)
+    if include_aspect(aspects, "dataProductProperties"):
+        properties_mcp = create_data_product_properties_mcp(
+            data_product_urn=data_product_urn,
+            name=name,
+            description=description,
+            external_url=external_url,
+            custom_properties=custom_properties,
+            **kwargs
+        )
+        if properties_mcp:
+            mcps.append(properties_mcp)
     
     # Note: Editable properties are now included in the main properties MCP above
     # to avoid duplicate dataProductProperties aspects that would overwrite custom properties
     
     if include_all_aspects:
         # Ownership
-        if owners:
+        if owners and include_aspect(aspects, "ownership"):
             ownership_mcp = create_data_product_ownership_mcp(
                 data_product_urn=data_product_urn,
                 owners=owners,
@@ -495,16 +499,17 @@ def create_data_product_staged_changes(
                 mcps.append(ownership_mcp)
         
         # Status (soft delete)
-        status_mcp = create_data_product_status_mcp(
-            data_product_urn=data_product_urn,
-            removed=False,
-            **kwargs
-        )
-        if status_mcp:
-            mcps.append(status_mcp)
+        if include_aspect(aspects, "status"):
+            status_mcp = create_data_product_status_mcp(
+                data_product_urn=data_product_urn,
+                removed=False,
+                **kwargs
+            )
+            if status_mcp:
+                mcps.append(status_mcp)
         
         # Global tags
-        if tags:
+        if tags and include_aspect(aspects, "globalTags"):
             tags_mcp = create_data_product_global_tags_mcp(
                 data_product_urn=data_product_urn,
                 tags=tags,
@@ -514,7 +519,7 @@ def create_data_product_staged_changes(
                 mcps.append(tags_mcp)
         
         # Glossary terms
-        if terms:
+        if terms and include_aspect(aspects, "glossaryTerms"):
             terms_mcp = create_data_product_glossary_terms_mcp(
                 data_product_urn=data_product_urn,
                 terms=terms,
@@ -524,7 +529,7 @@ def create_data_product_staged_changes(
                 mcps.append(terms_mcp)
         
         # Institutional memory
-        if links:
+        if links and include_aspect(aspects, "institutionalMemory"):
             memory_mcp = create_data_product_institutional_memory_mcp(
                 data_product_urn=data_product_urn,
                 links=links,
@@ -534,7 +539,7 @@ def create_data_product_staged_changes(
                 mcps.append(memory_mcp)
         
         # Structured properties
-        if structured_properties:
+        if structured_properties and include_aspect(aspects, "structuredProperties"):
             struct_props_mcp = create_data_product_structured_properties_mcp(
                 data_product_urn=data_product_urn,
                 structured_properties=structured_properties,
@@ -544,7 +549,7 @@ def create_data_product_staged_changes(
                 mcps.append(struct_props_mcp)
         
         # Domains
-        if domains:
+        if domains and include_aspect(aspects, "domains"):
             domains_mcp = create_data_product_domains_mcp(
                 data_product_urn=data_product_urn,
                 domains=domains,
@@ -554,7 +559,7 @@ def create_data_product_staged_changes(
                 mcps.append(domains_mcp)
         
         # Sub types
-        if sub_types:
+        if sub_types and include_aspect(aspects, "subTypes"):
             sub_types_mcp = create_data_product_sub_types_mcp(
                 data_product_urn=data_product_urn,
                 sub_types=sub_types,
@@ -564,7 +569,7 @@ def create_data_product_staged_changes(
                 mcps.append(sub_types_mcp)
         
         # Deprecation
-        if deprecated or deprecation_note:
+        if (deprecated or deprecation_note) and include_aspect(aspects, "deprecation"):
             deprecation_mcp = create_data_product_deprecation_mcp(
                 data_product_urn=data_product_urn,
                 deprecated=deprecated,
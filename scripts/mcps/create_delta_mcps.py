@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+Create a delta MCP file holding only the MCPs that changed between two git
+revisions of a staged mcp_file.json.
+
+MCPs are matched by (entityUrn, aspectName) and compared by content fingerprint,
+so MCPs that only differ in audit stamp times are treated as unchanged. Aspects
+that were removed from the staged file are emitted as DELETE MCPs.
+
+Example:
+    python scripts/mcps/create_delta_mcps.py \\
+        --file metadata-manager/dev/tags/mcp_file.json \\
+        --base origin/main --head HEAD --output tags_delta_mcps.json
+"""
+
+import argparse
+import json
+import logging
+import os
+import subprocess
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add the parent directory to the sys.path
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from utils.mcp_fingerprint import fingerprint_mcps, mcp_key
+
+logger = logging.getLogger(__name__)
+
+# Revision GitHub reports as "before" for the first push of a branch
+NULL_REVISION = "0" * 40
+
+
+def setup_logging(log_level: str = "INFO"):
+    """Set up logging configuration"""
+    numeric_level = getattr(logging, log_level.upper(), None)
+    if not isinstance(numeric_level, int):
+        numeric_level = logging.INFO
+
+    logging.basicConfig(
+        level=numeric_level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Create a delta MCP file with only the MCPs changed between two revisions"
+    )
+
+    parser.add_argument(
+        "--file",
+        required=True,
+        help="Path to the staged MCP file (e.g. metadata-manager/dev/tags/mcp_file.json)",
+    )
+
+    parser.add_argument(
+        "--base",
+        help="Base git revision. When empty or the null revision, every MCP in head is emitted",
+    )
+
+    parser.add_argument(
+        "--head",
+        help="Head git revision (default: the working tree version of the file)",
+    )
+
+    parser.add_argument(
+        "--output",
+        required=True,
+        help="Path to write the delta MCP file to",
+    )
+
+    parser.add_argument(
+        "--no-deletions",
+        action="store_true",
+        help="Do not emit DELETE MCPs for aspects removed from the staged file",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR"],
+        default="INFO",
+        help="Set logging level (default: INFO)",
+    )
+
+    return parser.parse_args()
+
+
+def _parse_mcp_file_content(content: str, source: str) -> List[Dict[str, Any]]:
+    """Parse staged MCP file content (list or legacy {"mcps": [...]} layout)"""
+    if not content.strip():
+        return []
+    try:
+        file_content = json.loads(content)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid JSON in {source}: {e}")
+
+    if isinstance(file_content, list):
+        return file_content
+    if isinstance(file_content, dict) and "mcps" in file_content:
+        return file_content["mcps"]
+    raise ValueError(f"Unknown MCP file format in {source}")
+
+
+def read_mcps_at_revision(file_path: str, revision: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Read the MCPs in a staged file at a git revision
+
+    Args:
+        file_path: Path to the staged MCP file
+        revision: Git revision, or None for the working tree version
+
+    Returns:
+        List of MCP dictionaries (empty if the file does not exist at that revision)
+    """
+    if revision is None:
+        if not os.path.exists(file_path):
+            return []
+        with open(file_path, "r") as f:
+            return _parse_mcp_file_content(f.read(), file_path)
+
+    # Resolve the path relative to the file's own directory so this works from any cwd
+    file_dir = os.path.dirname(os.path.abspath(file_path))
+    result = subprocess.run(
+        ["git", "show", f"{revision}:./{os.path.basename(file_path)}"],
+        cwd=file_dir,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        logger.info(f"{file_path} does not exist at {revision}: {result.stderr.strip()}")
+        return []
+    return _parse_mcp_file_content(result.stdout, f"{revision}:{file_path}")
+
+
+def create_aspect_delete_mcp(mcp: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Create a DELETE MCP removing the aspect of a staged MCP
+
+    Args:
+        mcp: MCP dictionary whose aspect should be deleted
+
+    Returns:
+        DELETE MCP dictionary
+    """
+    return {
+        "entityType": mcp.get("entityType"),
+        "entityUrn": mcp.get("entityUrn"),
+        "changeType": "DELETE",
+        "aspectName": mcp.get("aspectName"),
+    }
+
+
+def compute_delta_mcps(
+    base_mcps: List[Dict[str, Any]],
+    head_mcps: List[Dict[str, Any]],
+    include_deletions: bool = True,
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Compute the MCPs needed to move DataHub from the base to the head staged state
+
+    Args:
+        base_mcps: MCPs in the base revision of the staged file
+        head_mcps: MCPs in the head revision of the staged file
+        include_deletions: Whether to emit DELETE MCPs for removed aspects
+
+    Returns:
+        Tuple of the delta MCPs (head order, deletions last) and counts of
+        added, changed, deleted and unchanged aspects
+    """
+    base_fingerprints = fingerprint_mcps(base_mcps)
+    head_fingerprints = fingerprint_mcps(head_mcps)
+
+    # When a key is staged more than once the last MCP wins, as it would on ingestion
+    head_latest = {mcp_key(mcp): mcp for mcp in head_mcps if isinstance(mcp, dict)}
+    base_latest = {mcp_key(mcp): mcp for mcp in base_mcps if isinstance(mcp, dict)}
+
+    delta = []
+    stats = {"added": 0, "changed": 0, "deleted": 0, "unchanged": 0}
+    for key, mcp in head_latest.items():
+        if key not in base_fingerprints:
+            stats["added"] += 1
+        elif base_fingerprints[key] != head_fingerprints[key]:
+            stats["changed"] += 1
+        else:
+            stats["unchanged"] += 1
+            continue
+        delta.append(mcp)
+
+    if include_deletions:
+        for key, mcp in base_latest.items():
+            if key not in head_fingerprints:
+                stats["deleted"] += 1
+                delta.append(create_aspect_delete_mcp(mcp))
+
+    return delta, stats
+
+
+def main():
+    args = parse_args()
+    setup_logging(args.log_level)
+
+    base = args.base if args.base and args.base != NULL_REVISION else None
+    try:
+        head_mcps = read_mcps_at_revision(args.file, args.head)
+        if base is None:
+            logger.info("No base revision, emitting every staged MCP")
+            base_mcps = []
+        else:
+            base_mcps = read_mcps_at_revision(args.file, base)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    delta, stats = compute_delta_mcps(base_mcps, head_mcps, include_deletions=not args.no_deletions)
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, "w") as f:
+        json.dump(delta, f, indent=2)
+
+    logger.info(
+        f"Wrote {len(delta)} MCPs to {args.output} "
+        f"({stats['added']} added, {stats['changed']} changed, {stats['deleted']} deleted, "
+        f"{stats['unchanged']} unchanged)"
+    )
+
+
+if __name__ == "__main__":
+    main()
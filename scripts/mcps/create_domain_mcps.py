@@ -9,7 +9,7 @@ import logging
 import os
 import sys
 import time
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, Iterable, List
 
 # Add parent directory to sys.path
 sys.path.append(
@@ -59,6 +59,7 @@ except ImportError:
     sys.exit(1)
 
 from utils.urn_utils import generate_unified_urn
+from scripts.mcps.staging_utils import include_aspect, save_mcp_to_file
 
 
 logger = logging.getLogger(__name__)
@@ -596,77 +597,6 @@ def create_domain_display_properties_mcp(
     return mcp.to_obj()
 
 
-def save_mcp_to_file(mcp: Dict[str, Any], output_path: str, enable_dedup: bool = True) -> bool:
-    """
-    Save an MCP to a JSON file with optional deduplication
-    
-    Args:
-        mcp: The MCP dictionary to save
-        output_path: Path where to save the file
-        enable_dedup: Whether to enable deduplication (skip if file exists with same content)
-    
-    Returns:
-        True if file was created/updated, False if skipped due to deduplication
-    """
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    if enable_dedup and os.path.exists(output_path):
-        # Check if the content is the same
-        try:
-            with open(output_path, 'r') as f:
-                existing_mcp = json.load(f)
-            
-            # Remove timestamp fields for comparison
-            mcp_copy = json.loads(json.dumps(mcp))
-            existing_copy = json.loads(json.dumps(existing_mcp))
-            _remove_timestamp_fields(mcp_copy)
-            _remove_timestamp_fields(existing_copy)
-            
-            if _mcps_are_equal(mcp_copy, existing_copy):
-                logger.debug(f"Skipping {output_path} - content unchanged")
-                return False
-        except (json.JSONDecodeError, KeyError):
-            # If we can't read/parse the existing file, overwrite it
-            pass
-    
-    # Write the file
-    with open(output_path, 'w') as f:
-        json.dump(mcp, f, indent=2)
-    
-    logger.info(f"Created MCP file: {output_path}")
-    return True
-
-
-def _mcps_are_equal(mcp1: Dict[str, Any], mcp2: Dict[str, Any]) -> bool:
-    """
-    Compare two MCPs for equality, ignoring timestamp fields
-    """
-    try:
-        return json.dumps(mcp1, sort_keys=True) == json.dumps(mcp2, sort_keys=True)
-    except Exception:
-        return False
-
-
-def _remove_timestamp_fields(mcp: Dict[str, Any]) -> None:
-    """
-    Remove timestamp fields from MCP for comparison purposes
-    """
-    if isinstance(mcp, dict):
-        # Remove common timestamp fields
-        timestamp_fields = ['time', 'created', 'lastModified', 'lastComputed']
-        for field in timestamp_fields:
-            mcp.pop(field, None)
-        
-        # Recursively process nested objects
-        for value in mcp.values():
-            if isinstance(value, dict):
-                _remove_timestamp_fields(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        _remove_timestamp_fields(item)
-
 
 def parse_args():
     """Parse command line arguments"""
@@ -812,6 +742,7 @@ def create_domain_staged_changes(
     include_all_aspects: bool = True,
     custom_aspects: Optional[Dict[str, Any]] = None,
     custom_urn: Optional[str] = None,
+    aspects: Optional[Iterable[str]] = None,
     **kwargs
 ) -> List[Dict[str, Any]]:
     """
@@ -833,6 +764,7 @@ def create_domain_staged_changes(
         parent_domain: Parent domain URN
         include_all_aspects: Whether to include all supported aspects
         custom_aspects: Custom aspects dictionary
+        aspects: Optional names of the aspects to create (default: all)
         **kwargs: Additional arguments
     
     Returns:
@@ -844,18 +776,19 @@ def create_domain_staged_changes(
     domain_id = effective_urn.split(":")[-1]
     
     # 1. Domain Properties (always include)
-    properties_mcp = create_domain_properties_mcp(
-        domain_urn=effective_urn,
-        domain_name=name,
-        owner=owners[0] if owners else "admin",
-        description=description,
-        parent_domain_urn=parent_domain,
-        custom_properties=custom_properties or {}
-    )
-    mcps.append(properties_mcp)
+    if include_aspect(aspects, "domainProperties"):
+        properties_mcp = create_domain_properties_mcp(
+            domain_urn=effective_urn,
+            domain_name=name,
+            owner=owners[0] if owners else "admin",
+            description=description,
+            parent_domain_urn=parent_domain,
+            custom_properties=custom_properties or {}
+        )
+        mcps.append(properties_mcp)
     
     # 2. Ownership (always include)
-    if owners:
+    if owners and include_aspect(aspects, "ownership"):
         ownership_mcp = create_domain_ownership_mcp(
         domain_urn=effective_urn,
             owner=owners[0]
@@ -863,7 +796,7 @@ def create_domain_staged_changes(
         mcps.append(ownership_mcp)
     
     # 3. Global Tags (if tags provided)
-    if tags:
+    if tags and include_aspect(aspects, "globalTags"):
         tags_mcp = create_domain_global_tags_mcp(
         domain_urn=effective_urn,
             tags=tags,
@@ -872,7 +805,7 @@ def create_domain_staged_changes(
         mcps.append(tags_mcp)
     
     # 4. Glossary Terms (if terms provided)
-    if terms:
+    if terms and include_aspect(aspects, "glossaryTerms"):
         terms_mcp = create_domain_glossary_terms_mcp(
         domain_urn=effective_urn,
             glossary_terms=terms,
@@ -881,7 +814,7 @@ def create_domain_staged_changes(
         mcps.append(terms_mcp)
     
     # 5. Institutional Memory (if links provided)
-    if links:
+    if links and include_aspect(aspects, "institutionalMemory"):
         memory_mcp = create_domain_institutional_memory_mcp(
         domain_urn=effective_urn,
             memory_elements=links,
@@ -890,7 +823,7 @@ def create_domain_staged_changes(
         mcps.append(memory_mcp)
     
     # 6. Structured Properties (if provided)
-    if structured_properties:
+    if structured_properties and include_aspect(aspects, "structuredProperties"):
         props_mcp = create_domain_structured_properties_mcp(
         domain_urn=effective_urn,
             properties=structured_properties,
@@ -899,7 +832,7 @@ def create_domain_staged_changes(
         mcps.append(props_mcp)
     
     # 7. Forms (if provided)
-    if forms:
+    if forms and include_aspect(aspects, "forms"):
         forms_mcp = create_domain_forms_mcp(
         domain_urn=effective_urn,
             completed_forms=[f.get("urn") for f in forms if f.get("urn")]
@@ -907,7 +840,7 @@ def create_domain_staged_changes(
         mcps.append(forms_mcp)
     
     # 8. Test Results (if provided)
-    if test_results:
+    if test_results and include_aspect(aspects, "testResults"):
         test_mcp = create_domain_test_results_mcp(
         domain_urn=effective_urn,
             owner=owners[0] if owners else "admin",
@@ -917,7 +850,7 @@ def create_domain_staged_changes(
         mcps.append(test_mcp)
     
     # 9. Display Properties (if provided)
-    if display_properties:
+    if display_properties and include_aspect(aspects, "displayProperties"):
         display_mcp = create_domain_display_properties_mcp(
         domain_urn=effective_urn,
             color_hex=display_properties.get("colorHex"),
@@ -1005,68 +938,3 @@ def save_mcps_to_files(
     
     return saved_files
 
-
-def _mcps_are_equal(mcp1: Dict[str, Any], mcp2: Dict[str, Any]) -> bool:
-    """
-    Compare two MCP dictionaries for equality, ignoring timestamp fields
-    
-    Args:
-        mcp1: First MCP dictionary
-        mcp2: Second MCP dictionary
-    
-    Returns:
-        True if MCPs are functionally equivalent, False otherwise
-    """
-    try:
-        # Create deep copies to avoid modifying originals
-        import copy
-        mcp1_copy = copy.deepcopy(mcp1)
-        mcp2_copy = copy.deepcopy(mcp2)
-        
-        # Remove timestamp fields that change on every run
-        _remove_timestamp_fields(mcp1_copy)
-        _remove_timestamp_fields(mcp2_copy)
-        
-        # Compare the sanitized MCPs
-        return mcp1_copy == mcp2_copy
-    except Exception as e:
-        logger.warning(f"Error comparing MCPs: {e}")
-        return False
-
-
-def _remove_timestamp_fields(mcp: Dict[str, Any]) -> None:
-    """
-    Remove timestamp fields from MCP dictionary (modifies in place)
-    
-    Args:
-        mcp: MCP dictionary to modify
-    """
-    try:
-        # Remove common timestamp fields
-        if isinstance(mcp, dict):
-            # Remove auditStamp timestamps
-            if "aspect" in mcp and isinstance(mcp["aspect"], dict):
-                aspect = mcp["aspect"]
-                
-                # Remove timestamps from ownership aspect
-                if "lastModified" in aspect and isinstance(aspect["lastModified"], dict):
-                    if "time" in aspect["lastModified"]:
-                        del aspect["lastModified"]["time"]
-                
-                # Remove timestamps from any other audit stamps
-                for key, value in aspect.items():
-                    if isinstance(value, dict) and "time" in value:
-                        del value["time"]
-                    elif isinstance(value, list):
-                        for item in value:
-                            if isinstance(item, dict) and "time" in item:
-                                del item["time"]
-            
-            # Remove any top-level timestamp fields
-            if "systemMetadata" in mcp and isinstance(mcp["systemMetadata"], dict):
-                if "lastObserved" in mcp["systemMetadata"]:
-                    del mcp["systemMetadata"]["lastObserved"]
-                if "runId" in mcp["systemMetadata"]:
-                    del mcp["systemMetadata"]["runId"]
-    except Exception as e:
-        logger.warning(f"Error removing timestamp fields: {e}")
\ No newline at end of file
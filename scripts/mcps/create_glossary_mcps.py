@@ -9,7 +9,7 @@ import logging
 import os
 import sys
 import time
-from typing import Dict, Optional, Any, List
+from typing import Dict, Optional, Any, Iterable, List
 
 # Add parent directory to sys.path
 sys.path.append(
@@ -74,6 +74,7 @@ except ImportError:
 
 # Import local utilities
 from utils.urn_utils import generate_unified_urn, extract_name_from_properties
+from scripts.mcps.staging_utils import include_aspect
 
 logger = logging.getLogger(__name__)
 
@@ -1146,6 +1147,7 @@ def create_comprehensive_glossary_mcps(
     environment: Optional[str] = None,
     mutation_name: Optional[str] = None,
     custom_urn: Optional[str] = None,
+    aspects: Optional[Iterable[str]] = None,
 ) -> List[Dict[str, Any]]:
     """
     Create comprehensive MCPs for a glossary entity using all available backend data
@@ -1156,6 +1158,8 @@ def create_comprehensive_glossary_mcps(
         owner: Owner username
         environment: Environment name (deprecated, use mutation_name instead)
         mutation_name: Mutation name for deterministic URN (optional)
+        custom_urn: Custom URN to use instead of generating one (optional)
+        aspects: Optional names of the aspects to create (default: all)
     
     Returns:
         List of MCP dictionaries
@@ -1164,179 +1168,195 @@ def create_comprehensive_glossary_mcps(
     
     # Determine DataHub entity type
     datahub_entity_type = "glossaryNode" if entity_type == "node" else "glossaryTerm"
+    info_aspect = "glossaryNodeInfo" if entity_type == "node" else "glossaryTermInfo"
     
     # 1. Core info MCP (always created) - KEY ASPECT
-    try:
-        if entity_type == "node":
-            info_mcp = create_glossary_node_info_mcp(
-                entity_data, owner, environment, mutation_name, custom_urn
-            )
-        else:
-            info_mcp = create_glossary_term_info_mcp(
-                entity_data, owner, environment, mutation_name, custom_urn
-            )
-        mcps.append(info_mcp)
-        logger.info(f"Created info MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.error(f"Failed to create info MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
-        # Info MCP is critical, so we should still try to continue but log the error
+    if include_aspect(aspects, info_aspect):
+        try:
+            if entity_type == "node":
+                info_mcp = create_glossary_node_info_mcp(
+                    entity_data, owner, environment, mutation_name, custom_urn
+                )
+            else:
+                info_mcp = create_glossary_term_info_mcp(
+                    entity_data, owner, environment, mutation_name, custom_urn
+                )
+            mcps.append(info_mcp)
+            logger.info(f"Created info MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.error(f"Failed to create info MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+            # Info MCP is critical, so we should still try to continue but log the error
     
     # 2. Ownership MCP (always created) - CORE ASPECT
-    try:
-        ownership_mcp = create_glossary_ownership_mcp(
-            entity_data, datahub_entity_type, owner, environment, mutation_name, custom_urn
-        )
-        mcps.append(ownership_mcp)
-        logger.info(f"Created ownership MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create ownership MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "ownership"):
+        try:
+            ownership_mcp = create_glossary_ownership_mcp(
+                entity_data, datahub_entity_type, owner, environment, mutation_name, custom_urn
+            )
+            mcps.append(ownership_mcp)
+            logger.info(f"Created ownership MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create ownership MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 3. Status MCP (always created) - CORE ASPECT
-    try:
-        status_mcp = create_glossary_status_mcp(
-            entity_data, datahub_entity_type, environment, mutation_name
-        )
-        mcps.append(status_mcp)
-        logger.info(f"Created status MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create status MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "status"):
+        try:
+            status_mcp = create_glossary_status_mcp(
+                entity_data, datahub_entity_type, environment, mutation_name
+            )
+            mcps.append(status_mcp)
+            logger.info(f"Created status MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create status MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 4. Global Tags MCP (if tags exist) - COMMON ASPECT
-    try:
-        tags_mcp = create_glossary_global_tags_mcp(
-            entity_data, datahub_entity_type, owner, environment, mutation_name
-        )
-        if tags_mcp:
-            mcps.append(tags_mcp)
-            logger.info(f"Created global tags MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create global tags MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "globalTags"):
+        try:
+            tags_mcp = create_glossary_global_tags_mcp(
+                entity_data, datahub_entity_type, owner, environment, mutation_name
+            )
+            if tags_mcp:
+                mcps.append(tags_mcp)
+                logger.info(f"Created global tags MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create global tags MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 5. Glossary Terms MCP (if glossary terms exist) - COMMON ASPECT
-    try:
-        terms_mcp = create_glossary_terms_mcp(
-            entity_data, datahub_entity_type, owner, environment, mutation_name
-        )
-        if terms_mcp:
-            mcps.append(terms_mcp)
-            logger.info(f"Created glossary terms MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create glossary terms MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "glossaryTerms"):
+        try:
+            terms_mcp = create_glossary_terms_mcp(
+                entity_data, datahub_entity_type, owner, environment, mutation_name
+            )
+            if terms_mcp:
+                mcps.append(terms_mcp)
+                logger.info(f"Created glossary terms MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create glossary terms MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 6. Browse Paths MCP (if browse paths exist) - SUPPORTED FOR TERMS
-    try:
-        browse_mcp = create_glossary_browse_paths_mcp(
-            entity_data, datahub_entity_type, environment, mutation_name
-        )
-        if browse_mcp:
-            mcps.append(browse_mcp)
-            logger.info(f"Created browse paths MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create browse paths MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "browsePaths"):
+        try:
+            browse_mcp = create_glossary_browse_paths_mcp(
+                entity_data, datahub_entity_type, environment, mutation_name
+            )
+            if browse_mcp:
+                mcps.append(browse_mcp)
+                logger.info(f"Created browse paths MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create browse paths MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 7. Institutional Memory MCP (if memory elements exist) - COMMON ASPECT
-    try:
-        memory_mcp = create_glossary_institutional_memory_mcp(
-            entity_data, datahub_entity_type, owner, environment, mutation_name
-        )
-        if memory_mcp:
-            mcps.append(memory_mcp)
-            logger.info(f"Created institutional memory MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create institutional memory MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "institutionalMemory"):
+        try:
+            memory_mcp = create_glossary_institutional_memory_mcp(
+                entity_data, datahub_entity_type, owner, environment, mutation_name
+            )
+            if memory_mcp:
+                mcps.append(memory_mcp)
+                logger.info(f"Created institutional memory MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create institutional memory MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 8. Display Properties MCP (if color_hex exists) - VISUAL ASPECT
-    try:
-        display_mcp = create_glossary_display_properties_mcp(
-            entity_data, datahub_entity_type, environment, mutation_name
-        )
-        if display_mcp:
-            mcps.append(display_mcp)
-            logger.info(f"Created display properties MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create display properties MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
-    
-    # 9. Deprecation MCP (if deprecated) - LIFECYCLE ASPECT
-    try:
-        if entity_data.get("deprecated", False):
-            deprecation_mcp = create_glossary_deprecation_mcp(
+    if include_aspect(aspects, "displayProperties"):
+        try:
+            display_mcp = create_glossary_display_properties_mcp(
                 entity_data, datahub_entity_type, environment, mutation_name
             )
-            if deprecation_mcp:
-                mcps.append(deprecation_mcp)
-                logger.info(f"Created deprecation MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create deprecation MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+            if display_mcp:
+                mcps.append(display_mcp)
+                logger.info(f"Created display properties MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create display properties MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    
+    # 9. Deprecation MCP (if deprecated) - LIFECYCLE ASPECT
+    if include_aspect(aspects, "deprecation"):
+        try:
+            if entity_data.get("deprecated", False):
+                deprecation_mcp = create_glossary_deprecation_mcp(
+                    entity_data, datahub_entity_type, environment, mutation_name
+                )
+                if deprecation_mcp:
+                    mcps.append(deprecation_mcp)
+                    logger.info(f"Created deprecation MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create deprecation MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # TERM-SPECIFIC ASPECTS
     if entity_type == "term":
         # 10. Related Terms MCP (only for terms, if related terms exist) - TERM-SPECIFIC
-        try:
-            related_mcp = create_glossary_related_terms_mcp(
-                entity_data, environment, mutation_name
-            )
-            if related_mcp:
-                mcps.append(related_mcp)
-                logger.info(f"Created related terms MCP for term {entity_data.get('id', 'unknown')}")
-        except Exception as e:
-            logger.warning(f"Failed to create related terms MCP for term {entity_data.get('id', 'unknown')}: {str(e)}")
+        if include_aspect(aspects, "glossaryRelatedTerms"):
+            try:
+                related_mcp = create_glossary_related_terms_mcp(
+                    entity_data, environment, mutation_name
+                )
+                if related_mcp:
+                    mcps.append(related_mcp)
+                    logger.info(f"Created related terms MCP for term {entity_data.get('id', 'unknown')}")
+            except Exception as e:
+                logger.warning(f"Failed to create related terms MCP for term {entity_data.get('id', 'unknown')}: {str(e)}")
         
         # 11. Domains MCP (only for terms, if domain exists) - TERM-SPECIFIC
-        try:
-            domains_mcp = create_glossary_domains_mcp(
-                entity_data, owner, environment, mutation_name
-            )
-            if domains_mcp:
-                mcps.append(domains_mcp)
-                logger.info(f"Created domains MCP for term {entity_data.get('id', 'unknown')}")
-        except Exception as e:
-            logger.warning(f"Failed to create domains MCP for term {entity_data.get('id', 'unknown')}: {str(e)}")
+        if include_aspect(aspects, "domains"):
+            try:
+                domains_mcp = create_glossary_domains_mcp(
+                    entity_data, owner, environment, mutation_name
+                )
+                if domains_mcp:
+                    mcps.append(domains_mcp)
+                    logger.info(f"Created domains MCP for term {entity_data.get('id', 'unknown')}")
+            except Exception as e:
+                logger.warning(f"Failed to create domains MCP for term {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # NEW ASPECTS - Additional common aspects that could be supported
     
     # 12. Data Platform Instance MCP (if platform instance exists)
-    try:
-        platform_instance_mcp = create_glossary_data_platform_instance_mcp(
-            entity_data, datahub_entity_type, environment, mutation_name
-        )
-        if platform_instance_mcp:
-            mcps.append(platform_instance_mcp)
-            logger.info(f"Created data platform instance MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create data platform instance MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "dataPlatformInstance"):
+        try:
+            platform_instance_mcp = create_glossary_data_platform_instance_mcp(
+                entity_data, datahub_entity_type, environment, mutation_name
+            )
+            if platform_instance_mcp:
+                mcps.append(platform_instance_mcp)
+                logger.info(f"Created data platform instance MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create data platform instance MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 13. Sub Types MCP (if sub types exist)
-    try:
-        subtypes_mcp = create_glossary_subtypes_mcp(
-            entity_data, datahub_entity_type, environment, mutation_name
-        )
-        if subtypes_mcp:
-            mcps.append(subtypes_mcp)
-            logger.info(f"Created sub types MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create sub types MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "subTypes"):
+        try:
+            subtypes_mcp = create_glossary_subtypes_mcp(
+                entity_data, datahub_entity_type, environment, mutation_name
+            )
+            if subtypes_mcp:
+                mcps.append(subtypes_mcp)
+                logger.info(f"Created sub types MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create sub types MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 14. Forms MCP (if forms exist)
-    try:
-        forms_mcp = create_glossary_forms_mcp(
-            entity_data, datahub_entity_type, owner, environment, mutation_name
-        )
-        if forms_mcp:
-            mcps.append(forms_mcp)
-            logger.info(f"Created forms MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create forms MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "forms"):
+        try:
+            forms_mcp = create_glossary_forms_mcp(
+                entity_data, datahub_entity_type, owner, environment, mutation_name
+            )
+            if forms_mcp:
+                mcps.append(forms_mcp)
+                logger.info(f"Created forms MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create forms MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     # 15. Structured Properties MCP (if structured properties exist)
-    try:
-        structured_props_mcp = create_glossary_structured_properties_mcp(
-            entity_data, datahub_entity_type, owner, environment, mutation_name
-        )
-        if structured_props_mcp:
-            mcps.append(structured_props_mcp)
-            logger.info(f"Created structured properties MCP for {entity_type} {entity_data.get('id', 'unknown')}")
-    except Exception as e:
-        logger.warning(f"Failed to create structured properties MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
+    if include_aspect(aspects, "structuredProperties"):
+        try:
+            structured_props_mcp = create_glossary_structured_properties_mcp(
+                entity_data, datahub_entity_type, owner, environment, mutation_name
+            )
+            if structured_props_mcp:
+                mcps.append(structured_props_mcp)
+                logger.info(f"Created structured properties MCP for {entity_type} {entity_data.get('id', 'unknown')}")
+        except Exception as e:
+            logger.warning(f"Failed to create structured properties MCP for {entity_type} {entity_data.get('id', 'unknown')}: {str(e)}")
     
     logger.info(f"Created {len(mcps)} MCPs total for {entity_type} {entity_data.get('id', 'unknown')}")
     return mcps
@@ -45,6 +45,7 @@ except ImportError:
     sys.exit(1)
 
 from utils.urn_utils import generate_unified_urn
+from scripts.mcps.staging_utils import save_mcp_to_file
 
 
 logger = logging.getLogger(__name__)
@@ -275,77 +276,6 @@ def create_structured_property_institutional_memory_mcp(
     return mcp.to_obj()
 
 
-def save_mcp_to_file(mcp: Dict[str, Any], output_path: str, enable_dedup: bool = True) -> bool:
-    """
-    Save an MCP to a JSON file with optional deduplication
-    
-    Args:
-        mcp: The MCP dictionary to save
-        output_path: Path where to save the file
-        enable_dedup: Whether to enable deduplication (skip if file exists with same content)
-    
-    Returns:
-        True if file was created/updated, False if skipped due to deduplication
-    """
-    # Create directory if it doesn't exist
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
-    
-    if enable_dedup and os.path.exists(output_path):
-        # Check if the content is the same
-        try:
-            with open(output_path, 'r') as f:
-                existing_mcp = json.load(f)
-            
-            # Remove timestamp fields for comparison
-            mcp_copy = json.loads(json.dumps(mcp))
-            existing_copy = json.loads(json.dumps(existing_mcp))
-            _remove_timestamp_fields(mcp_copy)
-            _remove_timestamp_fields(existing_copy)
-            
-            if _mcps_are_equal(mcp_copy, existing_copy):
-                logger.debug(f"Skipping {output_path} - content unchanged")
-                return False
-        except (json.JSONDecodeError, KeyError):
-            # If we can't read/parse the existing file, overwrite it
-            pass
-    
-    # Write the file
-    with open(output_path, 'w') as f:
-        json.dump(mcp, f, indent=2)
-    
-    logger.info(f"Created MCP file: {output_path}")
-    return True
-
-
-def _mcps_are_equal(mcp1: Dict[str, Any], mcp2: Dict[str, Any]) -> bool:
-    """
-    Compare two MCPs for equality, ignoring timestamp fields
-    """
-    try:
-        return json.dumps(mcp1, sort_keys=True) == json.dumps(mcp2, sort_keys=True)
-    except Exception:
-        return False
-
-
-def _remove_timestamp_fields(mcp: Dict[str, Any]) -> None:
-    """
-    Remove timestamp fields from MCP for comparison purposes
-    """
-    if isinstance(mcp, dict):
-        # Remove common timestamp fields
-        timestamp_fields = ['time', 'created', 'lastModified', 'lastComputed']
-        for field in timestamp_fields:
-            mcp.pop(field, None)
-        
-        # Recursively process nested objects
-        for value in mcp.values():
-            if isinstance(value, dict):
-                _remove_timestamp_fields(value)
-            elif isinstance(value, list):
-                for item in value:
-                    if isinstance(item, dict):
-                        _remove_timestamp_fields(item)
-
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Create Structured Property MCPs")
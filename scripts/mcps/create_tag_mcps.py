@@ -4,7 +4,6 @@ Script to create MCP (Metadata Change Proposal) files for tags in DataHub
 """
 
 import argparse
-import json
 import logging
 import os
 import sys
@@ -31,6 +30,7 @@ except ImportError:
     sys.exit(1)
 
 from utils.urn_utils import generate_unified_urn
+from scripts.mcps.staging_utils import save_mcp_to_file
 
 
 logger = logging.getLogger(__name__)
@@ -227,114 +227,6 @@ def create_tag_ownership_mcp(
     return mcp.to_obj()
 
 
-def save_mcp_to_file(mcp: Dict[str, Any], output_path: str, enable_dedup: bool = True) -> bool:
-    """
-    Save an MCP dictionary to a JSON file with optional deduplication
-
-    Args:
-        mcp: The MCP dictionary
-        output_path: File path to save to
-        enable_dedup: Whether to enable deduplication (default: True)
-
-    Returns:
-        True if file was saved, False if skipped due to deduplication
-    """
-    try:
-        # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        # Check for deduplication if enabled
-        if enable_dedup and os.path.exists(output_path):
-            try:
-                with open(output_path, 'r') as f:
-                    existing_mcp = json.load(f)
-                
-                # Compare the MCPs for equality
-                if _mcps_are_equal(existing_mcp, mcp):
-                    logger.info(f"MCP file unchanged, skipping: {output_path}")
-                    return False
-                else:
-                    logger.info(f"MCP file changed, updating: {output_path}")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not read existing MCP file for comparison: {e}")
-                # Continue with saving if we can't read the existing file
-        
-        # Write to file
-        with open(output_path, 'w') as f:
-            json.dump(mcp, f, indent=2, default=str)
-            
-        logger.info(f"Saved MCP to: {output_path}")
-        return True
-    except Exception as e:
-        logger.error(f"Failed to save MCP: {str(e)}")
-        raise
-
-
-def _mcps_are_equal(mcp1: Dict[str, Any], mcp2: Dict[str, Any]) -> bool:
-    """
-    Compare two MCP dictionaries for equality, ignoring timestamp fields
-    
-    Args:
-        mcp1: First MCP dictionary
-        mcp2: Second MCP dictionary
-    
-    Returns:
-        True if MCPs are functionally equivalent, False otherwise
-    """
-    try:
-        # Create deep copies to avoid modifying originals
-        import copy
-        mcp1_copy = copy.deepcopy(mcp1)
-        mcp2_copy = copy.deepcopy(mcp2)
-        
-        # Remove timestamp fields that change on every run
-        _remove_timestamp_fields(mcp1_copy)
-        _remove_timestamp_fields(mcp2_copy)
-        
-        # Compare the sanitized MCPs
-        return mcp1_copy == mcp2_copy
-    except Exception as e:
-        logger.warning(f"Error comparing MCPs: {e}")
-        return False
-
-
-def _remove_timestamp_fields(mcp: Dict[str, Any]) -> None:
-    """
-    Remove timestamp fields from MCP dictionary (modifies in place)
-    
-    Args:
-        mcp: MCP dictionary to modify
-    """
-    try:
-        # Remove common timestamp fields
-        if isinstance(mcp, dict):
-            # Remove auditStamp timestamps
-            if "aspect" in mcp and isinstance(mcp["aspect"], dict):
-                aspect = mcp["aspect"]
-                
-                # Remove timestamps from ownership aspect
-                if "lastModified" in aspect and isinstance(aspect["lastModified"], dict):
-                    if "time" in aspect["lastModified"]:
-                        del aspect["lastModified"]["time"]
-                
-                # Remove timestamps from any other audit stamps
-                for key, value in aspect.items():
-                    if isinstance(value, dict) and "time" in value:
-                        del value["time"]
-                    elif isinstance(value, list):
-                        for item in value:
-                            if isinstance(item, dict) and "time" in item:
-                                del item["time"]
-            
-            # Remove any top-level timestamp fields
-            if "systemMetadata" in mcp and isinstance(mcp["systemMetadata"], dict):
-                if "lastObserved" in mcp["systemMetadata"]:
-                    del mcp["systemMetadata"]["lastObserved"]
-                if "runId" in mcp["systemMetadata"]:
-                    del mcp["systemMetadata"]["runId"]
-    except Exception as e:
-        logger.warning(f"Error removing timestamp fields: {e}")
-
 
 def main():
     """Main function"""
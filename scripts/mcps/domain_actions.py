@@ -2,6 +2,7 @@
 """
 Module providing functions for domain actions in the DataHub UI:
 - Add domain to staged changes
+- Bulk add domains to staged changes
 - Create comprehensive domain MCPs
 """
 
@@ -10,7 +11,7 @@ import logging
 import os
 import sys
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Iterable, Optional, List
 
 # Add the parent directory to the sys.path
 sys.path.append(
@@ -23,6 +24,15 @@ from scripts.mcps.create_domain_mcps import (
     create_domain_staged_changes,
     save_mcps_to_files
 )
+from scripts.mcps.staging_utils import (
+    MCP_FILE_NAME,
+    create_changed_mcps,
+    find_repo_root,
+    load_staged_mcps,
+    merge_staged_mcps,
+    save_mcp_to_file,
+    stage_mcps
+)
 
 logger = logging.getLogger(__name__)
 
@@ -122,6 +132,7 @@ def add_domain_to_staged_changes(
     environment: str = "dev",
     owner: str = "admin",
     base_dir: str = "metadata-manager",
+    aspects: Optional[Iterable[str]] = None,
     **kwargs
 ) -> Dict[str, Any]:
     """
@@ -146,6 +157,8 @@ def add_domain_to_staged_changes(
         environment: Environment name for URN generation
         owner: Owner username
         base_dir: Base directory for metadata files
+        aspects: Optional names of the changed aspects; only these are regenerated
+            when the domain is already staged
         **kwargs: Additional arguments
     
     Returns:
@@ -172,68 +185,9 @@ def add_domain_to_staged_changes(
             domain_urn = generate_urn_for_new_entity("domain", domain_id, environment, mutation_name)
             logger.info(f"Generated new domain URN: {domain_urn}")
         
-        # Create MCPs using the new comprehensive function
-        mcps = create_domain_staged_changes(
-            domain_urn=domain_urn,
-            name=name,
-            description=description,
-            owners=owners,
-            tags=tags,
-            terms=terms,
-            links=links,
-            custom_properties=custom_properties,
-            structured_properties=structured_properties,
-            forms=forms,
-            test_results=test_results,
-            display_properties=display_properties,
-            parent_domain=parent_domain,
-            include_all_aspects=include_all_aspects,
-            custom_aspects=custom_aspects,
-            custom_urn=None,
-            environment=environment,
-            mutation_name=mutation_name,
-            **kwargs
-        )
-        
-        if not mcps:
-            return {
-                "success": False,
-                "message": "Failed to create domain MCPs",
-                "domain_id": domain_id,
-                "mcps_created": 0,
-                "files_saved": []
-            }
-        
         # Determine output directory - use repo root metadata-manager instead of web_ui/metadata-manager
         if base_dir == "metadata-manager":
-            # Find repository root by looking for characteristic files
-            current_dir = os.path.abspath(os.getcwd())
-            repo_root = None
-            
-            # Search upwards for the repository root (look for README.md and scripts/ directory)
-            search_dir = current_dir
-            for _ in range(10):  # Limit search to avoid infinite loop
-                if (os.path.exists(os.path.join(search_dir, "README.md")) and 
-                    os.path.exists(os.path.join(search_dir, "scripts")) and
-                    os.path.exists(os.path.join(search_dir, "web_ui"))):
-                    repo_root = search_dir
-                    break
-                parent_dir = os.path.dirname(search_dir)
-                if parent_dir == search_dir:  # Reached filesystem root
-                    break
-                search_dir = parent_dir
-            
-            # Fallback: try to calculate from __file__ path
-            if not repo_root:
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                if "scripts/mcps" in script_dir:
-                    repo_root = os.path.dirname(os.path.dirname(script_dir))
-                else:
-                    # Last resort: assume we're in a subdirectory and go up
-                    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(script_dir)))
-            
-            output_dir = os.path.join(repo_root, "metadata-manager", environment, "domains")
-            logger.debug(f"Calculated repo root: {repo_root}, output dir: {output_dir}")
+            output_dir = os.path.join(find_repo_root(), "metadata-manager", environment, "domains")
         else:
             output_dir = os.path.join(base_dir, environment, "domains")
         
@@ -241,44 +195,54 @@ def add_domain_to_staged_changes(
         os.makedirs(output_dir, exist_ok=True)
         
         # Use constant filename like tags and structured properties
-        mcp_file_path = os.path.join(output_dir, "mcp_file.json")
+        mcp_file_path = os.path.join(output_dir, MCP_FILE_NAME)
+        existing_mcps = load_staged_mcps(mcp_file_path)
         
-        # Load existing MCP file or create new list - should be a simple list of MCPs
-        existing_mcps = []
-        if os.path.exists(mcp_file_path):
-            try:
-                with open(mcp_file_path, "r") as f:
-                    file_content = json.load(f)
-                    # Handle both old format (with metadata wrapper) and new format (simple list)
-                    if isinstance(file_content, list):
-                        existing_mcps = file_content
-                    elif isinstance(file_content, dict) and "mcps" in file_content:
-                        # Migrate from old format - extract just the MCPs
-                        existing_mcps = file_content["mcps"]
-                        logger.info(f"Migrating from old format - extracted {len(existing_mcps)} MCPs")
-                    else:
-                        logger.warning(f"Unknown MCP file format, starting fresh")
-                        existing_mcps = []
-                logger.info(f"Loaded existing MCP file with {len(existing_mcps)} existing MCPs")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not load existing MCP file: {e}. Creating new file.")
-                existing_mcps = []
+        # Create MCPs using the comprehensive function (only the changed aspects if already staged)
+        mcps, aspects = create_changed_mcps(
+            lambda create_aspects: create_domain_staged_changes(
+                domain_urn=domain_urn,
+                name=name,
+                description=description,
+                owners=owners,
+                tags=tags,
+                terms=terms,
+                links=links,
+                custom_properties=custom_properties,
+                structured_properties=structured_properties,
+                forms=forms,
+                test_results=test_results,
+                display_properties=display_properties,
+                parent_domain=parent_domain,
+                include_all_aspects=include_all_aspects,
+                custom_aspects=custom_aspects,
+                custom_urn=None,
+                aspects=create_aspects,
+                environment=environment,
+                mutation_name=mutation_name,
+                **kwargs
+            ),
+            existing_mcps,
+            aspects,
+            entity_urn=domain_urn,
+        )
         
-        # Remove any existing MCPs for this domain URN to avoid duplicates
-        existing_mcps = [
-            mcp for mcp in existing_mcps 
-            if mcp.get("entityUrn") != domain_urn
-        ]
+        if not mcps and aspects is None:
+            return {
+                "success": False,
+                "message": "Failed to create domain MCPs",
+                "domain_id": domain_id,
+                "mcps_created": 0,
+                "files_saved": []
+            }
         
-        # Add new MCPs to the list
-        existing_mcps.extend(mcps)
+        # Replace the existing MCPs for this domain URN to avoid duplicates
+        existing_mcps = merge_staged_mcps(existing_mcps, mcps, aspects=aspects, entity_urns=[domain_urn])
         
         # Save updated MCP file as a simple list (like tags and structured properties)
         try:
-            with open(mcp_file_path, 'w') as f:
-                json.dump(existing_mcps, f, indent=2)
-            logger.info(f"Saved MCP file with {len(existing_mcps)} MCPs to: {mcp_file_path}")
-            saved_files = [mcp_file_path]
+            saved_files = [mcp_file_path] if save_mcp_to_file(existing_mcps, mcp_file_path) else []
+            logger.info(f"Staged {len(existing_mcps)} MCPs in: {mcp_file_path}")
         except Exception as e:
             logger.error(f"Failed to save MCP file: {e}")
             saved_files = []
@@ -308,6 +272,88 @@ def add_domain_to_staged_changes(
         }
 
 
+def bulk_add_domains_to_staged_changes(
+    domains: List[Dict[str, Any]],
+    environment: str = "dev",
+    owner: str = "admin",
+    base_dir: Optional[str] = None,
+    mutation_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Add many domains to staged changes in one pass. The mutation configuration is
+    resolved once for the whole batch, MCPs for every domain are generated in memory
+    and the staged MCP file is read and written exactly once.
+    
+    Args:
+        domains: List of dictionaries holding add_domain_to_staged_changes keyword
+            arguments (domain_id, name, description, owners, ..., existing_urn)
+        environment: Environment name for URN generation
+        owner: Owner username
+        base_dir: Optional output directory (defaults to metadata-manager/{environment}/domains in repo root)
+        mutation_name: Optional mutation name (defaults to environment)
+    
+    Returns:
+        Dictionary with success/error counts, errors, MCP count, the MCP file path
+        and the positions of the staged inputs
+    """
+    from utils.urn_utils import get_mutation_config_for_environment, generate_mutated_urn
+    
+    env_name = mutation_name or environment or "dev"
+    mutation_config = get_mutation_config_for_environment(env_name)
+    
+    new_mcps = []
+    success_count = 0
+    staged_indexes = []
+    errors = []
+    for index, domain in enumerate(domains):
+        domain_kwargs = dict(domain)
+        domain_id = domain_kwargs.pop("domain_id", None)
+        name = domain_kwargs.pop("name", None) or domain_id
+        existing_urn = domain_kwargs.get("existing_urn")
+        try:
+            if not domain_id:
+                raise ValueError("domain_id is required")
+            
+            if existing_urn:
+                domain_urn = generate_mutated_urn(existing_urn, env_name, "domain", mutation_config)
+            else:
+                domain_urn = generate_urn_for_new_entity("domain", domain_id, environment, env_name)
+            
+            mcps = create_domain_staged_changes(
+                domain_urn=domain_urn,
+                name=name,
+                custom_urn=None,
+                environment=environment,
+                mutation_name=env_name,
+                **domain_kwargs
+            )
+            if not mcps:
+                raise ValueError("Failed to create domain MCPs")
+            
+            new_mcps.extend(mcps)
+            success_count += 1
+            staged_indexes.append(index)
+        except Exception as e:
+            errors.append(f"Domain {name}: {str(e)}")
+            logger.error(f"Error creating MCPs for domain {name}: {str(e)}")
+    
+    mcp_file_path = None
+    if new_mcps:
+        mcp_file_path = stage_mcps(new_mcps, environment, "domains", base_dir)
+    
+    logger.info(f"Bulk added {success_count} domains to staged changes with {len(new_mcps)} MCPs ({len(errors)} failed)")
+    
+    return {
+        "success_count": success_count,
+        "error_count": len(errors),
+        "errors": errors,
+        "mcps_created": len(new_mcps),
+        "mcp_file": mcp_file_path,
+        # Positions of the inputs whose MCPs were written to the staged file
+        "staged_indexes": staged_indexes if mcp_file_path else [],
+    }
+
+
 def add_domain_to_staged_changes_legacy(
     domain_data: Dict[str, Any],
     environment: str = "dev",
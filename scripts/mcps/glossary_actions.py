@@ -4,6 +4,7 @@ Module providing functions for glossary actions in the DataHub UI:
 - Download glossary JSON
 - Sync glossary to local database
 - Add glossary to staged changes
+- Bulk add glossary nodes and terms to staged changes
 """
 
 import json
@@ -11,7 +12,7 @@ import logging
 import os
 import sys
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional
 
 # Add the parent directory to the sys.path
 sys.path.append(
@@ -24,6 +25,12 @@ from scripts.mcps.create_glossary_mcps import (
     create_comprehensive_glossary_mcps,
     save_mcp_to_file
 )
+from scripts.mcps.staging_utils import (
+    create_changed_mcps,
+    load_staged_mcps,
+    merge_staged_mcps,
+    stage_mcps
+)
 
 # Try to import the new URN generation utilities
 try:
@@ -96,13 +103,90 @@ def extract_entity_id_from_urn(urn: str, entity_type: str) -> str:
     return urn.split(":")[-1]
 
 
+def _get_mutation_config(environment: str) -> Optional[Dict[str, Any]]:
+    """
+    Resolve the mutation configuration for an environment (None if unavailable)
+
+    Args:
+        environment: Environment name
+
+    Returns:
+        Mutation configuration dictionary or None
+    """
+    if not HAS_NEW_URN_UTILS:
+        return None
+    try:
+        mutation_config = get_mutation_config_for_environment(environment)
+        logger.info(f"Using mutation config for environment '{environment}': {mutation_config is not None}")
+        return mutation_config
+    except Exception as e:
+        logger.warning(f"Could not get mutation config for environment '{environment}': {e}")
+        return None
+
+
+def _create_glossary_entity_mcps(
+    entity_data: Dict[str, Any],
+    entity_type: str,
+    environment: str,
+    owner: str,
+    mutation_name: Optional[str] = None,
+    mutation_config: Optional[Dict[str, Any]] = None,
+    aspects: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Create the comprehensive MCPs for a single glossary node or term
+
+    Args:
+        entity_data: Glossary entity data as a dictionary
+        entity_type: Type of entity ("node" or "term")
+        environment: Environment name
+        owner: Owner username
+        mutation_name: Optional mutation name for deterministic URN generation
+        mutation_config: Mutation configuration already resolved for the environment
+        aspects: Optional names of the aspects to create (default: all)
+
+    Returns:
+        List of MCP dictionaries (info MCP first)
+    """
+    entity_id = entity_data.get("id")
+    if not entity_id:
+        raise ValueError(f"Entity ID is required for {entity_type}")
+    
+    # Generate mutated URN based on entity type
+    custom_urn = None
+    original_urn = entity_data.get("urn")
+    if HAS_NEW_URN_UTILS and mutation_config and original_urn:
+        if entity_type == "term":
+            mutated_urn = generate_glossary_term_urn(original_urn, environment, mutation_config)
+        elif entity_type == "node":
+            mutated_urn = generate_glossary_node_urn(original_urn, environment, mutation_config)
+        else:
+            mutated_urn = original_urn
+        
+        if mutated_urn != original_urn:
+            custom_urn = mutated_urn
+            logger.info(f"Generated mutated URN for {entity_type}: {original_urn} -> {mutated_urn}")
+    
+    logger.info(f"Creating comprehensive MCPs for {entity_type} '{entity_data.get('name', entity_id)}'...")
+    return create_comprehensive_glossary_mcps(
+        entity_data=entity_data,
+        entity_type=entity_type,
+        owner=owner,
+        environment=environment,
+        mutation_name=mutation_name,
+        custom_urn=custom_urn,
+        aspects=aspects
+    )
+
+
 def add_glossary_to_staged_changes(
     entity_data: Dict[str, Any], 
     entity_type: str,  # "node" or "term"
     environment: str, 
     owner: str,
     base_dir: Optional[str] = None,
-    mutation_name: Optional[str] = None
+    mutation_name: Optional[str] = None,
+    aspects: Optional[Iterable[str]] = None
 ) -> Dict[str, str]:
     """
     Add glossary entity to staged changes by creating a single MCP file containing all MCPs
@@ -114,6 +198,8 @@ def add_glossary_to_staged_changes(
         owner: Owner username
         base_dir: Optional base directory (defaults to metadata-manager/{environment} in repo root)
         mutation_name: Optional mutation name for deterministic URN generation
+        aspects: Optional names of the changed aspects; only these are regenerated
+            when the entity is already staged
 
     Returns:
         Dictionary with path to created MCP file
@@ -168,79 +254,28 @@ def add_glossary_to_staged_changes(
         # Use constant filename
         mcp_file_path = os.path.join(output_dir, "mcp_file.json")
         
-        # Load existing MCP file or create new list - should be a simple list of MCPs
-        existing_mcps = []
-        if os.path.exists(mcp_file_path):
-            try:
-                with open(mcp_file_path, "r") as f:
-                    file_content = json.load(f)
-                    # Handle both old format (with metadata wrapper) and new format (simple list)
-                    if isinstance(file_content, list):
-                        existing_mcps = file_content
-                    elif isinstance(file_content, dict) and "mcps" in file_content:
-                        # Migrate from old format - extract just the MCPs
-                        existing_mcps = file_content["mcps"]
-                        logger.info(f"Migrating from old format - extracted {len(existing_mcps)} MCPs")
-                    else:
-                        logger.warning(f"Unknown MCP file format, starting fresh")
-                        existing_mcps = []
-                logger.info(f"Loaded existing MCP file with {len(existing_mcps)} existing MCPs")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not load existing MCP file: {e}. Creating new file.")
-                existing_mcps = []
+        existing_mcps = load_staged_mcps(mcp_file_path)
+        mutation_config = _get_mutation_config(environment)
         
-        # Get mutation configuration for environment-based URN generation
-        mutation_config = None
-        custom_urn = None
-        if HAS_NEW_URN_UTILS:
-            try:
-                mutation_config = get_mutation_config_for_environment(environment)
-                if mutation_config:
-                    # Get the original URN from entity data
-                    original_urn = entity_data.get("urn")
-                    if original_urn:
-                        # Generate mutated URN based on entity type
-                        if entity_type == "term":
-                            mutated_urn = generate_glossary_term_urn(original_urn, environment, mutation_config)
-                        elif entity_type == "node":
-                            mutated_urn = generate_glossary_node_urn(original_urn, environment, mutation_config)
-                        else:
-                            mutated_urn = original_urn
-                        
-                        if mutated_urn != original_urn:
-                            custom_urn = mutated_urn
-                            logger.info(f"Generated mutated URN for {entity_type}: {original_urn} -> {mutated_urn}")
-                logger.info(f"Using mutation config for environment '{environment}': {mutation_config is not None}")
-            except Exception as e:
-                logger.warning(f"Could not get mutation config for environment '{environment}': {e}")
-
-        # Create comprehensive MCPs using all backend data
-        logger.info(f"Creating comprehensive MCPs for {entity_type} '{entity_name}'...")
-        new_mcps = create_comprehensive_glossary_mcps(
-            entity_data=entity_data,
-            entity_type=entity_type,
-            owner=owner,
-            environment=environment,
-            mutation_name=mutation_name,
-            custom_urn=custom_urn
+        # Create comprehensive MCPs using all backend data (only the changed aspects if already staged)
+        new_mcps, aspects = create_changed_mcps(
+            lambda create_aspects: _create_glossary_entity_mcps(
+                entity_data=entity_data,
+                entity_type=entity_type,
+                environment=environment,
+                owner=owner,
+                mutation_name=mutation_name,
+                mutation_config=mutation_config,
+                aspects=create_aspects,
+            ),
+            existing_mcps,
+            aspects,
         )
         
         logger.info(f"Created {len(new_mcps)} MCPs for {entity_type} '{entity_name}'")
         
-        # Remove any existing MCPs for this entity URN to avoid duplicates
-        # Get the entity URN from the first MCP (info MCP)
-        entity_entity_urn = None
-        if new_mcps:
-            entity_entity_urn = new_mcps[0].get("entityUrn")
-        
-        if entity_entity_urn:
-            existing_mcps = [
-                mcp for mcp in existing_mcps 
-                if mcp.get("entityUrn") != entity_entity_urn
-            ]
-        
-        # Add new MCPs to the list
-        existing_mcps.extend(new_mcps)
+        # Replace any existing MCPs for this entity URN to avoid duplicates
+        existing_mcps = merge_staged_mcps(existing_mcps, new_mcps, aspects=aspects)
         
         # Save updated MCP file as a simple list
         mcp_saved = save_mcp_to_file(existing_mcps, mcp_file_path)
@@ -327,4 +362,69 @@ def add_glossary_term_to_staged_changes(
     )
 
 
- 
\ No newline at end of file
+ 
+
+def bulk_add_glossary_to_staged_changes(
+    entities: List[Dict[str, Any]],
+    environment: str,
+    owner: str,
+    base_dir: Optional[str] = None,
+    mutation_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Add many glossary nodes and terms to staged changes in one pass. The mutation
+    configuration is resolved once, MCPs for every entity are generated in memory
+    and the staged MCP file is read and written exactly once.
+
+    Args:
+        entities: List of dictionaries with "entity_type" ("node" or "term") and
+            "entity_data" (same shape as add_glossary_to_staged_changes)
+        environment: Environment name (for directory structure)
+        owner: Owner username
+        base_dir: Optional output directory (defaults to metadata-manager/{environment}/glossary in repo root)
+        mutation_name: Optional mutation name for deterministic URN generation
+
+    Returns:
+        Dictionary with success/error counts, errors, MCP count, the MCP file path
+        and the positions of the staged inputs
+    """
+    mutation_config = _get_mutation_config(environment)
+    
+    new_mcps = []
+    success_count = 0
+    staged_indexes = []
+    errors = []
+    for index, entity in enumerate(entities):
+        entity_type = entity.get("entity_type")
+        entity_data = entity.get("entity_data") or {}
+        label = entity_data.get("name") or entity_data.get("id") or "unknown"
+        try:
+            new_mcps.extend(_create_glossary_entity_mcps(
+                entity_data=entity_data,
+                entity_type=entity_type,
+                environment=environment,
+                owner=owner,
+                mutation_name=mutation_name,
+                mutation_config=mutation_config,
+            ))
+            success_count += 1
+            staged_indexes.append(index)
+        except Exception as e:
+            errors.append(f"Glossary {entity_type} {label}: {str(e)}")
+            logger.error(f"Error creating MCPs for glossary {entity_type} {label}: {str(e)}")
+    
+    mcp_file_path = None
+    if new_mcps:
+        mcp_file_path = stage_mcps(new_mcps, environment, "glossary", base_dir)
+    
+    logger.info(f"Bulk added {success_count} glossary entities to staged changes with {len(new_mcps)} MCPs ({len(errors)} failed)")
+    
+    return {
+        "success_count": success_count,
+        "error_count": len(errors),
+        "errors": errors,
+        "mcps_created": len(new_mcps),
+        "mcp_file": mcp_file_path,
+        # Positions of the inputs whose MCPs were written to the staged file
+        "staged_indexes": staged_indexes if mcp_file_path else [],
+    }
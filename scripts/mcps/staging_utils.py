@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Shared helpers for writing staged MCP files:
+- Resolve the metadata-manager/{environment}/{entity folder} staging directory
+- Load an existing mcp_file.json (list or legacy {"mcps": [...]} layout)
+- Merge new MCPs into the staged list, replacing entries for the same entity
+  (or only the regenerated aspects of it)
+- Write staged MCPs back in a single atomic file update
+- Keep a sidecar content-hash index per staging directory so unchanged files
+  are detected with a single lookup instead of re-reading and comparing them
+"""
+
+import json
+import logging
+import os
+import sys
+import tempfile
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+# Add the parent directory to the sys.path
+sys.path.append(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from utils.mcp_fingerprint import mcp_fingerprint
+
+logger = logging.getLogger(__name__)
+
+MCP_FILE_NAME = "mcp_file.json"
+HASH_INDEX_FILE_NAME = ".mcp_hashes.json"
+
+
+def find_repo_root() -> str:
+    """
+    Find the repository root so staged files land in the repo-level metadata-manager
+    directory rather than web_ui/metadata-manager
+
+    Returns:
+        Absolute path to the repository root
+    """
+    # Search upwards for the repository root (look for README.md, scripts/ and web_ui/)
+    search_dir = os.path.abspath(os.getcwd())
+    for _ in range(10):  # Limit search to avoid infinite loop
+        if (os.path.exists(os.path.join(search_dir, "README.md")) and
+                os.path.exists(os.path.join(search_dir, "scripts")) and
+                os.path.exists(os.path.join(search_dir, "web_ui"))):
+            return search_dir
+        parent_dir = os.path.dirname(search_dir)
+        if parent_dir == search_dir:  # Reached filesystem root
+            break
+        search_dir = parent_dir
+
+    # Fallback: calculate from this file's location (scripts/mcps/staging_utils.py)
+    return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def get_staging_dir(environment: str, entity_folder: str, base_dir: Optional[str] = None) -> str:
+    """
+    Get (and create) the staging directory for an entity type
+
+    Args:
+        environment: Environment name (for directory structure)
+        entity_folder: Entity folder name (e.g. 'tags', 'domains', 'glossary')
+        base_dir: Optional explicit output directory
+
+    Returns:
+        Path to the staging directory
+    """
+    output_dir = base_dir or os.path.join(find_repo_root(), "metadata-manager", environment, entity_folder)
+    os.makedirs(output_dir, exist_ok=True)
+    return output_dir
+
+
+def load_staged_mcps(mcp_file_path: str) -> List[Dict[str, Any]]:
+    """
+    Load the MCPs already staged in an mcp_file.json
+
+    Args:
+        mcp_file_path: Path to the MCP file
+
+    Returns:
+        List of MCP dictionaries (empty if the file is missing or unreadable)
+    """
+    if not os.path.exists(mcp_file_path):
+        return []
+
+    try:
+        with open(mcp_file_path, "r") as f:
+            file_content = json.load(f)
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Could not load existing MCP file: {e}. Creating new file.")
+        return []
+
+    # Handle both old format (with metadata wrapper) and new format (simple list)
+    if isinstance(file_content, list):
+        existing_mcps = file_content
+    elif isinstance(file_content, dict) and "mcps" in file_content:
+        existing_mcps = file_content["mcps"]
+        logger.info(f"Migrating from old format - extracted {len(existing_mcps)} MCPs")
+    else:
+        logger.warning("Unknown MCP file format, starting fresh")
+        existing_mcps = []
+
+    logger.info(f"Loaded existing MCP file with {len(existing_mcps)} existing MCPs")
+    return existing_mcps
+
+
+def merge_staged_mcps(
+    existing_mcps: List[Dict[str, Any]],
+    new_mcps: Iterable[Dict[str, Any]],
+    aspects: Optional[Iterable[str]] = None,
+    entity_urns: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Merge new MCPs into the staged list. Every entity that appears in new_mcps (or in
+    entity_urns) has all of its previously staged MCPs replaced, matching the
+    per-entity behaviour of the add_*_to_staged_changes functions. When aspects is
+    given only the staged MCPs for those aspects are replaced, so a partial
+    regeneration keeps the entity's other staged aspects.
+
+    Args:
+        existing_mcps: MCPs currently in the staged file
+        new_mcps: Freshly generated MCPs
+        aspects: Optional names of the aspects that were regenerated
+        entity_urns: Optional URNs of the regenerated entities, needed when an
+            aspect was regenerated to nothing (e.g. all owners removed)
+
+    Returns:
+        Merged list of MCPs
+    """
+    new_mcps = list(new_mcps)
+    replaced_urns = {mcp.get("entityUrn") for mcp in new_mcps if mcp.get("entityUrn")}
+    replaced_urns.update(entity_urns or [])
+    replaced_aspects = set(aspects) if aspects is not None else None
+
+    def _is_replaced(mcp: Dict[str, Any]) -> bool:
+        if mcp.get("entityUrn") not in replaced_urns:
+            return False
+        return replaced_aspects is None or mcp.get("aspectName") in replaced_aspects
+
+    merged = [mcp for mcp in existing_mcps if not _is_replaced(mcp)]
+    merged.extend(new_mcps)
+    return merged
+
+
+def include_aspect(aspects: Optional[Iterable[str]], aspect_name: str) -> bool:
+    """
+    Check whether an MCP builder should emit an aspect
+
+    Args:
+        aspects: Names of the aspects to emit, or None for all aspects
+        aspect_name: Aspect name (e.g. 'ownership')
+
+    Returns:
+        True if the aspect should be emitted
+    """
+    return aspects is None or aspect_name in aspects
+
+
+def create_changed_mcps(
+    create_mcps: Callable[[Optional[set]], List[Dict[str, Any]]],
+    existing_mcps: List[Dict[str, Any]],
+    aspects: Optional[Iterable[str]],
+    entity_urn: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Optional[set]]:
+    """
+    Create the MCPs for the changed aspects of an entity. A partial set of aspects
+    is only usable while the entity is still present in the staged file; otherwise
+    (e.g. the file was cleared after a merge) every aspect is regenerated.
+
+    Args:
+        create_mcps: Callable taking the aspect names to create (None for all)
+        existing_mcps: MCPs currently in the staged file
+        aspects: Names of the changed aspects, or None for all aspects
+        entity_urn: URN the entity is staged under, if known before creating MCPs
+
+    Returns:
+        Tuple of the created MCPs and the regenerated aspect names (None for all),
+        ready to pass to merge_staged_mcps
+    """
+    if aspects is None:
+        return create_mcps(None), None
+
+    aspects = set(aspects)
+    mcps = create_mcps(aspects)
+    entity_urn = entity_urn or next((mcp.get("entityUrn") for mcp in mcps if mcp.get("entityUrn")), None)
+    if entity_urn is None or not any(mcp.get("entityUrn") == entity_urn for mcp in existing_mcps):
+        logger.info("Entity is not in the staged file, regenerating all aspects")
+        return create_mcps(None), None
+    return mcps, aspects
+
+
+def _atomic_write_json(data: Any, file_path: str, indent: Optional[int] = 2) -> None:
+    """Write JSON to a temporary file in the same directory and move it over file_path"""
+    output_dir = os.path.dirname(file_path) or "."
+    os.makedirs(output_dir, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(prefix=".tmp.", suffix=".json", dir=output_dir)
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent, default=str)
+        os.replace(tmp_path, file_path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+class McpHashIndex:
+    """
+    Sidecar index of content fingerprints for the MCP files in one staging
+    directory, stored as .mcp_hashes.json next to them.
+
+    Each entry records the fingerprint of the content last written by this module
+    together with the file's size and mtime, so an entry is only trusted while the
+    file on disk is the one that was written (not edited by hand or checked out).
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self.path = os.path.join(directory, HASH_INDEX_FILE_NAME)
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    @property
+    def entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, "r") as f:
+                    self._entries = json.load(f)
+                if not isinstance(self._entries, dict):
+                    self._entries = {}
+            except (FileNotFoundError, json.JSONDecodeError, IOError):
+                self._entries = {}
+        return self._entries
+
+    @staticmethod
+    def _stat(file_path: str) -> Optional[Dict[str, int]]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+    def lookup(self, file_path: str) -> Optional[str]:
+        """
+        Get the recorded fingerprint of a file, or None if there is no entry or
+        the file changed since it was recorded
+        """
+        entry = self.entries.get(os.path.basename(file_path))
+        if not entry:
+            return None
+        stat = self._stat(file_path)
+        if stat is None or stat["size"] != entry.get("size") or stat["mtime_ns"] != entry.get("mtime_ns"):
+            return None
+        return entry.get("fingerprint")
+
+    def record(self, file_path: str, fingerprint: str) -> None:
+        """Record the fingerprint of a file that has just been written"""
+        stat = self._stat(file_path)
+        if stat is None:
+            return
+        self.entries[os.path.basename(file_path)] = {"fingerprint": fingerprint, **stat}
+        try:
+            _atomic_write_json(self.entries, self.path)
+        except Exception as e:
+            logger.warning(f"Could not update MCP hash index {self.path}: {e}")
+
+
+def is_staged_file_unchanged(file_path: str, fingerprint: str) -> bool:
+    """
+    Check whether an MCP file already holds content with the given fingerprint.
+    Uses the sidecar hash index when its entry is current and only parses the
+    file when there is no usable entry (the index is then back-filled).
+
+    Args:
+        file_path: Path to the MCP file
+        fingerprint: Fingerprint of the content about to be written
+
+    Returns:
+        True if writing would not change the file's content
+    """
+    if not os.path.exists(file_path):
+        return False
+
+    index = McpHashIndex(os.path.dirname(file_path) or ".")
+    recorded = index.lookup(file_path)
+    if recorded is not None:
+        return recorded == fingerprint
+
+    try:
+        with open(file_path, "r") as f:
+            existing_fingerprint = mcp_fingerprint(json.load(f))
+    except (json.JSONDecodeError, IOError) as e:
+        logger.warning(f"Could not read existing MCP file for comparison: {e}")
+        return False
+
+    index.record(file_path, existing_fingerprint)
+    return existing_fingerprint == fingerprint
+
+
+def record_staged_file(file_path: str, fingerprint: str) -> None:
+    """
+    Record the fingerprint of an MCP file that has just been written
+
+    Args:
+        file_path: Path to the MCP file
+        fingerprint: Fingerprint of the written content
+    """
+    McpHashIndex(os.path.dirname(file_path) or ".").record(file_path, fingerprint)
+
+
+def save_mcp_to_file(mcp: Any, output_path: str, enable_dedup: bool = True) -> bool:
+    """
+    Save an MCP dictionary (or list of MCPs) to a JSON file with optional deduplication.
+    Unchanged content is detected through the sidecar hash index without
+    re-reading the existing file.
+
+    Args:
+        mcp: The MCP dictionary or list of MCP dictionaries
+        output_path: File path to save to
+        enable_dedup: Whether to enable deduplication (default: True)
+
+    Returns:
+        True if file was saved, False if skipped due to deduplication
+    """
+    try:
+        fingerprint = mcp_fingerprint(mcp)
+        if enable_dedup and is_staged_file_unchanged(output_path, fingerprint):
+            logger.info(f"MCP file unchanged, skipping: {output_path}")
+            return False
+
+        _atomic_write_json(mcp, output_path)
+        record_staged_file(output_path, fingerprint)
+
+        logger.info(f"Saved MCP to: {output_path}")
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save MCP: {str(e)}")
+        raise
+
+
+def stage_mcps(
+    new_mcps: List[Dict[str, Any]],
+    environment: str,
+    entity_folder: str,
+    base_dir: Optional[str] = None,
+) -> str:
+    """
+    Load the staged MCP file for an entity type once, merge a batch of new MCPs into
+    it and write it back in one atomic update
+
+    Args:
+        new_mcps: MCPs generated for one or many entities
+        environment: Environment name (for directory structure)
+        entity_folder: Entity folder name (e.g. 'tags')
+        base_dir: Optional explicit output directory
+
+    Returns:
+        Path to the MCP file
+    """
+    mcp_file_path = os.path.join(get_staging_dir(environment, entity_folder, base_dir), MCP_FILE_NAME)
+    merged = merge_staged_mcps(load_staged_mcps(mcp_file_path), new_mcps)
+    save_mcp_to_file(merged, mcp_file_path)
+    return mcp_file_path
@@ -2,6 +2,7 @@
 """
 Module providing functions for structured property actions in the DataHub UI:
 - Add structured property to staged changes
+- Bulk add structured properties to staged changes
 - Create comprehensive structured property MCPs
 """
 
@@ -23,6 +24,7 @@ from scripts.mcps.create_structured_property_mcps import (
     create_structured_property_staged_changes,
     save_mcps_to_files
 )
+from scripts.mcps.staging_utils import stage_mcps
 
 # Try to import the new URN generation utilities
 try:
@@ -258,6 +260,89 @@ def add_structured_property_to_staged_changes(
         }
 
 
+def bulk_add_structured_properties_to_staged_changes(
+    properties: List[Dict[str, Any]],
+    environment: str = "dev",
+    owner: str = "admin",
+    base_dir: Optional[str] = None,
+    mutation_name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Add many structured properties to staged changes in one pass. The mutation
+    configuration is resolved once, MCPs for every property are generated in memory
+    and the staged MCP file is read and written exactly once.
+    
+    Args:
+        properties: List of dictionaries holding add_structured_property_to_staged_changes
+            keyword arguments (property_id, qualified_name, display_name, ...)
+        environment: Environment name for URN generation
+        owner: Owner username
+        base_dir: Optional output directory (defaults to metadata-manager/{environment}/structured_properties in repo root)
+        mutation_name: Optional mutation name for deterministic URN generation
+    
+    Returns:
+        Dictionary with success/error counts, errors, MCP count, the MCP file path
+        and the positions of the staged inputs
+    """
+    mutation_config = None
+    if HAS_NEW_URN_UTILS:
+        try:
+            mutation_config = get_mutation_config_for_environment(environment)
+        except Exception as e:
+            logger.warning(f"Could not get mutation config for environment '{environment}': {e}")
+    
+    new_mcps = []
+    success_count = 0
+    staged_indexes = []
+    errors = []
+    for index, prop in enumerate(properties):
+        prop_kwargs = dict(prop)
+        property_id = prop_kwargs.pop("property_id", None)
+        label = prop_kwargs.get("display_name") or property_id or "unknown"
+        try:
+            if not property_id:
+                raise ValueError("property_id is required")
+            
+            property_urn = f"urn:li:structuredProperty:{property_id}"
+            custom_urn = None
+            if mutation_config:
+                mutated_urn = generate_structured_property_urn(property_urn, environment, mutation_config)
+                if mutated_urn != property_urn:
+                    custom_urn = mutated_urn
+                    property_urn = mutated_urn
+            
+            mcps = create_structured_property_staged_changes(
+                property_urn=property_urn,
+                custom_urn=custom_urn,
+                **prop_kwargs
+            )
+            if not mcps:
+                raise ValueError("Failed to create structured property MCPs")
+            
+            new_mcps.extend(mcps)
+            success_count += 1
+            staged_indexes.append(index)
+        except Exception as e:
+            errors.append(f"Property {label}: {str(e)}")
+            logger.error(f"Error creating MCPs for structured property {label}: {str(e)}")
+    
+    mcp_file_path = None
+    if new_mcps:
+        mcp_file_path = stage_mcps(new_mcps, environment, "structured_properties", base_dir)
+    
+    logger.info(f"Bulk added {success_count} structured properties to staged changes with {len(new_mcps)} MCPs ({len(errors)} failed)")
+    
+    return {
+        "success_count": success_count,
+        "error_count": len(errors),
+        "errors": errors,
+        "mcps_created": len(new_mcps),
+        "mcp_file": mcp_file_path,
+        # Positions of the inputs whose MCPs were written to the staged file
+        "staged_indexes": staged_indexes if mcp_file_path else [],
+    }
+
+
 def add_structured_property_to_staged_changes_legacy(
     property_data: Dict[str, Any],
     environment: str = "dev",
@@ -4,6 +4,7 @@ Module providing functions for tag actions in the DataHub UI:
 - Download tag JSON
 - Sync tag to local database
 - Add tag to staged changes
+- Bulk add tags to staged changes
 """
 
 import json
@@ -11,7 +12,7 @@ import logging
 import os
 import sys
 import time
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, List, Optional, Tuple
 
 # Add the parent directory to the sys.path
 sys.path.append(
@@ -19,12 +20,21 @@ sys.path.append(
 )
 
 # Import local utilities
-from utils.urn_utils import generate_deterministic_urn, extract_name_from_properties
+from utils.urn_utils import generate_deterministic_urn, extract_name_from_properties, generate_unified_urn
 from scripts.mcps.create_tag_mcps import (
     create_tag_properties_mcp, 
     create_tag_ownership_mcp, 
     save_mcp_to_file
 )
+from scripts.mcps.staging_utils import (
+    MCP_FILE_NAME,
+    create_changed_mcps,
+    get_staging_dir,
+    include_aspect,
+    load_staged_mcps,
+    merge_staged_mcps,
+    stage_mcps
+)
 
 # Try to import the new URN generation utilities
 try:
@@ -139,12 +149,135 @@ def sync_tag_to_local(tag_data: Dict[str, Any], local_db_path: Optional[str] = N
         return False
 
 
+def _get_mutation_config(environment: str) -> Optional[Dict[str, Any]]:
+    """
+    Resolve the mutation configuration for an environment (None if unavailable)
+
+    Args:
+        environment: Environment name
+
+    Returns:
+        Mutation configuration dictionary or None
+    """
+    if not HAS_NEW_URN_UTILS:
+        return None
+    try:
+        mutation_config = get_mutation_config_for_environment(environment)
+        logger.info(f"Using mutation config for environment '{environment}': {mutation_config is not None}")
+        return mutation_config
+    except Exception as e:
+        logger.warning(f"Could not get mutation config for environment '{environment}': {e}")
+        return None
+
+
+def _resolve_tag_urn(
+    tag_data: Dict[str, Any],
+    environment: str,
+    mutation_name: Optional[str] = None,
+    mutation_config: Optional[Dict[str, Any]] = None,
+    existing_urn: Optional[str] = None,
+) -> Tuple[str, Optional[str], str]:
+    """
+    Resolve the identifiers of a tag
+
+    Returns:
+        Tuple of the tag ID, the mutated URN (None if not mutated) and the URN
+        the tag's MCPs are staged under
+    """
+    tag_urn = tag_data.get("urn") or existing_urn
+    if not tag_urn:
+        raise ValueError("Tag URN not found in tag data")
+    
+    # Extract tag ID from URN or properties
+    tag_id = tag_data.get("key") or extract_tag_id_from_urn(tag_urn)
+    
+    # Generate mutated URN if mutations are configured
+    mutated_urn = tag_urn
+    if HAS_NEW_URN_UTILS and mutation_config:
+        try:
+            mutated_urn = generate_tag_urn(tag_urn, environment, mutation_config)
+            if mutated_urn != tag_urn:
+                logger.info(f"Generated mutated URN for tag: {tag_urn} -> {mutated_urn}")
+        except Exception as e:
+            logger.warning(f"Could not generate mutated URN: {e}")
+            mutated_urn = tag_urn
+    custom_urn = mutated_urn if mutated_urn != tag_urn else None
+    
+    staged_urn = custom_urn or generate_unified_urn("tag", tag_id, environment, mutation_name)
+    return tag_id, custom_urn, staged_urn
+
+
+def _create_tag_mcps(
+    tag_data: Dict[str, Any],
+    environment: str,
+    owner: str,
+    mutation_name: Optional[str] = None,
+    mutation_config: Optional[Dict[str, Any]] = None,
+    existing_urn: Optional[str] = None,
+    aspects: Optional[Iterable[str]] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Create the properties and ownership MCPs for a single tag
+
+    Args:
+        tag_data: Tag data as a dictionary
+        environment: Environment name
+        owner: Owner username
+        mutation_name: Optional mutation name for deterministic URN generation
+        mutation_config: Mutation configuration already resolved for the environment
+        existing_urn: URN of the tag in DataHub, used when tag_data has none
+        aspects: Optional names of the aspects to create (default: all)
+
+    Returns:
+        List of MCP dictionaries (properties MCP first)
+    """
+    # Extract tag information
+    tag_id, custom_urn, _ = _resolve_tag_urn(
+        tag_data, environment, mutation_name, mutation_config, existing_urn
+    )
+    
+    # Extract tag properties
+    tag_name = extract_name_from_properties(tag_data)
+    if not tag_name:
+        raise ValueError("Tag name not found in tag data")
+    
+    properties = tag_data.get("properties") or {}
+    description = properties.get("description")
+    color_hex = properties.get("colorHex")
+    
+    mcps = []
+    if include_aspect(aspects, "tagProperties"):
+        mcps.append(create_tag_properties_mcp(
+            tag_id=tag_id,
+            owner=owner,
+            tag_name=tag_name,
+            description=description,
+            color_hex=color_hex,
+            environment=environment,
+            mutation_name=mutation_name,
+            custom_urn=custom_urn
+        ))
+    
+    if include_aspect(aspects, "ownership"):
+        mcps.append(create_tag_ownership_mcp(
+            tag_id=tag_id,
+            owner=owner,
+            environment=environment,
+            mutation_name=mutation_name,
+            custom_urn=custom_urn
+        ))
+    
+    return mcps
+
+
 def add_tag_to_staged_changes(
     tag_data: Dict[str, Any], 
     environment: str, 
     owner: str,
     base_dir: Optional[str] = None,
-    mutation_name: Optional[str] = None
+    mutation_name: Optional[str] = None,
+    existing_urn: Optional[str] = None,
+    aspects: Optional[Iterable[str]] = None
 ) -> Dict[str, str]:
     """
     Add tag to staged changes by creating a single MCP file containing all MCPs
@@ -155,149 +288,41 @@ def add_tag_to_staged_changes(
         owner: Owner username
         base_dir: Optional base directory (defaults to metadata-manager/{environment} in repo root)
         mutation_name: Optional mutation name for deterministic URN generation
+        existing_urn: URN of the tag in DataHub, used when tag_data has none
+        aspects: Optional names of the changed aspects; only these are regenerated
+            when the tag is already staged
 
     Returns:
         Dictionary with path to created MCP file
     """
     try:
-        # Extract tag information
-        tag_urn = tag_data.get("urn")
-        if not tag_urn:
-            raise ValueError("Tag URN not found in tag data")
-        
-        # Extract tag properties
         tag_name = extract_name_from_properties(tag_data)
-        if not tag_name:
-            raise ValueError("Tag name not found in tag data")
-        
-        # Extract tag ID from URN or properties
-        tag_id = tag_data.get("key") or extract_tag_id_from_urn(tag_urn)
-        
-        # Get description if available
-        description = None
-        if "properties" in tag_data and "description" in tag_data["properties"]:
-            description = tag_data["properties"]["description"]
-        
-        # Get color if available
-        color_hex = None
-        if "properties" in tag_data and "colorHex" in tag_data["properties"]:
-            color_hex = tag_data["properties"]["colorHex"]
-        
-        # Determine output directory - use repo root metadata-manager instead of web_ui/metadata-manager
-        if base_dir:
-            output_dir = base_dir
-        else:
-            # Find repository root by looking for characteristic files
-            current_dir = os.path.abspath(os.getcwd())
-            repo_root = None
-            
-            # Search upwards for the repository root (look for README.md and scripts/ directory)
-            search_dir = current_dir
-            for _ in range(10):  # Limit search to avoid infinite loop
-                if (os.path.exists(os.path.join(search_dir, "README.md")) and 
-                    os.path.exists(os.path.join(search_dir, "scripts")) and
-                    os.path.exists(os.path.join(search_dir, "web_ui"))):
-                    repo_root = search_dir
-                    break
-                parent_dir = os.path.dirname(search_dir)
-                if parent_dir == search_dir:  # Reached filesystem root
-                    break
-                search_dir = parent_dir
-            
-            # Fallback: try to calculate from __file__ path
-            if not repo_root:
-                script_dir = os.path.dirname(os.path.abspath(__file__))
-                if "scripts/mcps" in script_dir:
-                    repo_root = os.path.dirname(os.path.dirname(script_dir))
-                else:
-                    # Last resort: assume we're in a subdirectory and go up
-                    repo_root = os.path.dirname(os.path.dirname(os.path.dirname(script_dir)))
-            
-            output_dir = os.path.join(repo_root, "metadata-manager", environment, "tags")
-            logger.debug(f"Calculated repo root: {repo_root}, output dir: {output_dir}")
-        
-        # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
-        
-        # Use constant filename
-        mcp_file_path = os.path.join(output_dir, "mcp_file.json")
         
-        # Load existing MCP file or create new list - should be a simple list of MCPs
-        existing_mcps = []
-        if os.path.exists(mcp_file_path):
-            try:
-                with open(mcp_file_path, "r") as f:
-                    file_content = json.load(f)
-                    # Handle both old format (with metadata wrapper) and new format (simple list)
-                    if isinstance(file_content, list):
-                        existing_mcps = file_content
-                    elif isinstance(file_content, dict) and "mcps" in file_content:
-                        # Migrate from old format - extract just the MCPs
-                        existing_mcps = file_content["mcps"]
-                        logger.info(f"Migrating from old format - extracted {len(existing_mcps)} MCPs")
-                    else:
-                        logger.warning(f"Unknown MCP file format, starting fresh")
-                        existing_mcps = []
-                logger.info(f"Loaded existing MCP file with {len(existing_mcps)} existing MCPs")
-            except (json.JSONDecodeError, IOError) as e:
-                logger.warning(f"Could not load existing MCP file: {e}. Creating new file.")
-                existing_mcps = []
-        
-        # Create new MCPs for this tag
-        new_mcps = []
-        
-        # Get mutation configuration for environment-based URN generation
-        mutation_config = None
-        if HAS_NEW_URN_UTILS:
-            try:
-                mutation_config = get_mutation_config_for_environment(environment)
-                logger.info(f"Using mutation config for environment '{environment}': {mutation_config is not None}")
-            except Exception as e:
-                logger.warning(f"Could not get mutation config for environment '{environment}': {e}")
-        
-        # Generate mutated URN if mutations are configured
-        mutated_urn = tag_urn
-        if HAS_NEW_URN_UTILS and mutation_config:
-            try:
-                mutated_urn = generate_tag_urn(tag_urn, environment, mutation_config)
-                if mutated_urn != tag_urn:
-                    logger.info(f"Generated mutated URN for tag: {tag_urn} -> {mutated_urn}")
-            except Exception as e:
-                logger.warning(f"Could not generate mutated URN: {e}")
-                mutated_urn = tag_urn
-        
-        # Create properties MCP
-        properties_mcp = create_tag_properties_mcp(
-            tag_id=tag_id,
-            owner=owner,
-            tag_name=tag_name,
-            description=description,
-            color_hex=color_hex,
-            environment=environment,
-            mutation_name=mutation_name,
-            custom_urn=mutated_urn if mutated_urn != tag_urn else None
+        mcp_file_path = os.path.join(get_staging_dir(environment, "tags", base_dir), MCP_FILE_NAME)
+        existing_mcps = load_staged_mcps(mcp_file_path)
+        mutation_config = _get_mutation_config(environment)
+        _, _, staged_urn = _resolve_tag_urn(
+            tag_data, environment, mutation_name, mutation_config, existing_urn
         )
-        new_mcps.append(properties_mcp)
         
-        # Create ownership MCP
-        ownership_mcp = create_tag_ownership_mcp(
-            tag_id=tag_id,
-            owner=owner,
-            environment=environment,
-            mutation_name=mutation_name,
-            custom_urn=mutated_urn if mutated_urn != tag_urn else None
+        # Create new MCPs for this tag (only the changed aspects if it is already staged)
+        new_mcps, aspects = create_changed_mcps(
+            lambda create_aspects: _create_tag_mcps(
+                tag_data=tag_data,
+                environment=environment,
+                owner=owner,
+                mutation_name=mutation_name,
+                mutation_config=mutation_config,
+                existing_urn=existing_urn,
+                aspects=create_aspects,
+            ),
+            existing_mcps,
+            aspects,
+            entity_urn=staged_urn,
         )
-        new_mcps.append(ownership_mcp)
         
-        # Remove any existing MCPs for this tag URN to avoid duplicates
-        tag_entity_urn = properties_mcp.get("entityUrn")
-        existing_mcps = [
-            mcp for mcp in existing_mcps 
-            if mcp.get("entityUrn") != tag_entity_urn
-        ]
-        
-        # Add new MCPs to the list
-        existing_mcps.extend(new_mcps)
+        # Replace any existing MCPs for this tag URN to avoid duplicates
+        existing_mcps = merge_staged_mcps(existing_mcps, new_mcps, aspects=aspects)
         
         # Save updated MCP file as a simple list
         mcp_saved = save_mcp_to_file(existing_mcps, mcp_file_path)
@@ -313,4 +338,66 @@ def add_tag_to_staged_changes(
         
     except Exception as e:
         logger.error(f"Error adding tag to staged changes: {str(e)}")
-        raise 
\ No newline at end of file
+        raise
+
+
+def bulk_add_tags_to_staged_changes(
+    tags_data: List[Dict[str, Any]],
+    environment: str,
+    owner: str,
+    base_dir: Optional[str] = None,
+    mutation_name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Add many tags to staged changes in one pass. The mutation configuration is
+    resolved once, MCPs for every tag are generated in memory and the staged
+    MCP file is read and written exactly once.
+
+    Args:
+        tags_data: List of tag data dictionaries (same shape as add_tag_to_staged_changes)
+        environment: Environment name (for directory structure)
+        owner: Owner username
+        base_dir: Optional base directory (defaults to metadata-manager/{environment}/tags in repo root)
+        mutation_name: Optional mutation name for deterministic URN generation
+
+    Returns:
+        Dictionary with success/error counts, errors, MCP count, the MCP file path
+        and the positions of the staged inputs
+    """
+    mutation_config = _get_mutation_config(environment)
+    
+    new_mcps = []
+    success_count = 0
+    staged_indexes = []
+    errors = []
+    for index, tag_data in enumerate(tags_data):
+        try:
+            new_mcps.extend(_create_tag_mcps(
+                tag_data=tag_data,
+                environment=environment,
+                owner=owner,
+                mutation_name=mutation_name,
+                mutation_config=mutation_config,
+            ))
+            success_count += 1
+            staged_indexes.append(index)
+        except Exception as e:
+            tag_label = tag_data.get("name") or tag_data.get("urn") or "unknown"
+            errors.append(f"Tag {tag_label}: {str(e)}")
+            logger.error(f"Error creating MCPs for tag {tag_label}: {str(e)}")
+    
+    mcp_file_path = None
+    if new_mcps:
+        mcp_file_path = stage_mcps(new_mcps, environment, "tags", base_dir)
+    
+    logger.info(f"Bulk added {success_count} tags to staged changes with {len(new_mcps)} MCPs ({len(errors)} failed)")
+    
+    return {
+        "success_count": success_count,
+        "error_count": len(errors),
+        "errors": errors,
+        "mcps_created": len(new_mcps),
+        "mcp_file": mcp_file_path,
+        # Positions of the inputs whose MCPs were written to the staged file
+        "staged_indexes": staged_indexes if mcp_file_path else [],
+    }
@@ -11,6 +11,7 @@ import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 
 # Add the parent directory to the sys.path
@@ -19,6 +20,7 @@ sys.path.append(
 )
 
 from utils.datahub_metadata_api import DataHubMetadataApiClient
+from utils.sync_watermark import DEFAULT_WATERMARK_DIR, SyncWatermark, watermark_path
 from utils.token_utils import get_token_from_env
 from utils.urn_utils import (
     get_full_urn_from_name,
@@ -28,6 +30,16 @@ from utils.urn_utils import (
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_SYNC_WORKERS = 4
+
+# Source listing method and per-entity sync method of each entity type
+SYNC_ENTITY_TYPES = {
+    "glossaryNode": ("list_glossary_nodes", "sync_glossary_node"),
+    "glossaryTerm": ("list_glossary_terms", "sync_glossary_term"),
+    "tag": ("list_tags", "sync_tag"),
+    "domain": ("list_domains", "sync_domain"),
+}
+
 
 def setup_logging(log_level: str):
     """
@@ -120,6 +132,31 @@ def parse_args():
         help="Logging level (default: INFO)",
     )
 
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Only sync entities that changed since the last successful sync (tracked in a per-source watermark)",
+    )
+
+    parser.add_argument(
+        "--watermark-dir",
+        default=DEFAULT_WATERMARK_DIR,
+        help=f"Directory holding the incremental sync watermarks (default: {DEFAULT_WATERMARK_DIR})",
+    )
+
+    parser.add_argument(
+        "--reset-watermark",
+        action="store_true",
+        help="Ignore the stored watermark and sync every entity, then record them all",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_SYNC_WORKERS,
+        help=f"Number of entities synced concurrently per entity type in incremental mode (default: {DEFAULT_SYNC_WORKERS})",
+    )
+
     parser.add_argument(
         "--use-deterministic-urns",
         action="store_true",
@@ -138,6 +175,8 @@ class MetadataSyncer:
         target_client: DataHubMetadataApiClient,
         dry_run: bool = False,
         use_deterministic_urns: bool = True,
+        watermark: Optional[SyncWatermark] = None,
+        max_workers: int = DEFAULT_SYNC_WORKERS,
     ):
         """
         Initialize the metadata syncer
@@ -147,11 +186,15 @@ class MetadataSyncer:
             target_client: Client for the target DataHub environment
             dry_run: Whether to perform a dry run without making changes
             use_deterministic_urns: Whether to use deterministic URNs for syncing
+            watermark: Watermark of the entities already synced, for incremental syncs
+            max_workers: Number of entities synced concurrently per entity type
         """
         self.source_client = source_client
         self.target_client = target_client
         self.dry_run = dry_run
         self.use_deterministic_urns = use_deterministic_urns
+        self.watermark = watermark
+        self.max_workers = max(1, max_workers)
 
     def get_deterministic_urn(
         self, entity_data: Dict[str, Any], entity_type: str
@@ -721,6 +764,79 @@ class MetadataSyncer:
                 {"status": "error", "message": f"Error syncing all domains: {str(e)}"}
             ]
 
+    def sync_changed_entities(self, entity_type: str) -> Dict[str, Any]:
+        """
+        Sync the entities of one type that changed since the watermark, concurrently
+
+        Entities are only recorded in the watermark once they synced successfully
+        (and never in a dry run), so failed entities are retried on the next run.
+
+        Args:
+            entity_type: Entity type (glossaryTerm, glossaryNode, tag, domain)
+
+        Returns:
+            Dictionary with the sync results and the synced/skipped/failed counts
+        """
+        list_method, sync_method = SYNC_ENTITY_TYPES[entity_type]
+        report = {"synced": 0, "skipped": 0, "failed": 0}
+
+        try:
+            entities = getattr(self.source_client, list_method)()
+        except Exception as e:
+            logger.error(f"Error listing {entity_type} entities: {str(e)}")
+            report["failed"] = 1
+            return {
+                "results": [{"status": "error", "message": f"Error listing {entity_type} entities: {str(e)}"}],
+                "report": report,
+            }
+
+        if self.watermark is not None:
+            changed, report["skipped"] = self.watermark.changed(entity_type, entities or [])
+        else:
+            changed = [(entity, None) for entity in entities or [] if entity.get("urn")]
+        logger.info(f"Syncing {len(changed)} changed {entity_type} entities ({report['skipped']} unchanged)")
+
+        def sync(entity: Dict[str, Any], fingerprint: Optional[str]) -> Dict[str, Any]:
+            result = getattr(self, sync_method)(entity["urn"])
+            if result.get("status") == "success" and fingerprint and not self.dry_run:
+                self.watermark.record(entity_type, entity["urn"], fingerprint)
+            return result
+
+        results = []
+        if changed:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(changed))) as executor:
+                results = list(executor.map(lambda item: sync(*item), changed))
+
+        for result in results:
+            report["synced" if result.get("status") == "success" else "failed"] += 1
+        return {"results": results, "report": report}
+
+    def sync_incremental(self, entity_types: List[str]) -> Dict[str, Any]:
+        """
+        Sync the changed entities of several types, one bounded worker pool per type,
+        with the types processed concurrently. The watermark is saved afterwards.
+
+        Args:
+            entity_types: Entity types to sync
+
+        Returns:
+            Dictionary with the sync results and a per-type report of synced/skipped/failed counts
+        """
+        with ThreadPoolExecutor(max_workers=max(1, len(entity_types))) as executor:
+            outcomes = dict(zip(entity_types, executor.map(self.sync_changed_entities, entity_types)))
+
+        if self.watermark is not None and not self.dry_run:
+            self.watermark.save()
+
+        report = {entity_type: outcome["report"] for entity_type, outcome in outcomes.items()}
+        report["total"] = {
+            key: sum(counts[key] for counts in report.values()) for key in ("synced", "skipped", "failed")
+        }
+        return {
+            "results": [result for outcome in outcomes.values() for result in outcome["results"]],
+            "report": report,
+        }
+
 
 def main():
     args = parse_args()
@@ -758,12 +874,23 @@ def main():
         logger.error(f"Error initializing DataHub clients: {str(e)}")
         sys.exit(1)
 
+    # Load the watermark of this source/target pair for incremental syncs
+    watermark = None
+    if args.incremental:
+        watermark = SyncWatermark(watermark_path(args.watermark_dir, args.source_url, args.target_url))
+        if args.reset_watermark:
+            watermark.reset()
+        elif watermark.updated_at:
+            logger.info(f"Syncing changes since the watermark of {watermark.updated_at}")
+
     # Initialize syncer
     syncer = MetadataSyncer(
         source_client,
         target_client,
         args.dry_run,
         use_deterministic_urns=args.use_deterministic_urns,
+        watermark=watermark,
+        max_workers=args.max_workers,
     )
 
     # Load config file if provided
@@ -827,6 +954,30 @@ def main():
                 else:
                     logger.warning(f"Unsupported entity URN: {urn}")
 
+        elif args.incremental:
+            # Sync only the changed entities, with the entity types in parallel
+            entity_types = (
+                list(SYNC_ENTITY_TYPES) if args.entity_type == "all" else [args.entity_type]
+            )
+            incremental = syncer.sync_incremental(entity_types)
+            results["results"].extend(incremental["results"])
+            results["report"] = incremental["report"]
+
+            if args.include_properties:
+                for result in incremental["results"]:
+                    if (
+                        result.get("status") == "success"
+                        and "urn" in result
+                        and not result["urn"].startswith("urn:li:tag:")
+                    ):
+                        prop_result = syncer.sync_structured_properties(result["urn"])
+                        results["results"].append(prop_result)
+
+            total = incremental["report"]["total"]
+            logger.info(
+                f"Incremental sync: {total['synced']} synced, {total['skipped']} unchanged, {total['failed']} failed"
+            )
+
         else:
             # Sync all entities of specified type
             if args.entity_type == "glossaryTerm" or args.entity_type == "all":
@@ -11,6 +11,7 @@ from scripts.metadata_tests.metadata_test_utils import (
     TestResult,
     TestSeverity,
 )
+from utils.relationship_graph import DOMAIN, PARENT_NODE, entity_type_of
 
 logger = logging.getLogger(__name__)
 
@@ -18,53 +19,22 @@ logger = logging.getLogger(__name__)
 class GlossaryTermsInDomainsTest(MetadataTest):
     """Test that glossary terms are assigned to appropriate domains"""
 
+    required_entity_types = ("domain", "glossaryTerm")
+
     def run(self) -> List[TestResult]:
         results = []
 
-        # Get all domains to build a set of valid domain URNs
-        domains = self.client.list_domains()
-        domain_urns = {domain.get("urn") for domain in domains if domain.get("urn")}
-
-        # Get all glossary terms
-        terms = self.client.list_glossary_terms()
-
-        for term in terms:
-            term_urn = term.get("urn")
-            if not term_urn:
-                continue
-
-            # Get detailed term info
-            term_info = self.client.export_glossary_term(term_urn)
-            if not term_info:
-                results.append(
-                    self.create_result(
-                        False,
-                        f"Failed to retrieve detailed info for glossary term: {term_urn}",
-                        entity_urn=term_urn,
-                    )
-                )
-                continue
-
-            # Check if term has domains
-            has_domain = False
-            invalid_domains = []
-
-            if "domains" in term_info and "domains" in term_info["domains"]:
-                term_domains = term_info["domains"]["domains"]
+        # Domain membership of every term, from the relationship graph
+        graph = self.relationship_graph("domain", "glossaryTerm")
 
-                if term_domains:
-                    has_domain = True
-
-                    # Check if all domains are valid
-                    for domain in term_domains:
-                        domain_urn = domain.get("urn")
-                        if domain_urn and domain_urn not in domain_urns:
-                            invalid_domains.append(domain_urn)
+        for term_urn in graph.urns("glossaryTerm"):
+            term_domains = graph.targets(term_urn, DOMAIN)
+            invalid_domains = [domain_urn for domain_urn in term_domains if domain_urn not in graph]
 
             # Create test results
-            term_name = term_info.get("properties", {}).get("name", term_urn)
+            term_name = graph.name(term_urn) or term_urn
 
-            if not has_domain:
+            if not term_domains:
                 results.append(
                     self.create_result(
                         False,
@@ -99,11 +69,13 @@ class GlossaryTermsInDomainsTest(MetadataTest):
 class DomainOwnershipTest(MetadataTest):
     """Test that domains have ownership information"""
 
+    required_entity_types = ("domain",)
+
     def run(self) -> List[TestResult]:
         results = []
 
         # Get all domains
-        domains = self.client.list_domains()
+        domains = self.list_entities("domain")
 
         for domain in domains:
             domain_urn = domain.get("urn")
@@ -111,7 +83,7 @@ class DomainOwnershipTest(MetadataTest):
                 continue
 
             # Get detailed domain info
-            domain_info = self.client.export_domain(domain_urn)
+            domain_info = self.get_entity(domain_urn, "domain")
             if not domain_info:
                 results.append(
                     self.create_result(
@@ -161,97 +133,58 @@ class DomainOwnershipTest(MetadataTest):
 class GlossaryHierarchyTest(MetadataTest):
     """Test the glossary node and term hierarchy structure"""
 
+    required_entity_types = ("glossaryNode", "glossaryTerm")
+
     def run(self) -> List[TestResult]:
         results = []
 
-        # Get all glossary nodes
-        nodes = self.client.list_glossary_nodes()
-        node_urns = {node.get("urn") for node in nodes if node.get("urn")}
-
-        # Track hierarchy issues
-        orphaned_nodes = []
-        circular_refs = set()
-
-        # Check node hierarchy
-        for node in nodes:
-            node_urn = node.get("urn")
-            if not node_urn:
-                continue
-
-            # Get detailed node info
-            node_info = self.client.export_glossary_node(
-                node_urn, include_children=True
-            )
-            if not node_info:
-                continue
-
-            # Check parent-child relationships
-            if "parentNode" in node_info:
-                parent_urn = node_info["parentNode"].get("urn")
-
-                if parent_urn and parent_urn not in node_urns:
-                    orphaned_nodes.append((node_urn, parent_urn))
+        graph = self.relationship_graph("glossaryNode", "glossaryTerm")
 
-                # Check for circular references (simplified check)
-                if parent_urn == node_urn:
-                    circular_refs.add(node_urn)
+        # Nodes and terms whose parent node does not exist, and parent node cycles
+        orphans = graph.orphans(PARENT_NODE)
+        orphaned_nodes = [(urn, parent) for urn, parent in orphans if entity_type_of(urn) == "glossaryNode"]
+        orphaned_terms = [(urn, parent) for urn, parent in orphans if entity_type_of(urn) == "glossaryTerm"]
+        cycles = graph.cycles(PARENT_NODE)
 
         # Create test results for hierarchy issues
-        if orphaned_nodes:
-            for node_urn, parent_urn in orphaned_nodes:
-                results.append(
-                    self.create_result(
-                        False,
-                        f"Glossary node references non-existent parent node: {parent_urn}",
-                        entity_urn=node_urn,
-                        severity=TestSeverity.ERROR,
-                        details={"nodeUrn": node_urn, "parentUrn": parent_urn},
-                    )
+        for node_urn, parent_urn in orphaned_nodes:
+            results.append(
+                self.create_result(
+                    False,
+                    f"Glossary node references non-existent parent node: {parent_urn}",
+                    entity_urn=node_urn,
+                    severity=TestSeverity.ERROR,
+                    details={"nodeUrn": node_urn, "parentUrn": parent_urn},
                 )
+            )
 
-        if circular_refs:
-            for node_urn in circular_refs:
+        for cycle in cycles:
+            path = " -> ".join(cycle + [cycle[0]])
+            for node_urn in cycle:
                 results.append(
                     self.create_result(
                         False,
-                        "Glossary node has circular reference (references itself as parent)",
+                        f"Glossary node has circular reference: {path}",
                         entity_urn=node_urn,
                         severity=TestSeverity.ERROR,
-                        details={"circularReference": True},
+                        details={"circularReference": True, "cycle": cycle},
                     )
                 )
 
-        # Get glossary terms and check their parent nodes
-        terms = self.client.list_glossary_terms()
-
-        for term in terms:
-            term_urn = term.get("urn")
-            if not term_urn:
-                continue
-
-            # Get detailed term info
-            term_info = self.client.export_glossary_term(term_urn)
-            if not term_info:
-                continue
-
-            # Check parent node
-            if "parentNode" in term_info:
-                parent_urn = term_info["parentNode"].get("urn")
-
-                if parent_urn and parent_urn not in node_urns:
-                    term_name = term_info.get("properties", {}).get("name", term_urn)
-                    results.append(
-                        self.create_result(
-                            False,
-                            f"Glossary term '{term_name}' references non-existent parent node: {parent_urn}",
-                            entity_urn=term_urn,
-                            severity=TestSeverity.ERROR,
-                            details={"termUrn": term_urn, "parentNodeUrn": parent_urn},
-                        )
-                    )
+        for term_urn, parent_urn in orphaned_terms:
+            term_name = graph.name(term_urn) or term_urn
+            results.append(
+                self.create_result(
+                    False,
+                    f"Glossary term '{term_name}' references non-existent parent node: {parent_urn}",
+                    entity_urn=term_urn,
+                    severity=TestSeverity.ERROR,
+                    details={"termUrn": term_urn, "parentNodeUrn": parent_urn},
+                )
+            )
 
         # Add a success result if no issues found
-        if not orphaned_nodes and not circular_refs:
+        if not orphaned_nodes and not cycles:
             results.append(
                 self.create_result(
                     True,
@@ -9,7 +9,7 @@ with glossary terms, tags, and structured properties.
 import logging
 import os
 import sys
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 # Add the parent directory to the sys.path
 sys.path.append(
@@ -20,6 +20,22 @@ from utils.datahub_metadata_api import DataHubMetadataApiClient
 
 logger = logging.getLogger(__name__)
 
+# Largest number of matching URNs returned by the count-only searches
+DEFAULT_SAMPLE_LIMIT = 100
+
+COUNT_ENTITIES_QUERY = """
+query countEntities($input: SearchAcrossEntitiesInput!) {
+  searchAcrossEntities(input: $input) {
+    total
+    searchResults {
+      entity {
+        urn
+      }
+    }
+  }
+}
+"""
+
 
 def get_entities_with_glossary_term(
     client: DataHubMetadataApiClient,
@@ -35,7 +51,8 @@ def get_entities_with_glossary_term(
         entity_types: Optional list of entity types to filter by (e.g., "dataset", "dashboard")
 
     Returns:
-        List of entities with the specified glossary term
+        List of entities with the specified glossary term (at most 1000; use
+        count_entities_with_glossary_term for totals)
     """
     # GraphQL query to get entities with the specified glossary term
     query = """
@@ -157,7 +174,8 @@ def get_entities_with_tag(
         entity_types: Optional list of entity types to filter by (e.g., "dataset", "dashboard")
 
     Returns:
-        List of entities with the specified tag
+        List of entities with the specified tag (at most 1000; use
+        count_entities_with_tag for totals)
     """
     # GraphQL query to get entities with the specified tag
     query = """
@@ -501,3 +519,112 @@ def get_entities_with_structured_property(
             f"Error querying entities with structured property '{property_name}': {str(e)}"
         )
         return []
+
+
+def search_criterion(
+    field: str, value: Optional[str] = None, negated: bool = False
+) -> Dict[str, Any]:
+    """
+    Build a search filter criterion.
+
+    Args:
+        field: Search index field (e.g. "tags", "glossaryTerms", "owners", "domains")
+        value: Value the field must contain; if None, the field only has to exist
+        negated: Whether to match the entities that do NOT meet the condition
+
+    Returns:
+        Criterion dictionary for the "and" list of an orFilters entry
+    """
+    if value is None:
+        return {"field": field, "condition": "EXISTS", "negated": negated}
+    return {"field": field, "condition": "EQUAL", "values": [value], "negated": negated}
+
+
+def count_entities(
+    client: DataHubMetadataApiClient,
+    entity_types: Optional[List[str]] = None,
+    criteria: Optional[List[Dict[str, Any]]] = None,
+    sample_limit: int = 0,
+) -> Tuple[int, List[str]]:
+    """
+    Count the entities matching all criteria with a single search, computed
+    server-side, and return at most sample_limit of their URNs.
+
+    Args:
+        client: DataHub metadata client
+        entity_types: Entity types to count (e.g. "DATASET"); all types if None
+        criteria: Filter criteria that must all hold (see search_criterion)
+        sample_limit: Number of matching URNs to return (0 to only count)
+
+    Returns:
+        Tuple of (total number of matching entities, sample of their URNs)
+
+    Raises:
+        ValueError: If the search response is not in the expected format
+    """
+    search_input: Dict[str, Any] = {
+        "query": "*",
+        "start": 0,
+        "count": max(0, sample_limit),
+    }
+    if entity_types:
+        search_input["types"] = entity_types
+    if criteria:
+        search_input["orFilters"] = [{"and": criteria}]
+
+    result = client.execute_graphql(COUNT_ENTITIES_QUERY, {"input": search_input})
+    search = ((result or {}).get("data") or {}).get("searchAcrossEntities")
+    if search is None:
+        errors = [error.get("message", "Unknown error") for error in (result or {}).get("errors", [])]
+        raise ValueError(f"Unexpected response to count query: {', '.join(errors) or result}")
+
+    urns = [
+        search_result["entity"]["urn"]
+        for search_result in search.get("searchResults") or []
+        if (search_result.get("entity") or {}).get("urn")
+    ]
+    return search.get("total", 0), urns[:sample_limit]
+
+
+def count_entities_with_tag(
+    client: DataHubMetadataApiClient,
+    tag_urn: str,
+    entity_types: Optional[List[str]] = None,
+    sample_limit: int = 0,
+) -> Tuple[int, List[str]]:
+    """
+    Count the entities that have a tag, without fetching them all.
+
+    Args:
+        client: DataHub metadata client
+        tag_urn: URN of the tag
+        entity_types: Optional list of entity types to count
+        sample_limit: Number of matching URNs to return
+
+    Returns:
+        Tuple of (number of entities with the tag, sample of their URNs)
+    """
+    return count_entities(client, entity_types, [search_criterion("tags", tag_urn)], sample_limit)
+
+
+def count_entities_with_glossary_term(
+    client: DataHubMetadataApiClient,
+    term_urn: str,
+    entity_types: Optional[List[str]] = None,
+    sample_limit: int = 0,
+) -> Tuple[int, List[str]]:
+    """
+    Count the entities that have a glossary term, without fetching them all.
+
+    Args:
+        client: DataHub metadata client
+        term_urn: URN of the glossary term
+        entity_types: Optional list of entity types to count
+        sample_limit: Number of matching URNs to return
+
+    Returns:
+        Tuple of (number of entities with the glossary term, sample of their URNs)
+    """
+    return count_entities(
+        client, entity_types, [search_criterion("glossaryTerms", term_urn)], sample_limit
+    )
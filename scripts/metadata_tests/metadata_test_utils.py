@@ -7,9 +7,13 @@ import json
 import logging
 import os
 import sys
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
-from typing import Dict, Any, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Tuple
 
 # Add the parent directory to the sys.path
 sys.path.append(
@@ -17,9 +21,28 @@ sys.path.append(
 )
 
 from utils.datahub_metadata_api import DataHubMetadataApiClient
+from utils.relationship_graph import RelationshipGraph
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TEST_WORKERS = 4
+
+# Client method listing every entity of a type, with the same data as its export_* method
+SNAPSHOT_LOADERS = {
+    "domain": "list_domains",
+    "glossaryNode": "list_glossary_nodes",
+    "glossaryTerm": "list_glossary_terms",
+    "tag": "list_tags",
+}
+
+# Client method exporting a single entity of a type
+ENTITY_EXPORTERS = {
+    "domain": "export_domain",
+    "glossaryNode": "export_glossary_node",
+    "glossaryTerm": "export_glossary_term",
+    "tag": "export_tag",
+}
+
 
 class TestSeverity(Enum):
     """Severity level for test results"""
@@ -78,9 +101,98 @@ class TestResult:
         return f"[{status}] {self.test_name}{entity_info}: {self.message}"
 
 
+class EntitySnapshot:
+    """Read-only snapshot of the entities of some types, fetched once and shared by tests"""
+
+    def __init__(self, entities: Mapping[str, Iterable[Dict[str, Any]]], timings: Optional[Dict[str, float]] = None):
+        """
+        Initialize the snapshot
+
+        Args:
+            entities: Entities by entity type
+            timings: Seconds spent fetching each entity type
+        """
+        self._entities = MappingProxyType(
+            {entity_type: tuple(items) for entity_type, items in entities.items()}
+        )
+        self._by_urn = MappingProxyType(
+            {
+                entity.get("urn"): entity
+                for items in self._entities.values()
+                for entity in items
+                if entity.get("urn")
+            }
+        )
+        self.timings = dict(timings or {})
+        self._graph: Optional[RelationshipGraph] = None
+        self._graph_lock = threading.Lock()
+
+    @classmethod
+    def fetch(
+        cls,
+        client: DataHubMetadataApiClient,
+        entity_types: Iterable[str],
+        max_workers: int = DEFAULT_TEST_WORKERS,
+    ) -> "EntitySnapshot":
+        """
+        Fetch every entity of the given types, one type per worker
+
+        Args:
+            client: DataHub metadata client
+            entity_types: Entity types to fetch (keys of SNAPSHOT_LOADERS)
+            max_workers: Number of entity types fetched concurrently
+
+        Returns:
+            Snapshot of the fetched entities
+        """
+        entity_types = sorted(set(entity_types))
+        timings: Dict[str, float] = {}
+
+        def load(entity_type: str) -> List[Dict[str, Any]]:
+            started = time.time()
+            entities = getattr(client, SNAPSHOT_LOADERS[entity_type])() or []
+            timings[entity_type] = round(time.time() - started, 3)
+            logger.info(f"Snapshot fetched {len(entities)} {entity_type} entities in {timings[entity_type]}s")
+            return entities
+
+        if not entity_types:
+            return cls({})
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(entity_types)))) as executor:
+            entities = dict(zip(entity_types, executor.map(load, entity_types)))
+        return cls(entities, timings)
+
+    def has(self, entity_type: str) -> bool:
+        """Whether the snapshot holds the entities of a type"""
+        return entity_type in self._entities
+
+    def entities(self, entity_type: str) -> Tuple[Dict[str, Any], ...]:
+        """All entities of a type"""
+        return self._entities.get(entity_type, ())
+
+    def get(self, urn: str) -> Optional[Dict[str, Any]]:
+        """Entity with the given URN, if it is in the snapshot"""
+        return self._by_urn.get(urn)
+
+    def counts(self) -> Dict[str, int]:
+        """Number of entities of each type"""
+        return {entity_type: len(items) for entity_type, items in self._entities.items()}
+
+    def graph(self) -> RelationshipGraph:
+        """Relationship graph of the snapshot, built on first use and shared by the tests"""
+        with self._graph_lock:
+            if self._graph is None:
+                self._graph = RelationshipGraph.from_entities(
+                    entity for items in self._entities.values() for entity in items
+                )
+            return self._graph
+
+
 class MetadataTest(ABC):
     """Abstract base class for metadata tests"""
 
+    # Entity types the test reads, fetched once into the suite's shared snapshot
+    required_entity_types: Tuple[str, ...] = ()
+
     def __init__(self, client: DataHubMetadataApiClient, name: Optional[str] = None):
         """
         Initialize a metadata test
@@ -91,6 +203,55 @@ class MetadataTest(ABC):
         """
         self.client = client
         self.name = name or self.__class__.__name__
+        self.snapshot: Optional[EntitySnapshot] = None
+
+    def list_entities(self, entity_type: str) -> List[Dict[str, Any]]:
+        """
+        All entities of a type, from the shared snapshot when it holds them
+
+        Args:
+            entity_type: Entity type (domain, glossaryNode, glossaryTerm, tag)
+
+        Returns:
+            List of entities
+        """
+        if self.snapshot is not None and self.snapshot.has(entity_type):
+            return list(self.snapshot.entities(entity_type))
+        return getattr(self.client, SNAPSHOT_LOADERS[entity_type])() or []
+
+    def get_entity(self, urn: str, entity_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Detailed data of an entity, from the shared snapshot when it holds it
+
+        Args:
+            urn: Entity URN
+            entity_type: Entity type (domain, glossaryNode, glossaryTerm, tag)
+
+        Returns:
+            Entity data, or None if it could not be retrieved
+        """
+        if self.snapshot is not None:
+            entity = self.snapshot.get(urn)
+            if entity is not None:
+                return entity
+        return getattr(self.client, ENTITY_EXPORTERS[entity_type])(urn)
+
+    def relationship_graph(self, *entity_types: str) -> RelationshipGraph:
+        """
+        Relationship graph of the entities of some types
+
+        Args:
+            *entity_types: Entity types the graph must hold (domain, glossaryNode, glossaryTerm, tag)
+
+        Returns:
+            The shared snapshot's graph when the snapshot holds all the types,
+            otherwise a graph of the listed entities
+        """
+        if self.snapshot is not None and all(self.snapshot.has(entity_type) for entity_type in entity_types):
+            return self.snapshot.graph()
+        return RelationshipGraph.from_entities(
+            entity for entity_type in entity_types for entity in self.list_entities(entity_type)
+        )
 
     @abstractmethod
     def run(self) -> List[TestResult]:
@@ -136,17 +297,22 @@ class MetadataTest(ABC):
 class MetadataTestSuite:
     """Class representing a suite of metadata tests"""
 
-    def __init__(self, name: str, client: DataHubMetadataApiClient):
+    def __init__(self, name: str, client: DataHubMetadataApiClient, snapshot_source: Any = None):
         """
         Initialize a test suite
 
         Args:
             name: Name of the test suite
             client: DataHub metadata client
+            snapshot_source: Where the shared snapshot is read from instead of the
+                client, e.g. a local MetadataMirror (optional)
         """
         self.name = name
         self.client = client
+        self.snapshot_source = snapshot_source
         self.tests: List[MetadataTest] = []
+        self.snapshot: Optional[EntitySnapshot] = None
+        self.timings: Dict[str, float] = {}
 
     def add_test(self, test: MetadataTest) -> None:
         """
@@ -157,24 +323,48 @@ class MetadataTestSuite:
         """
         self.tests.append(test)
 
-    def run_all(self) -> Dict[str, List[TestResult]]:
+    def run_all(self, max_workers: int = DEFAULT_TEST_WORKERS) -> Dict[str, List[TestResult]]:
         """
         Run all tests in the suite
 
+        The entity types the tests declare in required_entity_types are fetched
+        once, concurrently, into a shared read-only snapshot; the tests then run
+        concurrently against it.
+
+        Args:
+            max_workers: Number of tests (and entity types fetched) run concurrently
+
         Returns:
             Dictionary mapping test names to test results
         """
-        results: Dict[str, List[TestResult]] = {}
-
+        entity_types = {
+            entity_type for test in self.tests for entity_type in test.required_entity_types
+        }
+        self.snapshot = EntitySnapshot.fetch(self.snapshot_source or self.client, entity_types, max_workers)
         for test in self.tests:
+            test.snapshot = self.snapshot
+
+        def run_test(test: MetadataTest) -> List[TestResult]:
             logger.info(f"Running test: {test.name}")
-            test_results = test.run()
-            results[test.name] = test_results
+            started = time.time()
+            try:
+                test_results = test.run()
+            except Exception as e:
+                logger.error(f"Test {test.name} raised an exception: {str(e)}")
+                test_results = [test.create_result(False, f"Test raised an exception: {str(e)}")]
+            self.timings[test.name] = round(time.time() - started, 3)
+            return test_results
 
-            # Log results
-            for result in test_results:
-                log_level = logging.INFO if result.success else logging.ERROR
-                logger.log(log_level, str(result))
+        results: Dict[str, List[TestResult]] = {}
+        if self.tests:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(self.tests)))) as executor:
+                for test, test_results in zip(self.tests, executor.map(run_test, self.tests)):
+                    results[test.name] = test_results
+
+                    # Log results
+                    for result in test_results:
+                        log_level = logging.INFO if result.success else logging.ERROR
+                        logger.log(log_level, str(result))
 
         return results
 
@@ -192,11 +382,18 @@ class MetadataTestSuite:
         for test_name, test_results_list in results.items():
             test_results[test_name] = [r.to_dict() for r in test_results_list]
 
-        return {
+        result_dict = {
             "name": self.name,
             "testCount": len(self.tests),
             "results": test_results,
+            "timings": {name: self.timings[name] for name in results if name in self.timings},
         }
+        if self.snapshot is not None:
+            result_dict["snapshot"] = {
+                "counts": self.snapshot.counts(),
+                "timings": self.snapshot.timings,
+            }
+        return result_dict
 
     def save_results(
         self, results: Dict[str, List[TestResult]], output_file: str
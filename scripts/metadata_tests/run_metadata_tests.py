@@ -8,7 +8,7 @@ import json
 import logging
 import os
 import sys
-from typing import List, Optional
+from typing import Any, List, Optional
 
 # Add the parent directory to the sys.path
 sys.path.append(
@@ -16,8 +16,10 @@ sys.path.append(
 )
 
 from utils.datahub_metadata_api import DataHubMetadataApiClient
+from utils.metadata_mirror import MetadataMirror
 from utils.token_utils import get_token_from_env
 from scripts.metadata_tests.metadata_test_utils import (
+    DEFAULT_TEST_WORKERS,
     MetadataTest,
     MetadataTestSuite,
     TestResult,
@@ -103,6 +105,19 @@ def parse_args():
         help="Logging level (default: INFO)",
     )
 
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_TEST_WORKERS,
+        help=f"Number of tests run concurrently against the shared entity snapshot (default: {DEFAULT_TEST_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--mirror",
+        help="Read the entities tested from this local metadata mirror (see mirror_metadata.py) "
+        "instead of querying DataHub",
+    )
+
     parser.add_argument(
         "--fail-on-error",
         action="store_true",
@@ -120,11 +135,13 @@ def parse_args():
 class DomainRequiredFieldsTest(MetadataTest):
     """Test that domains have all required fields"""
 
+    required_entity_types = ("domain",)
+
     def run(self) -> List[TestResult]:
         results = []
 
         # Get all domains
-        domains = self.client.list_domains()
+        domains = self.list_entities("domain")
 
         for domain in domains:
             domain_urn = domain.get("urn")
@@ -132,7 +149,7 @@ class DomainRequiredFieldsTest(MetadataTest):
                 continue
 
             # Get detailed domain info
-            domain_info = self.client.export_domain(domain_urn)
+            domain_info = self.get_entity(domain_urn, "domain")
             if not domain_info:
                 results.append(
                     self.create_result(
@@ -201,11 +218,13 @@ class DomainRequiredFieldsTest(MetadataTest):
 class GlossaryTermRequiredFieldsTest(MetadataTest):
     """Test that glossary terms have all required fields"""
 
+    required_entity_types = ("glossaryTerm",)
+
     def run(self) -> List[TestResult]:
         results = []
 
         # Get all glossary terms
-        terms = self.client.list_glossary_terms()
+        terms = self.list_entities("glossaryTerm")
 
         for term in terms:
             term_urn = term.get("urn")
@@ -213,7 +232,7 @@ class GlossaryTermRequiredFieldsTest(MetadataTest):
                 continue
 
             # Get detailed term info
-            term_info = self.client.export_glossary_term(term_urn)
+            term_info = self.get_entity(term_urn, "glossaryTerm")
             if not term_info:
                 results.append(
                     self.create_result(
@@ -281,6 +300,7 @@ def load_tests(
     entity_type: Optional[str] = None,
     entity_urn: Optional[str] = None,
     config_file: Optional[str] = None,
+    snapshot_source: Any = None,
 ) -> MetadataTestSuite:
     """
     Load tests based on entity type and configuration
@@ -290,11 +310,12 @@ def load_tests(
         entity_type: Type of entity to test
         entity_urn: Specific entity URN to test
         config_file: Test configuration file
+        snapshot_source: Where the tested entities are read from instead of the client (optional)
 
     Returns:
         Test suite with loaded tests
     """
-    suite = MetadataTestSuite("DataHub Metadata Quality Tests", client)
+    suite = MetadataTestSuite("DataHub Metadata Quality Tests", client, snapshot_source)
 
     # Add tests based on entity type or include all if not specified
     if not entity_type or entity_type == "domain":
@@ -345,8 +366,9 @@ def main():
 
     try:
         # Load and run tests
+        mirror = MetadataMirror(args.mirror) if args.mirror else None
         test_suite = load_tests(
-            client, args.entity_type, args.entity_urn, args.test_config
+            client, args.entity_type, args.entity_urn, args.test_config, mirror
         )
 
         if not test_suite.tests:
@@ -354,7 +376,7 @@ def main():
             sys.exit(1)
 
         logger.info(f"Running {len(test_suite.tests)} tests...")
-        results = test_suite.run_all()
+        results = test_suite.run_all(max_workers=args.max_workers)
 
         # Determine if there were errors
         has_errors = False
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Maintain a local SQLite mirror of the metadata of a DataHub instance.
+
+The first run scrolls through all mirrored entity types; later runs only rewrite
+the entities that changed and drop the ones that were deleted, so the script can
+run frequently (e.g. from cron). Metadata tests (run_metadata_tests.py --mirror),
+comparisons (compare_metadata.py --source-mirror/--target-mirror) and the web UI
+(METADATA_MIRROR_DIR) read from the mirror instead of querying DataHub.
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+
+# Add the parent directory to the sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.datahub_rest_client import DataHubRestClient
+from utils.metadata_mirror import (
+    DEFAULT_MIRROR_DIR,
+    DEFAULT_MIRROR_WORKERS,
+    DEFAULT_SCROLL_SIZE,
+    MIRROR_ENTITY_TYPES,
+    MetadataMirror,
+    mirror_path,
+)
+from utils.token_utils import get_token_from_env
+
+logger = logging.getLogger(__name__)
+
+
+def setup_logging(log_level: str):
+    """
+    Set up logging configuration
+    """
+    numeric_level = getattr(logging, log_level.upper(), None)
+    if not isinstance(numeric_level, int):
+        raise ValueError(f"Invalid log level: {log_level}")
+
+    logging.basicConfig(
+        level=numeric_level,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+
+def parse_args():
+    """
+    Parse command line arguments
+    """
+    parser = argparse.ArgumentParser(
+        description="Maintain a local SQLite mirror of DataHub metadata"
+    )
+
+    parser.add_argument(
+        "--server-url",
+        "-s",
+        required=True,
+        help="DataHub server URL (e.g., http://localhost:8080)",
+    )
+
+    parser.add_argument(
+        "--token-file",
+        help="File containing DataHub access token",
+    )
+
+    parser.add_argument(
+        "--mirror-dir",
+        default=DEFAULT_MIRROR_DIR,
+        help=f"Directory holding one mirror per DataHub instance (default: {DEFAULT_MIRROR_DIR})",
+    )
+
+    parser.add_argument(
+        "--mirror-file",
+        help="Path of the mirror database (default: derived from --mirror-dir and --server-url)",
+    )
+
+    parser.add_argument(
+        "--entity-types",
+        nargs="+",
+        choices=MIRROR_ENTITY_TYPES,
+        help="Entity types to refresh (default: all)",
+    )
+
+    parser.add_argument(
+        "--skip-associations",
+        action="store_true",
+        help="Do not refresh the datasets, dashboards, ... associated with tags, terms and domains",
+    )
+
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=DEFAULT_SCROLL_SIZE,
+        help=f"Number of entities fetched per request (default: {DEFAULT_SCROLL_SIZE})",
+    )
+
+    parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=DEFAULT_MIRROR_WORKERS,
+        help=f"Number of entity types fetched concurrently (default: {DEFAULT_MIRROR_WORKERS})",
+    )
+
+    parser.add_argument(
+        "--status",
+        action="store_true",
+        help="Print the last sync of each entity type and exit",
+    )
+
+    parser.add_argument(
+        "--log-level",
+        default="INFO",
+        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
+        help="Logging level (default: INFO)",
+    )
+
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    setup_logging(args.log_level)
+
+    path = args.mirror_file or mirror_path(args.mirror_dir, args.server_url)
+    mirror = MetadataMirror(path)
+
+    if args.status:
+        print(json.dumps(mirror.status(), indent=2))
+        return
+
+    # Get token from file or environment
+    token = None
+    if args.token_file:
+        try:
+            with open(args.token_file, "r") as f:
+                token = f.read().strip()
+        except Exception as e:
+            logger.error(f"Error reading token file: {str(e)}")
+            sys.exit(1)
+    else:
+        token = get_token_from_env()
+
+    try:
+        client = DataHubRestClient(args.server_url, token)
+    except Exception as e:
+        logger.error(f"Error initializing client: {str(e)}")
+        sys.exit(1)
+
+    logger.info(f"Refreshing the metadata mirror {path} from {args.server_url}")
+    report = mirror.sync(
+        client,
+        entity_types=args.entity_types,
+        associations=not args.skip_associations,
+        page_size=args.page_size,
+        max_workers=args.max_workers,
+    )
+    mirror.close()
+
+    print(json.dumps(report, indent=2))
+    if report.get("errors"):
+        logger.error(f"Failed to refresh: {', '.join(report['errors'])}")
+        sys.exit(1)
+    logger.info("Metadata mirror refreshed successfully")
+
+
+if __name__ == "__main__":
+    main()
@@ -7,14 +7,20 @@ for migrating metadata between DataHub environments using browse path and name m
 
 Usage:
     python process_metadata_migration.py --input exported_entities.json --target-env staging --dry-run
+    python process_metadata_migration.py --input exported_entities.jsonl --target-env staging --chunk-size 500
 """
 
 import argparse
+import hashlib
 import json
 import os
+import random
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Any
 from dataclasses import dataclass
 import logging
 from urllib.parse import urlparse
@@ -25,6 +31,11 @@ sys.path.insert(0, str(project_root))
 
 from utils.datahub_api import DataHubClient
 from utils.datahub_metadata_api import DataHubMetadataApiClient
+from utils.json_stream import is_json_lines_path, iter_json_lines, iter_json_object_members, read_json_header
+from utils.mcp_emitter import BatchMcpEmitter, DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS, DEFAULT_MAX_RETRIES
+from utils.mcp_fingerprint import aspect_fingerprint
+from utils.run_journal import RunJournal
+from utils.target_diff import DEFAULT_DIFF_BATCH_SIZE, TargetStateDiff
 
 try:
     from datahub.metadata.schema_classes import (
@@ -46,6 +57,681 @@ except ImportError as e:
     logging.error(f"Failed to import DataHub schema classes: {e}")
     sys.exit(1)
 
+# Fields fetched for every target entity candidate
+TARGET_ENTITY_SEARCH_QUERY = """
+query GetTargetEntitiesForMigration($input: SearchAcrossEntitiesInput!) {
+  searchAcrossEntities(input: $input) {
+    start
+    count
+    total
+    searchResults {
+      entity {
+        urn
+        type
+        ... on Dataset {
+          name
+          platform {
+            name
+            properties {
+              displayName
+            }
+          }
+          dataPlatformInstance {
+            instanceId
+            platform {
+              name
+            }
+          }
+          domain {
+            domain {
+              urn
+            }
+          }
+          browsePaths {
+            path
+          }
+          browsePathV2 {
+            path {
+              entity {
+                ... on Container {
+                  properties {
+                    name
+                  }
+                }
+              }
+            }
+          }
+          editableProperties {
+            name
+            description
+          }
+          tags {
+            tags {
+              tag {
+                urn
+              }
+            }
+          }
+          glossaryTerms {
+            terms {
+              term {
+                urn
+                glossaryTermInfo {
+                  name
+                }
+              }
+            }
+          }
+          structuredProperties {
+            properties {
+              structuredProperty {
+                urn
+              }
+              values {
+                ... on StringValue {
+                  stringValue
+                }
+                ... on NumberValue {
+                  numberValue
+                }
+              }
+              valueEntities {
+                urn
+              }
+            }
+          }
+        }
+        ... on Container {
+          properties {
+            name
+          }
+          platform {
+            name
+            properties {
+              displayName
+            }
+          }
+          dataPlatformInstance {
+            instanceId
+            platform {
+              name
+            }
+          }
+          domain {
+            domain {
+              urn
+            }
+          }
+          browsePathV2 {
+            path {
+              entity {
+                ... on Container {
+                  properties {
+                    name
+                  }
+                }
+              }
+            }
+          }
+          editableProperties {
+            description
+          }
+          tags {
+            tags {
+              tag {
+                urn
+              }
+            }
+          }
+          glossaryTerms {
+            terms {
+              term {
+                urn
+                glossaryTermInfo {
+                  name
+                }
+              }
+            }
+          }
+          structuredProperties {
+            properties {
+              structuredProperty {
+                urn
+              }
+              values {
+                ... on StringValue {
+                  stringValue
+                }
+                ... on NumberValue {
+                  numberValue
+                }
+              }
+              valueEntities {
+                urn
+              }
+            }
+          }
+        }
+        ... on Chart {
+          properties {
+            name
+          }
+          platform {
+            name
+            properties {
+              displayName
+            }
+          }
+          dataPlatformInstance {
+            instanceId
+            platform {
+              name
+            }
+          }
+          domain {
+            domain {
+              urn
+            }
+          }
+          browsePaths {
+            path
+          }
+          browsePathV2 {
+            path {
+              entity {
+                ... on Container {
+                  properties {
+                    name
+                  }
+                }
+              }
+            }
+          }
+          editableProperties {
+            description
+          }
+          tags {
+            tags {
+              tag {
+                urn
+              }
+            }
+          }
+          glossaryTerms {
+            terms {
+              term {
+                urn
+                glossaryTermInfo {
+                  name
+                }
+              }
+            }
+          }
+          structuredProperties {
+            properties {
+              structuredProperty {
+                urn
+              }
+              values {
+                ... on StringValue {
+                  stringValue
+                }
+                ... on NumberValue {
+                  numberValue
+                }
+              }
+              valueEntities {
+                urn
+              }
+            }
+          }
+        }
+        ... on Dashboard {
+          properties {
+            name
+          }
+          platform {
+            name
+            properties {
+              displayName
+            }
+          }
+          dataPlatformInstance {
+            instanceId
+            platform {
+              name
+            }
+          }
+          domain {
+            domain {
+              urn
+            }
+          }
+          browsePaths {
+            path
+          }
+          browsePathV2 {
+            path {
+              entity {
+                ... on Container {
+                  properties {
+                    name
+                  }
+                }
+              }
+            }
+          }
+          editableProperties {
+            description
+          }
+          tags {
+            tags {
+              tag {
+                urn
+              }
+            }
+          }
+          glossaryTerms {
+            terms {
+              term {
+                urn
+                glossaryTermInfo {
+                  name
+                }
+              }
+            }
+          }
+          structuredProperties {
+            properties {
+              structuredProperty {
+                urn
+              }
+              values {
+                ... on StringValue {
+                  stringValue
+                }
+                ... on NumberValue {
+                  numberValue
+                }
+              }
+              valueEntities {
+                urn
+              }
+            }
+          }
+        }
+        ... on DataFlow {
+          properties {
+            name
+          }
+          platform {
+            name
+            properties {
+              displayName
+            }
+          }
+          dataPlatformInstance {
+            instanceId
+            platform {
+              name
+            }
+          }
+          domain {
+            domain {
+              urn
+            }
+          }
+          browsePaths {
+            path
+          }
+          browsePathV2 {
+            path {
+              entity {
+                ... on Container {
+                  properties {
+                    name
+                  }
+                }
+              }
+            }
+          }
+          editableProperties {
+            description
+          }
+          tags {
+            tags {
+              tag {
+                urn
+              }
+            }
+          }
+          glossaryTerms {
+            terms {
+              term {
+                urn
+                glossaryTermInfo {
+                  name
+                }
+              }
+            }
+          }
+          structuredProperties {
+            properties {
+              structuredProperty {
+                urn
+              }
+              values {
+                ... on StringValue {
+                  stringValue
+                }
+                ... on NumberValue {
+                  numberValue
+                }
+              }
+              valueEntities {
+                urn
+              }
+            }
+          }
+        }
+        ... on DataJob {
+          properties {
+            name
+          }
+          dataFlow {
+            flowId
+            properties {
+              name
+            }
+          }
+          dataPlatformInstance {
+            instanceId
+            platform {
+              name
+            }
+          }
+          domain {
+            domain {
+              urn
+            }
+          }
+          browsePaths {
+            path
+          }
+          browsePathV2 {
+            path {
+              entity {
+                ... on Container {
+                  properties {
+                    name
+                  }
+                }
+              }
+            }
+          }
+          editableProperties {
+            description
+          }
+          tags {
+            tags {
+              tag {
+                urn
+              }
+            }
+          }
+          glossaryTerms {
+            terms {
+              term {
+                urn
+                glossaryTermInfo {
+                  name
+                }
+              }
+            }
+          }
+          structuredProperties {
+            properties {
+              structuredProperty {
+                urn
+              }
+              values {
+                ... on StringValue {
+                  stringValue
+                }
+                ... on NumberValue {
+                  numberValue
+                }
+              }
+              valueEntities {
+                urn
+              }
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Number of names or browse path components packed into one lookup request
+DEFAULT_LOOKUP_BATCH_SIZE = 50
+
+# Number of search results requested per page of a lookup
+DEFAULT_LOOKUP_PAGE_SIZE = 500
+
+# Seconds cached lookup results stay valid
+DEFAULT_LOOKUP_CACHE_TTL = 3600
+
+# Elasticsearch result window; results beyond it cannot be paged to
+MAX_LOOKUP_RESULTS = 10000
+
+# Search index field holding the entity name, for types that do not use "name"
+NAME_SEARCH_FIELDS = {
+    'CHART': 'title',
+    'DASHBOARD': 'title',
+}
+
+
+class TargetLookupPlanner:
+    """
+    Plans and runs the searches that fetch target entity candidates.
+
+    Source names and browse path components are grouped by (platform, entity type)
+    and packed into batches, each fetched with a single paged searchAcrossEntities
+    request using orFilters. Batches run concurrently, and their results are cached
+    on disk per target environment so repeated runs do not search again.
+    """
+
+    def __init__(
+        self,
+        graph: Any,
+        target_environment: str,
+        batch_size: int = DEFAULT_LOOKUP_BATCH_SIZE,
+        page_size: int = DEFAULT_LOOKUP_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_dir: Optional[str] = None,
+        cache_ttl: int = DEFAULT_LOOKUP_CACHE_TTL,
+    ):
+        self.graph = graph
+        self.batch_size = max(1, batch_size)
+        self.page_size = max(1, page_size)
+        self.max_workers = max(1, max_workers)
+        self.cache_ttl = cache_ttl
+        self.cache_path = Path(cache_dir) / f"{target_environment}.json" if cache_dir else None
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._cache = self._load_cache()
+        self.cache_hits = 0
+
+    def _load_cache(self) -> Dict[str, Any]:
+        """Load cached lookup results for the target environment"""
+        if not self.cache_path or not self.cache_path.exists():
+            return {}
+        try:
+            with open(self.cache_path, 'r') as f:
+                cache = json.load(f)
+        except (OSError, ValueError) as e:
+            self.logger.warning(f"Ignoring unreadable lookup cache {self.cache_path}: {e}")
+            return {}
+        now = time.time()
+        return {
+            key: entry for key, entry in cache.items()
+            if now - entry.get('fetched_at', 0) < self.cache_ttl
+        }
+
+    def save_cache(self):
+        """Write the lookup cache, dropping expired entries"""
+        if not self.cache_path:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.cache_path.with_suffix('.tmp')
+        with self._lock:
+            with open(temp_path, 'w') as f:
+                json.dump(self._cache, f)
+        os.replace(temp_path, self.cache_path)
+
+    @staticmethod
+    def _cache_key(variables: Dict[str, Any]) -> str:
+        payload = json.dumps(variables, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def plan(self, groups: Dict[Tuple[Optional[str], Optional[str]], Dict[str, set]]) -> List[Dict[str, Any]]:
+        """
+        Pack source lookups into search requests
+
+        Args:
+            groups: Mapping of (platform name, entity type) to the sets of source
+                "names" and "browse_paths" components to look up
+
+        Returns:
+            List of lookups, each with its kind, platform, values and search variables
+        """
+        lookups = []
+        for (platform, entity_type), group in sorted(groups.items(), key=lambda item: (str(item[0][0]), str(item[0][1]))):
+            platform_criteria = []
+            if platform:
+                platform_criteria.append({
+                    "field": "platform",
+                    "condition": "EQUAL",
+                    "values": [f"urn:li:dataPlatform:{platform}"],
+                    "negated": False
+                })
+            name_field = NAME_SEARCH_FIELDS.get(entity_type or '', 'name')
+
+            for kind, values in (('name', group.get('names')), ('browse_path', group.get('browse_paths'))):
+                values = sorted(values or [])
+                for i in range(0, len(values), self.batch_size):
+                    batch = values[i:i + self.batch_size]
+                    if kind == 'name':
+                        # CONTAIN also finds names carrying a schema prefix; results are filtered afterwards
+                        or_filters = [{"and": [{"field": name_field, "condition": "CONTAIN", "values": batch, "negated": False}] + platform_criteria}]
+                    else:
+                        or_filters = [
+                            {"and": [{"field": field, "condition": "CONTAIN", "values": batch, "negated": False}] + platform_criteria}
+                            for field in ("browsePathV2", "browsePath")
+                        ]
+                    variables = {"input": {"query": "*", "start": 0, "count": self.page_size, "orFilters": or_filters}}
+                    if entity_type:
+                        variables["input"]["types"] = [entity_type]
+                    lookups.append({
+                        'kind': kind,
+                        'platform': platform,
+                        'values': batch,
+                        'variables': variables,
+                    })
+        return lookups
+
+    def _search(self, variables: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run a search, following pages until all results are fetched"""
+        key = self._cache_key(variables)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            with self._lock:
+                self.cache_hits += 1
+            return cached['entities']
+
+        entities = []
+        start = 0
+        while True:
+            page_variables = {"input": dict(variables["input"], start=start)}
+            result = self.graph.execute_graphql(TARGET_ENTITY_SEARCH_QUERY, page_variables)
+            search = (result or {}).get("searchAcrossEntities") or {}
+            page = [item.get("entity") for item in search.get("searchResults") or [] if item.get("entity")]
+            entities.extend(page)
+            start += self.page_size
+            total = search.get("total") or 0
+            if not page or start >= total:
+                break
+            if start >= MAX_LOOKUP_RESULTS:
+                self.logger.warning(f"Lookup matched {total} entities, only the first {MAX_LOOKUP_RESULTS} were fetched; lower the lookup batch size")
+                break
+
+        with self._lock:
+            self._cache[key] = {'fetched_at': time.time(), 'entities': entities}
+        return entities
+
+    def _run_lookup(self, lookup: Dict[str, Any], name_matcher: Optional[Callable[[str, str, str], bool]]) -> List[Dict[str, Any]]:
+        """Run one lookup and keep the results that belong to it"""
+        entities = []
+        for entity in self._search(lookup['variables']):
+            # Check the platform on the client side as well, in case the filter was not applied
+            entity_platform = (entity.get("platform") or {}).get("name", "")
+            if lookup['platform'] and entity_platform and entity_platform != lookup['platform']:
+                continue
+            if lookup['kind'] == 'name' and name_matcher:
+                entity_name = entity.get("name") or (entity.get("properties") or {}).get("name", "")
+                if not any(name_matcher(entity_name, name, entity.get("urn", "")) for name in lookup['values']):
+                    continue
+            entities.append(entity)
+        return entities
+
+    def run(self, lookups: List[Dict[str, Any]], name_matcher: Optional[Callable[[str, str, str], bool]] = None) -> List[Dict[str, Any]]:
+        """
+        Run lookups concurrently
+
+        Args:
+            lookups: Lookups returned by plan()
+            name_matcher: Callable (entity_name, source_name, entity_urn) -> bool used
+                to drop name lookup results that do not match any looked up name
+
+        Returns:
+            Unique target entities, in lookup order
+        """
+        unique_entities = {}
+        if not lookups:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(lookups))) as executor:
+            results = list(executor.map(lambda lookup: self._run_lookup(lookup, name_matcher), lookups))
+
+        for entities in results:
+            for entity in entities:
+                urn = entity.get('urn')
+                if urn and urn not in unique_entities:
+                    unique_entities[urn] = entity
+
+        self.save_cache()
+        self.logger.info(
+            f"Ran {len(lookups)} lookups ({self.cache_hits} served from cache), "
+            f"found {len(unique_entities)} unique target entities"
+        )
+        return list(unique_entities.values())
+
+
+# Keys of an export document holding the entity list
+ENTITY_ARRAY_KEYS = ('entities', 'export_data')
+
+# Number of source entities loaded, matched and emitted together
+DEFAULT_CHUNK_SIZE = 1000
+
+# Directory the run journals of resumable migrations are written to
+DEFAULT_JOURNAL_DIR = '.cache/migration_runs'
+
+# Number of already emitted aspects read back from the target by --verify
+DEFAULT_VERIFY_SAMPLE = 100
+
 @dataclass
 class EntityMatch:
     """Represents a matched entity between source and target environments"""
@@ -54,6 +740,13 @@ class EntityMatch:
     target_name: str
     browse_path: str
     confidence: float
+    match_method: str = 'exact'
+    candidate_count: int = 1
+
+    @property
+    def ambiguous(self) -> bool:
+        """Whether the matching index returned more than one candidate"""
+        return self.candidate_count > 1
 
 @dataclass
 class MCPTask:
@@ -63,20 +756,183 @@ class MCPTask:
     aspect_data: Dict[str, Any]
     source_urns: List[str]  # Original URNs that need mutation
 
+class EntityMatchIndex:
+    """
+    Indexes over target entities, built once so that each source entity is
+    matched with a constant number of lookups instead of a scan of all targets.
+
+    Indexes, in the order they are tried:
+    - exact: (type, browse path, name)
+    - qualified_name: (type, browse path and name joined by '.', platform instance stripped)
+    - browse_path: reverse trie over the qualified name segments, matching the
+      longest common suffix of at least two segments (e.g. schema.table)
+    - name: (name) multimap, preferring targets of the same type
+    """
+
+    # Confidence of a match by the index that produced it
+    CONFIDENCE = {
+        'exact': 1.0,
+        'qualified_name': 0.95,
+        'browse_path': 0.9,
+        'name': 0.8,
+    }
+
+    # Minimum number of trailing segments a browse path trie match must share
+    MIN_SUFFIX_DEPTH = 2
+
+    def __init__(self):
+        self.exact = {}
+        self.qualified_names = {}
+        self.names = {}
+        self.trie = {}
+
+    @staticmethod
+    def qualified_segments(browse_path: str, name: str, platform_instance: Optional[str] = None) -> List[str]:
+        """Split a browse path and name into lowercase segments, without the platform instance"""
+        segments = [part.strip().lower() for part in (browse_path or '').strip('/').split('/') if part.strip()]
+        segments.extend(part.strip().lower() for part in (name or '').split('.') if part.strip())
+        if platform_instance and segments and segments[0] == platform_instance.lower():
+            segments = segments[1:]
+        return segments
+
+    def add(self, entity: Dict[str, Any], entity_type: str, browse_path: str, name: str, platform_instance: Optional[str] = None):
+        """Add a target entity to every index"""
+        entity_type = (entity_type or '').lower()
+        self.exact.setdefault((entity_type, (browse_path or '').lower(), (name or '').lower()), []).append(entity)
+        if name:
+            self.names.setdefault(name.lower(), []).append(entity)
+
+        segments = self.qualified_segments(browse_path, name, platform_instance)
+        if not segments:
+            return
+        self.qualified_names.setdefault((entity_type, '.'.join(segments)), []).append(entity)
+
+        node = self.trie.setdefault(entity_type, {'children': {}, 'entities': []})
+        for segment in reversed(segments):
+            node = node['children'].setdefault(segment, {'children': {}, 'entities': []})
+            node['entities'].append(entity)
+
+    def _match_suffix(self, entity_type: str, segments: List[str]) -> List[Dict[str, Any]]:
+        """Find the targets sharing the longest qualified name suffix with the segments"""
+        node = self.trie.get(entity_type)
+        best = []
+        depth = 0
+        for segment in reversed(segments):
+            if node is None:
+                break
+            node = node['children'].get(segment)
+            if node is None:
+                break
+            depth += 1
+            if depth >= self.MIN_SUFFIX_DEPTH:
+                best = node['entities']
+        return best
+
+    @staticmethod
+    def _unique_sorted(entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Deduplicate candidates by URN and order them deterministically"""
+        unique = {}
+        for entity in entities:
+            unique.setdefault(entity.get('urn') or '', entity)
+        return [unique[urn] for urn in sorted(unique)]
+
+    def match(
+        self,
+        entity_type: str,
+        expected_name: str,
+        browse_path: str,
+        name: str,
+        platform_instance: Optional[str] = None,
+    ) -> Tuple[Optional[str], List[Dict[str, Any]]]:
+        """
+        Find the target candidates for a source entity
+
+        Args:
+            entity_type: Source entity type
+            expected_name: Expected fully qualified target name (with platform instance)
+            browse_path: Source browse path
+            name: Source entity name
+            platform_instance: Source platform instance
+
+        Returns:
+            Tuple of the index that matched (None if no index matched) and the
+            candidate target entities, ordered by URN
+        """
+        entity_type = (entity_type or '').lower()
+
+        # Target entities are usually fetched without browse paths, so the
+        # expected name is looked up with an empty browse path first
+        candidates = self.exact.get((entity_type, '', (expected_name or '').lower()))
+        if not candidates and browse_path:
+            candidates = self.exact.get((entity_type, browse_path.lower(), (name or '').lower()))
+        if candidates:
+            return 'exact', self._unique_sorted(candidates)
+
+        segments = self.qualified_segments(browse_path, name, platform_instance)
+        if segments:
+            candidates = self.qualified_names.get((entity_type, '.'.join(segments)))
+            if candidates:
+                return 'qualified_name', self._unique_sorted(candidates)
+
+            candidates = self._match_suffix(entity_type, segments)
+            if candidates:
+                return 'browse_path', self._unique_sorted(candidates)
+
+        candidates = self.names.get((name or '').lower(), [])
+        if candidates:
+            same_type = [entity for entity in candidates if (entity.get('type') or '').lower() == entity_type]
+            return 'name', self._unique_sorted(same_type or candidates)
+
+        return None, []
+
+
 class MetadataMigrationProcessor:
     """Main processor for metadata migration"""
     
-    def __init__(self, target_environment: str, mutations: Optional[Dict] = None, dry_run: bool = False):
+    def __init__(
+        self,
+        target_environment: str,
+        mutations: Optional[Dict] = None,
+        dry_run: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        failures_file: Optional[str] = None,
+        lookup_batch_size: int = DEFAULT_LOOKUP_BATCH_SIZE,
+        lookup_cache_dir: Optional[str] = None,
+        lookup_cache_ttl: int = DEFAULT_LOOKUP_CACHE_TTL,
+        journal_dir: str = DEFAULT_JOURNAL_DIR,
+        diff_target_state: bool = False,
+        diff_batch_size: int = DEFAULT_DIFF_BATCH_SIZE,
+    ):
         self.target_environment = target_environment
         self.mutations = mutations or {}
         self.dry_run = dry_run
         self.api_client = None
         self.metadata_api = None
+        self.emitter = None
+        self.emitter_options = {
+            'batch_size': batch_size,
+            'max_workers': max_workers,
+            'max_retries': max_retries,
+            'failures_file': failures_file,
+        }
+        
+        # Emit outcome across all chunks
+        self.emitted_mcp_count = 0
+        self.failed_mcp_count = 0
         
         # Track if mutations were already applied during export
         self.mutations_already_applied = False
         self.export_metadata = None
         
+        # Number of MCPs saved to files so far in dry-run mode
+        self.saved_mcp_count = 0
+        
+        # Journal of the current run, so an interrupted migration can be resumed (not used in dry-run mode)
+        self.journal_dir = journal_dir
+        self.journal = None
+        
         # Setup logging
         logging.basicConfig(
             level=logging.INFO,
@@ -87,6 +943,23 @@ class MetadataMigrationProcessor:
         # Initialize API clients if not dry run
         if not dry_run:
             self._initialize_api_clients()
+        
+        self.lookup_planner = TargetLookupPlanner(
+            self.metadata_api.context.graph if self.metadata_api else None,
+            target_environment,
+            batch_size=lookup_batch_size,
+            max_workers=max_workers,
+            cache_dir=lookup_cache_dir,
+            cache_ttl=lookup_cache_ttl,
+        )
+        
+        # Optional pre-emit diff dropping MCPs the target already has (needs a connection, so not in dry-run mode)
+        self.target_diff = None
+        if diff_target_state:
+            if self.metadata_api:
+                self.target_diff = TargetStateDiff(self.metadata_api.context.graph, batch_size=diff_batch_size, max_workers=max_workers)
+            else:
+                self.logger.info("DRY RUN: Target state diff skipped, all generated MCPs are kept")
     
     def safe_get(self, obj: Any, *keys: str, default: Any = None) -> Any:
         """Safely get nested values from dictionaries, handling None values"""
@@ -112,78 +985,96 @@ class MetadataMigrationProcessor:
             
             self.api_client = DataHubClient(server_url, token)
             self.metadata_api = DataHubMetadataApiClient(server_url, token)
+            self.emitter = BatchMcpEmitter(self.metadata_api.context.graph, **self.emitter_options)
             self.logger.info(f"Initialized API clients for environment: {self.target_environment}")
         except Exception as e:
             self.logger.error(f"Failed to initialize API clients: {e}")
             if not self.dry_run:
                 raise
     
-    def load_exported_entities(self, filepath: str) -> List[Dict[str, Any]]:
-        """Load exported entities from JSON file"""
-        try:
+    def _apply_export_metadata(self, metadata: Dict[str, Any]):
+        """Apply the header metadata of an export (mutation state and configuration)"""
+        # Log export information
+        self.logger.info(f"Loaded export from {metadata.get('environment', 'unknown')} environment")
+        self.logger.info(f"Export timestamp: {metadata.get('export_timestamp', 'unknown')}")
+        self.logger.info(f"Mutations already applied: {metadata.get('mutations_applied', False)}")
+        
+        # If mutations were already applied, we don't need to apply them again
+        if metadata.get('mutations_applied', False):
+            self.logger.info("Mutations were already applied during export - skipping mutation step")
+            self.mutations_already_applied = True
+            self.export_metadata = metadata
+            
+            # Extract mutations from export metadata for browse path searches
+            mutation_config = metadata.get('mutation_config') or {}
+            if 'platform_instance_mapping' in mutation_config:
+                # Convert export format to internal format
+                self.mutations = {
+                    'platform_instances': mutation_config['platform_instance_mapping']
+                }
+                self.logger.info(f"Loaded platform instance mappings from export: {self.mutations['platform_instances']}")
+            else:
+                self.mutations = {}
+    
+    def load_export_header(self, filepath: str) -> Optional[Dict[str, Any]]:
+        """
+        Read and apply the header metadata of an export before any entity is processed.
+        Only the start of the file is parsed when the metadata precedes the entities.
+        """
+        metadata = read_json_header(filepath, 'metadata', stream_keys=ENTITY_ARRAY_KEYS)
+        if isinstance(metadata, dict):
+            self._apply_export_metadata(metadata)
+        return metadata
+    
+    def iter_exported_entities(self, filepath: str) -> Iterator[Dict[str, Any]]:
+        """
+        Stream entities from an export file without loading it into memory.
+        
+        Supports JSON Lines (.jsonl/.ndjson, one entity per line with an optional
+        {"metadata": {...}} first line) and JSON documents: a list of entities,
+        {"metadata": ..., "entities": [...]}, legacy {"entities": [...]} or
+        {"export_data": [...]}, or a single entity. Invalid or empty entities are skipped.
+        """
+        invalid_count = 0
+        valid_count = 0
+        
+        def entities():
             with open(filepath, 'r') as f:
-                data = json.load(f)
-            
-            # Handle different export formats
-            if isinstance(data, dict):
-                # New format: check for metadata and entities
-                if 'metadata' in data and 'entities' in data:
-                    # Extract metadata information
-                    metadata = data['metadata']
-                    entities = data['entities']
-                    
-                    # Log export information
-                    self.logger.info(f"Loaded export from {metadata.get('environment', 'unknown')} environment")
-                    self.logger.info(f"Export timestamp: {metadata.get('export_timestamp', 'unknown')}")
-                    self.logger.info(f"Mutations already applied: {metadata.get('mutations_applied', False)}")
-                    
-                    # If mutations were already applied, we don't need to apply them again
-                    if metadata.get('mutations_applied', False):
-                        self.logger.info("Mutations were already applied during export - skipping mutation step")
-                        self.mutations_already_applied = True
-                        self.export_metadata = metadata
-                        
-                        # Extract mutations from export metadata for browse path searches
-                        if 'mutation_config' in metadata:
-                            mutation_config = metadata['mutation_config']
-                            if 'platform_instance_mapping' in mutation_config:
-                                # Convert export format to internal format
-                                self.mutations = {
-                                    'platform_instances': mutation_config['platform_instance_mapping']
-                                }
-                                self.logger.info(f"Loaded platform instance mappings from export: {self.mutations['platform_instances']}")
-                            else:
-                                self.mutations = {}
-                        else:
-                            self.mutations = {}
-                    
-                elif 'entities' in data:
-                    # Legacy format with entities key
-                    entities = data['entities']
-                elif 'export_data' in data:
-                    # Legacy format with export_data key
-                    entities = data['export_data']
-                else:
-                    # Single entity format
-                    entities = [data]
+                if is_json_lines_path(filepath):
+                    for line_number, value in iter_json_lines(f):
+                        if line_number == 1 and isinstance(value, dict) and list(value) == ['metadata']:
+                            continue
+                        yield value
+                    return
+                
+                # Members that are not entity arrays make up a single-entity document
+                single_entity = {}
+                has_entity_array = False
+                for key, value, is_item in iter_json_object_members(f, stream_keys=ENTITY_ARRAY_KEYS):
+                    if is_item:
+                        has_entity_array = True
+                        yield value
+                    elif key != 'metadata':
+                        single_entity[key] = value
+                if not has_entity_array and single_entity:
+                    yield single_entity
+        
+        for entity in entities():
+            if entity is not None and isinstance(entity, dict) and len(entity) > 0:
+                valid_count += 1
+                yield entity
             else:
-                # List format
-                entities = data
-            
-            # Filter out None values and invalid entities
-            valid_entities = []
-            invalid_count = 0
-            for entity in entities:
-                if entity is not None and isinstance(entity, dict) and len(entity) > 0:
-                    valid_entities.append(entity)
-                else:
-                    invalid_count += 1
-                    
-            self.logger.info(f"Loaded {len(valid_entities)} valid entities from {filepath}")
-            if invalid_count > 0:
-                self.logger.warning(f"Filtered out {invalid_count} invalid/null entities")
-            return valid_entities
-            
+                invalid_count += 1
+        
+        self.logger.info(f"Loaded {valid_count} valid entities from {filepath}")
+        if invalid_count > 0:
+            self.logger.warning(f"Filtered out {invalid_count} invalid/null entities")
+    
+    def load_exported_entities(self, filepath: str) -> List[Dict[str, Any]]:
+        """Load exported entities from a JSON or JSON Lines file"""
+        try:
+            self.load_export_header(filepath)
+            return list(self.iter_exported_entities(filepath))
         except Exception as e:
             self.logger.error(f"Failed to load entities from {filepath}: {e}")
             raise
@@ -237,113 +1128,50 @@ class MetadataMigrationProcessor:
         
         return name
     
+    def _collect_lookup_groups(self, source_entities: List[Dict[str, Any]]) -> Dict[Tuple[Optional[str], Optional[str]], Dict[str, set]]:
+        """Collect the names and browse path components to look up, grouped by (platform, entity type)"""
+        groups = {}
+        platform_instance_mutations = self.mutations.get('platform_instances', {})
+        
+        for entity in source_entities:
+            if not entity or not isinstance(entity, dict):
+                continue
+            
+            platform = self.safe_get(entity, 'platform', 'name')
+            group = groups.setdefault((platform, entity.get('type')), {'names': set(), 'browse_paths': set()})
+            
+            if entity.get('name'):
+                group['names'].add(entity['name'])
+            
+            # Build browse path including platform instance
+            path_parts = []
+            platform_instance = self.safe_get(entity, 'dataPlatformInstance', 'instanceId')
+            if platform_instance:
+                path_parts.append(platform_instance)
+            browse_path = self.extract_browse_path(entity)
+            if browse_path:
+                path_parts.extend(part.strip() for part in browse_path.strip('/').split('/') if part.strip())
+            
+            # Even if mutations were "already applied", search for the mutated components in the
+            # target environment since the source entities may still contain original platform instances
+            for part in path_parts:
+                group['browse_paths'].add(platform_instance_mutations.get(part, part))
+        
+        return groups
+    
     def fetch_target_entities(self, source_entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Fetch entities from target environment based on browse paths and name/platform matching"""
         if self.dry_run:
             self.logger.info("DRY RUN: Would fetch target entities based on browse paths and name/platform matching")
-            # Show what the query would be even in dry-run mode
+            # Show what the queries would be even in dry-run mode
             self._show_graphql_query_preview(source_entities)
             return []
         
         try:
-            # Extract unique browse paths from source entities and apply mutations
-            browse_paths = set()
-            platforms = set()
-            entity_types = set()
-            entity_names = set()
-            platform_instances = set()
-            mutated_browse_paths = set()
-            
-            for entity in source_entities:
-                if not entity or not isinstance(entity, dict):
-                    continue
-                    
-                # Build browse path including platform instance
-                path_parts = []
-                
-                # Add platform instance as first component if available
-                platform_instance = self.safe_get(entity, 'dataPlatformInstance', 'instanceId')
-                if platform_instance:
-                    path_parts.append(platform_instance)
-                
-                # Add browse path components
-                browse_path = self.extract_browse_path(entity)
-                if browse_path:
-                    # Extract path components for search
-                    browse_path_parts = [part.strip() for part in browse_path.strip('/').split('/') if part.strip()]
-                    path_parts.extend(browse_path_parts)
-                
-                if path_parts:
-                    browse_paths.update(path_parts)
-                    
-                    # Apply platform instance mutations to browse path components
-                    mutated_path_parts = []
-                    for part in path_parts:
-                        # Check if this part is a platform instance that needs mutation
-                        if part in self.mutations.get('platform_instances', {}):
-                            mutated_part = self.mutations['platform_instances'][part]
-                            mutated_path_parts.append(mutated_part)
-                            self.logger.debug(f"Mutated browse path component: {part} -> {mutated_part}")
-                        else:
-                            mutated_path_parts.append(part)
-                    mutated_browse_paths.update(mutated_path_parts)
-                
-                # Also collect platforms, entity types, names, and platform instances
-                if entity.get('platform', {}).get('name'):
-                    platforms.add(entity['platform']['name'])
-                if entity.get('type'):
-                    entity_types.add(entity['type'])
-                if entity.get('name'):
-                    entity_names.add(entity['name'])
-                if entity.get('dataPlatformInstance', {}).get('instanceId'):
-                    platform_instances.add(entity['dataPlatformInstance']['instanceId'])
-            
-            # Determine which browse paths to use for searching
-            # Even if mutations were "already applied", we need to search for the mutated browse paths
-            # in the target environment since the source entities may still contain original platform instances
-            search_browse_paths = list(mutated_browse_paths) if mutated_browse_paths else list(browse_paths)
-            if self.mutations_already_applied:
-                if mutated_browse_paths:
-                    self.logger.info("Mutations were marked as applied during export, but applying them for browse path search")
-                    self.logger.info(f"Original browse paths: {list(browse_paths)} -> Mutated browse paths: {list(mutated_browse_paths)}")
-                else:
-                    self.logger.info("Using original browse paths since no mutations were needed")
-            else:
-                self.logger.info(f"Applied platform instance mutations to browse paths: {list(browse_paths)} -> {list(mutated_browse_paths)}")
+            lookups = self.lookup_planner.plan(self._collect_lookup_groups(source_entities))
+            self.logger.info(f"Planned {len(lookups)} target lookups for {len(source_entities)} source entities")
             
-            # Search for entities using multiple approaches
-            target_entities = []
-            
-            # Approach 1: Search by browse paths (with mutations applied)
-            if search_browse_paths:
-                self.logger.info(f"Searching target DataHub for entities with browse path components: {search_browse_paths}")
-                browse_path_entities = self._search_entities_by_browse_paths(search_browse_paths, list(platforms), list(entity_types), list(platform_instances))
-                target_entities.extend(browse_path_entities)
-                self.logger.info(f"Browse path search found {len(browse_path_entities)} entities")
-            
-            # Approach 2: Search by name and platform (for different platform instances)
-            # This is the primary matching approach when browse paths don't match
-            if entity_names and platforms:
-                self.logger.info(f"Searching target DataHub for entities by name and platform: {sorted(entity_names)[:10]}{'...' if len(entity_names) > 10 else ''} on {sorted(platforms)}")
-                if platform_instances:
-                    self.logger.info(f"Source entities have platform instances: {sorted(platform_instances)}")
-                name_platform_entities = self._search_entities_by_name_and_platform(
-                    list(entity_names),
-                    list(platforms),
-                    list(entity_types),
-                    list(platform_instances)
-                )
-                target_entities.extend(name_platform_entities)
-                self.logger.info(f"Name/platform search found {len(name_platform_entities)} entities")
-            
-            # Remove duplicates based on URN
-            unique_entities = {}
-            for entity in target_entities:
-                urn = entity.get('urn')
-                if urn and urn not in unique_entities:
-                    unique_entities[urn] = entity
-            
-            final_entities = list(unique_entities.values())
+            final_entities = self.lookup_planner.run(lookups, name_matcher=self._name_matches)
             self.logger.info(f"Fetched {len(final_entities)} unique entities from target environment")
             return final_entities
             
@@ -351,763 +1179,6 @@ class MetadataMigrationProcessor:
             self.logger.error(f"Failed to fetch target entities: {e}")
             return []
     
-    def _search_entities_by_browse_paths(self, browse_path_components: List[str], platforms: List[str], entity_types: List[str], platform_instances: List[str] = None) -> List[Dict[str, Any]]:
-        """Search for entities in target DataHub using browse path components"""
-        try:
-            # Create GraphQL query for searching entities by browse paths
-            query = """
-            query GetEntitiesWithBrowsePathsForSearch($input: SearchAcrossEntitiesInput!) {
-              searchAcrossEntities(input: $input) {
-                start
-                count
-                total
-                searchResults {
-                  entity {
-                    urn
-                    type
-                    ... on Dataset {
-                      name
-                      platform {
-                        name
-                        properties {
-                          displayName
-                        }
-                      }
-                      dataPlatformInstance {
-                        instanceId
-                        platform {
-                          name
-                        }
-                      }
-                      domain {
-                        domain {
-                          urn
-                        }
-                      }
-                      browsePaths {
-                        path
-                      }
-                      browsePathV2 {
-                        path {
-                          entity {
-                            ... on Container {
-                              properties {
-                                name
-                              }
-                            }
-                          }
-                        }
-                      }
-                      editableProperties {
-                        name
-                        description
-                      }
-                      tags {
-                        tags {
-                          tag {
-                            urn
-                          }
-                        }
-                      }
-                      glossaryTerms {
-                        terms {
-                          term {
-                            urn
-                            glossaryTermInfo {
-                              name
-                            }
-                          }
-                        }
-                      }
-                      structuredProperties {
-                        properties {
-                          structuredProperty {
-                            urn
-                          }
-                          values {
-                            ... on StringValue {
-                              stringValue
-                            }
-                            ... on NumberValue {
-                              numberValue
-                            }
-                          }
-                          valueEntities {
-                            urn
-                          }
-                        }
-                      }
-                    }
-                    ... on Container {
-                      properties {
-                        name
-                      }
-                      platform {
-                        name
-                        properties {
-                          displayName
-                        }
-                      }
-                      dataPlatformInstance {
-                        instanceId
-                        platform {
-                          name
-                        }
-                      }
-                      domain {
-                        domain {
-                          urn
-                        }
-                      }
-                      browsePathV2 {
-                        path {
-                          entity {
-                            ... on Container {
-                              properties {
-                                name
-                              }
-                            }
-                          }
-                        }
-                      }
-                      editableProperties {
-                        description
-                      }
-                      tags {
-                        tags {
-                          tag {
-                            urn
-                          }
-                        }
-                      }
-                      glossaryTerms {
-                        terms {
-                          term {
-                            urn
-                            glossaryTermInfo {
-                              name
-                            }
-                          }
-                        }
-                      }
-                      structuredProperties {
-                        properties {
-                          structuredProperty {
-                            urn
-                          }
-                          values {
-                            ... on StringValue {
-                              stringValue
-                            }
-                            ... on NumberValue {
-                              numberValue
-                            }
-                          }
-                          valueEntities {
-                            urn
-                          }
-                        }
-                      }
-                    }
-                    ... on Chart {
-                      properties {
-                        name
-                      }
-                      platform {
-                        name
-                        properties {
-                          displayName
-                        }
-                      }
-                      dataPlatformInstance {
-                        instanceId
-                        platform {
-                          name
-                        }
-                      }
-                      domain {
-                        domain {
-                          urn
-                        }
-                      }
-                      browsePaths {
-                        path
-                      }
-                      browsePathV2 {
-                        path {
-                          entity {
-                            ... on Container {
-                              properties {
-                                name
-                              }
-                            }
-                          }
-                        }
-                      }
-                      editableProperties {
-                        description
-                      }
-                      tags {
-                        tags {
-                          tag {
-                            urn
-                          }
-                        }
-                      }
-                      glossaryTerms {
-                        terms {
-                          term {
-                            urn
-                            glossaryTermInfo {
-                              name
-                            }
-                          }
-                        }
-                      }
-                      structuredProperties {
-                        properties {
-                          structuredProperty {
-                            urn
-                          }
-                          values {
-                            ... on StringValue {
-                              stringValue
-                            }
-                            ... on NumberValue {
-                              numberValue
-                            }
-                          }
-                          valueEntities {
-                            urn
-                          }
-                        }
-                      }
-                    }
-                    ... on Dashboard {
-                      properties {
-                        name
-                      }
-                      platform {
-                        name
-                        properties {
-                          displayName
-                        }
-                      }
-                      dataPlatformInstance {
-                        instanceId
-                        platform {
-                          name
-                        }
-                      }
-                      domain {
-                        domain {
-                          urn
-                        }
-                      }
-                      browsePaths {
-                        path
-                      }
-                      browsePathV2 {
-                        path {
-                          entity {
-                            ... on Container {
-                              properties {
-                                name
-                              }
-                            }
-                          }
-                        }
-                      }
-                      editableProperties {
-                        description
-                      }
-                      tags {
-                        tags {
-                          tag {
-                            urn
-                          }
-                        }
-                      }
-                      glossaryTerms {
-                        terms {
-                          term {
-                            urn
-                            glossaryTermInfo {
-                              name
-                            }
-                          }
-                        }
-                      }
-                      structuredProperties {
-                        properties {
-                          structuredProperty {
-                            urn
-                          }
-                          values {
-                            ... on StringValue {
-                              stringValue
-                            }
-                            ... on NumberValue {
-                              numberValue
-                            }
-                          }
-                          valueEntities {
-                            urn
-                          }
-                        }
-                      }
-                    }
-                    ... on DataFlow {
-                      properties {
-                        name
-                      }
-                      platform {
-                        name
-                        properties {
-                          displayName
-                        }
-                      }
-                      dataPlatformInstance {
-                        instanceId
-                        platform {
-                          name
-                        }
-                      }
-                      domain {
-                        domain {
-                          urn
-                        }
-                      }
-                      browsePaths {
-                        path
-                      }
-                      browsePathV2 {
-                        path {
-                          entity {
-                            ... on Container {
-                              properties {
-                                name
-                              }
-                            }
-                          }
-                        }
-                      }
-                      editableProperties {
-                        description
-                      }
-                      tags {
-                        tags {
-                          tag {
-                            urn
-                          }
-                        }
-                      }
-                      glossaryTerms {
-                        terms {
-                          term {
-                            urn
-                            glossaryTermInfo {
-                              name
-                            }
-                          }
-                        }
-                      }
-                      structuredProperties {
-                        properties {
-                          structuredProperty {
-                            urn
-                          }
-                          values {
-                            ... on StringValue {
-                              stringValue
-                            }
-                            ... on NumberValue {
-                              numberValue
-                            }
-                          }
-                          valueEntities {
-                            urn
-                          }
-                        }
-                      }
-                    }
-                    ... on DataJob {
-                      properties {
-                        name
-                      }
-                      dataFlow {
-                        flowId
-                        properties {
-                          name
-                        }
-                      }
-                      dataPlatformInstance {
-                        instanceId
-                        platform {
-                          name
-                        }
-                      }
-                      domain {
-                        domain {
-                          urn
-                        }
-                      }
-                      browsePaths {
-                        path
-                      }
-                      browsePathV2 {
-                        path {
-                          entity {
-                            ... on Container {
-                              properties {
-                                name
-                              }
-                            }
-                          }
-                        }
-                      }
-                      editableProperties {
-                        description
-                      }
-                      tags {
-                        tags {
-                          tag {
-                            urn
-                          }
-                        }
-                      }
-                      glossaryTerms {
-                        terms {
-                          term {
-                            urn
-                            glossaryTermInfo {
-                              name
-                            }
-                          }
-                        }
-                      }
-                      structuredProperties {
-                        properties {
-                          structuredProperty {
-                            urn
-                          }
-                          values {
-                            ... on StringValue {
-                              stringValue
-                            }
-                            ... on NumberValue {
-                              numberValue
-                            }
-                          }
-                          valueEntities {
-                            urn
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-            """
-            
-            # Create OR filters for browse paths
-            or_filters = []
-            
-            # Add browsePathV2 filter
-            if browse_path_components:
-                or_filters.append({
-                    "and": [
-                        {
-                            "field": "browsePathV2",
-                            "condition": "CONTAIN",
-                            "values": browse_path_components,
-                            "negated": False
-                        }
-                    ]
-                })
-                
-                # Add browsePath filter as fallback
-                or_filters.append({
-                    "and": [
-                        {
-                            "field": "browsePath",
-                            "condition": "CONTAIN",
-                            "values": browse_path_components,
-                            "negated": False
-                        }
-                    ]
-                })
-            
-            # Note: Platform filtering via GraphQL orFilters doesn't seem to work reliably
-            # So we'll do broader search and filter manually on client side
-            # if platforms:
-            #     or_filters.append({
-            #         "and": [
-            #             {
-            #                 "field": "platform",
-            #                 "condition": "EQUAL",
-            #                 "values": platforms,
-            #                 "negated": False
-            #             }
-            #         ]
-            #     })
-            
-            # Add platform instance filter if we have platform instances
-            # Note: Only add this filter if we know the target entities have platform instances
-            # Many target environments may not have platform instances set, so we'll match by name/platform primarily
-            if platform_instances:
-                self.logger.info(f"Source entities have platform instances: {platform_instances}")
-                self.logger.info("Note: Target entities may not have platform instances - will match by name/platform primarily")
-                # Don't add platformInstance filter as it may exclude valid matches
-                # or_filters.append({
-                #     "and": [
-                #         {
-                #             "field": "platformInstance",
-                #             "condition": "EQUAL",
-                #             "values": platform_instances,
-                #             "negated": False
-                #         }
-                #     ]
-                # })
-            
-            variables = {
-                "input": {
-                    "query": "",
-                    "start": 0,
-                    "count": 1000,
-                    "orFilters": or_filters
-                }
-            }
-            
-            # Add entity types filter if we have them
-            if entity_types:
-                variables["input"]["types"] = entity_types
-            
-            self.logger.info(f"Executing GraphQL query with variables: {variables}")
-            if platform_instances:
-                self.logger.info(f"Including platform instances in search: {platform_instances}")
-            
-            # Execute the GraphQL query
-            result = self.metadata_api.context.graph.execute_graphql(query, variables)
-            
-            if result and "searchAcrossEntities" in result:
-                search_results = result["searchAcrossEntities"].get("searchResults", [])
-                entities = []
-                
-                for search_result in search_results:
-                    entity = search_result.get("entity")
-                    if entity:
-                        # Apply platform filtering manually since GraphQL filter doesn't work reliably
-                        entity_platform = entity.get("platform", {}).get("name", "")
-                        if not platforms or entity_platform in platforms:
-                            entities.append(entity)
-                        else:
-                            self.logger.debug(f"Filtered out entity {entity.get('name', 'N/A')} with platform {entity_platform}")
-                
-                self.logger.info(f"Found {len(entities)} entities in target DataHub (after platform filtering)")
-                return entities
-            else:
-                self.logger.warning("No search results found in GraphQL response")
-                return []
-            
-        except Exception as e:
-            self.logger.error(f"Error searching entities by browse paths: {e}")
-            return []
-    
-    def _search_entities_by_name_and_platform(self, entity_names: List[str], platforms: List[str], entity_types: List[str], platform_instances: List[str] = None) -> List[Dict[str, Any]]:
-        """Search for entities in target DataHub using name and platform (for different platform instances)"""
-        try:
-            # Create GraphQL query for searching entities by name and platform
-            query = """
-            query GetEntitiesByNameAndPlatform($input: SearchAcrossEntitiesInput!) {
-              searchAcrossEntities(input: $input) {
-                start
-                count
-                total
-                searchResults {
-                  entity {
-                    urn
-                    type
-                    ... on Dataset {
-                      name
-                      platform {
-                        name
-                        properties {
-                          displayName
-                        }
-                      }
-                      dataPlatformInstance {
-                        instanceId
-                        platform {
-                          name
-                        }
-                      }
-                      domain {
-                        domain {
-                          urn
-                        }
-                      }
-                      browsePaths {
-                        path
-                      }
-                      browsePathV2 {
-                        path {
-                          entity {
-                            ... on Container {
-                              properties {
-                                name
-                              }
-                            }
-                          }
-                        }
-                      }
-                      editableProperties {
-                        name
-                        description
-                      }
-                      tags {
-                        tags {
-                          tag {
-                            urn
-                          }
-                        }
-                      }
-                      glossaryTerms {
-                        terms {
-                          term {
-                            urn
-                            glossaryTermInfo {
-                              name
-                            }
-                          }
-                        }
-                      }
-                      structuredProperties {
-                        properties {
-                          structuredProperty {
-                            urn
-                          }
-                          values {
-                            ... on StringValue {
-                              stringValue
-                            }
-                            ... on NumberValue {
-                              numberValue
-                            }
-                          }
-                          valueEntities {
-                            urn
-                          }
-                        }
-                      }
-                    }
-                  }
-                }
-              }
-            }
-            """
-            
-            # Create OR filters for each entity name combined with platform
-            or_filters = []
-            
-            # Note: Platform filtering via GraphQL orFilters doesn't seem to work reliably
-            # So we'll do broader search and filter manually on client side
-            # if platforms:
-            #     or_filters.append({
-            #         "and": [
-            #             {
-            #                 "field": "platform",
-            #                 "condition": "EQUAL",
-            #                 "values": platforms,
-            #                 "negated": False
-            #             }
-            #         ]
-            #     })
-            
-            # Add platform instance filter
-            # Note: Many target environments may not have platform instances set
-            # so we'll match by name/platform primarily and not filter by platform instance
-            if platform_instances:
-                self.logger.info(f"Source entities have platform instances: {platform_instances}")
-                self.logger.info("Note: Target entities may not have platform instances - will match by name/platform primarily")
-                # Don't add platformInstance filter as it may exclude valid matches
-                # or_filters.append({
-                #     "and": [
-                #         {
-                #             "field": "platformInstance",
-                #             "condition": "EQUAL",
-                #             "values": platform_instances,
-                #             "negated": False
-                #         }
-                #     ]
-                # })
-            
-            # Use a broad search to get all entities from the platform and filter manually
-            # This handles cases where entity names might have schema prefixes or differences
-            query_string = "*"  # Search for all entities, rely on platform filter
-            
-            variables = {
-                "input": {
-                    "query": query_string,
-                    "start": 0,
-                    "count": 1000,
-                    "orFilters": or_filters
-                }
-            }
-            
-            # Add entity types filter if we have them
-            if entity_types:
-                variables["input"]["types"] = entity_types
-            
-            self.logger.info(f"Executing name/platform GraphQL query with variables: {variables}")
-            
-            # Execute the GraphQL query
-            result = self.metadata_api.context.graph.execute_graphql(query, variables)
-            
-            if result and "searchAcrossEntities" in result:
-                search_results = result["searchAcrossEntities"]["searchResults"]
-                all_entities = []
-                
-                for search_result in search_results:
-                    entity = search_result.get("entity")
-                    if entity:
-                        # Apply platform filtering manually since GraphQL filter doesn't work reliably
-                        entity_platform = entity.get("platform", {}).get("name", "")
-                        if not platforms or entity_platform in platforms:
-                            all_entities.append(entity)
-                        else:
-                            self.logger.debug(f"Filtered out entity {entity.get('name', 'N/A')} with platform {entity_platform}")
-                
-                # Filter entities manually to match source entity names
-                matched_entities = []
-                self.logger.debug(f"Filtering {len(all_entities)} entities against {len(entity_names)} source names")
-                for entity in all_entities:
-                    entity_name = entity.get("name", "")
-                    entity_urn = entity.get("urn", "")
-                    
-                    # Check if this entity matches any of our source entity names
-                    matched = False
-                    for source_name in entity_names:
-                        if self._name_matches(entity_name, source_name, entity_urn):
-                            matched_entities.append(entity)
-                            self.logger.info(f"Matched entity: {entity_name} -> {source_name}")
-                            matched = True
-                            break
-                    
-                    if not matched:
-                        self.logger.debug(f"No match found for target entity: {entity_name} (URN: {entity_urn})")
-                
-                self.logger.info(f"Found {len(all_entities)} total entities (after platform filtering), {len(matched_entities)} matched by name/platform search")
-                return matched_entities
-            else:
-                self.logger.warning("No search results found in name/platform GraphQL response")
-                return []
-            
-        except Exception as e:
-            self.logger.error(f"Error searching entities by name and platform: {e}")
-            return []
-    
     def _name_matches(self, entity_name: str, source_name: str, entity_urn: str) -> bool:
         """Check if an entity name matches a source name, handling schema prefixes and variations"""
         if not entity_name or not source_name:
@@ -1146,129 +1217,27 @@ class MetadataMigrationProcessor:
         return False
     
     def _show_graphql_query_preview(self, source_entities: List[Dict[str, Any]]):
-        """Show what the GraphQL query would look like in dry-run mode"""
+        """Show what the lookup queries would look like in dry-run mode"""
         try:
-            # Extract browse paths and other info (same logic as the real method)
-            browse_paths = set()
-            platforms = set()
-            entity_types = set()
-            mutated_browse_paths = set()
-            
-            for entity in source_entities:
-                if not entity or not isinstance(entity, dict):
-                    continue
-                    
-                # Build browse path including platform instance
-                path_parts = []
-                
-                # Add platform instance as first component if available
-                platform_instance = self.safe_get(entity, 'dataPlatformInstance', 'instanceId')
-                if platform_instance:
-                    path_parts.append(platform_instance)
-                
-                # Add browse path components
-                browse_path = self.extract_browse_path(entity)
-                if browse_path:
-                    # Extract path components for search
-                    browse_path_parts = [part.strip() for part in browse_path.strip('/').split('/') if part.strip()]
-                    path_parts.extend(browse_path_parts)
-                
-                if path_parts:
-                    browse_paths.update(path_parts)
-                    
-                    # Apply platform instance mutations to browse path components
-                    mutated_path_parts = []
-                    for part in path_parts:
-                        # Check if this part is a platform instance that needs mutation
-                        if part in self.mutations.get('platform_instances', {}):
-                            mutated_part = self.mutations['platform_instances'][part]
-                            mutated_path_parts.append(mutated_part)
-                        else:
-                            mutated_path_parts.append(part)
-                    mutated_browse_paths.update(mutated_path_parts)
-                
-                # Also collect platforms and entity types
-                if entity.get('platform', {}).get('name'):
-                    platforms.add(entity['platform']['name'])
-                if entity.get('type'):
-                    entity_types.add(entity['type'])
-            
-            # Determine which browse paths to use for search
-            # Even if mutations were "already applied", we need to search for the mutated browse paths
-            # in the target environment since the source entities may still contain original platform instances
-            search_browse_paths = list(mutated_browse_paths) if mutated_browse_paths else list(browse_paths)
-            
-            # Create the same OR filters as the real method
-            or_filters = []
-            
-            if search_browse_paths:
-                or_filters.append({
-                    "and": [
-                        {
-                            "field": "browsePathV2",
-                            "condition": "CONTAIN",
-                            "values": search_browse_paths,
-                            "negated": False
-                        }
-                    ]
-                })
-                
-                or_filters.append({
-                    "and": [
-                        {
-                            "field": "browsePath",
-                            "condition": "CONTAIN",
-                            "values": search_browse_paths,
-                            "negated": False
-                        }
-                    ]
-                })
-            
-            if platforms:
-                or_filters.append({
-                    "and": [
-                        {
-                            "field": "platform",
-                            "condition": "EQUAL",
-                            "values": list(platforms),
-                            "negated": False
-                        }
-                    ]
-                })
-            
-            variables = {
-                "input": {
-                    "query": "",
-                    "start": 0,
-                    "count": 1000,
-                    "orFilters": or_filters
-                }
-            }
-            
-            if entity_types:
-                variables["input"]["types"] = list(entity_types)
+            lookups = self.lookup_planner.plan(self._collect_lookup_groups(source_entities))
             
             self.logger.info("=== DRY RUN: GraphQL Query Preview ===")
-            self.logger.info(f"Query: searchAcrossEntities")
-            if mutated_browse_paths:
-                self.logger.info(f"Original browse path components: {list(browse_paths)}")
-                self.logger.info(f"Mutated browse path components: {list(mutated_browse_paths)}")
-            else:
-                self.logger.info(f"Browse path components: {list(browse_paths)}")
-            self.logger.info(f"Platforms: {list(platforms)}")
-            self.logger.info(f"Entity types: {list(entity_types)}")
-            self.logger.info(f"Variables: {variables}")
+            self.logger.info(f"Query: searchAcrossEntities, {len(lookups)} lookups")
+            for lookup in lookups[:5]:
+                self.logger.info(
+                    f"{lookup['kind']} lookup on {lookup['platform'] or 'any platform'} "
+                    f"({len(lookup['values'])} values): {lookup['variables']}"
+                )
+            if len(lookups) > 5:
+                self.logger.info(f"... and {len(lookups) - 5} more lookups")
             self.logger.info("=== End Query Preview ===")
             
         except Exception as e:
             self.logger.error(f"Error showing GraphQL preview: {e}")
     
-    def match_entities(self, source_entities: List[Dict[str, Any]], target_entities: List[Dict[str, Any]]) -> List[EntityMatch]:
-        """Match source entities with target entities based on browse path and name"""
-        matches = []
-        
-        # Create lookup for target entities
-        target_lookup = {}
+    def build_match_index(self, target_entities: List[Dict[str, Any]]) -> EntityMatchIndex:
+        """Build the matching indexes over target entities"""
+        index = EntityMatchIndex()
         for target_entity in target_entities:
             # Skip None or empty entities
             if not target_entity or not isinstance(target_entity, dict):
@@ -1277,13 +1246,20 @@ class MetadataMigrationProcessor:
                 
             browse_path = self.extract_browse_path(target_entity)
             name = self.extract_entity_name(target_entity)
-            entity_type = target_entity.get('type', '')
-            
-            key = f"{entity_type}:{browse_path}:{name}".lower()
-            target_lookup[key] = target_entity
+            platform_instance = self.safe_get(target_entity, 'dataPlatformInstance', 'instanceId')
+            index.add(target_entity, target_entity.get('type', ''), browse_path, name, platform_instance)
             
             # DEBUG: Log target entity details
-            self.logger.debug(f"Target entity - URN: {target_entity.get('urn')}, Name: {name}, Browse path: {browse_path}, Key: {key}")
+            self.logger.debug(f"Target entity - URN: {target_entity.get('urn')}, Name: {name}, Browse path: {browse_path}")
+        return index
+    
+    def match_entities(self, source_entities: List[Dict[str, Any]], target_entities: List[Dict[str, Any]]) -> List[EntityMatch]:
+        """Match source entities with target entities based on browse path and name"""
+        matches = []
+        ambiguous_count = 0
+        
+        # Create lookup indexes for target entities
+        index = self.build_match_index(target_entities)
         
         # Match source entities
         for source_entity in source_entities:
@@ -1303,54 +1279,49 @@ class MetadataMigrationProcessor:
             if platform_instance:
                 # For target matching, we need to find entities with the CURRENT platform instance (abc)
                 # The mutation will be applied in the MCP, not in the matching
-                current_platform_instance = platform_instance  # Keep original for matching
-                
-                # Build expected target entity name (with original platform instance)
                 if source_browse_path:
                     browse_path_parts = [part.strip() for part in source_browse_path.strip('/').split('/') if part.strip()]
-                    target_entity_name = f"{current_platform_instance}.{'.'.join(browse_path_parts)}.{source_name}"
+                    target_entity_name = f"{platform_instance}.{'.'.join(browse_path_parts)}.{source_name}"
                 else:
-                    target_entity_name = f"{current_platform_instance}.{source_name}"
+                    target_entity_name = f"{platform_instance}.{source_name}"
             else:
                 target_entity_name = source_name
             
-            # Try to match using the expected target entity name
-            target_key = f"{source_type}::{target_entity_name}".lower()  # Empty browse path since target entities don't have browse paths
-            
             # DEBUG: Log matching attempt
-            self.logger.debug(f"Source entity - Name: {source_name}, Type: {source_type}, Target key: {target_key}")
+            self.logger.debug(f"Source entity - Name: {source_name}, Type: {source_type}, Expected target: {target_entity_name}")
+            
+            method, candidates = index.match(
+                source_type, target_entity_name, source_browse_path, source_name, platform_instance
+            )
+            if not candidates:
+                self.logger.warning(f"No match found for: {source_type}:{source_browse_path}:{source_name} (expected target: {target_entity_name})")
+                continue
             
-            if target_key in target_lookup:
-                target_entity = target_lookup[target_key]
-                match = EntityMatch(
-                    source_entity=source_entity,
-                    target_urn=target_entity['urn'],
-                    target_name=self.extract_entity_name(target_entity),
-                    browse_path=self.extract_browse_path(target_entity),
-                    confidence=1.0  # Exact match
+            target_entity = candidates[0]
+            match = EntityMatch(
+                source_entity=source_entity,
+                target_urn=target_entity['urn'],
+                target_name=self.extract_entity_name(target_entity),
+                browse_path=self.extract_browse_path(target_entity),
+                confidence=EntityMatchIndex.CONFIDENCE[method],
+                match_method=method,
+                candidate_count=len(candidates)
+            )
+            matches.append(match)
+            
+            if match.ambiguous:
+                ambiguous_count += 1
+                self.logger.warning(
+                    f"Ambiguous {method} match for {source_name}: {len(candidates)} candidates "
+                    f"({', '.join(candidate.get('urn', '') for candidate in candidates[:5])}{'...' if len(candidates) > 5 else ''}), "
+                    f"using {target_entity['urn']}"
                 )
-                matches.append(match)
-                self.logger.info(f"Matched: {source_name} -> {target_entity['urn']} (platform instance match)")
             else:
-                # Fallback: try matching by simple name only
-                fallback_matches = [entity for key, entity in target_lookup.items() if key.endswith(f":{source_name}".lower())]
-                
-                if fallback_matches:
-                    # Take the first match if multiple found
-                    target_entity = fallback_matches[0]
-                    match = EntityMatch(
-                        source_entity=source_entity,
-                        target_urn=target_entity['urn'],
-                        target_name=self.extract_entity_name(target_entity),
-                        browse_path=self.extract_browse_path(target_entity),
-                        confidence=0.8  # Lower confidence for name-only match
-                    )
-                    matches.append(match)
-                    self.logger.info(f"Fallback matched: {source_name} -> {target_entity['urn']} (name-only match)")
-                else:
-                    self.logger.warning(f"No match found for: {source_type}:{source_browse_path}:{source_name} (expected target: {target_entity_name})")
+                self.logger.info(f"Matched: {source_name} -> {target_entity['urn']} ({method} match)")
         
         self.logger.info(f"Found {len(matches)} entity matches out of {len(source_entities)} source entities")
+        if ambiguous_count:
+            self.logger.warning(f"{ambiguous_count} matches were ambiguous")
         return matches
     
     def apply_urn_mutations(self, urn: str) -> str:
@@ -1650,20 +1621,27 @@ class MetadataMigrationProcessor:
                 for i, mcp in enumerate(mcps[:5]):  # Show first 5 as preview
                     self.logger.info(f"MCP {i+1}: {mcp.entityUrn} -> {mcp.aspect.__class__.__name__}")
         else:
-            # Emit to DataHub
-            for mcp in mcps:
-                try:
-                    self.metadata_api.context.graph.emit_mcp(mcp)
-                    self.logger.debug(f"Emitted MCP for {mcp.entityUrn}")
-                except Exception as e:
-                    self.logger.error(f"Failed to emit MCP for {mcp.entityUrn}: {e}")
+            # Emit to DataHub in concurrent batches; rejected MCPs go to the failures file.
+            # Batches acknowledged by an earlier attempt of a resumed run are not sent again.
+            if self.journal:
+                result = self.emitter.emit(
+                    mcps,
+                    skip_batches=self.journal.acked_batches,
+                    on_batch_emitted=self.journal.ack_batch,
+                )
+            else:
+                result = self.emitter.emit(mcps)
+            # Skipped batches were acknowledged by an earlier attempt, so they count as emitted
+            self.emitted_mcp_count += result.emitted + result.skipped
+            self.failed_mcp_count += result.failed
     
     def _save_mcps_to_files(self, mcps: List[MetadataChangeProposalWrapper], output_dir: str):
         """Save MCPs to JSON files for review"""
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        for i, mcp in enumerate(mcps):
+        # Number files across chunks so later chunks do not overwrite earlier ones
+        for i, mcp in enumerate(mcps, start=self.saved_mcp_count):
             filename = f"mcp_{i+1}_{mcp.entityUrn.split('/')[-1]}.json"
             filepath = output_path / filename
             
@@ -1678,68 +1656,273 @@ class MetadataMigrationProcessor:
             with open(filepath, 'w') as f:
                 json.dump(mcp_dict, f, indent=2)
         
+        self.saved_mcp_count += len(mcps)
         self.logger.info(f"Saved {len(mcps)} MCPs to {output_dir}")
     
-    def process_migration(self, exported_entities_file: str, output_dir: str = None) -> Dict[str, Any]:
-        """Main method to process metadata migration"""
-        try:
-            # Load exported entities
-            source_entities = self.load_exported_entities(exported_entities_file)
-            
-            # Extract unique platforms and entity types
-            platforms = set()
-            entity_types = set()
-            for i, entity in enumerate(source_entities):
-                self.logger.debug(f"Processing entity {i}: type={type(entity)}, value={entity}")
-                
-                # Skip None or empty entities
-                if not entity or not isinstance(entity, dict):
-                    self.logger.warning(f"Skipping invalid entity {i}: {entity}")
-                    continue
-                
-                # Double check to ensure entity is not None before accessing
-                if entity is None:
-                    self.logger.error(f"Entity {i} is None after validation!")
-                    continue
-                    
-                platform_info = entity.get('platform') or {}
-                if platform_info.get('name'):
-                    platforms.add(platform_info['name'])
-                if entity.get('type'):
-                    entity_types.add(entity['type'])
-            
+    def _iter_chunks(self, entities: Iterator[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """Group streamed entities into lists of at most chunk_size entities"""
+        chunk = []
+        for entity in entities:
+            chunk.append(entity)
+            if len(chunk) >= chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    def _match_to_record(self, match: EntityMatch) -> Dict[str, Any]:
+        """Journal form of a match, without the source entity"""
+        return {
+            'source_urn': match.source_entity.get('urn'),
+            'target_urn': match.target_urn,
+            'target_name': match.target_name,
+            'browse_path': match.browse_path,
+            'confidence': match.confidence,
+            'match_method': match.match_method,
+            'candidate_count': match.candidate_count,
+        }
+    
+    def _restore_matches(self, source_entities: List[Dict[str, Any]], records: List[Dict[str, Any]]) -> List[EntityMatch]:
+        """Rebuild the matches of a chunk from its journaled match table"""
+        entities_by_urn = {entity.get('urn'): entity for entity in source_entities}
+        matches = []
+        for record in records:
+            source_entity = entities_by_urn.get(record.get('source_urn'))
+            if source_entity is None:
+                self.logger.warning(f"Journaled source entity {record.get('source_urn')} is no longer in the export, skipping")
+                continue
+            fields = {key: value for key, value in record.items() if key != 'source_urn'}
+            matches.append(EntityMatch(source_entity=source_entity, **fields))
+        return matches
+    
+    def _generate_chunk_mcps(self, matches: List[EntityMatch]) -> Tuple[List[MetadataChangeProposalWrapper], int]:
+        """Generate the MCPs of a chunk's matches. Returns the MCPs and the number of tasks generated"""
+        all_mcps = []
+        tasks_generated = 0
+        
+        for match in matches:
+            tasks = self.generate_mcps_for_match(match)
+            tasks_generated += len(tasks)
+            
+            for task in tasks:
+                mcp = self.create_mcp_from_task(task)
+                if mcp:
+                    all_mcps.append(mcp)
+        
+        return all_mcps, tasks_generated
+    
+    def process_chunk(self, source_entities: List[Dict[str, Any]], output_dir: str = None, chunk_number: Optional[int] = None) -> Dict[str, Any]:
+        """Fetch targets for, match, generate and emit MCPs for one chunk of source entities"""
+        journaled = self.journal.chunk_results.get(chunk_number) if self.journal else None
+        
+        if journaled is not None:
+            # Matched by an earlier attempt of this run: reuse the match table instead of searching again
+            target_entity_count = journaled['target_entities']
+            matches = self._restore_matches(source_entities, journaled['matches'])
+            self.logger.info(f"Reusing the journaled match table of chunk {chunk_number} ({len(matches)} matches)")
+        else:
             # Fetch target entities based on browse paths from source entities
             target_entities = self.fetch_target_entities(source_entities)
+            target_entity_count = len(target_entities)
             
             # Match entities
             matches = self.match_entities(source_entities, target_entities)
+            if self.journal:
+                self.journal.record('chunk_result', chunk=chunk_number, result={
+                    'target_entities': target_entity_count,
+                    'matches': [self._match_to_record(match) for match in matches],
+                })
+        
+        # Generate MCPs
+        all_mcps, tasks_generated = self._generate_chunk_mcps(matches)
+        mcps_generated = len(all_mcps)
+        
+        # Drop MCPs that would not change the target
+        mcps_unchanged = 0
+        if self.target_diff:
+            diff = self.target_diff.diff(all_mcps)
+            all_mcps = diff.changed
+            mcps_unchanged = diff.unchanged
+        
+        # Emit MCPs
+        emitted_before = self.emitted_mcp_count
+        failed_before = self.failed_mcp_count
+        self.emit_mcps(all_mcps, output_dir)
+        
+        summary = {
+            'target_entities': target_entity_count,
+            'matches': len(matches),
+            'ambiguous_matches': sum(1 for match in matches if match.ambiguous),
+            'mcps_generated': mcps_generated,
+            'mcps_unchanged': mcps_unchanged,
+            'tasks_generated': tasks_generated,
+        }
+        # A chunk with rejected MCPs is not completed, so resuming the run retries it
+        if self.journal and self.failed_mcp_count == failed_before:
+            self.journal.record(
+                'chunk_completed',
+                chunk=chunk_number,
+                summary=dict(summary, mcps_emitted=self.emitted_mcp_count - emitted_before),
+            )
+        return summary
+    
+    def _sample_for_verification(self, sample: List[MetadataChangeProposalWrapper], seen: int, mcps: List[MetadataChangeProposalWrapper], sample_size: int, rng: random.Random) -> int:
+        """Reservoir-sample MCPs across chunks, so the sample stays bounded. Returns the number of MCPs seen"""
+        for mcp in mcps:
+            seen += 1
+            if len(sample) < sample_size:
+                sample.append(mcp)
+            else:
+                index = rng.randrange(seen)
+                if index < sample_size:
+                    sample[index] = mcp
+        return seen
+    
+    def verify_emitted_mcps(self, mcps: List[MetadataChangeProposalWrapper]) -> Dict[str, Any]:
+        """
+        Read aspects back from the target environment and compare them with the MCPs that were emitted
+        
+        Args:
+            mcps: Emitted MCPs to check
+            
+        Returns:
+            Dictionary with the number of aspects checked and the mismatching (urn, aspect) pairs
+        """
+        graph = self.metadata_api.context.graph
+        mismatches = []
+        for mcp in mcps:
+            aspect_name = mcp.aspect.get_aspect_name()
+            try:
+                current = graph.get_aspect(entity_urn=mcp.entityUrn, aspect_type=type(mcp.aspect))
+            except Exception as e:
+                self.logger.warning(f"Could not read {aspect_name} of {mcp.entityUrn}: {e}")
+                current = None
+            if current is None or aspect_fingerprint(current.to_obj()) != aspect_fingerprint(mcp.aspect.to_obj()):
+                self.logger.warning(f"Verification mismatch: {aspect_name} of {mcp.entityUrn} differs from the emitted aspect")
+                mismatches.append({'entity_urn': mcp.entityUrn, 'aspect': aspect_name})
+        
+        self.logger.info(f"Verified {len(mcps)} emitted aspects, {len(mismatches)} mismatches")
+        return {'checked': len(mcps), 'mismatches': mismatches}
+    
+    def process_migration(
+        self,
+        exported_entities_file: str,
+        output_dir: str = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        resume_run_id: Optional[str] = None,
+        verify: bool = False,
+        verify_sample: int = DEFAULT_VERIFY_SAMPLE,
+    ) -> Dict[str, Any]:
+        """
+        Main method to process metadata migration.
+        
+        The export header is read first, then entities are streamed from the file and
+        loaded, matched, converted to MCPs and emitted in chunks of chunk_size, so memory
+        use does not grow with the size of the export.
+        
+        Outside dry-run mode every run is journaled: the match table of each chunk,
+        the acknowledged MCP batches and the completed chunks. Resuming a run skips
+        completed chunks, reuses journaled match tables and does not re-send
+        acknowledged batches. With verify, a sample of the aspects emitted by the
+        skipped chunks is read back from the target and compared.
+        """
+        try:
+            if not self.dry_run:
+                if resume_run_id:
+                    self.journal = RunJournal.resume(self.journal_dir, resume_run_id)
+                    params = self.journal.params
+                    if params.get('input') and os.path.abspath(exported_entities_file) != params['input']:
+                        raise ValueError(f"Run {resume_run_id} was started with {params['input']}, not {exported_entities_file}")
+                    if params.get('chunk_size') and params['chunk_size'] != chunk_size:
+                        # Chunks are identified by number, so the original chunk size must be kept
+                        self.logger.warning(f"Using the chunk size of run {resume_run_id} ({params['chunk_size']}) instead of {chunk_size}")
+                        chunk_size = params['chunk_size']
+                    if params.get('batch_size') and params['batch_size'] != self.emitter.batch_size:
+                        self.logger.warning(f"Using the batch size of run {resume_run_id} ({params['batch_size']}) so acknowledged batches are recognized")
+                        self.emitter.batch_size = params['batch_size']
+                else:
+                    self.journal = RunJournal.start(
+                        self.journal_dir,
+                        input=os.path.abspath(exported_entities_file),
+                        target_environment=self.target_environment,
+                        chunk_size=chunk_size,
+                        batch_size=self.emitter.batch_size,
+                    )
+                self.logger.info(f"Run id: {self.journal.run_id} (resume with --resume {self.journal.run_id})")
+            
+            # Read the export metadata (mutation state) before any entity
+            self.load_export_header(exported_entities_file)
+            
+            summary = {
+                'source_entities': 0,
+                'target_entities': 0,
+                'matches': 0,
+                'ambiguous_matches': 0,
+                'mcps_generated': 0,
+                'mcps_unchanged': 0,
+                'tasks_generated': 0,
+            }
+            chunks_resumed = 0
+            resumed_mcps_emitted = 0
+            verify_candidates = []
+            verify_seen = 0
+            rng = random.Random(resume_run_id)
             
-            # Generate MCPs
-            all_mcps = []
-            all_tasks = []
+            # Extract unique platforms and entity types
+            platforms = set()
+            entity_types = set()
             
-            for match in matches:
-                tasks = self.generate_mcps_for_match(match)
-                all_tasks.extend(tasks)
+            entities = self.iter_exported_entities(exported_entities_file)
+            for chunk_number, source_entities in enumerate(self._iter_chunks(entities, chunk_size), start=1):
+                for entity in source_entities:
+                    platform_info = entity.get('platform') or {}
+                    if platform_info.get('name'):
+                        platforms.add(platform_info['name'])
+                    if entity.get('type'):
+                        entity_types.add(entity['type'])
                 
-                for task in tasks:
-                    mcp = self.create_mcp_from_task(task)
-                    if mcp:
-                        all_mcps.append(mcp)
-            
-            # Emit MCPs
-            self.emit_mcps(all_mcps, output_dir)
+                summary['source_entities'] += len(source_entities)
+                if self.journal and chunk_number in self.journal.completed_chunks:
+                    # Completed by an earlier attempt of this run
+                    chunk_summary = self.journal.completed_chunks[chunk_number]
+                    chunks_resumed += 1
+                    resumed_mcps_emitted += chunk_summary.get('mcps_emitted', 0)
+                    for key in summary:
+                        if key != 'source_entities':
+                            summary[key] += chunk_summary.get(key, 0)
+                    if verify and chunk_number in self.journal.chunk_results:
+                        matches = self._restore_matches(source_entities, self.journal.chunk_results[chunk_number]['matches'])
+                        mcps, _ = self._generate_chunk_mcps(matches)
+                        verify_seen = self._sample_for_verification(verify_candidates, verify_seen, mcps, verify_sample, rng)
+                    self.logger.info(f"Skipping chunk {chunk_number}: completed by an earlier attempt of this run")
+                    continue
+                
+                chunk_summary = self.process_chunk(source_entities, output_dir, chunk_number=chunk_number)
+                for key, value in chunk_summary.items():
+                    summary[key] += value
+                self.logger.info(
+                    f"Processed chunk {chunk_number}: {len(source_entities)} entities, "
+                    f"{chunk_summary['matches']} matches, {chunk_summary['mcps_generated']} MCPs "
+                    f"({summary['source_entities']} entities so far)"
+                )
             
             # Return summary
-            return {
-                'source_entities': len(source_entities),
-                'target_entities': len(target_entities),
-                'matches': len(matches),
-                'mcps_generated': len(all_mcps),
-                'tasks_generated': len(all_tasks),
-                'platforms': list(platforms),
-                'entity_types': list(entity_types)
-            }
+            summary['mcp_reduction_ratio'] = (
+                summary['mcps_unchanged'] / summary['mcps_generated'] if summary['mcps_generated'] else 0.0
+            )
+            summary['mcps_emitted'] = self.emitted_mcp_count + resumed_mcps_emitted
+            summary['mcps_failed'] = self.failed_mcp_count
+            summary['platforms'] = list(platforms)
+            summary['entity_types'] = list(entity_types)
+            
+            if self.journal:
+                summary['run_id'] = self.journal.run_id
+                summary['chunks_resumed'] = chunks_resumed
+                if verify:
+                    summary['verification'] = self.verify_emitted_mcps(verify_candidates)
+                if not self.failed_mcp_count:
+                    self.journal.record('run_completed', summary=summary)
+            return summary
             
         except Exception as e:
             import traceback
@@ -1749,14 +1932,34 @@ class MetadataMigrationProcessor:
 
 def main():
     parser = argparse.ArgumentParser(description='Process metadata migration between DataHub environments')
-    parser.add_argument('--input', required=True, help='Input JSON file with exported entities')
+    parser.add_argument('--input', required=True, help='Input JSON or JSON Lines (.jsonl) file with exported entities')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help=f'Number of entities processed at a time (default: {DEFAULT_CHUNK_SIZE})')
     parser.add_argument('--target-env', required=True, help='Target environment name')
     parser.add_argument('--output-dir', help='Output directory for generated MCPs (dry run)')
     parser.add_argument('--dry-run', action='store_true', help='Generate MCPs without emitting them')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose logging')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE, help=f'Number of MCPs per batch ingest request (default: {DEFAULT_BATCH_SIZE})')
+    parser.add_argument('--max-workers', type=int, default=DEFAULT_MAX_WORKERS, help=f'Number of batches emitted concurrently (default: {DEFAULT_MAX_WORKERS})')
+    parser.add_argument('--max-retries', type=int, default=DEFAULT_MAX_RETRIES, help=f'Retries of a failed batch before it is bisected (default: {DEFAULT_MAX_RETRIES})')
+    parser.add_argument('--lookup-batch-size', type=int, default=DEFAULT_LOOKUP_BATCH_SIZE, help=f'Number of names or browse path components per target lookup request (default: {DEFAULT_LOOKUP_BATCH_SIZE})')
+    parser.add_argument('--lookup-cache-dir', default='.cache/migration_lookups', help='Directory target lookup results are cached in, per target environment (default: .cache/migration_lookups)')
+    parser.add_argument('--lookup-cache-ttl', type=int, default=DEFAULT_LOOKUP_CACHE_TTL, help=f'Seconds cached target lookups stay valid (default: {DEFAULT_LOOKUP_CACHE_TTL})')
+    parser.add_argument('--no-lookup-cache', action='store_true', help='Do not read or write the target lookup cache')
+    parser.add_argument('--failures-file', default='failed_mcps.jsonl', help='JSON Lines file rejected MCPs are written to for replay (default: failed_mcps.jsonl)')
+    parser.add_argument('--skip-unchanged', action='store_true', help='Fetch the current aspects of matched target entities and drop MCPs that would not change them')
+    parser.add_argument('--diff-batch-size', type=int, default=DEFAULT_DIFF_BATCH_SIZE, help=f'Number of target entities fetched per request by --skip-unchanged (default: {DEFAULT_DIFF_BATCH_SIZE})')
+    parser.add_argument('--journal-dir', default=DEFAULT_JOURNAL_DIR, help=f'Directory run journals are written to (default: {DEFAULT_JOURNAL_DIR})')
+    parser.add_argument('--resume', metavar='RUN_ID', help='Resume an interrupted run, skipping completed chunks and acknowledged MCP batches')
+    parser.add_argument('--verify', action='store_true', help='With --resume, read back a sample of the aspects emitted by completed chunks and compare them')
+    parser.add_argument('--verify-sample', type=int, default=DEFAULT_VERIFY_SAMPLE, help=f'Number of emitted aspects checked by --verify (default: {DEFAULT_VERIFY_SAMPLE})')
     
     args = parser.parse_args()
     
+    if args.resume and args.dry_run:
+        parser.error('--resume cannot be used with --dry-run (dry runs are not journaled)')
+    if args.verify and not args.resume:
+        parser.error('--verify requires --resume')
+    
     if args.verbose:
         # Set up verbose logging
         logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -1769,12 +1972,29 @@ def main():
     processor = MetadataMigrationProcessor(
         target_environment=args.target_env,
         mutations={},  # Empty mutations since they're already applied
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        batch_size=args.batch_size,
+        max_workers=args.max_workers,
+        max_retries=args.max_retries,
+        failures_file=args.failures_file,
+        lookup_batch_size=args.lookup_batch_size,
+        lookup_cache_dir=None if args.no_lookup_cache else args.lookup_cache_dir,
+        lookup_cache_ttl=args.lookup_cache_ttl,
+        journal_dir=args.journal_dir,
+        diff_target_state=args.skip_unchanged,
+        diff_batch_size=args.diff_batch_size
     )
     
     # Process migration
     try:
-        result = processor.process_migration(args.input, args.output_dir)
+        result = processor.process_migration(
+            args.input,
+            args.output_dir,
+            chunk_size=args.chunk_size,
+            resume_run_id=args.resume,
+            verify=args.verify,
+            verify_sample=args.verify_sample,
+        )
         
         print("\n" + "="*50)
         print("MIGRATION PROCESSING SUMMARY")
@@ -1782,7 +2002,10 @@ def main():
         print(f"Source entities: {result['source_entities']}")
         print(f"Target entities: {result['target_entities']}")
         print(f"Entity matches: {result['matches']}")
+        print(f"Ambiguous matches: {result['ambiguous_matches']}")
         print(f"MCPs generated: {result['mcps_generated']}")
+        if args.skip_unchanged:
+            print(f"MCPs unchanged in target (dropped): {result['mcps_unchanged']} ({result['mcp_reduction_ratio']:.0%} reduction)")
         print(f"Tasks generated: {result['tasks_generated']}")
         print(f"Platforms: {', '.join(result['platforms'])}")
         print(f"Entity types: {', '.join(result['entity_types'])}")
@@ -1797,7 +2020,15 @@ def main():
         if args.dry_run:
             print(f"\nDRY RUN: MCPs saved to {args.output_dir or 'logs'}")
         else:
-            print(f"\nMCPs emitted to {args.target_env} environment")
+            print(f"\nMCPs emitted to {args.target_env} environment: {result['mcps_emitted']} emitted, {result['mcps_failed']} failed")
+            if result['mcps_failed']:
+                print(f"Failed MCPs written to {args.failures_file} (replay with scripts/import_metadata.py --replay-failures)")
+            print(f"Run id: {result['run_id']} ({result['chunks_resumed']} chunks resumed from an earlier attempt)")
+            if result['mcps_failed']:
+                print(f"Resume with: --resume {result['run_id']}")
+            if 'verification' in result:
+                verification = result['verification']
+                print(f"Verified aspects: {verification['checked']} checked, {len(verification['mismatches'])} mismatches")
         
         print("="*50)
         
@@ -3,25 +3,108 @@
 Script to process DataHub metadata test files and execute the appropriate GraphQL mutations.
 This script reads JSON files from metadata-manager/{environment}/metadata_tests/ and calls
 the corresponding DataHub GraphQL APIs.
+
+Tests are sent as static, parameterized mutations: tests using the same mutation
+are combined into aliased multi-mutation documents of up to BATCH_SIZE tests, and
+the batches are sent concurrently (MAX_WORKERS). Tests that did not change since
+they were last applied to the same DataHub instance are skipped (FORCE_APPLY=true
+applies them all).
 """
 
+import hashlib
 import json
 import os
 import sys
 import glob
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Tuple
 import requests
 
+DEFAULT_BATCH_SIZE = 25
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_STATE_DIR = '.cache/metadata_test_state'
+
+# Variable definitions and selection set of each supported mutation. The query
+# text only depends on the mutation and the batch size, so DataHub parses the
+# same few documents however many tests are deployed.
+MUTATIONS = {
+    'createTest': {
+        'variables': {'input': 'CreateTestInput!'},
+        'selection': '',
+    },
+    'updateTest': {
+        'variables': {'urn': 'String!', 'input': 'UpdateTestInput!'},
+        'selection': '',
+    },
+    'deleteTest': {
+        'variables': {'urn': 'String!'},
+        'selection': '',
+    },
+    'upsertDatasetAssertion': {
+        'variables': {'input': 'UpsertDatasetAssertionInput!'},
+        'selection': '{ urn info { type description } }',
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def build_batch_mutation(mutation: str, count: int) -> str:
+    """
+    Build the document applying `count` mutations of the same kind
+
+    Each mutation gets the alias t<i> and its own variables ($input0, $urn0, ...).
+
+    Args:
+        mutation: Name of the mutation (a key of MUTATIONS)
+        count: Number of mutations in the document
+
+    Returns:
+        The GraphQL document
+    """
+    spec = MUTATIONS[mutation]
+    definitions = ', '.join(
+        f'${name}{i}: {graphql_type}'
+        for i in range(count)
+        for name, graphql_type in spec['variables'].items()
+    )
+    fields = []
+    for i in range(count):
+        arguments = ', '.join(f'{name}: ${name}{i}' for name in spec['variables'])
+        selection = f" {spec['selection']}" if spec['selection'] else ''
+        fields.append(f'  t{i}: {mutation}({arguments}){selection}')
+    return f'mutation {mutation}Batch({definitions}) {{\n' + '\n'.join(fields) + '\n}'
+
+
+def mutation_fingerprint(mutation: str, variables: Dict[str, Any]) -> str:
+    """Fingerprint of a mutation and its variables, used to skip unchanged tests"""
+    canonical = json.dumps({'mutation': mutation, 'variables': variables}, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
 
 class DataHubTestProcessor:
     """Processes metadata test files and calls DataHub GraphQL APIs"""
     
-    def __init__(self, datahub_url: str, datahub_token: str, environment: str, dry_run: bool = False):
+    def __init__(
+        self,
+        datahub_url: str,
+        datahub_token: str,
+        environment: str,
+        dry_run: bool = False,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        state_dir: str = DEFAULT_STATE_DIR,
+        force: bool = False,
+    ):
         self.datahub_url = datahub_url.rstrip('/')
         self.datahub_token = datahub_token
         self.environment = environment
         self.dry_run = dry_run
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.state_file = Path(state_dir) / f'{environment}.json'
+        self.force = force
         self.session = requests.Session()
         self.session.headers.update({
             'Authorization': f'Bearer {datahub_token}',
@@ -33,6 +116,9 @@ class DataHubTestProcessor:
             'processed': 0,
             'created': 0,
             'updated': 0,
+            'applied': 0,
+            'unchanged': 0,
+            'failed': 0,
             'errors': [],
             'details': []
         }
@@ -45,16 +131,10 @@ class DataHubTestProcessor:
             print(f"No metadata_tests directory found for environment: {self.environment}")
             return self.results
         
-        test_files = list(tests_dir.glob('*.json'))
+        test_files = sorted(tests_dir.glob('*.json'))
         print(f"Found {len(test_files)} metadata test files to process")
         
-        for file_path in test_files:
-            try:
-                self.process_test_file(file_path)
-            except Exception as e:
-                error_msg = f"Error processing {file_path}: {str(e)}"
-                print(f"ERROR: {error_msg}")
-                self.results['errors'].append(error_msg)
+        self.process_test_files(test_files)
         
         # Write results to file for workflow
         with open(f'metadata-test-results-{self.environment}.json', 'w') as f:
@@ -64,8 +144,73 @@ class DataHubTestProcessor:
     
     def process_test_file(self, file_path: Path) -> None:
         """Process a single metadata test file"""
-        print(f"Processing: {file_path}")
+        self.process_test_files([file_path])
+    
+    def process_test_files(self, test_files: List[Path]) -> None:
+        """
+        Load test files concurrently and apply them in batched mutations
+
+        Tests whose mutation and variables match what was last applied to this
+        DataHub instance are skipped, unless `force` is set.
+        """
+        tests = self.load_test_files(test_files)
+        state = self.load_state()
         
+        pending = []
+        for test in tests:
+            if not self.force and state.get(test['key']) == test['fingerprint']:
+                self._record(test, 'unchanged', 'Unchanged since last deployment')
+            else:
+                pending.append(test)
+        
+        if self.dry_run:
+            for test in pending:
+                print(f"  DRY RUN: Would execute {test['mutation']} for {test['name']}")
+                self._record(test, 'applied', f"DRY RUN: Would execute {test['mutation']}")
+            return
+        
+        batches = self.build_batches(pending)
+        print(f"Applying {len(pending)} metadata tests in {len(batches)} requests "
+              f"({len(tests) - len(pending)} unchanged)")
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [executor.submit(self.execute_batch, mutation, batch) for mutation, batch in batches]
+            for future in as_completed(futures):
+                for test, success, message in future.result():
+                    if success:
+                        state[test['key']] = test['fingerprint']
+                        self._record(test, 'applied', f"Successfully {test['operation']}d metadata test")
+                    else:
+                        state.pop(test['key'], None)
+                        self._record(test, 'failed', message)
+        
+        self.save_state(state)
+    
+    def load_test_files(self, test_files: List[Path]) -> List[Dict[str, Any]]:
+        """Load test files concurrently, recording the files that cannot be loaded as errors"""
+        tests = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {executor.submit(self.load_test_file, file_path): file_path for file_path in test_files}
+            for future in as_completed(futures):
+                file_path = futures[future]
+                try:
+                    tests.append(future.result())
+                except Exception as e:
+                    error_msg = f"Error processing {file_path}: {str(e)}"
+                    print(f"ERROR: {error_msg}")
+                    self.results['errors'].append(error_msg)
+                    self.results['failed'] += 1
+        
+        tests.sort(key=lambda test: test['file'])
+        return tests
+    
+    def load_test_file(self, file_path: Path) -> Dict[str, Any]:
+        """
+        Read a metadata test file into the mutation and variables it applies
+
+        Raises:
+            ValueError: If the file has no valid GraphQL input
+        """
         with open(file_path, 'r') as f:
             test_data = json.load(f)
         
@@ -78,158 +223,144 @@ class DataHubTestProcessor:
             raise ValueError(f"No GraphQL input found in {file_path}")
         
         mutation = graphql_input.get('mutation')
-        input_data = graphql_input.get('input')
+        input_data = graphql_input.get('input') or {}
+        urn = graphql_input.get('urn') or input_data.get('urn')
         
-        if not mutation or not input_data:
+        if not mutation or not (input_data or urn):
             raise ValueError(f"Invalid GraphQL input in {file_path}")
+        if mutation not in MUTATIONS:
+            raise ValueError(f"Unsupported mutation: {mutation}")
         
-        print(f"  Operation: {operation}")
-        print(f"  Type: {test_type}")
-        print(f"  Mutation: {mutation}")
-        
-        if self.dry_run:
-            print(f"  DRY RUN: Would execute {mutation} for {name}")
-            self.results['details'].append({
-                'name': name,
-                'type': test_type,
-                'success': True,
-                'message': f'DRY RUN: Would execute {mutation}'
-            })
-        else:
-            result = self.execute_graphql_mutation(mutation, input_data)
-            if result['success']:
-                if operation == 'create':
-                    self.results['created'] += 1
-                else:
-                    self.results['updated'] += 1
-                
-                self.results['details'].append({
-                    'name': name,
-                    'type': test_type,
-                    'success': True,
-                    'message': f'Successfully {operation}d metadata test'
-                })
+        variables = {}
+        for variable in MUTATIONS[mutation]['variables']:
+            if variable == 'urn':
+                if not urn:
+                    raise ValueError(f"{mutation} requires a test urn in {file_path}")
+                variables['urn'] = urn
             else:
-                self.results['details'].append({
-                    'name': name,
-                    'type': test_type,
-                    'success': False,
-                    'message': result['error']
-                })
+                # The urn is a separate argument of the mutations that take one
+                variables['input'] = (
+                    {key: value for key, value in input_data.items() if key != 'urn'}
+                    if 'urn' in MUTATIONS[mutation]['variables'] else input_data
+                )
         
-        self.results['processed'] += 1
+        return {
+            'file': str(file_path),
+            'key': Path(file_path).name,
+            'name': name,
+            'type': test_type,
+            'operation': operation,
+            'mutation': mutation,
+            'variables': variables,
+            'fingerprint': mutation_fingerprint(mutation, variables),
+        }
     
-    def execute_graphql_mutation(self, mutation: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a GraphQL mutation"""
+    def build_batches(self, tests: List[Dict[str, Any]]) -> List[Tuple[str, List[Dict[str, Any]]]]:
+        """Group tests by mutation and split them into batches of at most batch_size tests"""
+        by_mutation: Dict[str, List[Dict[str, Any]]] = {}
+        for test in tests:
+            by_mutation.setdefault(test['mutation'], []).append(test)
         
-        # Build the GraphQL query based on mutation type
-        query = self.build_graphql_query(mutation, input_data)
-        
-        if not query:
-            return {'success': False, 'error': f'Unsupported mutation: {mutation}'}
+        return [
+            (mutation, group[start:start + self.batch_size])
+            for mutation, group in by_mutation.items()
+            for start in range(0, len(group), self.batch_size)
+        ]
+    
+    def execute_batch(self, mutation: str, tests: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], bool, str]]:
+        """
+        Apply a batch of tests in one aliased multi-mutation request
+
+        Args:
+            mutation: Mutation shared by the tests
+            tests: Tests of the batch (as returned by load_test_file)
+
+        Returns:
+            List of (test, success, error message) tuples, one per test
+        """
+        query = build_batch_mutation(mutation, len(tests))
+        variables = {
+            f'{name}{i}': value
+            for i, test in enumerate(tests)
+            for name, value in test['variables'].items()
+        }
         
         try:
             response = self.session.post(
                 f'{self.datahub_url}/api/graphql',
-                json={'query': query},
+                json={'query': query, 'variables': variables, 'operationName': f'{mutation}Batch'},
                 timeout=30
             )
-            
-            if response.status_code == 200:
-                result = response.json()
-                if 'errors' in result:
-                    return {'success': False, 'error': str(result['errors'])}
-                return {'success': True, 'data': result.get('data')}
-            else:
-                return {'success': False, 'error': f'HTTP {response.status_code}: {response.text}'}
-                
+            if response.status_code != 200:
+                error = f'HTTP {response.status_code}: {response.text}'
+                return [(test, False, error) for test in tests]
+            result = response.json()
         except Exception as e:
-            return {'success': False, 'error': str(e)}
-    
-    def build_graphql_query(self, mutation: str, input_data: Dict[str, Any]) -> Optional[str]:
-        """Build GraphQL query string for the given mutation"""
-        
-        # Convert input data to GraphQL format
-        input_str = self.dict_to_graphql(input_data)
-        
-        if mutation == 'createTest':
-            return f"""
-            mutation {{
-                {mutation}(input: {input_str}) {{
-                    urn
-                    info {{
-                        name
-                        description
-                        category
-                    }}
-                }}
-            }}
-            """
+            return [(test, False, str(e)) for test in tests]
         
-        elif mutation == 'updateTest':
-            return f"""
-            mutation {{
-                {mutation}(input: {input_str}) {{
-                    urn
-                    info {{
-                        name
-                        description
-                        category
-                    }}
-                }}
-            }}
-            """
-        
-        elif mutation == 'deleteTest':
-            return f"""
-            mutation {{
-                {mutation}(input: {input_str}) {{
-                    urn
-                }}
-            }}
-            """
-        
-        # Add other test-related mutations as needed
-        elif mutation == 'upsertDatasetAssertion':
-            return f"""
-            mutation {{
-                {mutation}(input: {input_str}) {{
-                    urn
-                    info {{
-                        type
-                        description
-                    }}
-                }}
-            }}
-            """
+        data = result.get('data') or {}
+        alias_errors: Dict[str, List[str]] = {}
+        general_errors = []
+        for error in result.get('errors') or []:
+            path = error.get('path') if isinstance(error, dict) else None
+            message = error.get('message', str(error)) if isinstance(error, dict) else str(error)
+            if path:
+                alias_errors.setdefault(str(path[0]), []).append(message)
+            else:
+                general_errors.append(message)
         
-        return None
+        outcomes = []
+        for i, test in enumerate(tests):
+            alias = f't{i}'
+            if alias in alias_errors:
+                outcomes.append((test, False, '; '.join(alias_errors[alias])))
+            elif alias in data:
+                outcomes.append((test, True, ''))
+            else:
+                outcomes.append((test, False, '; '.join(general_errors) or 'No result returned'))
+        return outcomes
+    
+    def load_state(self) -> Dict[str, str]:
+        """Fingerprints of the tests last applied to this DataHub instance, by file name"""
+        if not self.state_file.exists():
+            return {}
+        try:
+            with open(self.state_file, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"WARNING: Ignoring unreadable state file {self.state_file}: {str(e)}")
+            return {}
+        if state.get('datahub_url') != self.datahub_url:
+            return {}
+        return state.get('applied', {})
     
-    def dict_to_graphql(self, data: Any, indent: int = 0) -> str:
-        """Convert a Python dict to GraphQL input format"""
-        if data is None:
-            return 'null'
-        elif isinstance(data, bool):
-            return 'true' if data else 'false'
-        elif isinstance(data, (int, float)):
-            return str(data)
-        elif isinstance(data, str):
-            # Escape quotes and backslashes
-            escaped = data.replace('\\', '\\\\').replace('"', '\\"')
-            return f'"{escaped}"'
-        elif isinstance(data, list):
-            items = [self.dict_to_graphql(item, indent + 1) for item in data]
-            return f'[{", ".join(items)}]'
-        elif isinstance(data, dict):
-            indent_str = "  " * indent
-            next_indent_str = "  " * (indent + 1)
-            items = []
-            for key, value in data.items():
-                graphql_value = self.dict_to_graphql(value, indent + 1)
-                items.append(f'{next_indent_str}{key}: {graphql_value}')
-            return f'{{\n{",".join(items)}\n{indent_str}}}'
-        else:
-            return str(data)
+    def save_state(self, applied: Dict[str, str]) -> None:
+        """Store the fingerprints of the applied tests"""
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_file, 'w') as f:
+            json.dump({'datahub_url': self.datahub_url, 'applied': applied}, f, indent=2, sort_keys=True)
+    
+    def _record(self, test: Dict[str, Any], outcome: str, message: str) -> None:
+        """Record the outcome (applied, unchanged or failed) of a test"""
+        self.results['processed'] += 1
+        self.results[outcome] += 1
+        if outcome == 'applied' and not self.dry_run:
+            if test['operation'] == 'create':
+                self.results['created'] += 1
+            else:
+                self.results['updated'] += 1
+        elif outcome == 'failed':
+            error_msg = f"{test['name'] or test['file']}: {message}"
+            print(f"ERROR: {error_msg}")
+            self.results['errors'].append(error_msg)
+        
+        self.results['details'].append({
+            'name': test['name'],
+            'type': test['type'],
+            'success': outcome != 'failed',
+            'status': outcome,
+            'message': message
+        })
 
 
 def main():
@@ -239,6 +370,9 @@ def main():
     datahub_token = os.getenv('DATAHUB_TOKEN')
     environment = os.getenv('ENVIRONMENT', 'dev')
     dry_run = os.getenv('DRY_RUN', 'false').lower() == 'true'
+    force = os.getenv('FORCE_APPLY', 'false').lower() == 'true'
+    batch_size = int(os.getenv('BATCH_SIZE', DEFAULT_BATCH_SIZE))
+    max_workers = int(os.getenv('MAX_WORKERS', DEFAULT_MAX_WORKERS))
     
     if not datahub_url or not datahub_token:
         print("ERROR: DATAHUB_URL and DATAHUB_TOKEN environment variables are required")
@@ -248,13 +382,19 @@ def main():
     print(f"DataHub URL: {datahub_url}")
     print(f"Dry run: {dry_run}")
     
-    processor = DataHubTestProcessor(datahub_url, datahub_token, environment, dry_run)
+    processor = DataHubTestProcessor(
+        datahub_url, datahub_token, environment, dry_run,
+        batch_size=batch_size, max_workers=max_workers, force=force
+    )
     results = processor.process_tests()
     
     print(f"\nProcessing complete!")
     print(f"Processed: {results['processed']}")
     print(f"Created: {results['created']}")
     print(f"Updated: {results['updated']}")
+    print(f"Applied: {results['applied']}")
+    print(f"Unchanged: {results['unchanged']}")
+    print(f"Failed: {results['failed']}")
     print(f"Errors: {len(results['errors'])}")
     
     if results['errors']:
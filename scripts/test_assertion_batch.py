@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the concurrent per-asset assertion runner in utils/assertion_batch.py.
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.assertions.run_assertions import run_datasets
+from utils.assertion_batch import BatchAssertionRunner, group_by_asset
+
+
+class FakeMetadataClient:
+    """Answers runAssertionsForAsset from a fixed {asset: {assertion: type}} catalog"""
+
+    def __init__(self, catalog, barrier=None, failing=()):
+        self.catalog = catalog
+        self.barrier = barrier
+        self.failing = set(failing)
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def run_assertions_for_asset(self, dataset_urn, tag_urns=None, save_result=True):
+        with self.lock:
+            self.calls.append(dataset_urn)
+        if self.barrier:
+            self.barrier.wait()
+        if dataset_urn in self.failing:
+            raise RuntimeError("asset unavailable")
+        return {"results": {
+            urn: {"type": result_type, "nativeResults": []}
+            for urn, result_type in self.catalog[dataset_urn].items()
+        }}
+
+
+class TestBatchAssertionRunner(unittest.TestCase):
+    """Test cases for BatchAssertionRunner and group_by_asset"""
+
+    def setUp(self):
+        self.catalog = {
+            f"urn:li:dataset:d{i}": {
+                f"urn:li:assertion:d{i}-fresh": "SUCCESS",
+                f"urn:li:assertion:d{i}-volume": "FAILURE" if i == 1 else "SUCCESS",
+            }
+            for i in range(3)
+        }
+
+    def test_group_by_asset(self):
+        groups = group_by_asset([
+            ("urn:li:assertion:a", "urn:li:dataset:d1"),
+            ("urn:li:assertion:b", None),
+            ("urn:li:assertion:c", "urn:li:dataset:d1"),
+            ("urn:li:assertion:d", "urn:li:dataset:d0"),
+        ])
+
+        self.assertEqual(list(groups), ["urn:li:dataset:d1", "urn:li:dataset:d0"])
+        self.assertEqual(groups["urn:li:dataset:d1"], ["urn:li:assertion:a", "urn:li:assertion:c"])
+
+    def test_assets_run_concurrently_with_one_request_each(self):
+        client = FakeMetadataClient(self.catalog, barrier=threading.Barrier(3, timeout=5))
+        done = []
+
+        summary = BatchAssertionRunner(client, max_workers=3).run(
+            {urn: None for urn in self.catalog}, on_asset_done=done.append
+        )
+
+        self.assertEqual(sorted(client.calls), sorted(self.catalog))
+        self.assertEqual(len(done), 3)
+        self.assertEqual((summary.assertions, summary.succeeded, summary.failed), (6, 5, 1))
+
+    def test_results_are_limited_to_the_requested_assertions(self):
+        client = FakeMetadataClient(self.catalog)
+
+        summary = BatchAssertionRunner(client, max_workers=2).run(
+            {"urn:li:dataset:d1": ["urn:li:assertion:d1-fresh"]}
+        )
+
+        self.assertEqual((summary.assertions, summary.succeeded, summary.failed), (1, 1, 0))
+
+    def test_a_failing_asset_does_not_stop_the_batch(self):
+        client = FakeMetadataClient(self.catalog, failing={"urn:li:dataset:d0"})
+        done = {}
+
+        summary = BatchAssertionRunner(client, max_workers=2).run(
+            {urn: None for urn in self.catalog},
+            on_asset_done=lambda result: done.setdefault(result.asset_urn, result),
+        )
+
+        self.assertEqual((summary.completed_assets, summary.failed_assets), (3, 1))
+        self.assertIn("asset unavailable", done["urn:li:dataset:d0"].error)
+        self.assertEqual(done["urn:li:dataset:d2"].statuses["urn:li:assertion:d2-volume"], "SUCCESS")
+
+    def test_run_assertions_script_output(self):
+        client = FakeMetadataClient(self.catalog, failing={"urn:li:dataset:d2"})
+
+        output = run_datasets(client, {urn: None for urn in self.catalog}, max_workers=2)
+
+        self.assertEqual(list(output["datasets"]), list(self.catalog))
+        self.assertEqual(
+            output["datasets"]["urn:li:dataset:d1"]["results"]["urn:li:assertion:d1-volume"]["status"], "FAILURE"
+        )
+        self.assertIn("asset unavailable", output["datasets"]["urn:li:dataset:d2"]["error"])
+        self.assertEqual(
+            {key: output["summary"][key] for key in ("datasets", "failed_datasets", "total", "succeeded", "failed")},
+            {"datasets": 3, "failed_datasets": 1, "total": 4, "succeeded": 3, "failed": 1},
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
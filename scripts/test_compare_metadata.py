@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the scripts/compare_metadata.py script and its diff engine.
+"""
+
+import io
+import json
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import compare_metadata
+from scripts.compare_metadata import compare_lists, iter_entities, normalize_entity, replace_urns, write_section_jsonl
+from utils.metadata_diff import UnsortedStreamError, iter_entity_diffs
+
+
+def _term(urn, name, owners=(), parent=None, modified=1000):
+    entity = {
+        "urn": urn,
+        "type": "GLOSSARY_TERM",
+        "properties": {"name": name, "description": "", "__typename": "GlossaryTermProperties"},
+        "ownership": {
+            "owners": [{"owner": {"urn": owner}, "type": "TECHNICAL_OWNER"} for owner in owners],
+            "lastModified": {"time": modified, "actor": "urn:li:corpuser:admin"},
+        },
+    }
+    if parent:
+        entity["parentNodes"] = {"nodes": [{"urn": parent}]}
+    return entity
+
+
+class ScrollingGraphQL:
+    """Serves scrollAcrossEntities over a sorted list of entities"""
+
+    def __init__(self, entities):
+        self.entities = entities
+        self.requests = []
+
+    def execute_graphql(self, query, variables=None):
+        scroll_input = variables["input"]
+        self.requests.append(scroll_input)
+        start = int(scroll_input.get("scrollId") or 0)
+        end = start + scroll_input["count"]
+        return {"data": {"scrollAcrossEntities": {
+            "nextScrollId": str(end) if end < len(self.entities) else None,
+            "searchResults": [{"entity": entity} for entity in self.entities[start:end]],
+        }}}
+
+
+class TestCompareMetadata(unittest.TestCase):
+    """Test cases for compare_metadata.py"""
+
+    def test_ownership_and_parent_differences_are_reported_per_field(self):
+        source = [_term("urn:li:glossaryTerm:a", "A", owners=["urn:li:corpuser:bob"], parent="urn:li:glossaryNode:x")]
+        target = [_term("urn:li:glossaryTerm:a", "A", owners=["urn:li:corpuser:amy"], parent="urn:li:glossaryNode:y")]
+
+        missing_in_target, missing_in_source, different = compare_lists(source, target)
+
+        self.assertEqual((missing_in_target, missing_in_source), ([], []))
+        self.assertEqual(different[0]["aspects"], ["ownership", "parentNodes"])
+        self.assertEqual(
+            [difference["path"] for difference in different[0]["differences"]],
+            ["ownership.owners[0].owner.urn", "parentNodes.nodes[0].urn"],
+        )
+
+    def test_audit_times_typename_and_owner_order_are_ignored(self):
+        source = normalize_entity(_term("urn:li:glossaryTerm:a", "A", owners=["urn:li:corpuser:b", "urn:li:corpuser:a"]))
+        target = normalize_entity(_term("urn:li:glossaryTerm:a", "A", owners=["urn:li:corpuser:a", "urn:li:corpuser:b"], modified=2000))
+        del target["properties"]["__typename"]
+
+        self.assertEqual(list(iter_entity_diffs([source], [target])), [])
+
+    def test_sorted_streams_are_merged(self):
+        source = [_term(f"urn:li:glossaryTerm:{key}", key) for key in ("a", "b", "d")]
+        target = [_term(f"urn:li:glossaryTerm:{key}", key) for key in ("b", "c", "d")]
+        target[2]["properties"]["description"] = "changed"
+
+        diffs = list(iter_entity_diffs(iter(source), iter(target), presorted=True))
+
+        self.assertEqual(
+            [(diff["key"].split(":")[-1], diff["status"]) for diff in diffs],
+            [("a", "missing_in_target"), ("c", "missing_in_source"), ("d", "different")],
+        )
+
+    def test_unsorted_presorted_input_is_detected(self):
+        source = [_term("urn:li:glossaryTerm:b", "B"), _term("urn:li:glossaryTerm:a", "A")]
+
+        with self.assertRaises(UnsortedStreamError):
+            list(iter_entity_diffs(source, [], presorted=True))
+
+    def test_jsonl_output_with_mutated_urns(self):
+        source = [_term("urn:li:glossaryTerm:dev.a", "A"), _term("urn:li:glossaryTerm:dev.b", "B")]
+        target = [_term("urn:li:glossaryTerm:prod.a", "A")]
+        out = io.StringIO()
+
+        counts = write_section_jsonl(
+            out, "glossary.terms", source, target, source_transform=replace_urns([("dev.", "prod.")]), presorted=False
+        )
+
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual(counts, {"missing_in_target": 1, "missing_in_source": 0, "different": 0})
+        self.assertEqual((lines[0]["urn"], lines[0]["status"]), ("urn:li:glossaryTerm:prod.b", "missing_in_target"))
+        self.assertEqual(lines[-1], {"section": "glossary.terms", "summary": counts})
+
+    def test_entities_are_scrolled_past_the_search_result_cap(self):
+        graphql = ScrollingGraphQL([_term(f"urn:li:glossaryTerm:t{i:05d}", f"T{i}") for i in range(10500)])
+        client = mock.Mock(client=graphql)
+
+        urns = [entity["urn"] for entity in iter_entities(client, "GLOSSARY_TERM", page_size=1000)]
+
+        self.assertEqual(len(urns), 10500)
+        self.assertEqual(urns[-1], "urn:li:glossaryTerm:t10499")
+        self.assertEqual(len(graphql.requests), 11)
+        self.assertEqual(graphql.requests[0]["sortInput"]["sortCriterion"]["field"], "urn")
+
+    def test_unsorted_section_written_to_stdout_is_compared_in_memory(self):
+        source = [_term("urn:li:glossaryTerm:b", "B"), _term("urn:li:glossaryTerm:a", "A")]
+        target = [_term("urn:li:glossaryTerm:a", "A")]
+        stdout = io.StringIO()
+        stdout.seekable = lambda: False
+        argv = ["compare_metadata.py", "--source-url", "http://a", "--target-url", "http://b",
+                "--format", "jsonl", "--compare-type", "tags"]
+
+        source_client, target_client = mock.Mock(), mock.Mock()
+        entities = {id(source_client): source, id(target_client): target}
+
+        with mock.patch.object(sys, "argv", argv), mock.patch.object(sys, "stdout", stdout), \
+                mock.patch.object(compare_metadata, "setup_logging"), \
+                mock.patch.object(compare_metadata, "DataHubMetadataClient", side_effect=[source_client, target_client]), \
+                mock.patch.object(compare_metadata, "iter_entities", side_effect=lambda client, *args: iter(entities[id(client)])):
+            compare_metadata.main()
+
+        lines = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([line.get("urn") for line in lines], ["urn:li:glossaryTerm:b", None])
+        self.assertEqual(lines[-1]["summary"], {"missing_in_target": 1, "missing_in_source": 0, "different": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
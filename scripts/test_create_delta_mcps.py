@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the scripts/mcps/create_delta_mcps.py script.
+"""
+
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.mcps.create_delta_mcps import compute_delta_mcps, read_mcps_at_revision
+
+
+def _mcp(urn, aspect_name, value, time=1000):
+    aspect = {"value": value, "lastModified": {"time": time, "actor": "urn:li:corpuser:admin"}}
+    return {
+        "entityType": "tag",
+        "entityUrn": urn,
+        "changeType": "UPSERT",
+        "aspectName": aspect_name,
+        "aspect": {"value": json.dumps(aspect), "contentType": "application/json"},
+    }
+
+
+class TestCreateDeltaMcps(unittest.TestCase):
+    """Test cases for create_delta_mcps.py"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_only_added_changed_and_deleted_aspects_are_emitted(self):
+        base = [
+            _mcp("urn:li:tag:a", "tagProperties", "a"),
+            _mcp("urn:li:tag:a", "ownership", "admin"),
+            _mcp("urn:li:tag:b", "tagProperties", "b"),
+        ]
+        head = [
+            # Only the audit stamp time differs, so this is unchanged
+            _mcp("urn:li:tag:a", "tagProperties", "a", time=2000),
+            _mcp("urn:li:tag:a", "ownership", "bob"),
+            _mcp("urn:li:tag:c", "tagProperties", "c"),
+        ]
+
+        delta, stats = compute_delta_mcps(base, head)
+
+        self.assertEqual(stats, {"added": 1, "changed": 1, "deleted": 1, "unchanged": 1})
+        self.assertEqual(
+            [(m["entityUrn"], m["aspectName"], m["changeType"]) for m in delta],
+            [
+                ("urn:li:tag:a", "ownership", "UPSERT"),
+                ("urn:li:tag:c", "tagProperties", "UPSERT"),
+                ("urn:li:tag:b", "tagProperties", "DELETE"),
+            ],
+        )
+
+    def test_deletions_can_be_skipped(self):
+        delta, stats = compute_delta_mcps([_mcp("urn:li:tag:a", "tagProperties", "a")], [], include_deletions=False)
+
+        self.assertEqual(delta, [])
+        self.assertEqual(stats["deleted"], 0)
+
+    def test_read_mcps_at_revision(self):
+        def git(*args):
+            subprocess.run(["git", *args], cwd=self.temp_dir, check=True, capture_output=True)
+
+        git("init", "-q")
+        staged_dir = os.path.join(self.temp_dir, "metadata-manager", "dev", "tags")
+        os.makedirs(staged_dir)
+        mcp_file = os.path.join(staged_dir, "mcp_file.json")
+        with open(mcp_file, "w") as f:
+            json.dump({"mcps": [_mcp("urn:li:tag:a", "tagProperties", "a")]}, f)
+        git("add", "-A")
+        git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "base")
+
+        with open(mcp_file, "w") as f:
+            json.dump([], f)
+
+        self.assertEqual(len(read_mcps_at_revision(mcp_file, "HEAD")), 1)
+        self.assertEqual(read_mcps_at_revision(mcp_file), [])
+        self.assertEqual(read_mcps_at_revision(os.path.join(staged_dir, "missing.json"), "HEAD"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
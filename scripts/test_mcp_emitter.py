@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the batched MCP emitter in utils/mcp_emitter.py.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.metadata.schema_classes import TagPropertiesClass
+
+from utils.mcp_emitter import BatchMcpEmitter, load_failed_mcps
+
+
+def _mcp(name):
+    return MetadataChangeProposalWrapper(entityUrn=f"urn:li:tag:{name}", aspect=TagPropertiesClass(name=name))
+
+
+class FakeEmitter:
+    """Records batches and rejects any batch containing a poison tag"""
+
+    def __init__(self, poison=(), transient_failures=0):
+        self.poison = set(poison)
+        self.transient_failures = transient_failures
+        self.batches = []
+        self.lock = threading.Lock()
+
+    def emit_mcps(self, mcps):
+        with self.lock:
+            self.batches.append([mcp.entityUrn for mcp in mcps])
+            if self.transient_failures:
+                self.transient_failures -= 1
+                raise ConnectionError("temporarily unavailable")
+        if any(mcp.entityUrn in self.poison for mcp in mcps):
+            raise ValueError("invalid aspect")
+
+
+class TestBatchMcpEmitter(unittest.TestCase):
+    """Test cases for BatchMcpEmitter"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.failures_file = os.path.join(self.temp_dir, "failed_mcps.jsonl")
+        self.mcps = [_mcp(f"t{i}") for i in range(10)]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_mcps_are_sent_in_batches(self):
+        fake = FakeEmitter()
+        result = BatchMcpEmitter(fake, batch_size=4, max_workers=3).emit(self.mcps)
+
+        self.assertEqual((result.emitted, result.failed, result.batches), (10, 0, 3))
+        self.assertEqual(sorted(len(batch) for batch in fake.batches), [2, 4, 4])
+
+    @patch("utils.mcp_emitter.time.sleep")
+    def test_transient_failures_are_retried(self, sleep):
+        fake = FakeEmitter(transient_failures=2)
+        result = BatchMcpEmitter(fake, batch_size=10, max_retries=3, retry_backoff=1.0).emit(self.mcps)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.retries, 2)
+        self.assertEqual([call.args[0] for call in sleep.call_args_list], [1.0, 2.0])
+
+    @patch("utils.mcp_emitter.time.sleep")
+    def test_poison_mcp_is_isolated_and_written_for_replay(self, sleep):
+        fake = FakeEmitter(poison={"urn:li:tag:t7"})
+        emitter = BatchMcpEmitter(fake, batch_size=10, max_retries=1, failures_file=self.failures_file)
+
+        result = emitter.emit(self.mcps)
+
+        self.assertEqual((result.emitted, result.failed), (9, 1))
+        replay = load_failed_mcps(self.failures_file)
+        self.assertEqual([mcp.entityUrn for mcp in replay], ["urn:li:tag:t7"])
+        self.assertEqual(replay[0].aspect.name, "t7")
+
+
+if __name__ == "__main__":
+    unittest.main()
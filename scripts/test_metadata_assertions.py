@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the count-based aggregate assertions in scripts/assertions/metadata_assertions.py.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.assertions.metadata_assertions import (
+    assert_all_entities_of_type_have_owner,
+    assert_all_entities_of_type_have_tag,
+    run_assertions,
+)
+
+
+class CountingClient:
+    """Answers count searches from a catalog of {urn: {"owners": [...], "tags": [...]}}"""
+
+    def __init__(self, catalog):
+        self.catalog = catalog
+        self.requests = []
+
+    def execute_graphql(self, query, variables=None):
+        search_input = variables["input"]
+        self.requests.append(search_input)
+        criteria = (search_input.get("orFilters") or [{"and": []}])[0]["and"]
+
+        def matches(values, criterion):
+            if criterion["condition"] == "EXISTS":
+                found = bool(values.get(criterion["field"]))
+            else:
+                found = criterion["values"][0] in values.get(criterion["field"], [])
+            return found != criterion["negated"]
+
+        urns = sorted(urn for urn, values in self.catalog.items() if all(matches(values, c) for c in criteria))
+        return {"data": {"searchAcrossEntities": {
+            "total": len(urns),
+            "searchResults": [{"entity": {"urn": urn}} for urn in urns[:search_input["count"]]],
+        }}}
+
+
+class TestAggregateAssertions(unittest.TestCase):
+    """Test cases for the aggregate assertion mode"""
+
+    def setUp(self):
+        self.catalog = {
+            f"urn:li:dataset:d{i}": {"owners": ["urn:li:corpuser:amy"] if i % 3 else [], "tags": ["urn:li:tag:pii"]}
+            for i in range(10)
+        }
+        self.client = CountingClient(self.catalog)
+
+    def test_ownership_is_checked_with_two_count_queries(self):
+        result = assert_all_entities_of_type_have_owner(self.client, "DATASET", sample_limit=2)
+
+        self.assertFalse(result.success)
+        self.assertEqual(len(self.client.requests), 2)
+        self.assertEqual(self.client.requests[0]["count"], 0)
+        self.assertEqual((result.details["totalEntityCount"], result.details["missingEntityCount"]), (10, 4))
+        self.assertEqual(result.details["violatingEntities"], ["urn:li:dataset:d0", "urn:li:dataset:d3"])
+        self.assertTrue(self.client.requests[1]["orFilters"][0]["and"][0]["negated"])
+
+    def test_tag_assertion_aggregate_mode(self):
+        result = assert_all_entities_of_type_have_tag(self.client, "DATASET", "urn:li:tag:pii", aggregate=True)
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.message, "All 10 entities of type DATASET have tag urn:li:tag:pii")
+
+    def test_filters_restrict_the_checked_entities(self):
+        filters = [{"field": "owners", "condition": "EXISTS", "negated": False}]
+
+        summary = run_assertions([{
+            "type": "all_entities_of_type_have_owner",
+            "params": {"client": self.client, "entity_type": "DATASET", "filters": filters},
+        }])
+
+        self.assertEqual(summary["successCount"], 1)
+        self.assertEqual(summary["results"][0]["details"]["totalEntityCount"], 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
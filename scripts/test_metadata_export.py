@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the concurrent, streaming metadata export in utils/metadata_export.py.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils._datahub_metadata_client import DataHubMetadataClient
+from utils.metadata_export import export_sections, iter_exported_section
+
+
+class FakeRestClient:
+    """Answers aliased glossaryNode requests and records the queries"""
+
+    def __init__(self):
+        self.queries = []
+
+    def execute_graphql(self, query, variables=None):
+        self.queries.append(query)
+        return {"data": {alias.replace("u", "e"): {"urn": urn, "children": {"total": 0}} for alias, urn in variables.items()}}
+
+
+class TestMetadataExport(unittest.TestCase):
+    """Test cases for export_sections and the batched export requests"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.tags = [{"urn": f"urn:li:tag:t{i}", "name": f"t{i}"} for i in range(3)]
+        self.nodes = [{"urn": "urn:li:glossaryNode:n"}]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_sections_are_fetched_concurrently_and_streamed_to_files(self):
+        # Both fetchers must be running at the same time to get past the barrier
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fetch(entities):
+            barrier.wait()
+            return iter(entities)
+
+        manifest_path = os.path.join(self.temp_dir, "export.json")
+        manifest = export_sections(
+            {"tags": lambda: fetch(self.tags), "glossary_nodes": lambda: fetch(self.nodes)},
+            manifest_path,
+            fmt="jsonl.gz",
+        )
+
+        self.assertEqual(list(manifest["sections"]), ["tags", "glossary_nodes"])
+        self.assertEqual(manifest["sections"]["tags"]["file"], "export.tags.jsonl.gz")
+        self.assertEqual(manifest["sections"]["tags"]["count"], 3)
+        self.assertEqual(list(iter_exported_section(manifest_path, "tags")), self.tags)
+        with open(manifest_path) as f:
+            self.assertEqual(json.load(f)["format"], "jsonl.gz")
+
+    def test_json_format_keeps_the_document_layout(self):
+        output_file = os.path.join(self.temp_dir, "export.json")
+        export_sections(
+            {"tags": lambda: self.tags, "glossary_nodes": lambda: self.nodes, "glossary_terms": lambda: []},
+            output_file,
+        )
+
+        with open(output_file) as f:
+            document = json.load(f)
+        self.assertEqual(document["tags"], self.tags)
+        self.assertEqual(document["glossary"], {"nodes": self.nodes, "terms": []})
+        self.assertEqual(document["version"], "1.0")
+
+    def test_glossary_nodes_are_fetched_in_batches(self):
+        client = DataHubMetadataClient.__new__(DataHubMetadataClient)
+        client.client = FakeRestClient()
+        urns = [f"urn:li:glossaryNode:n{i}" for i in range(5)]
+
+        nodes = client.get_glossary_nodes(urns, batch_size=2)
+
+        self.assertEqual(list(nodes), urns)
+        self.assertEqual(len(client.client.queries), 3)
+        self.assertIn("e1: glossaryNode(urn: $u1)", client.client.queries[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the dependency-levelled metadata import in utils/metadata_import.py.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.mcp_emitter import BatchMcpEmitter
+from utils.metadata_export import export_sections
+from utils.metadata_import import LevelledImporter, build_import_plan, load_import_sections, topological_levels
+
+
+def _domain(key, parent=None):
+    domain = {"urn": f"urn:li:domain:{key}", "id": key, "properties": {"name": key.title()}}
+    if parent:
+        domain["parentDomains"] = {"domains": [{"urn": f"urn:li:domain:{parent}"}]}
+    return domain
+
+
+class FakeGraph:
+    """Records emitted batches and rejects the MCPs of some entities"""
+
+    def __init__(self, rejected=()):
+        self.rejected = set(rejected)
+        self.batches = []
+
+    def emit_mcps(self, mcps):
+        self.batches.append([mcp.entityUrn for mcp in mcps])
+        rejected = [mcp.entityUrn for mcp in mcps if mcp.entityUrn in self.rejected]
+        if rejected:
+            raise ValueError(f"rejected {rejected[0]}")
+
+
+class TestMetadataImport(unittest.TestCase):
+    """Test cases for build_import_plan, topological_levels and LevelledImporter"""
+
+    def setUp(self):
+        self.sections = {
+            # Children are listed before their parents on purpose
+            "domains": [_domain("emea", parent="sales"), _domain("sales"), _domain("hr"), _domain("uk", parent="emea")],
+            "glossary_nodes": [
+                {
+                    "urn": "urn:li:glossaryNode:finance",
+                    "properties": {"name": "Finance"},
+                    "children": {"relationships": [
+                        {"entity": {"urn": "urn:li:glossaryTerm:revenue", "type": "GLOSSARY_TERM",
+                                    "properties": {"name": "Revenue"}}},
+                    ]},
+                }
+            ],
+            "structured_properties": [
+                {"urn": "urn:li:structuredProperty:tier", "definition": {
+                    "qualifiedName": "tier",
+                    "valueType": {"urn": "urn:li:dataType:datahub.string"},
+                    "entityTypes": [{"urn": "urn:li:entityType:datahub.domain"}],
+                }}
+            ],
+        }
+        self.sections["domains"][2]["structuredProperties"] = {"properties": [
+            {"structuredProperty": {"urn": "urn:li:structuredProperty:tier"}, "values": [{"stringValue": "gold"}]}
+        ]}
+
+    def test_levels_follow_the_hierarchies(self):
+        levels, cyclic = topological_levels(build_import_plan(self.sections))
+
+        self.assertEqual(cyclic, [])
+        self.assertEqual(levels, [
+            ["urn:li:domain:sales", "urn:li:glossaryNode:finance", "urn:li:structuredProperty:tier"],
+            ["urn:li:domain:emea", "urn:li:domain:hr", "urn:li:glossaryTerm:revenue"],
+            ["urn:li:domain:uk"],
+        ])
+
+    def test_each_level_is_emitted_in_batches(self):
+        graph = FakeGraph()
+
+        result = LevelledImporter(BatchMcpEmitter(graph, batch_size=2, max_retries=0)).run(
+            build_import_plan(self.sections)
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual((result.levels, len(result.imported)), (3, 7))
+        # Level 2 has four MCPs (hr carries its property values) sent in two batches
+        self.assertEqual([len(batch) for batch in graph.batches], [2, 1, 2, 2, 1])
+        self.assertEqual(graph.batches[-1], ["urn:li:domain:uk"])
+
+    def test_a_failed_subtree_does_not_stop_other_branches(self):
+        graph = FakeGraph(rejected={"urn:li:domain:sales"})
+
+        result = LevelledImporter(BatchMcpEmitter(graph, max_retries=0, retry_backoff=0)).run(
+            build_import_plan(self.sections)
+        )
+
+        self.assertEqual(list(result.failed), ["urn:li:domain:sales"])
+        self.assertEqual(sorted(result.skipped), ["urn:li:domain:emea", "urn:li:domain:uk"])
+        self.assertIn("urn:li:domain:hr", result.imported)
+        self.assertIn("urn:li:glossaryTerm:revenue", result.imported)
+
+    def test_existing_entities_are_left_untouched_without_overwrite(self):
+        graph = FakeGraph()
+
+        result = LevelledImporter(BatchMcpEmitter(graph), exists=lambda urn: urn == "urn:li:domain:sales").run(
+            build_import_plan(self.sections)
+        )
+
+        self.assertEqual(result.existing, ["urn:li:domain:sales"])
+        self.assertIn("urn:li:domain:emea", result.imported)
+        self.assertNotIn("urn:li:domain:sales", [urn for batch in graph.batches for urn in batch])
+
+    def test_cycles_are_reported(self):
+        sections = {"domains": [_domain("a", parent="b"), _domain("b", parent="a"), _domain("c")]}
+
+        levels, cyclic = topological_levels(build_import_plan(sections))
+
+        self.assertEqual(levels, [["urn:li:domain:c"]])
+        self.assertEqual(cyclic, ["urn:li:domain:a", "urn:li:domain:b"])
+
+    def test_json_lines_exports_are_read(self):
+        temp_dir = tempfile.mkdtemp()
+        try:
+            manifest = os.path.join(temp_dir, "export.json")
+            export_sections({"domains": lambda: self.sections["domains"]}, manifest, fmt="jsonl")
+            document = os.path.join(temp_dir, "document.json")
+            with open(document, "w") as f:
+                json.dump({"version": "1.0", "glossary": {"nodes": self.sections["glossary_nodes"], "terms": []}}, f)
+
+            self.assertEqual(load_import_sections(manifest), {"domains": self.sections["domains"]})
+            self.assertEqual(
+                load_import_sections(document),
+                {"glossary_nodes": self.sections["glossary_nodes"], "glossary_terms": []},
+            )
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the local metadata mirror in utils/metadata_mirror.py.
+"""
+
+import copy
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.metadata_mirror import ASSOCIATIONS, MetadataMirror, mirror_path
+from scripts.metadata_tests import entity_relationship_tests, metadata_test_utils
+
+
+class ScrollingClient:
+    """Serves scrollAcrossEntities from {entity type: [entities]}, two entities per page"""
+
+    def __init__(self, entities):
+        self.entities = entities
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def execute_graphql(self, query, variables=None):
+        search_input = variables["input"]
+        with self.lock:
+            self.requests.append(search_input)
+        matching = [
+            entity
+            for entity_type in search_input["types"]
+            for entity in self.entities.get(entity_type, [])
+        ]
+        offset = int(search_input.get("scrollId") or 0)
+        page = matching[offset:offset + 2]
+        next_id = str(offset + 2) if offset + 2 < len(matching) else None
+        return {"data": {"scrollAcrossEntities": {
+            "nextScrollId": next_id,
+            "count": len(page),
+            "total": len(matching),
+            "searchResults": [{"entity": copy.deepcopy(entity)} for entity in page],
+        }}}
+
+
+class TestMetadataMirror(unittest.TestCase):
+    """Test cases for MetadataMirror sync and queries"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = mirror_path(self.temp_dir, "http://datahub-gms:8080")
+        self.entities = {
+            "DOMAIN": [{"urn": "urn:li:domain:sales", "type": "DOMAIN", "properties": {"name": "Sales"}}],
+            "GLOSSARY_NODE": [{"urn": "urn:li:glossaryNode:finance", "type": "GLOSSARY_NODE",
+                               "properties": {"name": "Finance"}}],
+            "GLOSSARY_TERM": [
+                {"urn": f"urn:li:glossaryTerm:t{i}", "type": "GLOSSARY_TERM", "properties": {"name": f"T{i}"},
+                 "parentNodes": {"nodes": [{"urn": "urn:li:glossaryNode:finance"}]},
+                 "domain": {"domain": {"urn": "urn:li:domain:sales"}}}
+                for i in range(3)
+            ],
+            "TAG": [{"urn": "urn:li:tag:pii", "type": "TAG", "name": "pii",
+                     "properties": {"name": "PII", "colorHex": "#ff0000"},
+                     "ownership": {"owners": [
+                         {"owner": {"urn": "urn:li:corpuser:amy", "username": "amy",
+                                    "properties": {"displayName": "Amy Lee"}}},
+                         {"owner": {"urn": "urn:li:corpGroup:data", "name": "data", "properties": None}},
+                     ]}}],
+            "DATASET": [{"urn": "urn:li:dataset:orders", "type": "DATASET", "properties": {"name": "orders"},
+                         "tags": {"tags": [{"tag": {"urn": "urn:li:tag:pii"}}]},
+                         "domain": {"domain": {"urn": "urn:li:domain:sales"}}}],
+        }
+        self.client = ScrollingClient(self.entities)
+        self.mirror = MetadataMirror(self.path)
+
+    def tearDown(self):
+        self.mirror.close()
+        shutil.rmtree(self.temp_dir)
+
+    def _sync(self):
+        return self.mirror.sync(
+            self.client, entity_types=["DOMAIN", "GLOSSARY_NODE", "GLOSSARY_TERM", "TAG"], max_workers=3
+        )
+
+    def test_sync_pages_through_entities_and_answers_queries(self):
+        report = self._sync()
+
+        self.assertEqual(report["GLOSSARY_TERM"], {"total": 3, "changed": 3, "removed": 0})
+        self.assertEqual(report[ASSOCIATIONS]["total"], 1)
+        self.assertTrue(any(request.get("scrollId") == "2" for request in self.client.requests))
+        self.assertEqual(len(self.mirror.entities("GLOSSARY_TERM")), 3)
+        self.assertEqual([e["urn"] for e in self.mirror.entities_with_tag("urn:li:tag:pii")], ["urn:li:dataset:orders"])
+        self.assertEqual(len(self.mirror.children("urn:li:glossaryNode:finance")), 3)
+        self.assertEqual(len(self.mirror.entities_in_domain("urn:li:domain:sales")), 4)
+        self.assertEqual(len(self.mirror.entities_in_domain("urn:li:domain:sales", "DATASET")), 1)
+        tag = self.mirror.list_tags(query="pi")[0]
+        self.assertEqual((tag["name"], tag["colorHex"], tag["owner_names"]), ("PII", "#ff0000", ["Amy Lee", "data"]))
+
+    def test_resync_only_rewrites_changed_entities_and_drops_deleted_ones(self):
+        self._sync()
+        self.entities["GLOSSARY_TERM"][0]["properties"]["name"] = "Renamed"
+        del self.entities["GLOSSARY_TERM"][2]
+        self.entities["DATASET"][0]["tags"] = {"tags": []}
+
+        report = self._sync()
+
+        self.assertEqual(report["GLOSSARY_TERM"], {"total": 2, "changed": 1, "removed": 1})
+        self.assertEqual(report["TAG"]["changed"], 0)
+        self.assertEqual(self.mirror.get("urn:li:glossaryTerm:t0")["properties"]["name"], "Renamed")
+        self.assertIsNone(self.mirror.get("urn:li:glossaryTerm:t2"))
+        self.assertEqual(self.mirror.entities_with_tag("urn:li:tag:pii"), [])
+        self.assertTrue(self.mirror.is_fresh("GLOSSARY_TERM", 60))
+        self.assertFalse(self.mirror.is_fresh("TEST", 60))
+
+    def test_failed_entity_type_keeps_its_previous_mirror(self):
+        self._sync()
+        self.client.execute_graphql = lambda query, variables=None: {"errors": [{"message": "GMS down"}]}
+
+        report = self._sync()
+
+        self.assertIn("GMS down", report["errors"]["TAG"])
+        self.assertEqual(len(self.mirror.entities("TAG")), 1)
+
+    def test_listing_is_written_batch_by_batch_as_it_is_consumed(self):
+        self._sync()
+        written = []
+
+        def listing():
+            for i in range(5):
+                if i == 4:
+                    written.extend(entity["urn"] for entity in self.mirror.entities("GLOSSARY_TERM"))
+                    raise RuntimeError("GMS down")
+                yield {"urn": f"urn:li:glossaryTerm:new{i}", "type": "GLOSSARY_TERM", "properties": {"name": f"N{i}"}}
+
+        with self.assertRaisesRegex(RuntimeError, "GMS down"):
+            self.mirror.replace_entities("GLOSSARY_TERM", ["GLOSSARY_TERM"], listing(), batch_size=2)
+
+        # The first two batches were written before the listing failed, nothing was removed
+        self.assertIn("urn:li:glossaryTerm:new3", written)
+        self.assertEqual(len(self.mirror.entities("GLOSSARY_TERM")), 7)
+        self.assertEqual(self.mirror.status()["GLOSSARY_TERM"]["total"], 3)
+
+        report = self.mirror.replace_entities(
+            "GLOSSARY_TERM", ["GLOSSARY_TERM"], self.entities["GLOSSARY_TERM"] * 2, batch_size=2
+        )
+        self.assertEqual(report, {"total": 3, "changed": 0, "removed": 4})
+
+    def test_entities_are_read_back_page_by_page(self):
+        self._sync()
+
+        urns = [entity["urn"] for entity in self.mirror.iter_entities("GLOSSARY_TERM", page_size=2)]
+
+        self.assertEqual(urns, [f"urn:li:glossaryTerm:t{i}" for i in range(3)])
+
+    def test_metadata_tests_read_the_snapshot_from_the_mirror(self):
+        self._sync()
+        suite = metadata_test_utils.MetadataTestSuite("Quality", client=None, snapshot_source=self.mirror)
+        suite.add_test(entity_relationship_tests.DomainOwnershipTest(None))
+
+        results = suite.run_all()
+
+        self.assertEqual([r.entity_urn for r in results["DomainOwnershipTest"]], ["urn:li:domain:sales"])
+        self.assertEqual(suite.snapshot.counts(), {"domain": 1})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the incremental, parallel sync of scripts/metadata_sync/sync_metadata.py.
+"""
+
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.metadata_sync.sync_metadata import MetadataSyncer
+from utils.sync_watermark import SyncWatermark, watermark_path
+
+
+class FakeSourceClient:
+    """Lists a fixed set of source entities"""
+
+    def __init__(self, entities):
+        self.entities = entities
+
+    def list_glossary_terms(self):
+        return self.entities.get("glossaryTerm", [])
+
+    def list_glossary_nodes(self):
+        return self.entities.get("glossaryNode", [])
+
+    def list_tags(self):
+        return self.entities.get("tag", [])
+
+    def list_domains(self):
+        return self.entities.get("domain", [])
+
+
+class RecordingSyncer(MetadataSyncer):
+    """Records the synced URNs instead of talking to DataHub"""
+
+    def __init__(self, *args, failing=(), **kwargs):
+        super().__init__(*args, **kwargs)
+        self.failing = set(failing)
+        self.synced = []
+        self.lock = threading.Lock()
+
+    def _sync(self, urn):
+        with self.lock:
+            self.synced.append(urn)
+        return {"status": "error" if urn in self.failing else "success", "urn": urn}
+
+    sync_glossary_term = sync_glossary_node = sync_tag = sync_domain = _sync
+
+
+def _tag(name, description=""):
+    return {"urn": f"urn:li:tag:{name}", "type": "TAG", "properties": {"name": name, "description": description}}
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Test cases for MetadataSyncer.sync_incremental and SyncWatermark"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = watermark_path(self.temp_dir, "http://dev:8080", "http://prod:8080")
+        self.entities = {
+            "tag": [_tag("pii"), _tag("gold")],
+            "domain": [{"urn": "urn:li:domain:sales", "properties": {"name": "Sales"}}],
+        }
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _run(self, failing=(), dry_run=False):
+        syncer = RecordingSyncer(
+            FakeSourceClient(self.entities), None, dry_run=dry_run,
+            watermark=SyncWatermark(self.path), max_workers=2, failing=failing,
+        )
+        return syncer, syncer.sync_incremental(["tag", "domain", "glossaryTerm"])
+
+    def test_only_changed_entities_are_synced_on_the_next_run(self):
+        _, first = self._run()
+        self.assertEqual(first["report"]["total"], {"synced": 3, "skipped": 0, "failed": 0})
+
+        self.entities["tag"][1] = _tag("gold", "Curated data")
+        syncer, second = self._run()
+
+        self.assertEqual(syncer.synced, ["urn:li:tag:gold"])
+        self.assertEqual(second["report"]["tag"], {"synced": 1, "skipped": 1, "failed": 0})
+        self.assertEqual(second["report"]["total"], {"synced": 1, "skipped": 2, "failed": 0})
+
+    def test_failed_entities_are_retried(self):
+        _, first = self._run(failing={"urn:li:domain:sales"})
+        self.assertEqual(first["report"]["domain"]["failed"], 1)
+
+        syncer, _ = self._run()
+
+        self.assertEqual(syncer.synced, ["urn:li:domain:sales"])
+
+    def test_dry_run_does_not_move_the_watermark(self):
+        self._run(dry_run=True)
+
+        self.assertFalse(self.path.exists())
+        syncer, _ = self._run()
+        self.assertEqual(len(syncer.synced), 3)
+
+    def test_audit_times_do_not_count_as_changes(self):
+        self.entities["tag"][0]["ownership"] = {"owners": [], "lastModified": {"time": 1, "actor": "urn:li:corpuser:admin"}}
+        self._run()
+        self.entities["tag"][0]["ownership"]["lastModified"]["time"] = 2
+
+        syncer, _ = self._run()
+
+        self.assertEqual(syncer.synced, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
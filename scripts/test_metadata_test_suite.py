@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared-snapshot MetadataTestSuite runner in scripts/metadata_tests.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.metadata_tests import entity_relationship_tests, metadata_test_utils
+
+
+class FakeClient:
+    """Serves a small catalog and counts the requests made"""
+
+    def __init__(self):
+        self.calls = Counter()
+        self.lock = threading.Lock()
+        self.domains = [
+            {"urn": "urn:li:domain:sales", "properties": {"name": "Sales"},
+             "ownership": {"owners": [{"owner": {"urn": "urn:li:corpuser:amy"}}]}},
+            {"urn": "urn:li:domain:hr", "properties": {"name": "HR"}},
+        ]
+        self.terms = [
+            {"urn": "urn:li:glossaryTerm:revenue", "properties": {"name": "Revenue"},
+             "domains": {"domains": [{"urn": "urn:li:domain:sales"}]},
+             "parentNode": {"urn": "urn:li:glossaryNode:missing"}},
+        ]
+
+    def _count(self, method):
+        with self.lock:
+            self.calls[method] += 1
+
+    def list_domains(self):
+        self._count("list_domains")
+        return self.domains
+
+    def list_glossary_terms(self):
+        self._count("list_glossary_terms")
+        return self.terms
+
+    def list_glossary_nodes(self):
+        self._count("list_glossary_nodes")
+        return []
+
+    def export_domain(self, urn):
+        self._count("export_domain")
+        return None
+
+    def export_glossary_term(self, urn):
+        self._count("export_glossary_term")
+        return None
+
+
+class TestMetadataTestSuite(unittest.TestCase):
+    """Test cases for MetadataTestSuite.run_all"""
+
+    def setUp(self):
+        self.client = FakeClient()
+        self.suite = metadata_test_utils.MetadataTestSuite("Quality", self.client)
+        for test_class in (
+            entity_relationship_tests.GlossaryTermsInDomainsTest,
+            entity_relationship_tests.DomainOwnershipTest,
+            entity_relationship_tests.GlossaryHierarchyTest,
+        ):
+            self.suite.add_test(test_class(self.client))
+
+    def test_each_entity_type_is_fetched_once(self):
+        results = self.suite.run_all(max_workers=3)
+
+        self.assertEqual(
+            self.client.calls,
+            Counter(list_domains=1, list_glossary_terms=1, list_glossary_nodes=1),
+        )
+        ownership = {r.entity_urn: r.success for r in results["DomainOwnershipTest"]}
+        self.assertEqual(ownership, {"urn:li:domain:sales": True, "urn:li:domain:hr": False})
+        self.assertFalse(results["GlossaryHierarchyTest"][0].success)
+
+    def test_tests_run_concurrently_with_timings_saved(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        class WaitingTest(metadata_test_utils.MetadataTest):
+            required_entity_types = ("domain",)
+
+            def run(self):
+                barrier.wait()
+                return [self.create_result(True, f"{len(self.list_entities('domain'))} domains")]
+
+        suite = metadata_test_utils.MetadataTestSuite("Concurrent", self.client)
+        for index in range(3):
+            suite.add_test(WaitingTest(self.client, name=f"waiting{index}"))
+        results = suite.run_all(max_workers=3)
+
+        temp_dir = tempfile.mkdtemp()
+        try:
+            output_file = os.path.join(temp_dir, "results.json")
+            suite.save_results(results, output_file)
+            with open(output_file) as f:
+                saved = json.load(f)
+        finally:
+            shutil.rmtree(temp_dir)
+
+        self.assertEqual(list(saved["results"]), ["waiting0", "waiting1", "waiting2"])
+        self.assertEqual(sorted(saved["timings"]), ["waiting0", "waiting1", "waiting2"])
+        self.assertEqual(saved["snapshot"]["counts"], {"domain": 2})
+        self.assertEqual(self.client.calls["list_domains"], 1)
+
+    def test_a_failing_test_is_reported_without_stopping_the_others(self):
+        class BrokenTest(metadata_test_utils.MetadataTest):
+            def run(self):
+                raise RuntimeError("boom")
+
+        self.suite.add_test(BrokenTest(self.client))
+        results = self.suite.run_all()
+
+        self.assertEqual(len(results), 4)
+        self.assertIn("boom", results["BrokenTest"][0].message)
+
+
+if __name__ == "__main__":
+    unittest.main()
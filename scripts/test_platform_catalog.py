@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the platform catalog in utils/platform_catalog.py.
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.platform_catalog import PlatformCatalogCache, fetch_platform_catalog, parse_instance_urn
+
+
+class CatalogClient:
+    """Serves the platform catalog query, counting requests"""
+
+    server_url = "http://datahub-gms:8080"
+
+    def __init__(self):
+        self.requests = []
+        self.snowflake_count = 10
+        self.fail = False
+        self.served = threading.Event()
+
+    def execute_graphql(self, query, variables=None):
+        self.requests.append(variables["input"])
+        self.served.set()
+        if self.fail:
+            return {"errors": [{"message": "GMS down"}]}
+        return {"data": {"aggregateAcrossEntities": {"facets": [
+            {"field": "platform", "aggregations": [
+                {"value": "urn:li:dataPlatform:snowflake", "count": self.snowflake_count,
+                 "entity": {"urn": "urn:li:dataPlatform:snowflake", "name": "snowflake"}},
+                {"value": "urn:li:dataPlatform:kafka", "count": 4, "entity": None},
+            ]},
+            {"field": "platformInstance", "aggregations": [
+                {"value": "urn:li:dataPlatformInstance:(urn:li:dataPlatform:snowflake,prod)", "count": 7},
+                {"value": "urn:li:dataPlatformInstance:(urn:li:dataPlatform:snowflake,dev)", "count": 3},
+                {"value": "urn:li:dataPlatformInstance:(urn:li:dataPlatform:kafka,events)", "count": 4,
+                 "entity": {"instanceId": "events", "platform": {"name": "kafka"}}},
+            ]},
+            {"field": "_entityType", "aggregations": [
+                {"value": "DATASET", "count": 12},
+                {"value": "dataJob", "count": 2},
+            ]},
+        ]}}}
+
+
+class TestPlatformCatalog(unittest.TestCase):
+    """Test cases for the platform catalog and its cache"""
+
+    def setUp(self):
+        self.client = CatalogClient()
+
+    def test_catalog_is_built_from_one_aggregation(self):
+        catalog = fetch_platform_catalog(self.client, entity_type="DATASET")
+
+        self.assertEqual(len(self.client.requests), 1)
+        self.assertEqual(self.client.requests[0]["types"], ["DATASET"])
+        self.assertEqual(catalog.platform_names(), ["kafka", "snowflake"])
+        self.assertEqual(catalog.platforms["snowflake"], 10)
+        self.assertEqual(catalog.instance_names("Snowflake"), ["dev", "prod"])
+        self.assertEqual(catalog.instance_names(), ["dev", "events", "prod"])
+        self.assertEqual(catalog.entity_types, {"DATASET": 12, "DATAJOB": 2})
+
+    def test_parse_instance_urn(self):
+        self.assertEqual(
+            parse_instance_urn("urn:li:dataPlatformInstance:(urn:li:dataPlatform:mysql,eu,1)"), ("mysql", "eu,1")
+        )
+        self.assertIsNone(parse_instance_urn("urn:li:dataPlatform:mysql"))
+
+    def test_cache_serves_from_memory_and_refreshes_in_background(self):
+        cache = PlatformCatalogCache(refresh_after=60, max_age=3600)
+        first = cache.get(self.client)
+        self.assertIs(cache.get(self.client), first)
+        self.assertEqual(len(self.client.requests), 1)
+
+        first.fetched_at -= 120
+        self.client.served.clear()
+        self.client.snowflake_count = 11
+        self.assertIs(cache.get(self.client), first)
+        self.assertTrue(self.client.served.wait(5))
+        for _ in range(100):
+            if cache.get(self.client) is not first:
+                break
+            threading.Event().wait(0.01)
+
+        self.assertEqual(cache.get(self.client).platforms["snowflake"], 11)
+        self.assertEqual(len(self.client.requests), 2)
+
+    def test_failed_refresh_keeps_the_previous_catalog(self):
+        cache = PlatformCatalogCache()
+        first = cache.get(self.client, "DATASET")
+        self.client.fail = True
+
+        self.assertIs(cache.get(self.client, "DATASET", force_refresh=True), first)
+        self.assertIsNone(cache.get(self.client, "CHART"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Unit tests for scripts/process_metadata_migration.py.
+"""
+
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.process_metadata_migration import EntityMatchIndex, MetadataMigrationProcessor, TargetLookupPlanner
+from datahub.metadata.schema_classes import DomainsClass
+
+from utils.json_stream import iter_json_object_members
+from utils.mcp_emitter import BatchMcpEmitter
+
+
+def _dataset(urn, name, platform_instance=None, browse_path=None):
+    entity = {"urn": urn, "type": "DATASET", "name": name}
+    if platform_instance:
+        entity["dataPlatformInstance"] = {"instanceId": platform_instance}
+    if browse_path:
+        entity["browsePaths"] = [browse_path]
+    return entity
+
+
+class TestEntityMatching(unittest.TestCase):
+    """Test cases for MetadataMigrationProcessor.match_entities"""
+
+    def setUp(self):
+        self.processor = MetadataMigrationProcessor(target_environment="staging", dry_run=True)
+
+    def _match_one(self, source, targets):
+        matches = self.processor.match_entities([source], targets)
+        self.assertEqual(len(matches), 1)
+        return matches[0]
+
+    def test_exact_match_on_expected_target_name(self):
+        source = _dataset("urn:src", "orders", platform_instance="abc", browse_path="/db/sales")
+        match = self._match_one(source, [_dataset("urn:dst", "abc.db.sales.orders", platform_instance="abc")])
+
+        self.assertEqual((match.target_urn, match.match_method, match.confidence), ("urn:dst", "exact", 1.0))
+
+    def test_qualified_name_ignores_platform_instance(self):
+        source = _dataset("urn:src", "orders", platform_instance="abc", browse_path="/db/sales")
+        match = self._match_one(source, [_dataset("urn:dst", "xyz.db.sales.orders", platform_instance="xyz")])
+
+        self.assertEqual((match.target_urn, match.match_method), ("urn:dst", "qualified_name"))
+        self.assertEqual(match.confidence, EntityMatchIndex.CONFIDENCE["qualified_name"])
+
+    def test_browse_path_suffix_prefers_longest_suffix(self):
+        source = _dataset("urn:src", "orders", browse_path="/prod/db/sales")
+        targets = [
+            _dataset("urn:other", "xyz.db.marketing.orders"),
+            _dataset("urn:dst", "xyz.db.sales.orders"),
+        ]
+        match = self._match_one(source, targets)
+
+        self.assertEqual((match.target_urn, match.match_method), ("urn:dst", "browse_path"))
+        self.assertFalse(match.ambiguous)
+
+    def test_ambiguous_name_match_is_deterministic(self):
+        source = _dataset("urn:src", "orders", browse_path="/db")
+        targets = [
+            _dataset("urn:b", "orders", browse_path="/warehouse"),
+            _dataset("urn:a", "orders", browse_path="/lake"),
+        ]
+
+        match = self._match_one(source, targets)
+        reversed_match = self._match_one(source, list(reversed(targets)))
+
+        self.assertEqual((match.target_urn, match.match_method), ("urn:a", "name"))
+        self.assertEqual(reversed_match.target_urn, "urn:a")
+        self.assertTrue(match.ambiguous)
+        self.assertEqual(match.candidate_count, 2)
+
+    def test_unmatched_entity_is_skipped(self):
+        source = _dataset("urn:src", "orders")
+        self.assertEqual(self.processor.match_entities([source], [_dataset("urn:dst", "customers")]), [])
+
+
+class TestExportStreaming(unittest.TestCase):
+    """Test cases for streaming exported entities"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.processor = MetadataMigrationProcessor(target_environment="staging", dry_run=True)
+        self.metadata = {
+            "environment": "dev",
+            "mutations_applied": True,
+            "mutation_config": {"platform_instance_mapping": {"abc": "xyz"}},
+        }
+        self.entities = [_dataset(f"urn:{i}", f"table_{i}") for i in range(5)]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _write(self, filename, content):
+        path = os.path.join(self.temp_dir, filename)
+        with open(path, "w") as f:
+            f.write(content)
+        return path
+
+    def test_object_members_are_parsed_across_small_reads(self):
+        document = json.dumps({"metadata": self.metadata, "entities": self.entities + [None], "count": 12345})
+
+        members = list(iter_json_object_members(io.StringIO(document), stream_keys=["entities"], read_size=7))
+
+        self.assertEqual(members[0], ("metadata", self.metadata, False))
+        self.assertEqual([value for key, value, is_item in members if is_item], self.entities + [None])
+        self.assertEqual(members[-1], ("count", 12345, False))
+
+    def test_export_layout_is_streamed_with_header_first(self):
+        path = self._write("export.json", json.dumps({"metadata": self.metadata, "entities": self.entities + [{}]}, indent=2))
+
+        self.processor.load_export_header(path)
+        entities = list(self.processor.iter_exported_entities(path))
+
+        self.assertTrue(self.processor.mutations_already_applied)
+        self.assertEqual(self.processor.mutations, {"platform_instances": {"abc": "xyz"}})
+        self.assertEqual(entities, self.entities)
+
+    def test_json_lines_with_header(self):
+        lines = [json.dumps({"metadata": self.metadata})] + [json.dumps(entity) for entity in self.entities]
+        path = self._write("export.jsonl", "\n".join(lines) + "\n")
+
+        self.assertEqual(self.processor.load_exported_entities(path), self.entities)
+        self.assertTrue(self.processor.mutations_already_applied)
+
+    def test_legacy_list_and_single_entity_layouts(self):
+        list_path = self._write("list.json", json.dumps(self.entities))
+        single_path = self._write("single.json", json.dumps(self.entities[0]))
+
+        self.assertEqual(self.processor.load_exported_entities(list_path), self.entities)
+        self.assertEqual(self.processor.load_exported_entities(single_path), [self.entities[0]])
+
+    def test_process_migration_works_in_chunks(self):
+        path = self._write("export.json", json.dumps({"metadata": self.metadata, "entities": self.entities}))
+        chunk_sizes = []
+        original_process_chunk = self.processor.process_chunk
+
+        def process_chunk(source_entities, output_dir=None, **kwargs):
+            chunk_sizes.append(len(source_entities))
+            return original_process_chunk(source_entities, output_dir, **kwargs)
+
+        self.processor.process_chunk = process_chunk
+        result = self.processor.process_migration(path, chunk_size=2)
+
+        self.assertEqual(chunk_sizes, [2, 2, 1])
+        self.assertEqual(result["source_entities"], 5)
+        self.assertEqual(result["entity_types"], ["DATASET"])
+
+
+class FakeGraph:
+    """Serves search pages from a fixed list of entities and records the requests"""
+
+    def __init__(self, entities):
+        self.entities = entities
+        self.requests = []
+
+    def execute_graphql(self, query, variables):
+        search = variables["input"]
+        self.requests.append(search)
+        start, count = search["start"], search["count"]
+        page = self.entities[start:start + count]
+        return {"searchAcrossEntities": {"total": len(self.entities), "searchResults": [{"entity": e} for e in page]}}
+
+
+class TestTargetLookupPlanner(unittest.TestCase):
+    """Test cases for batched target lookups"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_plan_batches_values_per_platform_and_type(self):
+        planner = TargetLookupPlanner(None, "staging", batch_size=2)
+        groups = {
+            ("snowflake", "DATASET"): {"names": {"a", "b", "c"}, "browse_paths": {"db"}},
+            ("looker", "DASHBOARD"): {"names": {"sales"}, "browse_paths": set()},
+        }
+
+        lookups = planner.plan(groups)
+
+        self.assertEqual(
+            [(lookup["platform"], lookup["kind"], lookup["values"]) for lookup in lookups],
+            [
+                ("looker", "name", ["sales"]),
+                ("snowflake", "name", ["a", "b"]),
+                ("snowflake", "name", ["c"]),
+                ("snowflake", "browse_path", ["db"]),
+            ],
+        )
+        dashboard_filter = lookups[0]["variables"]["input"]["orFilters"][0]["and"]
+        self.assertEqual(dashboard_filter[0]["field"], "title")
+        self.assertEqual(dashboard_filter[1]["values"], ["urn:li:dataPlatform:looker"])
+        self.assertEqual(lookups[0]["variables"]["input"]["types"], ["DASHBOARD"])
+
+    def test_results_are_paged_filtered_and_cached(self):
+        entities = [
+            {"urn": f"urn:{i}", "name": f"table_{i}", "platform": {"name": "snowflake"}} for i in range(5)
+        ] + [{"urn": "urn:other", "name": "table_1", "platform": {"name": "postgres"}}]
+        graph = FakeGraph(entities)
+        planner = TargetLookupPlanner(graph, "staging", page_size=2, cache_dir=self.temp_dir)
+        lookups = planner.plan({("snowflake", "DATASET"): {"names": {"table_1", "table_3"}, "browse_paths": set()}})
+
+        found = planner.run(lookups, name_matcher=lambda entity_name, name, urn: entity_name == name)
+
+        self.assertEqual([e["urn"] for e in found], ["urn:1", "urn:3"])
+        self.assertEqual([request["start"] for request in graph.requests], [0, 2, 4])
+
+        cached_graph = FakeGraph([])
+        cached_planner = TargetLookupPlanner(cached_graph, "staging", page_size=2, cache_dir=self.temp_dir)
+        self.assertEqual(cached_planner.run(lookups, name_matcher=lambda entity_name, name, urn: entity_name == name), found)
+        self.assertEqual((cached_graph.requests, cached_planner.cache_hits), ([], 1))
+
+    def test_expired_cache_entries_are_ignored(self):
+        graph = FakeGraph([{"urn": "urn:1", "name": "a"}])
+        planner = TargetLookupPlanner(graph, "staging", cache_dir=self.temp_dir)
+        lookups = planner.plan({(None, "DATASET"): {"names": {"a"}, "browse_paths": set()}})
+        planner.run(lookups)
+
+        expired_planner = TargetLookupPlanner(graph, "staging", cache_dir=self.temp_dir, cache_ttl=0)
+        expired_planner.run(lookups)
+
+        self.assertEqual((len(graph.requests), expired_planner.cache_hits), (2, 0))
+
+
+class RecordingEmitter:
+    """Records the emitted entity URNs and rejects the poisoned ones"""
+
+    def __init__(self, poison=()):
+        self.poison = set(poison)
+        self.emitted = []
+
+    def emit_mcps(self, mcps):
+        if any(mcp.entityUrn in self.poison for mcp in mcps):
+            raise ValueError("rejected")
+        self.emitted.extend(mcp.entityUrn for mcp in mcps)
+
+
+class TestResumableMigration(unittest.TestCase):
+    """Test cases for journaled, resumable migration runs"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.temp_dir, "export.json")
+        entities = []
+        for i in range(4):
+            entity = _dataset(f"urn:src{i}", f"table_{i}")
+            entity["domain"] = {"domain": "urn:li:domain:sales"}
+            entities.append(entity)
+        with open(self.input_file, "w") as f:
+            json.dump({"metadata": {"environment": "dev"}, "entities": entities}, f)
+        self.targets = [_dataset(f"urn:li:dataset:dst{i}", f"table_{i}") for i in range(4)]
+        self.fetches = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def _processor(self, emitter):
+        processor = MetadataMigrationProcessor(
+            target_environment="staging", dry_run=True, journal_dir=os.path.join(self.temp_dir, "runs")
+        )
+        # Journaling is only used outside dry-run mode
+        processor.dry_run = False
+        processor.emitter = BatchMcpEmitter(emitter, batch_size=1, max_workers=1, max_retries=0)
+
+        def fetch_target_entities(source_entities):
+            self.fetches += 1
+            return self.targets
+
+        processor.fetch_target_entities = fetch_target_entities
+        return processor
+
+    def test_resume_skips_completed_chunks_and_acknowledged_batches(self):
+        first = self._processor(RecordingEmitter(poison={"urn:li:dataset:dst3"}))
+        first_result = first.process_migration(self.input_file, chunk_size=2)
+        self.assertEqual((first_result["mcps_emitted"], first_result["mcps_failed"]), (3, 1))
+        self.assertEqual(self.fetches, 2)
+
+        emitter = RecordingEmitter()
+        result = self._processor(emitter).process_migration(self.input_file, chunk_size=2, resume_run_id=first_result["run_id"])
+
+        # Chunk 1 was completed, chunk 2 reuses its match table and only re-sends the rejected MCP
+        self.assertEqual(self.fetches, 2)
+        self.assertEqual(emitter.emitted, ["urn:li:dataset:dst3"])
+        self.assertEqual((result["chunks_resumed"], result["matches"], result["mcps_emitted"]), (1, 4, 4))
+
+    def test_verify_reads_back_emitted_aspects(self):
+        run_id = self._processor(RecordingEmitter()).process_migration(self.input_file, chunk_size=2)["run_id"]
+        processor = self._processor(RecordingEmitter())
+        processor.metadata_api = MagicMock()
+        processor.metadata_api.context.graph.get_aspect.side_effect = lambda entity_urn, aspect_type: (
+            None if entity_urn == "urn:li:dataset:dst1" else DomainsClass(domains=["urn:li:domain:sales"])
+        )
+
+        result = processor.process_migration(self.input_file, chunk_size=2, resume_run_id=run_id, verify=True)
+
+        self.assertEqual(result["chunks_resumed"], 2)
+        self.assertEqual(result["verification"]["checked"], 4)
+        self.assertEqual(result["verification"]["mismatches"], [{"entity_urn": "urn:li:dataset:dst1", "aspect": "domains"}])
+
+    def test_resume_rejects_a_different_input(self):
+        run_id = self._processor(RecordingEmitter()).process_migration(self.input_file, chunk_size=2)["run_id"]
+        other_input = os.path.join(self.temp_dir, "other.json")
+        shutil.copy(self.input_file, other_input)
+
+        with self.assertRaises(ValueError):
+            self._processor(RecordingEmitter()).process_migration(other_input, chunk_size=2, resume_run_id=run_id)
+
+
+if __name__ == "__main__":
+    unittest.main()
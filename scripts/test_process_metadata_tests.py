@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the batched mutation execution in scripts/process_metadata_tests.py.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.process_metadata_tests import DataHubTestProcessor, build_batch_mutation
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.payload = payload
+        self.status_code = status_code
+        self.text = json.dumps(payload)
+
+    def json(self):
+        return self.payload
+
+
+class FakeSession:
+    """Answers batched mutations, failing the aliases whose variables carry a name in `failing`"""
+
+    def __init__(self, failing=()):
+        self.failing = set(failing)
+        self.requests = []
+        self.lock = threading.Lock()
+
+    def post(self, url, json=None, timeout=None):
+        with self.lock:
+            self.requests.append(json)
+        data, errors = {}, []
+        for key, value in json["variables"].items():
+            if not key.startswith("input"):
+                continue
+            alias = f"t{key[len('input'):]}"
+            if value.get("name") in self.failing:
+                data[alias] = None
+                errors.append({"message": f"{value['name']} rejected", "path": [alias]})
+            else:
+                data[alias] = f"urn:li:test:{value.get('name')}"
+        payload = {"data": data}
+        if errors:
+            payload["errors"] = errors
+        return FakeResponse(payload)
+
+
+class TestDataHubTestProcessor(unittest.TestCase):
+    """Test cases for DataHubTestProcessor"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cwd = os.getcwd()
+        os.chdir(self.temp_dir)
+        self.tests_dir = Path("metadata-manager/dev/metadata_tests")
+        self.tests_dir.mkdir(parents=True)
+        for i in range(5):
+            self._write_test(f"test_{i}", "createTest", {"name": f"test_{i}", "definition": {"json": "{}"}})
+        self._write_test("renamed", "updateTest", {"urn": "urn:li:test:renamed", "name": "renamed"},
+                         operation="update")
+
+    def tearDown(self):
+        os.chdir(self.cwd)
+        shutil.rmtree(self.temp_dir)
+
+    def _write_test(self, name, mutation, input_data, operation="create"):
+        with open(self.tests_dir / f"{name}.json", "w") as f:
+            json.dump({"operation": operation, "test_type": "metadata_test", "name": name,
+                       "graphql_input": {"mutation": mutation, "input": input_data}}, f)
+
+    def _processor(self, session, **kwargs):
+        processor = DataHubTestProcessor("http://datahub:8080/", "token", "dev",
+                                         batch_size=2, max_workers=3, **kwargs)
+        processor.session = session
+        return processor
+
+    def test_batch_document_is_static_and_aliased(self):
+        document = build_batch_mutation("updateTest", 2)
+
+        self.assertIn("$urn1: String!, $input1: UpdateTestInput!", document)
+        self.assertIn("t1: updateTest(urn: $urn1, input: $input1)", document)
+        self.assertIs(document, build_batch_mutation("updateTest", 2))
+
+    def test_tests_are_applied_in_batches_with_variables(self):
+        session = FakeSession()
+
+        results = self._processor(session).process_tests()
+
+        # 5 creates in batches of 2 and 1 update
+        self.assertEqual(len(session.requests), 4)
+        self.assertEqual((results["applied"], results["unchanged"], results["failed"]), (6, 0, 0))
+        self.assertEqual((results["created"], results["updated"]), (5, 1))
+        update = next(r for r in session.requests if r["operationName"] == "updateTestBatch")
+        self.assertEqual(update["variables"], {"urn0": "urn:li:test:renamed", "input0": {"name": "renamed"}})
+        self.assertTrue(all("test_" not in request["query"] for request in session.requests))
+        self.assertTrue(Path("metadata-test-results-dev.json").exists())
+
+    def test_unchanged_tests_are_skipped_and_failed_ones_retried(self):
+        self._processor(FakeSession(failing={"test_3"})).process_tests()
+        self._write_test("test_0", "createTest", {"name": "test_0", "definition": {"json": "{\"on\": 1}"}})
+        session = FakeSession()
+
+        results = self._processor(session).process_tests()
+
+        applied = sorted(
+            value["name"] for request in session.requests for value in request["variables"].values()
+        )
+        self.assertEqual(applied, ["test_0", "test_3"])
+        self.assertEqual((results["applied"], results["unchanged"], results["failed"]), (2, 4, 0))
+
+    def test_errors_are_attributed_to_their_tests(self):
+        results = self._processor(FakeSession(failing={"test_1"})).process_tests()
+
+        self.assertEqual((results["applied"], results["failed"]), (5, 1))
+        self.assertEqual(len(results["errors"]), 1)
+        self.assertIn("test_1 rejected", results["errors"][0])
+
+    def test_invalid_files_are_reported_and_dry_run_sends_nothing(self):
+        (self.tests_dir / "broken.json").write_text(json.dumps({"graphql_input": {"mutation": "dropAll"}}))
+        session = FakeSession()
+
+        results = self._processor(session, dry_run=True).process_tests()
+
+        self.assertEqual(session.requests, [])
+        self.assertEqual((results["applied"], results["failed"]), (6, 1))
+        self.assertFalse(Path(".cache/metadata_test_state/dev.json").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
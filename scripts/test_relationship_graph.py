@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the relationship graph index in utils/relationship_graph.py.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.relationship_graph import (
+    DOMAIN,
+    IS_A,
+    PARENT_DOMAIN,
+    PARENT_NODE,
+    RelationshipGraph,
+    parent_domain_urn,
+)
+from scripts.metadata_tests import entity_relationship_tests, metadata_test_utils
+
+
+def node(name, parent=None):
+    entity = {"urn": f"urn:li:glossaryNode:{name}", "properties": {"name": name.title()}}
+    if parent:
+        entity["parentNodes"] = {"nodes": [{"urn": f"urn:li:glossaryNode:{parent}"}]}
+    return entity
+
+
+def term(name, parent=None, domain=None, is_a=()):
+    entity = {"urn": f"urn:li:glossaryTerm:{name}", "properties": {"name": name.title()}}
+    if parent:
+        entity["parentNodes"] = {"nodes": [{"urn": f"urn:li:glossaryNode:{parent}"}]}
+    if domain:
+        entity["domain"] = {"domain": {"urn": f"urn:li:domain:{domain}"}}
+    entity["relationships"] = {"relationships": [
+        {"type": "IsA", "entity": {"urn": f"urn:li:glossaryTerm:{related}"}} for related in is_a
+    ]}
+    return entity
+
+
+class TestRelationshipGraph(unittest.TestCase):
+    """Test cases for RelationshipGraph"""
+
+    def setUp(self):
+        self.entities = [
+            {"urn": "urn:li:domain:sales", "properties": {"name": "Sales"}},
+            {"urn": "urn:li:domain:emea", "parentDomains": {"domains": [{"urn": "urn:li:domain:sales"}]}},
+            node("finance"),
+            node("revenue", parent="finance"),
+            node("loop_a", parent="loop_b"),
+            node("loop_b", parent="loop_a"),
+            term("arr", parent="revenue", domain="sales", is_a=["income"]),
+            term("income", parent="finance", domain="emea"),
+            term("stray", parent="deleted"),
+        ]
+        self.graph = RelationshipGraph.from_entities(self.entities)
+
+    def test_lookups_in_both_directions(self):
+        self.assertEqual(self.graph.parent("urn:li:glossaryTerm:arr"), "urn:li:glossaryNode:revenue")
+        self.assertEqual(
+            self.graph.children("urn:li:glossaryNode:finance"),
+            ["urn:li:glossaryNode:revenue", "urn:li:glossaryTerm:income"],
+        )
+        self.assertEqual(self.graph.members("urn:li:domain:sales"), ["urn:li:glossaryTerm:arr"])
+        self.assertEqual(self.graph.targets("urn:li:glossaryTerm:arr", IS_A), ["urn:li:glossaryTerm:income"])
+        self.assertEqual(self.graph.sources("urn:li:domain:sales", PARENT_DOMAIN), ["urn:li:domain:emea"])
+        self.assertEqual(self.graph.name("urn:li:glossaryTerm:income"), "Income")
+
+    def test_hierarchy_queries(self):
+        self.assertEqual(self.graph.depth("urn:li:glossaryTerm:arr"), 2)
+        self.assertEqual(self.graph.depth("urn:li:glossaryNode:finance"), 0)
+        self.assertEqual(
+            self.graph.ancestors("urn:li:glossaryTerm:arr"),
+            ["urn:li:glossaryNode:revenue", "urn:li:glossaryNode:finance"],
+        )
+        self.assertEqual(
+            sorted(self.graph.subtree("urn:li:glossaryNode:finance")),
+            ["urn:li:glossaryNode:revenue", "urn:li:glossaryTerm:arr", "urn:li:glossaryTerm:income"],
+        )
+        self.assertEqual(self.graph.roots(PARENT_NODE, "glossaryNode"), ["urn:li:glossaryNode:finance"])
+        self.assertEqual(
+            self.graph.orphans(PARENT_NODE), [("urn:li:glossaryTerm:stray", "urn:li:glossaryNode:deleted")]
+        )
+        self.assertEqual(self.graph.orphans(DOMAIN), [])
+
+    def test_cycles_and_levels(self):
+        cycles = self.graph.cycles(PARENT_NODE)
+
+        self.assertEqual(len(cycles), 1)
+        self.assertEqual(sorted(cycles[0]), ["urn:li:glossaryNode:loop_a", "urn:li:glossaryNode:loop_b"])
+        self.assertEqual(self.graph.depth("urn:li:glossaryNode:loop_a"), 1)
+
+        levels, blocked = self.graph.topological_levels([PARENT_NODE])
+        self.assertIn("urn:li:glossaryNode:finance", levels[0])
+        self.assertIn("urn:li:glossaryNode:revenue", levels[1])
+        self.assertIn("urn:li:glossaryTerm:arr", levels[2])
+        self.assertEqual(blocked, ["urn:li:glossaryNode:loop_a", "urn:li:glossaryNode:loop_b"])
+
+    def test_deep_hierarchies_do_not_recurse(self):
+        chain = [node("n0")] + [node(f"n{i}", parent=f"n{i - 1}") for i in range(1, 5000)]
+        graph = RelationshipGraph.from_entities(chain)
+
+        self.assertEqual(graph.depth("urn:li:glossaryNode:n4999"), 4999)
+        self.assertEqual(graph.depth("urn:li:glossaryNode:n10"), 10)
+        self.assertEqual(graph.cycles(PARENT_NODE), [])
+        self.assertEqual(len(graph.subtree("urn:li:glossaryNode:n0")), 4999)
+
+    def test_parent_domain_formats(self):
+        self.assertEqual(parent_domain_urn({"parentDomain": "urn:li:domain:a"}), "urn:li:domain:a")
+        self.assertEqual(
+            parent_domain_urn({"parentRelationships": {"relationships": [
+                {"type": "ParentOf", "entity": {"type": "DOMAIN", "urn": "urn:li:domain:b"}}
+            ]}}),
+            "urn:li:domain:b",
+        )
+        self.assertIsNone(parent_domain_urn({}))
+
+    def test_hierarchy_test_uses_the_snapshot_graph(self):
+        snapshot = metadata_test_utils.EntitySnapshot({
+            "glossaryNode": [e for e in self.entities if "glossaryNode" in e["urn"]],
+            "glossaryTerm": [e for e in self.entities if "glossaryTerm" in e["urn"]],
+        })
+        test = entity_relationship_tests.GlossaryHierarchyTest(None)
+        test.snapshot = snapshot
+
+        results = test.run()
+
+        failing = sorted(r.entity_urn for r in results if not r.success)
+        self.assertEqual(
+            failing,
+            ["urn:li:glossaryNode:loop_a", "urn:li:glossaryNode:loop_b", "urn:li:glossaryTerm:stray"],
+        )
+        self.assertIs(test.relationship_graph("glossaryNode", "glossaryTerm"), snapshot.graph())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the run history helpers in utils/run_events.py.
+"""
+
+import sys
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.run_events import compact_run_events, parse_run_events, select_runs_to_prune
+
+
+def _event(timestamp_millis, result_type, rows=None):
+    result = {"type": result_type}
+    if rows is not None:
+        result["nativeResults"] = [{"key": "rows", "value": str(rows)}]
+    return {"timestampMillis": timestamp_millis, "status": "COMPLETE", "result": result}
+
+
+class TestRunEvents(unittest.TestCase):
+    """Test cases for parse_run_events, compact_run_events and select_runs_to_prune"""
+
+    def setUp(self):
+        self.run_events = {
+            "total": 3,
+            "failed": 1,
+            "succeeded": 2,
+            "runEvents": [
+                _event(1700000000000, "SUCCESS", rows=10),
+                _event(1700007200000, "FAILURE", rows=0),
+                _event("not a time", "SUCCESS"),
+                _event(1700003600000, "SUCCESS"),
+            ],
+        }
+
+    def test_run_events_are_flattened_most_recent_first(self):
+        records = parse_run_events(self.run_events)
+
+        self.assertEqual([record["status"] for record in records], ["FAILURE", "SUCCESS", "SUCCESS"])
+        self.assertEqual(records[0]["run_at"], datetime(2023, 11, 15, 0, 13, 20, tzinfo=timezone.utc))
+        self.assertEqual(records[0]["details"], {"rows": "0"})
+        self.assertEqual(parse_run_events(None), [])
+
+    def test_compact_summary_keeps_counts_and_the_latest_event(self):
+        compact = compact_run_events(self.run_events)
+
+        self.assertEqual((compact["total"], compact["failed"], compact["succeeded"]), (3, 1, 2))
+        self.assertEqual(compact["runEvents"], [_event(1700007200000, "FAILURE", rows=0)])
+        self.assertEqual(len(self.run_events["runEvents"]), 4)
+
+    def test_retention_and_daily_downsampling(self):
+        now = datetime(2024, 6, 30, 12, tzinfo=timezone.utc)
+        runs = [
+            (1, "a", now - timedelta(hours=1)),
+            (2, "a", now - timedelta(hours=2)),
+            (3, "a", now - timedelta(days=20, hours=1)),
+            (4, "a", now - timedelta(days=20, hours=3)),
+            (5, "b", now - timedelta(days=20, hours=2)),
+            (6, "a", now - timedelta(days=100)),
+        ]
+
+        pruned = select_runs_to_prune(runs, now, retention_days=90, downsample_after_days=14)
+
+        self.assertEqual(pruned, {4, 6})
+        self.assertEqual(select_runs_to_prune(runs, now, retention_days=0, downsample_after_days=0), set())
+
+
+if __name__ == "__main__":
+    unittest.main()
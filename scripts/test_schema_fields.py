@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the paginated schema fields in utils/schema_fields.py.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.schema_fields import (
+    apply_editable,
+    decode_cursor,
+    fetch_schema_fields,
+    fetch_schema_state,
+    page_fields,
+)
+
+URN = "urn:li:dataset:(urn:li:dataPlatform:snowflake,db.wide_table,PROD)"
+
+
+class SchemaClient:
+    """Serves the schema queries of one dataset with many fields"""
+
+    def __init__(self, field_count):
+        self.queries = []
+        self.schema_metadata = {
+            "version": 3,
+            "hash": "abc",
+            "createdAt": 1700000000000,
+            "fields": [
+                {
+                    "fieldPath": f"col_{i:04d}",
+                    "nativeDataType": "VARCHAR",
+                    "description": "Customer id" if i % 10 == 0 else None,
+                    "tags": {"tags": [{"tag": {"urn": "urn:li:tag:pii"}}]} if i == 5 else None,
+                }
+                for i in range(field_count)
+            ],
+        }
+        self.editable = [
+            {"fieldPath": "col_0001", "description": "Edited",
+             "tags": {"tags": [{"tag": {"urn": "urn:li:tag:gold", "properties": {"name": "Gold"}}}]}},
+        ]
+
+    def execute_graphql(self, query, variables=None):
+        self.queries.append(query)
+        if "schemaState" in query:
+            version = {key: value for key, value in self.schema_metadata.items() if key != "fields"}
+            dataset = {"schemaMetadata": version,
+                       "editableSchemaMetadata": {"editableSchemaFieldInfo": self.editable}}
+        else:
+            dataset = {"schemaMetadata": self.schema_metadata}
+        return {"data": {"dataset": dataset}}
+
+
+class TestSchemaFields(unittest.TestCase):
+    """Test cases for schema field parsing, filtering and paging"""
+
+    def setUp(self):
+        self.client = SchemaClient(2500)
+        self.version_key, self.fields = fetch_schema_fields(self.client, URN)
+        state_version, editable = fetch_schema_state(self.client, URN)
+        self.assertEqual(state_version, self.version_key)
+        self.merged = apply_editable(self.fields, editable)
+
+    def test_edits_are_laid_over_the_parsed_fields(self):
+        self.assertEqual(len(self.fields), 2500)
+        self.assertEqual(self.merged[1]["description"], "Edited")
+        self.assertEqual(self.merged[1]["tags"], ["Gold"])
+        self.assertTrue(self.merged[1]["edited"])
+        self.assertEqual(self.merged[5]["tags"], ["pii"])
+        # The cached fields are left untouched
+        self.assertEqual(self.fields[1]["description"], "")
+
+    def test_cursor_walks_through_all_fields(self):
+        seen = []
+        cursor = None
+        while True:
+            page = page_fields(self.merged, self.version_key, cursor=cursor, count=1000)
+            seen.extend(field["fieldPath"] for field in page["fields"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        self.assertEqual(len(seen), 2500)
+        self.assertEqual(len(set(seen)), 2500)
+        self.assertEqual(page["offset"], 2000)
+
+    def test_filters(self):
+        page = page_fields(self.merged, self.version_key, count=10, query="COL_00", has_description=True)
+        self.assertEqual(page["matched"], 11)  # col_0000..col_0090 plus the edited col_0001
+        self.assertEqual(page["total"], 2500)
+        self.assertIsNotNone(page["next_cursor"])
+
+        tagged = page_fields(self.merged, self.version_key, has_tags=True)
+        self.assertEqual([field["fieldPath"] for field in tagged["fields"]], ["col_0001", "col_0005"])
+        self.assertIsNone(tagged["next_cursor"])
+
+    def test_cursor_of_another_schema_version_is_rejected(self):
+        cursor = page_fields(self.merged, self.version_key, count=100)["next_cursor"]
+        self.assertEqual(decode_cursor(cursor, self.version_key), 100)
+
+        with self.assertRaises(ValueError):
+            decode_cursor(cursor, "4:def:1700000001000")
+        with self.assertRaises(ValueError):
+            decode_cursor("not-a-cursor", self.version_key)
+
+
+if __name__ == "__main__":
+    unittest.main()
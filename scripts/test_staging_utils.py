@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the staged MCP file helpers and the bulk staging API.
+"""
+
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.mcps.staging_utils import (
+    HASH_INDEX_FILE_NAME,
+    MCP_FILE_NAME,
+    create_changed_mcps,
+    load_staged_mcps,
+    merge_staged_mcps,
+    save_mcp_to_file,
+    stage_mcps,
+)
+from utils.mcp_fingerprint import mcp_fingerprint
+from scripts.mcps import tag_actions
+from scripts.mcps.tag_actions import add_tag_to_staged_changes, bulk_add_tags_to_staged_changes
+
+
+def _tag(name):
+    return {
+        "urn": f"urn:li:tag:{name}",
+        "name": name,
+        "properties": {"name": name, "description": f"{name} tag", "colorHex": "#000000"},
+    }
+
+
+def _ownership_mcp(time, owner="admin", run_id="run-1"):
+    aspect = {
+        "owners": [{"owner": f"urn:li:corpuser:{owner}", "type": "DATAOWNER"}],
+        "lastModified": {"time": time, "actor": "urn:li:corpuser:admin"},
+    }
+    return {
+        "entityType": "tag",
+        "entityUrn": "urn:li:tag:pii",
+        "changeType": "UPSERT",
+        "aspectName": "ownership",
+        "aspect": {"value": json.dumps(aspect), "contentType": "application/json"},
+        "systemMetadata": {"lastObserved": time, "runId": run_id},
+    }
+
+
+class TestMcpFingerprint(unittest.TestCase):
+    """Test cases for utils/mcp_fingerprint.py"""
+
+    def test_volatile_fields_are_ignored(self):
+        self.assertEqual(
+            mcp_fingerprint(_ownership_mcp(1000, run_id="a")),
+            mcp_fingerprint(_ownership_mcp(2000, run_id="b")),
+        )
+
+    def test_aspect_content_changes_fingerprint(self):
+        self.assertNotEqual(
+            mcp_fingerprint(_ownership_mcp(1000)),
+            mcp_fingerprint(_ownership_mcp(1000, owner="bob")),
+        )
+
+    def test_serialized_and_decoded_aspects_match(self):
+        serialized = _ownership_mcp(1000)
+        decoded = dict(serialized, aspect=json.loads(serialized["aspect"]["value"]))
+
+        self.assertEqual(mcp_fingerprint(serialized), mcp_fingerprint(decoded))
+
+
+class TestStagingUtils(unittest.TestCase):
+    """Test cases for scripts/mcps/staging_utils.py"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir)
+
+    def test_merge_replaces_entity_mcps(self):
+        existing = [
+            {"entityUrn": "urn:li:tag:a", "aspectName": "tagProperties", "v": 1},
+            {"entityUrn": "urn:li:tag:a", "aspectName": "ownership", "v": 1},
+            {"entityUrn": "urn:li:tag:b", "aspectName": "tagProperties", "v": 1},
+        ]
+        new = [{"entityUrn": "urn:li:tag:a", "aspectName": "tagProperties", "v": 2}]
+
+        merged = merge_staged_mcps(existing, new)
+
+        self.assertEqual(
+            merged,
+            [
+                {"entityUrn": "urn:li:tag:b", "aspectName": "tagProperties", "v": 1},
+                {"entityUrn": "urn:li:tag:a", "aspectName": "tagProperties", "v": 2},
+            ],
+        )
+
+    def test_merge_replaces_only_regenerated_aspects(self):
+        existing = [
+            {"entityUrn": "urn:li:tag:a", "aspectName": "tagProperties", "v": 1},
+            {"entityUrn": "urn:li:tag:a", "aspectName": "ownership", "v": 1},
+        ]
+
+        merged = merge_staged_mcps(existing, [], aspects={"ownership"}, entity_urns=["urn:li:tag:a"])
+
+        self.assertEqual(merged, [{"entityUrn": "urn:li:tag:a", "aspectName": "tagProperties", "v": 1}])
+
+    def test_create_changed_mcps_regenerates_all_when_not_staged(self):
+        requested = []
+
+        def create_mcps(aspects):
+            requested.append(aspects)
+            return [{"entityUrn": "urn:li:tag:a", "aspectName": "ownership"}]
+
+        mcps, aspects = create_changed_mcps(create_mcps, [], {"ownership"})
+
+        self.assertEqual(requested, [{"ownership"}, None])
+        self.assertIsNone(aspects)
+
+    def test_load_legacy_wrapper_format(self):
+        path = os.path.join(self.temp_dir, MCP_FILE_NAME)
+        with open(path, "w") as f:
+            json.dump({"mcps": [{"entityUrn": "urn:li:tag:a"}]}, f)
+
+        self.assertEqual(load_staged_mcps(path), [{"entityUrn": "urn:li:tag:a"}])
+
+    def test_save_leaves_no_temporary_files(self):
+        path = os.path.join(self.temp_dir, MCP_FILE_NAME)
+        save_mcp_to_file([{"entityUrn": "urn:li:tag:a"}], path)
+
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), [HASH_INDEX_FILE_NAME, MCP_FILE_NAME])
+        self.assertEqual(load_staged_mcps(path), [{"entityUrn": "urn:li:tag:a"}])
+
+    def test_save_skips_unchanged_content(self):
+        path = os.path.join(self.temp_dir, MCP_FILE_NAME)
+
+        self.assertTrue(save_mcp_to_file([_ownership_mcp(1000)], path))
+        # Only the audit stamp time differs, so the content is unchanged
+        self.assertFalse(save_mcp_to_file([_ownership_mcp(2000)], path))
+        self.assertTrue(save_mcp_to_file([_ownership_mcp(2000, owner="bob")], path))
+
+    def test_save_ignores_stale_index_entry(self):
+        path = os.path.join(self.temp_dir, MCP_FILE_NAME)
+        save_mcp_to_file([_ownership_mcp(1000)], path)
+
+        # Simulate the file being replaced outside of the staging helpers
+        with open(path, "w") as f:
+            json.dump([_ownership_mcp(1000, owner="someone-else")], f)
+
+        self.assertTrue(save_mcp_to_file([_ownership_mcp(1000)], path))
+
+    def test_stage_mcps_uses_explicit_base_dir(self):
+        path = stage_mcps([{"entityUrn": "urn:li:tag:a"}], "dev", "tags", self.temp_dir)
+
+        self.assertEqual(path, os.path.join(self.temp_dir, MCP_FILE_NAME))
+
+    def test_bulk_add_tags_writes_all_tags_once(self):
+        result = bulk_add_tags_to_staged_changes(
+            tags_data=[_tag("pii"), _tag("gdpr"), {"name": "broken"}],
+            environment="dev",
+            owner="admin",
+            base_dir=self.temp_dir,
+        )
+
+        self.assertEqual(result["success_count"], 2)
+        self.assertEqual(result["error_count"], 1)
+        self.assertEqual(result["mcps_created"], 4)
+        self.assertEqual(result["staged_indexes"], [0, 1])
+
+        staged = load_staged_mcps(result["mcp_file"])
+        self.assertEqual(
+            sorted((m["entityUrn"], m["aspectName"]) for m in staged),
+            [
+                ("urn:li:tag:gdpr", "ownership"),
+                ("urn:li:tag:gdpr", "tagProperties"),
+                ("urn:li:tag:pii", "ownership"),
+                ("urn:li:tag:pii", "tagProperties"),
+            ],
+        )
+
+        # Re-staging the same tags replaces rather than duplicates
+        bulk_add_tags_to_staged_changes(
+            tags_data=[_tag("pii")], environment="dev", owner="admin", base_dir=self.temp_dir
+        )
+        self.assertEqual(len(load_staged_mcps(result["mcp_file"])), 4)
+
+    def test_add_tag_regenerates_only_changed_aspects(self):
+        mcp_file = bulk_add_tags_to_staged_changes(
+            tags_data=[_tag("pii")], environment="dev", owner="admin", base_dir=self.temp_dir
+        )["mcp_file"]
+        ownership_before = [m for m in load_staged_mcps(mcp_file) if m["aspectName"] == "ownership"]
+
+        changed = _tag("pii")
+        changed["properties"]["description"] = "changed"
+        add_tag_to_staged_changes(
+            changed, "dev", "admin", base_dir=self.temp_dir, aspects={"tagProperties"}
+        )
+
+        staged = load_staged_mcps(mcp_file)
+        self.assertEqual(len(staged), 2)
+        self.assertEqual([m for m in staged if m["aspectName"] == "ownership"], ownership_before)
+        self.assertIn("changed", next(m for m in staged if m["aspectName"] == "tagProperties")["aspect"]["value"])
+
+    def test_add_unchanged_tag_keeps_staged_mcps(self):
+        mcp_file = bulk_add_tags_to_staged_changes(
+            tags_data=[_tag("pii")], environment="dev", owner="admin", base_dir=self.temp_dir
+        )["mcp_file"]
+        staged_before = load_staged_mcps(mcp_file)
+
+        # No dirty aspects: the tag is found in the staged file, so nothing is regenerated
+        with mock.patch.object(tag_actions, "_create_tag_mcps", wraps=tag_actions._create_tag_mcps) as create:
+            add_tag_to_staged_changes(_tag("pii"), "dev", "admin", base_dir=self.temp_dir, aspects=set())
+
+        self.assertEqual([call.kwargs["aspects"] for call in create.call_args_list], [set()])
+        self.assertEqual(load_staged_mcps(mcp_file), staged_before)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the pre-emit target state diff in utils/target_diff.py.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.metadata.schema_classes import DomainsClass, GlobalTagsClass, TagAssociationClass
+
+from utils.target_diff import TargetStateDiff
+
+
+def _domains_mcp(urn, domain):
+    return MetadataChangeProposalWrapper(entityUrn=urn, aspect=DomainsClass(domains=[domain]))
+
+
+def _tags_mcp(urn, *tags):
+    return MetadataChangeProposalWrapper(
+        entityUrn=urn, aspect=GlobalTagsClass(tags=[TagAssociationClass(tag=tag) for tag in tags])
+    )
+
+
+class FakeGraph:
+    """Serves batchGet requests from a fixed target state"""
+
+    def __init__(self, state, failing_types=()):
+        self.state = state
+        self.failing_types = set(failing_types)
+        self.requests = []
+
+    def get_entities(self, entity_name, urns, aspects):
+        self.requests.append((entity_name, list(urns), list(aspects)))
+        if entity_name in self.failing_types:
+            raise ConnectionError("unavailable")
+        return {
+            urn: {name: (aspect, None) for name, aspect in self.state.get(urn, {}).items() if name in aspects}
+            for urn in urns
+        }
+
+
+class TestTargetStateDiff(unittest.TestCase):
+    """Test cases for TargetStateDiff"""
+
+    def setUp(self):
+        self.urns = [f"urn:li:dataset:(urn:li:dataPlatform:hive,t{i},PROD)" for i in range(3)]
+        self.state = {
+            self.urns[0]: {"domains": DomainsClass(domains=["urn:li:domain:sales"])},
+            self.urns[1]: {"globalTags": GlobalTagsClass(tags=[TagAssociationClass(tag="urn:li:tag:pii")])},
+        }
+
+    def test_only_changing_mcps_are_kept(self):
+        mcps = [
+            _domains_mcp(self.urns[0], "urn:li:domain:sales"),
+            _tags_mcp(self.urns[1], "urn:li:tag:pii", "urn:li:tag:gold"),
+            _domains_mcp(self.urns[2], "urn:li:domain:sales"),
+            _tags_mcp(self.urns[1], "urn:li:tag:pii"),
+        ]
+        graph = FakeGraph(self.state)
+
+        result = TargetStateDiff(graph, batch_size=2).diff(mcps)
+
+        self.assertEqual(result.changed, [mcps[1], mcps[2]])
+        self.assertEqual(result.unchanged, 2)
+        self.assertEqual(result.reduction_ratio, 0.5)
+        self.assertEqual(sorted(len(urns) for _, urns, _ in graph.requests), [1, 2])
+        self.assertEqual(graph.requests[0][2], ["domains", "globalTags"])
+
+    def test_mcps_are_kept_when_the_target_cannot_be_read(self):
+        mcps = [_domains_mcp(self.urns[0], "urn:li:domain:sales")]
+
+        result = TargetStateDiff(FakeGraph(self.state, failing_types={"dataset"})).diff(mcps)
+
+        self.assertEqual((result.changed, result.unchanged, result.unchecked), (mcps, 0, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the facet-based usage counts in utils/usage_counts.py.
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add the repository root to the path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from utils.usage_counts import (
+    FacetCounts,
+    fetch_facet_counts,
+    structured_property_facet,
+    structured_property_usage,
+    usage_counts,
+    with_value_counts,
+)
+
+
+class FacetClient:
+    """Serves aggregateAcrossEntities from {field: {value: count}}"""
+
+    def __init__(self, facets):
+        self.facets = facets
+        self.requests = []
+
+    def execute_graphql(self, query, variables=None):
+        aggregate_input = variables["input"]
+        self.requests.append(aggregate_input)
+        if "searchAcrossEntities" in query:
+            # Each value is carried by its own entities
+            facet_field = aggregate_input["orFilters"][0]["and"][0]["field"]
+            return {"data": {"searchAcrossEntities": {"total": sum(self.facets.get(facet_field, {}).values())}}}
+        max_values = aggregate_input["searchFlags"]["maxAggValues"]
+        wanted = None
+        for or_filter in aggregate_input.get("orFilters") or []:
+            wanted = set(or_filter["and"][0]["values"])
+        facets = []
+        for facet_field in aggregate_input["facets"]:
+            counts = self.facets.get(facet_field, {})
+            values = [value for value in counts if wanted is None or value in wanted][:max_values]
+            facets.append({
+                "field": facet_field,
+                "aggregations": [{"value": value, "count": counts[value]} for value in values],
+            })
+        return {"data": {"aggregateAcrossEntities": {"facets": facets}}}
+
+
+class TestUsageCounts(unittest.TestCase):
+    """Test cases for usage counts"""
+
+    def setUp(self):
+        self.client = FacetClient({
+            "tags": {"urn:li:tag:pii": 12, "urn:li:tag:gold": 3, "urn:li:tag:raw": 1},
+            "domains": {"urn:li:domain:sales": 40},
+            structured_property_facet("io.acryl.retention"): {"30": 5, "90": 2},
+        })
+
+    def test_counts_of_all_urns_come_from_one_request(self):
+        counts = usage_counts(
+            self.client, "domains", ["urn:li:domain:sales", "urn:li:domain:empty", "urn:li:domain:sales"]
+        )
+
+        self.assertEqual(counts, {"urn:li:domain:sales": 40, "urn:li:domain:empty": 0})
+        self.assertEqual(len(self.client.requests), 1)
+
+    def test_truncated_facet_counts_the_missing_values_separately(self):
+        facet = fetch_facet_counts(self.client, ["tags"], max_values=2)["tags"]
+        self.assertFalse(facet.complete)
+        self.assertIsNone(facet.get("urn:li:tag:raw"))
+
+        counts = usage_counts(self.client, "tags", ["urn:li:tag:pii", "urn:li:tag:raw"], facet=facet)
+
+        self.assertEqual(counts, {"urn:li:tag:pii": 12, "urn:li:tag:raw": 1})
+        self.assertEqual(len(self.client.requests), 2)
+        self.assertEqual(self.client.requests[1]["orFilters"][0]["and"][0]["values"], ["urn:li:tag:raw"])
+
+    def test_completing_a_facet_leaves_the_cached_one_unchanged(self):
+        facet = fetch_facet_counts(self.client, ["tags"], max_values=2)["tags"]
+
+        completed = with_value_counts(self.client, facet, ["urn:li:tag:raw"])
+
+        self.assertEqual(completed.get("urn:li:tag:raw"), 1)
+        self.assertIsNone(facet.get("urn:li:tag:raw"))
+        self.assertIs(with_value_counts(self.client, completed, ["urn:li:tag:raw"]), completed)
+
+    def test_cached_facet_is_reused(self):
+        facet = FacetCounts(field="tags", counts={"urn:li:tag:pii": 7})
+
+        self.assertEqual(usage_counts(self.client, "tags", ["urn:li:tag:pii"], facet=facet), {"urn:li:tag:pii": 7})
+        self.assertEqual(self.client.requests, [])
+
+    def test_structured_property_usage_sums_value_counts(self):
+        usage = structured_property_usage(self.client, ["io.acryl.retention", "io.acryl.unused"])
+
+        self.assertEqual(usage, {"io.acryl.retention": 7, "io.acryl.unused": 0})
+        self.assertEqual(len(self.client.requests), 1)
+
+    def test_truncated_structured_property_facet_counts_its_entities(self):
+        self.client.facets[structured_property_facet("io.acryl.owner")] = {f"user{i}": 1 for i in range(5)}
+
+        usage = structured_property_usage(self.client, ["io.acryl.owner", "io.acryl.retention"], max_values=3)
+
+        self.assertEqual(usage, {"io.acryl.owner": 5, "io.acryl.retention": 7})
+        self.assertEqual(len(self.client.requests), 2)
+        self.assertEqual(
+            self.client.requests[1]["orFilters"][0]["and"][0],
+            {"field": "structuredProperties.io.acryl.owner", "condition": "EXISTS"},
+        )
+
+    def test_error_response_raises(self):
+        self.client.execute_graphql = lambda query, variables=None: {"errors": [{"message": "Forbidden"}]}
+
+        with self.assertRaisesRegex(ValueError, "Forbidden"):
+            fetch_facet_counts(self.client, ["tags"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -11,9 +11,91 @@ from typing import Dict, Any, List, Optional
 
 
 from utils.datahub_rest_client import DataHubRestClient
+from utils.mcp_emitter import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS, BatchMcpEmitter
+from utils.metadata_export import DEFAULT_EXPORT_WORKERS, export_sections
+from utils.metadata_import import LevelledImporter, build_import_plan, load_import_sections
 
 logger = logging.getLogger(__name__)
 
+# Number of entities fetched per batched (aliased) GraphQL request
+DEFAULT_BATCH_GET_SIZE = 25
+
+# Fields of a glossary node with its direct children
+GLOSSARY_NODE_SELECTION = """
+            urn
+            type
+            exists
+            properties {
+              name
+              description
+              __typename
+            }
+            displayProperties {
+              colorHex
+              icon {
+                name
+                style
+                iconLibrary
+                __typename
+              }
+              __typename
+            }
+            children: relationships(
+              input: {types: ["IsPartOf"], direction: INCOMING, start: 0, count: 10000}
+            ) {
+              total
+              relationships {
+                direction
+                entity {
+                  type
+                  urn
+                  ... on GlossaryNode {
+                    properties {
+                      name
+                      description
+                      __typename
+                    }
+                    __typename
+                  }
+                  ... on GlossaryTerm {
+                    name
+                    hierarchicalName
+                    properties {
+                      name
+                      description
+                      __typename
+                    }
+                    __typename
+                  }
+                  __typename
+                }
+                __typename
+              }
+              __typename
+            }
+            __typename
+"""
+
+# Entities belonging to a domain
+DOMAIN_ENTITIES_SELECTION = """
+            urn
+            entities(input: {start: 0, count: 1000, query: "*"}) {
+              start
+              count
+              total
+              searchResults {
+                entity {
+                  urn
+                  type
+                  __typename
+                }
+                __typename
+              }
+              __typename
+            }
+            __typename
+"""
+
 
 class DataHubMetadataClient:
     """
@@ -32,6 +114,87 @@ class DataHubMetadataClient:
         self.server_url = server_url
         self.token = token
 
+    def _batch_get(
+        self, field: str, selection: str, urns: List[str], batch_size: int = DEFAULT_BATCH_GET_SIZE
+    ) -> Dict[str, Any]:
+        """
+        Fetch many entities with aliased GraphQL fields, batch_size entities per request
+
+        Args:
+            field: Root query field taking an urn argument (e.g. "glossaryNode")
+            selection: Fields selected for each entity
+            urns: URNs to fetch
+            batch_size: Number of entities per request
+
+        Returns:
+            Dictionary mapping URN to entity data (URNs that failed are left out)
+        """
+        results = {}
+        for i in range(0, len(urns), batch_size):
+            batch = urns[i : i + batch_size]
+            declarations = ", ".join(f"$u{j}: String!" for j in range(len(batch)))
+            fields = "\n".join(
+                f"e{j}: {field}(urn: $u{j}) {{{selection}}}" for j in range(len(batch))
+            )
+            query = f"query batchGet({declarations}) {{\n{fields}\n}}"
+            variables = {f"u{j}": urn for j, urn in enumerate(batch)}
+
+            try:
+                result = self.client.execute_graphql(query, variables)
+            except Exception as e:
+                logger.error(f"Error fetching {len(batch)} {field} entities: {str(e)}")
+                continue
+
+            if not result or "errors" in result:
+                error_messages = [
+                    error.get("message", "Unknown error")
+                    for error in (result or {}).get("errors", [])
+                ]
+                logger.error(f"GraphQL errors: {', '.join(error_messages)}")
+
+            data = (result or {}).get("data") or {}
+            for j, urn in enumerate(batch):
+                if data.get(f"e{j}"):
+                    results[urn] = data[f"e{j}"]
+        return results
+
+    def get_glossary_nodes(
+        self, node_urns: List[str], batch_size: int = DEFAULT_BATCH_GET_SIZE
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Get glossary nodes and their children, batch_size nodes per request
+
+        Args:
+            node_urns: Glossary node URNs
+            batch_size: Number of nodes per request
+
+        Returns:
+            Dictionary mapping node URN to glossary node data
+        """
+        return self._batch_get("glossaryNode", GLOSSARY_NODE_SELECTION, node_urns, batch_size)
+
+    def get_domain_entities(
+        self, domain_urns: List[str], batch_size: int = DEFAULT_BATCH_GET_SIZE
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get the entities belonging to domains, batch_size domains per request
+
+        Args:
+            domain_urns: Domain URNs
+            batch_size: Number of domains per request
+
+        Returns:
+            Dictionary mapping domain URN to its entities
+        """
+        domains = self._batch_get("domain", DOMAIN_ENTITIES_SELECTION, domain_urns, batch_size)
+        return {
+            urn: [
+                r.get("entity", {})
+                for r in (domain.get("entities") or {}).get("searchResults", [])
+            ]
+            for urn, domain in domains.items()
+        }
+
     def list_domains(self, query="*", start=0, count=100) -> List[Dict[str, Any]]:
         """
         List all domains in DataHub
@@ -330,64 +493,17 @@ class DataHubMetadataClient:
         Returns:
             Glossary node data or None if not found
         """
-        query = """
+        query = (
+            """
         query getGlossaryNode($urn: String!) {
           glossaryNode(urn: $urn) {
-            urn
-            type
-            exists
-            properties {
-              name
-              description
-              __typename
-            }
-            displayProperties {
-              colorHex
-              icon {
-                name
-                style
-                iconLibrary
-                __typename
-              }
-              __typename
-            }
-            children: relationships(
-              input: {types: ["IsPartOf"], direction: INCOMING, start: 0, count: 10000}
-            ) {
-              total
-              relationships {
-                direction
-                entity {
-                  type
-                  urn
-                  ... on GlossaryNode {
-                    properties {
-                      name
-                      description
-                      __typename
-                    }
-                    __typename
-                  }
-                  ... on GlossaryTerm {
-                    name
-                    hierarchicalName
-                    properties {
-                      name
-                      description
-                      __typename
-                    }
-                    __typename
-                  }
-                  __typename
-                }
-                __typename
-              }
-              __typename
-            }
-            __typename
+"""
+            + GLOSSARY_NODE_SELECTION
+            + """
           }
         }
         """
+        )
 
         variables = {"urn": node_urn}
 
@@ -1015,50 +1131,110 @@ class DataHubMetadataClient:
         logger.error("Tag import not yet implemented")
         return None
 
-    def export_all_metadata(self, output_file: str) -> bool:
+    def list_all_domains(self, page_size: int = 100) -> List[Dict[str, Any]]:
         """
-        Export all metadata (domains, glossary, tags, properties) to a file
+        List every domain, paging through list_domains
 
         Args:
-            output_file: Path to output file
+            page_size: Number of domains per request
+
+        Returns:
+            List of domain objects
+        """
+        domains = []
+        start = 0
+        while True:
+            page = self.list_domains(start=start, count=page_size)
+            domains.extend(page)
+            if len(page) < page_size:
+                return domains
+            start += page_size
+
+    def export_domains(self, include_entities: bool = False) -> List[Dict[str, Any]]:
+        """
+        Export all domains, with their entities fetched in batched requests if requested
+
+        Args:
+            include_entities: Whether to include entities belonging to each domain
+
+        Returns:
+            List of domain objects
+        """
+        domains = self.list_all_domains()
+        if include_entities:
+            entities = self.get_domain_entities([d["urn"] for d in domains if d.get("urn")])
+            for domain in domains:
+                domain["entities"] = entities.get(domain.get("urn"), [])
+        return domains
+
+    def export_glossary_nodes(self) -> List[Dict[str, Any]]:
+        """
+        Export the root glossary nodes with their children, fetched in batched requests
+
+        Returns:
+            List of glossary node objects
+        """
+        root_nodes = self.get_root_glossary_nodes()
+        detailed = self.get_glossary_nodes([n["urn"] for n in root_nodes if n.get("urn")])
+        return [detailed.get(node.get("urn"), node) for node in root_nodes]
+
+    def export_fetchers(self, sections: Optional[List[str]] = None, include_entities: bool = False) -> Dict[str, Any]:
+        """
+        Callables fetching each export section
+
+        Args:
+            sections: Section names to export (default: all)
+            include_entities: Whether domains include their entities
+
+        Returns:
+            Dictionary mapping section name to a callable returning its entities
+        """
+        fetchers = {
+            "domains": lambda: self.export_domains(include_entities),
+            "glossary_nodes": self.export_glossary_nodes,
+            "glossary_terms": self.get_root_glossary_terms,
+            "tags": self.list_all_tags,
+            "structured_properties": self.list_structured_properties,
+            "tests": self.list_metadata_tests,
+        }
+        if sections is None:
+            return fetchers
+        return {section: fetchers[section] for section in sections}
+
+    def export_all_metadata(
+        self,
+        output_file: str,
+        fmt: str = "json",
+        max_workers: int = DEFAULT_EXPORT_WORKERS,
+        include_entities: bool = False,
+        indent: Optional[int] = 2,
+        sections: Optional[List[str]] = None,
+    ) -> bool:
+        """
+        Export all metadata (domains, glossary, tags, properties, tests) to a file.
+        Sections are fetched concurrently; in the jsonl and jsonl.gz formats each
+        section is streamed to its own file as it completes and output_file is the manifest.
+
+        Args:
+            output_file: Path to output file (JSON document or manifest)
+            fmt: Export format (json, jsonl or jsonl.gz)
+            max_workers: Number of sections fetched concurrently
+            include_entities: Whether domains include their entities
+            indent: JSON indentation of the json format document
+            sections: Section names to export (default: all)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # Get all domains
-            domains = self.list_domains()
-
-            # Get all root glossary nodes and traverse them
-            root_nodes = self.get_root_glossary_nodes()
-            glossary_nodes = root_nodes.copy()
-
-            # Get all root glossary terms
-            root_terms = self.get_root_glossary_terms()
-            glossary_terms = root_terms.copy()
-
-            # Get all tags
-            tags = self.list_all_tags()
-
-            # Get all structured properties
-            structured_properties = self.list_structured_properties()
-
-            # Get all tests
-            tests = self.list_metadata_tests()
-
-            # Create the metadata export package
-            metadata_package = {
-                "version": "1.0",
-                "domains": domains,
-                "glossary": {"nodes": glossary_nodes, "terms": glossary_terms},
-                "tags": tags,
-                "structured_properties": structured_properties,
-                "tests": tests,
-            }
-
-            # Write to file
-            with open(output_file, "w") as f:
-                json.dump(metadata_package, f, indent=2)
+            export_sections(
+                self.export_fetchers(sections, include_entities),
+                output_file,
+                fmt=fmt,
+                max_workers=max_workers,
+                indent=indent,
+                metadata={"server_url": self.server_url},
+            )
 
             logger.info(f"Successfully exported metadata to {output_file}")
             return True
@@ -1066,12 +1242,28 @@ class DataHubMetadataClient:
             logger.error(f"Error exporting metadata: {str(e)}")
             return False
 
-    def import_metadata_from_file(self, input_file: str) -> bool:
+    def import_metadata_from_file(
+        self,
+        input_file: str,
+        sections: Optional[List[str]] = None,
+        overwrite: bool = True,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        failures_file: Optional[str] = None,
+    ) -> bool:
         """
-        Import metadata from a file
+        Import metadata from a file (JSON document or JSON Lines export manifest).
+        Entities are imported in dependency levels (parents before children,
+        property definitions before values); each level is emitted in concurrent
+        batches and a failed entity only holds back the entities depending on it.
 
         Args:
             input_file: Path to input file
+            sections: Section names to import (default: all)
+            overwrite: Whether entities that already exist are written again
+            batch_size: Number of MCPs per batch ingest request
+            max_workers: Number of batches sent concurrently
+            failures_file: JSON Lines file the rejected MCPs are written to (optional)
 
         Returns:
             True if successful, False otherwise
@@ -1086,12 +1278,25 @@ class DataHubMetadataClient:
                 logger.error("Invalid metadata package: missing version")
                 return False
 
-            # TODO: Implement the actual import logic for each metadata type
-            # This would involve creating all the entities in the correct order
-            # (e.g., domains before glossary terms that reference them)
+            if self.client.graph is None:
+                logger.error("DataHub graph client not initialized")
+                return False
 
-            logger.error("Metadata import not yet fully implemented")
-            return False
+            plan = build_import_plan(load_import_sections(input_file, sections))
+            emitter = BatchMcpEmitter(
+                self.client.graph,
+                batch_size=batch_size,
+                max_workers=max_workers,
+                failures_file=failures_file,
+            )
+            importer = LevelledImporter(emitter, exists=None if overwrite else self.client.graph.exists)
+            result = importer.run(plan)
+
+            for urn, error in result.failed.items():
+                logger.error(f"Failed to import {urn}: {error}")
+            for urn, reason in result.skipped.items():
+                logger.warning(f"Skipped {urn}: {reason}")
+            return result.success
         except Exception as e:
             logger.error(f"Error importing metadata: {str(e)}")
             return False
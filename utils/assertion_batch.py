@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Concurrent batch runner for DataHub assertions.
+
+Assertions are grouped by the asset they belong to and each asset is run with a
+single runAssertionsForAsset request. A bounded pool of workers runs several
+assets at a time; results are handed back to the calling thread as each asset
+completes, so callers can persist them in bulk and report progress while the
+rest of the batch is still running.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ASSERTION_WORKERS = 4
+
+
+@dataclass
+class AssetRunResult:
+    """Outcome of running the assertions of one asset"""
+    asset_urn: str
+    results: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    error: Optional[str] = None
+    seconds: float = 0.0
+
+    @property
+    def statuses(self) -> Dict[str, str]:
+        """Assertion URN -> result type (SUCCESS, FAILURE, ERROR, ...)"""
+        return {urn: (result or {}).get("type") or "UNKNOWN" for urn, result in self.results.items()}
+
+
+@dataclass
+class BatchRunSummary:
+    """Counts of a batch run"""
+    assets: int = 0
+    completed_assets: int = 0
+    failed_assets: int = 0
+    assertions: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    seconds: float = 0.0
+
+    def add(self, asset_result: AssetRunResult):
+        """Count the results of a completed asset"""
+        self.completed_assets += 1
+        if asset_result.error:
+            self.failed_assets += 1
+        for status in asset_result.statuses.values():
+            self.assertions += 1
+            if status == "SUCCESS":
+                self.succeeded += 1
+            else:
+                self.failed += 1
+
+
+def group_by_asset(assertions: Iterable[Tuple[str, Optional[str]]]) -> "OrderedDict[str, List[str]]":
+    """
+    Group assertion URNs by the URN of the asset they belong to
+
+    Args:
+        assertions: (assertion URN, asset URN) pairs; pairs without an asset are ignored
+
+    Returns:
+        Ordered dictionary mapping asset URN to its assertion URNs
+    """
+    groups: "OrderedDict[str, List[str]]" = OrderedDict()
+    for assertion_urn, asset_urn in assertions:
+        if assertion_urn and asset_urn:
+            groups.setdefault(asset_urn, []).append(assertion_urn)
+    return groups
+
+
+class BatchAssertionRunner:
+    """Run the assertions of many assets, a bounded number of assets at a time"""
+
+    def __init__(
+        self,
+        client: Any,
+        max_workers: int = DEFAULT_ASSERTION_WORKERS,
+        tag_urns: Optional[List[str]] = None,
+        save_result: bool = True,
+    ):
+        """
+        Initialize the runner
+
+        Args:
+            client: DataHubMetadataApiClient (anything with run_assertions_for_asset)
+            max_workers: Maximum number of assets run concurrently
+            tag_urns: Only run the assertions with these tags (optional)
+            save_result: Whether DataHub stores the run results
+        """
+        self.client = client
+        self.max_workers = max(1, max_workers)
+        self.tag_urns = tag_urns
+        self.save_result = save_result
+
+    def run_asset(self, asset_urn: str, assertion_urns: Optional[List[str]] = None) -> AssetRunResult:
+        """
+        Run the assertions of one asset
+
+        Args:
+            asset_urn: URN of the asset
+            assertion_urns: Only keep the results of these assertions (optional)
+
+        Returns:
+            AssetRunResult with the results by assertion URN, or the error
+        """
+        started = time.time()
+        asset_result = AssetRunResult(asset_urn=asset_urn)
+        try:
+            response = self.client.run_assertions_for_asset(
+                dataset_urn=asset_urn, tag_urns=self.tag_urns, save_result=self.save_result
+            )
+            if response is None:
+                asset_result.error = "Failed to run assertions for asset"
+            else:
+                results = response.get("results", {}) or {}
+                if assertion_urns is not None:
+                    wanted = set(assertion_urns)
+                    results = {urn: result for urn, result in results.items() if urn in wanted}
+                asset_result.results = results
+        except Exception as e:
+            logger.error(f"Error running assertions for {asset_urn}: {str(e)}")
+            asset_result.error = str(e)
+        asset_result.seconds = round(time.time() - started, 3)
+        return asset_result
+
+    def run(
+        self,
+        assets: Dict[str, Optional[List[str]]],
+        on_asset_done: Optional[Callable[[AssetRunResult], None]] = None,
+    ) -> BatchRunSummary:
+        """
+        Run the assertions of all assets
+
+        Args:
+            assets: Asset URN -> assertion URNs to keep (None keeps every result of the asset)
+            on_asset_done: Called with each AssetRunResult as soon as its asset completes,
+                from the calling thread (so it can safely write to a database)
+
+        Returns:
+            BatchRunSummary with asset and assertion counts
+        """
+        started = time.time()
+        summary = BatchRunSummary(assets=len(assets))
+        if not assets:
+            return summary
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(assets))) as executor:
+            futures = [
+                executor.submit(self.run_asset, asset_urn, assertion_urns)
+                for asset_urn, assertion_urns in assets.items()
+            ]
+            for future in as_completed(futures):
+                asset_result = future.result()
+                summary.add(asset_result)
+                if on_asset_done:
+                    try:
+                        on_asset_done(asset_result)
+                    except Exception as e:
+                        logger.error(f"Error handling the results of {asset_result.asset_urn}: {str(e)}")
+                logger.info(
+                    f"Ran {len(asset_result.results)} assertions for {asset_result.asset_urn} "
+                    f"in {asset_result.seconds}s ({summary.completed_assets}/{summary.assets} assets)"
+                )
+
+        summary.seconds = round(time.time() - started, 3)
+        logger.info(
+            f"Ran {summary.assertions} assertions on {summary.assets} assets in {summary.seconds}s: "
+            f"{summary.succeeded} succeeded, {summary.failed} failed, {summary.failed_assets} assets failed"
+        )
+        return summary
@@ -32,6 +32,7 @@ from datahub.metadata.schema_classes import (
     GlossaryTermAssociationClass,
 )
 
+from utils.mcp_emitter import BatchMcpEmitter, EmitResult, DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS
 
 logger = logging.getLogger(__name__)
 
@@ -97,6 +98,53 @@ class DataHubMetadataApiClient:
             logger.error(f"Error initializing DataHubGraph client: {str(e)}")
             raise
 
+    def emit_mcps(
+        self,
+        mcps: List[MetadataChangeProposalWrapper],
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        failures_file: Optional[str] = None,
+    ) -> EmitResult:
+        """
+        Emit MCPs in concurrent batches with retries
+
+        Args:
+            mcps: MCPs to emit
+            batch_size: Number of MCPs per batch ingest request
+            max_workers: Number of batches sent concurrently
+            failures_file: JSON Lines file the rejected MCPs are written to (optional)
+
+        Returns:
+            EmitResult with emitted/failed counts
+        """
+        if self.context.graph is None:
+            logger.error("DataHub graph client not initialized")
+            return EmitResult(failed=len(mcps))
+
+        emitter = BatchMcpEmitter(
+            self.context.graph,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            failures_file=failures_file,
+        )
+        return emitter.emit(mcps)
+
+    def emit_workunit(self, workunit: MetadataWorkUnit) -> bool:
+        """
+        Emit the MCP of a workunit
+
+        Args:
+            workunit: Workunit wrapping an MCP
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            return self.emit_mcps([workunit.metadata]).success
+        except Exception as e:
+            logger.error(f"Error emitting workunit: {str(e)}")
+            return False
+
     def list_domains(self) -> List[Dict[str, Any]]:
         """
         List all domains in DataHub
@@ -12,6 +12,9 @@ import requests
 import time
 from typing import Dict, Any, List, Optional, Union
 
+from utils.relationship_graph import RelationshipGraph
+from utils.usage_counts import usage_counts
+
 # Add DataHubGraph client imports if available, with fallback
 try:
     from datahub.ingestion.graph.client import DatahubClientConfig, DataHubGraph
@@ -4110,6 +4113,92 @@ class DataHubRestClient:
             self.logger.error(f"Error updating domain description: {str(e)}")
             return False
 
+    def update_domain_name(self, domain_urn: str, name: str) -> bool:
+        """
+        Rename a domain.
+
+        Args:
+            domain_urn (str): Domain URN
+            name (str): New name
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self.logger.info(f"Updating name for domain {domain_urn}")
+
+        mutation = """
+        mutation updateName($input: UpdateNameInput!) {
+          updateName(input: $input)
+        }
+        """
+
+        variables = {"input": {"urn": domain_urn, "name": name}}
+
+        try:
+            result = self.execute_graphql(mutation, variables)
+
+            if result and "data" in result and "updateName" in result["data"]:
+                success = result["data"]["updateName"]
+                if success:
+                    self.logger.info(f"Successfully updated name for domain {domain_urn}")
+                    return True
+
+            if result and "errors" in result:
+                error_messages = [
+                    e.get("message", "") for e in result.get("errors", [])
+                ]
+                self.logger.error(
+                    f"GraphQL errors when updating domain name: {', '.join(error_messages)}"
+                )
+
+            return False
+        except Exception as e:
+            self.logger.error(f"Error updating domain name: {str(e)}")
+            return False
+
+    def move_domain(self, domain_urn: str, parent_domain_urn: Optional[str] = None) -> bool:
+        """
+        Move a domain under another parent domain.
+
+        Args:
+            domain_urn (str): Domain URN
+            parent_domain_urn (str): New parent domain URN (None moves it to the root)
+
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self.logger.info(f"Moving domain {domain_urn} under {parent_domain_urn or 'the root'}")
+
+        mutation = """
+        mutation moveDomain($input: MoveDomainInput!) {
+          moveDomain(input: $input)
+        }
+        """
+
+        variables = {"input": {"resourceUrn": domain_urn, "parentDomain": parent_domain_urn}}
+
+        try:
+            result = self.execute_graphql(mutation, variables)
+
+            if result and "data" in result and "moveDomain" in result["data"]:
+                success = result["data"]["moveDomain"]
+                if success:
+                    self.logger.info(f"Successfully moved domain {domain_urn}")
+                    return True
+
+            if result and "errors" in result:
+                error_messages = [
+                    e.get("message", "") for e in result.get("errors", [])
+                ]
+                self.logger.error(
+                    f"GraphQL errors when moving domain: {', '.join(error_messages)}"
+                )
+
+            return False
+        except Exception as e:
+            self.logger.error(f"Error moving domain: {str(e)}")
+            return False
+
     def update_domain_display_properties(self, domain_urn: str, color_hex: str = None, icon: Dict[str, str] = None) -> bool:
         """
         Update the display properties of a domain.
@@ -6871,7 +6960,7 @@ class DataHubRestClient:
                 self.logger.error(f"Error in ultra-simple assertions query: {error_str}")
                 return {"success": True, "data": {"searchResults": [], "total": 0, "start": start, "count": 0}}
 
-    def list_domains(self, query="*", start=0, count=100):
+    def list_domains(self, query="*", start=0, count=100, include_entity_counts=True):
         """
         List domains in DataHub.
         
@@ -6879,6 +6968,8 @@ class DataHubRestClient:
             query (str): Search query to filter domains
             start (int): Starting offset for pagination
             count (int): Maximum number of domains to return
+            include_entity_counts (bool): Fill entities_count of all domains from one
+                domains facet request (otherwise entities_count is 0)
             
         Returns:
             list: List of domain objects
@@ -7003,9 +7094,6 @@ class DataHubRestClient:
                       style
                     }
                   }
-                  entities(input: { start: 0, count: 1, query: "*" }) {
-                    total
-                  }
                 }
               }
             }
@@ -7045,10 +7133,6 @@ class DataHubRestClient:
                             if domains_list and len(domains_list) > 0:
                                 parent_urn = domains_list[0].get("urn")
                         
-                        # Extract entities count from GraphQL response
-                        entities_info = entity.get("entities", {})
-                        entities_count = entities_info.get("total", 0) if entities_info else 0
-
                         domain = {
                             "urn": entity.get("urn"),
                             "id": entity.get("id"),
@@ -7060,13 +7144,24 @@ class DataHubRestClient:
                             "ownership": entity.get("ownership"),
                             "institutionalMemory": entity.get("institutionalMemory"),
                             "displayProperties": entity.get("displayProperties"),
-                            "entities": entity.get("entities"),  # Include full entities data for processing
-                            "entities_count": entities_count,  # Add entities count from GraphQL
+                            "entities": None,
+                            "entities_count": 0,
                             "structuredProperties": entity.get("structuredProperties"),  # Add structured properties
                         }
                         
                         domains.append(domain)
                 
+                if include_entity_counts and domains:
+                    # Entity counts of all domains from one facet request, not one search per domain
+                    try:
+                        entity_counts = usage_counts(self, "domains", [domain["urn"] for domain in domains])
+                    except Exception as e:
+                        self.logger.warning(f"Error getting domain entity counts: {str(e)}")
+                        entity_counts = {}
+                    for domain in domains:
+                        domain["entities_count"] = entity_counts.get(domain["urn"], 0)
+                        domain["entities"] = {"total": domain["entities_count"]}
+                
                 return domains
             
             if result and "errors" in result:
@@ -9400,11 +9495,8 @@ query GetEntitiesWithBrowsePathsForSearch($input: SearchAcrossEntitiesInput!) {
         Resolve relationship names by looking up URNs in the processed items.
         This should be called after all items have been processed.
         """
-        # Create a URN to name mapping
-        urn_to_name = {}
-        for item in items:
-            if item and item.get("urn") and item.get("name"):
-                urn_to_name[item["urn"]] = item["name"]
+        # Index the items once; names are then looked up by URN
+        graph = RelationshipGraph.from_entities(item for item in items if item)
         
         # Update relationship names
         for item in items:
@@ -9412,8 +9504,9 @@ query GetEntitiesWithBrowsePathsForSearch($input: SearchAcrossEntitiesInput!) {
                 for relationship in item["relationships"]:
                     if relationship and relationship.get("entity"):
                         entity_urn = relationship["entity"].get("urn")
-                        if entity_urn and entity_urn in urn_to_name:
-                            relationship["entity"]["name"] = urn_to_name[entity_urn]
+                        name = graph.name(entity_urn) if entity_urn in graph else None
+                        if name:
+                            relationship["entity"]["name"] = name
         
         return items
 
@@ -4,6 +4,7 @@ Utility functions for DataHub integration that can be used across the applicatio
 Maintains consistent access to DataHub client and configuration.
 """
 
+import hashlib
 import os
 import logging
 import time
@@ -130,6 +131,186 @@ def get_datahub_client_from_request(request):
     return get_datahub_client(request=request)
 
 
+def get_metadata_mirror(client, entity_type):
+    """
+    Get the local metadata mirror of the client's DataHub instance, if one is
+    configured (METADATA_MIRROR_DIR) and the entity type was synced recently
+    (METADATA_MIRROR_MAX_AGE_SECONDS). The caller closes the mirror.
+
+    Args:
+        client: DataHub client of the current connection
+        entity_type: Entity type that will be read (e.g. TAG)
+
+    Returns:
+        MetadataMirror: the mirror, or None if it should not be used
+    """
+    mirror_dir = getattr(settings, "METADATA_MIRROR_DIR", None)
+    if not mirror_dir or not client:
+        return None
+
+    from utils.metadata_mirror import MetadataMirror, mirror_path
+
+    path = mirror_path(mirror_dir, client.server_url)
+    if not path.exists():
+        return None
+
+    try:
+        mirror = MetadataMirror(path)
+    except Exception as e:
+        logger.warning(f"Error opening metadata mirror {path}: {str(e)}")
+        return None
+
+    if not mirror.is_fresh(entity_type, getattr(settings, "METADATA_MIRROR_MAX_AGE_SECONDS", 3600)):
+        logger.debug(f"Metadata mirror {path} has no recent {entity_type} sync, using DataHub")
+        mirror.close()
+        return None
+    return mirror
+
+
+def get_usage_counts(client, facet_field, urns, force_refresh=False):
+    """
+    Get the number of entities referencing each of some URNs (tags, glossary
+    terms, domains), from one facet request per connection and facet that is
+    cached for USAGE_COUNTS_CACHE_SECONDS.
+
+    Args:
+        client: DataHub client of the current connection
+        facet_field: Facet field holding the references (tags, glossaryTerms, domains)
+        urns: URNs to count the usage of
+        force_refresh (bool): If True, bypass the cache
+
+    Returns:
+        dict: Usage count by URN, empty if the counts could not be fetched
+    """
+    if not client:
+        return {}
+
+    from utils.usage_counts import fetch_facet_counts, with_value_counts
+
+    server_key = hashlib.sha1(str(client.server_url).encode("utf-8")).hexdigest()[:16]
+    cache_key = f"datahub_usage_{server_key}_{facet_field}"
+    timeout = getattr(settings, "USAGE_COUNTS_CACHE_SECONDS", 300)
+
+    facet = None if force_refresh else cache.get(cache_key)
+    try:
+        fetched = facet is None
+        if fetched:
+            facet = fetch_facet_counts(client, [facet_field])[facet_field]
+        completed = with_value_counts(client, facet, urns)
+    except Exception as e:
+        logger.warning(f"Error fetching {facet_field} usage counts: {str(e)}")
+        return {}
+
+    # Store the facet again when it was fetched or completed with the counts of missing values
+    if fetched or completed is not facet:
+        cache.set(cache_key, completed, timeout)
+    return {urn: completed.get(urn) or 0 for urn in dict.fromkeys(urns) if urn}
+
+
+def get_structured_property_usage(client, qualified_names, force_refresh=False):
+    """
+    Get the number of values assigned for each of some structured properties,
+    from one facet request for the properties not cached yet. Each count is
+    cached per connection for USAGE_COUNTS_CACHE_SECONDS.
+
+    Args:
+        client: DataHub client of the current connection
+        qualified_names: Qualified names of the structured properties
+        force_refresh (bool): If True, bypass the cache
+
+    Returns:
+        dict: Usage count by qualified name, empty if the counts could not be fetched
+    """
+    qualified_names = list(dict.fromkeys(name for name in qualified_names if name))
+    if not client or not qualified_names:
+        return {}
+
+    from utils.usage_counts import structured_property_usage
+
+    server_key = hashlib.sha1(str(client.server_url).encode("utf-8")).hexdigest()[:16]
+    cache_keys = {
+        name: f"datahub_property_usage_{server_key}_{hashlib.sha1(name.encode('utf-8')).hexdigest()[:16]}"
+        for name in qualified_names
+    }
+    timeout = getattr(settings, "USAGE_COUNTS_CACHE_SECONDS", 300)
+
+    cached = {} if force_refresh else cache.get_many(list(cache_keys.values()))
+    counts = {name: cached[key] for name, key in cache_keys.items() if key in cached}
+    missing = [name for name in qualified_names if name not in counts]
+    if missing:
+        try:
+            fetched = structured_property_usage(client, missing)
+        except Exception as e:
+            logger.warning(f"Error fetching structured property usage counts: {str(e)}")
+            return counts
+        cache.set_many({cache_keys[name]: count for name, count in fetched.items()}, timeout)
+        counts.update(fetched)
+    return counts
+
+
+def get_schema_fields(client, urn, force_refresh=False):
+    """
+    Get the schema fields of a dataset with their edits applied. The parsed
+    fields are cached per connection, dataset and schema version for
+    SCHEMA_FIELDS_CACHE_SECONDS; the version and the edits are fetched every time.
+
+    Args:
+        client: DataHub client of the current connection
+        urn (str): Dataset URN
+        force_refresh (bool): If True, bypass the cache
+
+    Returns:
+        tuple: Version key of the schema and the list of fields
+
+    Raises:
+        ValueError: If a response is not in the expected format
+    """
+    from utils.schema_fields import apply_editable, fetch_schema_fields, fetch_schema_state
+
+    def cache_key(version_key):
+        key = f"{client.server_url}|{urn}|{version_key}"
+        return f"datahub_schema_{hashlib.sha1(key.encode('utf-8')).hexdigest()}"
+
+    version_key, editable = fetch_schema_state(client, urn)
+    fields = None if force_refresh else cache.get(cache_key(version_key))
+    if fields is None:
+        version_key, fields = fetch_schema_fields(client, urn)
+        cache.set(cache_key(version_key), fields, getattr(settings, "SCHEMA_FIELDS_CACHE_SECONDS", 3600))
+
+    return version_key, apply_editable(fields, editable)
+
+
+_platform_catalogs = None
+
+
+def get_platform_catalog(client, entity_type=None, force_refresh=False):
+    """
+    Get the platforms, platform instances and entity counts of the client's
+    DataHub instance from an in-memory catalog, refreshed in the background
+    after PLATFORM_CATALOG_REFRESH_SECONDS.
+
+    Args:
+        client: DataHub client of the current connection
+        entity_type (str, optional): Entity type of the catalog (default: all types)
+        force_refresh (bool): If True, fetch the catalog again
+
+    Returns:
+        PlatformCatalog: the catalog, or None if it could not be fetched
+    """
+    global _platform_catalogs
+    if not client:
+        return None
+
+    from utils.platform_catalog import PlatformCatalogCache
+
+    if _platform_catalogs is None:
+        _platform_catalogs = PlatformCatalogCache(
+            refresh_after=getattr(settings, "PLATFORM_CATALOG_REFRESH_SECONDS", 300),
+            max_age=getattr(settings, "PLATFORM_CATALOG_MAX_AGE_SECONDS", 3600),
+        )
+    return _platform_catalogs.get(client, entity_type, force_refresh=force_refresh)
+
+
 def test_datahub_connection(request=None):
     """
     Test if the DataHub connection is working (lightweight test).
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Incremental readers for large JSON and JSON Lines files.
+
+The readers parse one value at a time from a bounded buffer, so an export of
+millions of entities can be processed without holding the whole document (or a
+copy of it) in memory. Only the standard library is used.
+"""
+
+import json
+import logging
+from typing import Any, Dict, Iterable, Iterator, Optional, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_READ_SIZE = 1024 * 1024
+WHITESPACE = " \t\n\r"
+
+
+class _JsonStreamReader:
+    """Tokenizer that decodes JSON values from a file object one at a time"""
+
+    def __init__(self, fp: TextIO, read_size: int = DEFAULT_READ_SIZE):
+        self.fp = fp
+        self.read_size = read_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        """Read more data into the buffer, dropping consumed content. Returns False at EOF"""
+        if self.eof:
+            return False
+        chunk = self.fp.read(self.read_size)
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> Optional[str]:
+        """Return the next non-whitespace character without consuming it (None at EOF)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return None
+
+    def expect(self, chars: str) -> str:
+        """Consume the next non-whitespace character, which must be one of chars"""
+        char = self.peek()
+        if char is None or char not in chars:
+            raise ValueError(f"Expected one of {chars!r} but found {char!r}")
+        self.pos += 1
+        return char
+
+    def read_value(self) -> Any:
+        """Decode the next JSON value, reading more data until it is complete"""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                # A number at the end of the buffer may continue in the next chunk
+                if end < len(self.buffer) or self.eof:
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            if not self._fill():
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+                self.pos = end
+                return value
+
+    def iter_array(self) -> Iterator[Any]:
+        """Yield the items of the array starting at the current position"""
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.read_value()
+            if self.expect(",]") == "]":
+                return
+
+
+def iter_json_object_members(
+    fp: TextIO, stream_keys: Iterable[str] = (), read_size: int = DEFAULT_READ_SIZE
+) -> Iterator[Tuple[str, Any, bool]]:
+    """
+    Iterate over the members of a top-level JSON object (or the items of a
+    top-level JSON array) without loading the whole document
+
+    Args:
+        fp: Text file object positioned at the start of the document
+        stream_keys: Keys whose array values are yielded item by item
+        read_size: Number of characters read per chunk
+
+    Yields:
+        (key, value, is_item) tuples. For keys in stream_keys holding an array,
+        one tuple is yielded per array item with is_item=True. A top-level array
+        is yielded item by item with key None.
+    """
+    reader = _JsonStreamReader(fp, read_size)
+    stream_keys = set(stream_keys)
+
+    if reader.peek() == "[":
+        for item in reader.iter_array():
+            yield None, item, True
+        return
+
+    reader.expect("{")
+    if reader.peek() == "}":
+        return
+    while True:
+        key = reader.read_value()
+        reader.expect(":")
+        if key in stream_keys and reader.peek() == "[":
+            for item in reader.iter_array():
+                yield key, item, True
+        else:
+            yield key, reader.read_value(), False
+        if reader.expect(",}") == "}":
+            return
+
+
+def iter_json_lines(fp: TextIO) -> Iterator[Tuple[int, Any]]:
+    """
+    Iterate over the values of a JSON Lines file, skipping blank lines
+
+    Args:
+        fp: Text file object
+
+    Yields:
+        (line_number, value) tuples
+    """
+    for line_number, line in enumerate(fp, start=1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON on line {line_number}: {e}")
+
+
+def is_json_lines_path(filepath: str) -> bool:
+    """Whether a path names a JSON Lines file, judging by its extension"""
+    return str(filepath).lower().endswith((".jsonl", ".ndjson"))
+
+
+def read_json_header(
+    filepath: str, header_key: str, stream_keys: Iterable[str] = ()
+) -> Optional[Dict[str, Any]]:
+    """
+    Read a single header member of a large JSON or JSON Lines document,
+    stopping as soon as it is found
+
+    For JSON Lines files the header is a first line object holding header_key.
+
+    Args:
+        filepath: Path to the document
+        header_key: Key of the header member (e.g. "metadata")
+        stream_keys: Keys of large arrays that are skipped item by item
+
+    Returns:
+        The header value, or None if the document has no header
+    """
+    with open(filepath, "r") as f:
+        if is_json_lines_path(filepath):
+            for _, value in iter_json_lines(f):
+                if isinstance(value, dict) and header_key in value and len(value) == 1:
+                    return value[header_key]
+                return None
+            return None
+
+        for key, value, is_item in iter_json_object_members(f, stream_keys):
+            if key == header_key and not is_item:
+                return value
+    return None
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Batched, concurrent MCP emitter shared by the scripts that push MCPs to DataHub.
+
+MCPs are grouped into batch ingest requests (GMS ingestProposalBatch) and sent
+by a small pool of worker threads. A failed batch is retried with exponential
+backoff; if it still fails it is bisected until the MCPs that GMS rejects are
+isolated. Rejected MCPs are written to a JSON Lines failures file that can be
+replayed with load_failed_mcps().
+
+Every batch has a content-derived id (batch_id()), so a resumed run can skip the
+batches an earlier run already had acknowledged.
+"""
+
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Collection, Dict, List, Optional, Sequence, Union
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.metadata.schema_classes import MetadataChangeProposalClass
+
+from utils.mcp_fingerprint import mcp_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF = 1.0
+
+McpLike = Union[MetadataChangeProposalWrapper, MetadataChangeProposalClass]
+
+
+@dataclass
+class EmitResult:
+    """Outcome of emitting a set of MCPs"""
+    emitted: int = 0
+    failed: int = 0
+    batches: int = 0
+    retries: int = 0
+    skipped: int = 0
+    failures: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def success(self) -> bool:
+        return self.failed == 0
+
+
+def mcp_to_obj(mcp: Any) -> Dict[str, Any]:
+    """Serialize an MCP (wrapper, class or dict) to its JSON-compatible form"""
+    if isinstance(mcp, dict):
+        return mcp
+    return json.loads(json.dumps(mcp.to_obj()))
+
+
+def mcp_from_obj(obj: Dict[str, Any]) -> McpLike:
+    """Deserialize an MCP dictionary, as written to a staged or failures file"""
+    try:
+        return MetadataChangeProposalWrapper.from_obj(obj)
+    except Exception:
+        return MetadataChangeProposalClass.from_obj(obj)
+
+
+def batch_id(batch: Sequence[McpLike]) -> str:
+    """
+    Stable id of a batch of MCPs, derived from their content without volatile
+    fields, so the same batch gets the same id in a later run
+
+    Args:
+        batch: MCPs of the batch
+
+    Returns:
+        Hex digest identifying the batch
+    """
+    return mcp_fingerprint([mcp_to_obj(mcp) for mcp in batch])
+
+
+def load_failed_mcps(path: str) -> List[McpLike]:
+    """
+    Load the MCPs recorded in a failures file (or a JSON list of MCP dictionaries)
+    so they can be emitted again
+
+    Args:
+        path: Path to the failures file
+
+    Returns:
+        List of MCPs
+    """
+    with open(path, "r") as f:
+        content = f.read()
+
+    if content.lstrip().startswith("["):
+        records = json.loads(content)
+    else:
+        records = [json.loads(line) for line in content.splitlines() if line.strip()]
+
+    return [mcp_from_obj(record.get("mcp", record)) for record in records]
+
+
+class BatchMcpEmitter:
+    """Emit MCPs in batches from a small pool of concurrent senders"""
+
+    def __init__(
+        self,
+        emitter: Any,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        retry_backoff: float = DEFAULT_RETRY_BACKOFF,
+        failures_file: Optional[str] = None,
+    ):
+        """
+        Initialize the emitter
+
+        Args:
+            emitter: DataHub REST emitter or DataHubGraph used to send the MCPs
+            batch_size: Number of MCPs per batch ingest request
+            max_workers: Number of batches sent concurrently
+            max_retries: Number of retries of a failed batch before bisecting it
+            retry_backoff: Delay in seconds before the first retry, doubled on each retry
+            failures_file: JSON Lines file the rejected MCPs are written to (optional)
+        """
+        self.emitter = emitter
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+        self.max_retries = max(0, max_retries)
+        self.retry_backoff = retry_backoff
+        self.failures_file = failures_file
+        self._lock = threading.Lock()
+        self._failures_file_started = False
+
+    def _send(self, batch: Sequence[McpLike]):
+        """Send one batch, raising on failure"""
+        if hasattr(self.emitter, "emit_mcps"):
+            self.emitter.emit_mcps(list(batch))
+        else:
+            for mcp in batch:
+                self.emitter.emit_mcp(mcp)
+
+    def _send_with_retries(self, batch: Sequence[McpLike], retries: int, result: EmitResult) -> Optional[Exception]:
+        """Send a batch, retrying with exponential backoff. Returns the last error, if any"""
+        for attempt in range(retries + 1):
+            try:
+                self._send(batch)
+                return None
+            except Exception as e:
+                error = e
+                if attempt < retries:
+                    delay = self.retry_backoff * (2 ** attempt)
+                    logger.warning(
+                        f"Batch of {len(batch)} MCPs failed ({e}), retrying in {delay:.1f}s "
+                        f"(attempt {attempt + 1}/{retries})"
+                    )
+                    with self._lock:
+                        result.retries += 1
+                    time.sleep(delay)
+        return error
+
+    def _emit_batch(self, batch: Sequence[McpLike], result: EmitResult, retries: int) -> bool:
+        """Emit a batch, bisecting it on failure to isolate the rejected MCPs. Returns whether all MCPs were emitted"""
+        error = self._send_with_retries(batch, retries, result)
+        if error is None:
+            with self._lock:
+                result.emitted += len(batch)
+            return True
+
+        if len(batch) == 1:
+            mcp = batch[0]
+            logger.error(f"Failed to emit MCP for {getattr(mcp, 'entityUrn', None)}: {error}")
+            with self._lock:
+                result.failed += 1
+                result.failures.append({"mcp": mcp_to_obj(mcp), "error": str(error)})
+            return False
+
+        # The batch was retried already, so the halves are only sent once before splitting further
+        middle = len(batch) // 2
+        logger.info(f"Bisecting failed batch of {len(batch)} MCPs")
+        first_emitted = self._emit_batch(batch[:middle], result, retries=0)
+        second_emitted = self._emit_batch(batch[middle:], result, retries=0)
+        return first_emitted and second_emitted
+
+    def _write_failures(self, failures: List[Dict[str, Any]]):
+        """Append failures to the failures file, replacing it on the first write"""
+        if not self.failures_file or not failures:
+            return
+        mode = "a" if self._failures_file_started else "w"
+        with open(self.failures_file, mode) as f:
+            for failure in failures:
+                f.write(json.dumps(failure) + "\n")
+        self._failures_file_started = True
+        logger.info(f"Wrote {len(failures)} failed MCPs to {self.failures_file}")
+
+    def emit(
+        self,
+        mcps: Sequence[McpLike],
+        skip_batches: Optional[Collection[str]] = None,
+        on_batch_emitted: Optional[Callable[[str, int], None]] = None,
+    ) -> EmitResult:
+        """
+        Emit MCPs in batches
+
+        Args:
+            mcps: MCPs to emit (wrappers, MetadataChangeProposalClass or dictionaries)
+            skip_batches: Ids of batches that were already acknowledged and are not sent again
+            on_batch_emitted: Callable (batch_id, mcp_count) called, from the sending
+                thread, after every batch that was emitted without failures
+
+        Returns:
+            EmitResult with emitted/failed/skipped counts and the failed MCPs
+        """
+        mcps = [mcp_from_obj(mcp) if isinstance(mcp, dict) else mcp for mcp in mcps]
+        batches = [mcps[i:i + self.batch_size] for i in range(0, len(mcps), self.batch_size)]
+        result = EmitResult(batches=len(batches))
+        if not batches:
+            return result
+
+        pending = []
+        for batch in batches:
+            id_ = batch_id(batch) if skip_batches is not None or on_batch_emitted else None
+            if skip_batches is not None and id_ in skip_batches:
+                result.skipped += len(batch)
+            else:
+                pending.append((id_, batch))
+
+        def send(id_, batch):
+            if self._emit_batch(batch, result, self.max_retries) and on_batch_emitted:
+                on_batch_emitted(id_, len(batch))
+
+        if self.max_workers == 1 or len(pending) <= 1:
+            for id_, batch in pending:
+                send(id_, batch)
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pending))) as executor:
+                futures = [executor.submit(send, id_, batch) for id_, batch in pending]
+                for future in futures:
+                    future.result()
+
+        self._write_failures(result.failures)
+        logger.info(
+            f"Emitted {result.emitted} MCPs in {result.batches} batches "
+            f"({result.failed} failed, {result.skipped} already emitted, {result.retries} retries)"
+        )
+        return result
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Canonical content fingerprints for MCPs (Metadata Change Proposals).
+
+Two MCPs that only differ in volatile fields - audit stamp times such as
+lastModified.time, systemMetadata.lastObserved or systemMetadata.runId - get
+the same fingerprint. Serialized aspects ({"value": "<json>", "contentType":
+"application/json"}) are decoded first, so the fingerprint reflects the
+aspect content and not its string encoding.
+"""
+
+import copy
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# systemMetadata fields that change on every run
+VOLATILE_SYSTEM_METADATA_FIELDS = ("lastObserved", "runId")
+
+
+def _decode_aspect(aspect: Any) -> Any:
+    """Decode a serialized {"value": ..., "contentType": "application/json"} aspect"""
+    if (
+        isinstance(aspect, dict)
+        and isinstance(aspect.get("value"), str)
+        and aspect.get("contentType", "application/json") == "application/json"
+    ):
+        try:
+            return json.loads(aspect["value"])
+        except ValueError:
+            return aspect
+    return aspect
+
+
+def _strip_audit_times(value: Any) -> Any:
+    """
+    Remove "time" from audit stamps (dicts carrying both "time" and "actor"),
+    recursively. Returns a new structure; the input is not modified.
+    """
+    if isinstance(value, dict):
+        stripped = {
+            key: _strip_audit_times(item)
+            for key, item in value.items()
+            if not (key == "time" and "actor" in value)
+        }
+        return stripped
+    if isinstance(value, list):
+        return [_strip_audit_times(item) for item in value]
+    return value
+
+
+def canonicalize_aspect(aspect: Any) -> Any:
+    """
+    Return the canonical form of an aspect: decoded from its JSON string
+    encoding if needed and with audit stamp times removed
+
+    Args:
+        aspect: Aspect dictionary (decoded or serialized)
+
+    Returns:
+        Canonical aspect structure
+    """
+    return _strip_audit_times(_decode_aspect(aspect))
+
+
+def canonicalize_mcp(mcp: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Return the canonical form of an MCP dictionary, without volatile fields
+
+    Args:
+        mcp: MCP dictionary (as produced by MetadataChangeProposalWrapper.to_obj())
+
+    Returns:
+        New dictionary suitable for stable comparison and hashing
+    """
+    if not isinstance(mcp, dict):
+        return mcp
+
+    canonical = {key: value for key, value in mcp.items() if key not in ("aspect", "systemMetadata")}
+
+    if "aspect" in mcp:
+        canonical["aspect"] = canonicalize_aspect(mcp["aspect"])
+
+    system_metadata = mcp.get("systemMetadata")
+    if isinstance(system_metadata, dict):
+        system_metadata = {
+            key: value
+            for key, value in system_metadata.items()
+            if key not in VOLATILE_SYSTEM_METADATA_FIELDS
+        }
+        if system_metadata:
+            canonical["systemMetadata"] = copy.deepcopy(system_metadata)
+    elif system_metadata is not None:
+        canonical["systemMetadata"] = system_metadata
+
+    return canonical
+
+
+def _hash_canonical(value: Any) -> str:
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def mcp_fingerprint(mcp: Union[Dict[str, Any], List[Dict[str, Any]]]) -> str:
+    """
+    Compute the content fingerprint of an MCP, or of a list of MCPs (as stored
+    in a staged mcp_file.json)
+
+    Args:
+        mcp: MCP dictionary or list of MCP dictionaries
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form
+    """
+    if isinstance(mcp, list):
+        return _hash_canonical([canonicalize_mcp(item) for item in mcp])
+    return _hash_canonical(canonicalize_mcp(mcp))
+
+
+def aspect_fingerprint(aspect: Any) -> str:
+    """
+    Compute the content fingerprint of a single aspect value
+
+    Args:
+        aspect: Aspect dictionary (decoded or serialized)
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form
+    """
+    return _hash_canonical(canonicalize_aspect(aspect))
+
+
+def mcp_key(mcp: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Identity of an MCP within a staged file: (entityUrn, aspectName)
+
+    Args:
+        mcp: MCP dictionary
+
+    Returns:
+        Tuple of entity URN and aspect name
+    """
+    return mcp.get("entityUrn"), mcp.get("aspectName")
+
+
+def fingerprint_mcps(mcps: Iterable[Dict[str, Any]]) -> Dict[Tuple[Optional[str], Optional[str]], str]:
+    """
+    Fingerprint every MCP in a collection, keyed by (entityUrn, aspectName).
+    When the same key appears more than once the last MCP wins, matching the
+    order in which DataHub would apply them.
+
+    Args:
+        mcps: Iterable of MCP dictionaries
+
+    Returns:
+        Dictionary mapping (entityUrn, aspectName) to fingerprint
+    """
+    return {mcp_key(mcp): mcp_fingerprint(mcp) for mcp in mcps if isinstance(mcp, dict)}
+
+
+def mcps_are_equal(mcp1: Any, mcp2: Any) -> bool:
+    """
+    Compare two MCPs (or lists of MCPs) for equality, ignoring volatile fields
+
+    Args:
+        mcp1: First MCP dictionary or list
+        mcp2: Second MCP dictionary or list
+
+    Returns:
+        True if the MCPs are functionally equivalent
+    """
+    try:
+        return mcp_fingerprint(mcp1) == mcp_fingerprint(mcp2)
+    except Exception as e:
+        logger.warning(f"Error comparing MCPs: {e}")
+        return False
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Structural diff of metadata entities between two environments.
+
+Every top-level field of an entity (properties, ownership, parentNodes, ...)
+is treated as an aspect and reduced to a canonical fingerprint: audit stamp
+times and GraphQL __typename fields are ignored. Both sides are merged in key
+order, and field-level differences are only computed for entities whose
+fingerprints differ. With inputs already sorted by key (e.g. search results
+sorted by URN) the merge holds one entity per side in memory at a time.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.mcp_fingerprint import aspect_fingerprint, canonicalize_aspect
+
+logger = logging.getLogger(__name__)
+
+# Fields ignored at any depth
+IGNORED_FIELDS = ("__typename",)
+
+# Top-level fields that identify an entity rather than describe it
+IDENTITY_FIELDS = ("urn", "type")
+
+
+class UnsortedStreamError(ValueError):
+    """Raised when an input declared as sorted is not in ascending key order"""
+
+
+def _strip_ignored(value: Any) -> Any:
+    """Remove IGNORED_FIELDS recursively, returning a new structure"""
+    if isinstance(value, dict):
+        return {key: _strip_ignored(item) for key, item in value.items() if key not in IGNORED_FIELDS}
+    if isinstance(value, list):
+        return [_strip_ignored(item) for item in value]
+    return value
+
+
+def entity_aspects(entity: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Canonical aspects of an entity, keyed by top-level field name
+
+    Args:
+        entity: Entity dictionary (e.g. a GraphQL search result entity)
+
+    Returns:
+        Dictionary of canonical aspect values, without identity fields
+    """
+    return {
+        name: canonicalize_aspect(_strip_ignored(value))
+        for name, value in entity.items()
+        if name not in IDENTITY_FIELDS and name not in IGNORED_FIELDS and value is not None
+    }
+
+
+def entity_fingerprints(entity: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Per-aspect content fingerprints of an entity
+
+    Args:
+        entity: Entity dictionary
+
+    Returns:
+        Dictionary mapping aspect name to fingerprint
+    """
+    return {name: aspect_fingerprint(value) for name, value in entity_aspects(entity).items()}
+
+
+def field_differences(source: Any, target: Any, path: str = "") -> List[Dict[str, Any]]:
+    """
+    Field-level differences between two canonical values
+
+    Dictionaries are compared key by key and lists of equal length item by item;
+    any other difference is reported at the deepest common path.
+
+    Args:
+        source: Source value
+        target: Target value
+        path: Path of the values (e.g. "ownership.owners[0]")
+
+    Returns:
+        List of {"path", "source", "target"} dictionaries
+    """
+    if source == target:
+        return []
+    if isinstance(source, dict) and isinstance(target, dict):
+        differences = []
+        for key in sorted(set(source) | set(target)):
+            differences.extend(
+                field_differences(source.get(key), target.get(key), f"{path}.{key}" if path else key)
+            )
+        return differences
+    if isinstance(source, list) and isinstance(target, list) and len(source) == len(target):
+        differences = []
+        for index, (source_item, target_item) in enumerate(zip(source, target)):
+            differences.extend(field_differences(source_item, target_item, f"{path}[{index}]"))
+        return differences
+    return [{"path": path, "source": source, "target": target}]
+
+
+def _in_key_order(entities: Iterable[Dict[str, Any]], key: Callable[[Dict[str, Any]], Any], label: str) -> Iterator[Tuple[Any, Dict[str, Any]]]:
+    """Yield (key, entity) pairs, checking that keys ascend"""
+    previous = None
+    for entity in entities:
+        entity_key = key(entity)
+        if entity_key is None:
+            continue
+        if previous is not None and entity_key < previous:
+            raise UnsortedStreamError(f"{label} entities are not sorted by key: {entity_key!r} follows {previous!r}")
+        previous = entity_key
+        yield entity_key, entity
+
+
+def iter_entity_diffs(
+    source: Iterable[Dict[str, Any]],
+    target: Iterable[Dict[str, Any]],
+    key: Callable[[Dict[str, Any]], Any] = lambda entity: entity.get("urn"),
+    source_transform: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    presorted: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Merge two entity streams by key and yield their differences
+
+    Args:
+        source: Source entities
+        target: Target entities
+        key: Key of an entity (URN by default); entities without a key are skipped
+        source_transform: Applied to each source entity before keying and comparing
+            (e.g. to map source URNs to the URNs they are migrated to)
+        presorted: Whether both inputs are already in ascending key order. If not,
+            both sides are sorted in memory first
+
+    Yields:
+        {"key", "status", ...} records where status is missing_in_target (with the
+        source entity), missing_in_source (with the target entity) or different
+        (with the differing aspects and their field-level differences)
+
+    Raises:
+        UnsortedStreamError: If presorted is set and an input is out of order
+    """
+    if source_transform:
+        source = (source_transform(entity) for entity in source)
+    if not presorted:
+        source = sorted((entity for entity in source if key(entity) is not None), key=key)
+        target = sorted((entity for entity in target if key(entity) is not None), key=key)
+
+    source_iter = _in_key_order(source, key, "Source")
+    target_iter = _in_key_order(target, key, "Target")
+    source_item = next(source_iter, None)
+    target_item = next(target_iter, None)
+
+    while source_item is not None or target_item is not None:
+        if target_item is None or (source_item is not None and source_item[0] < target_item[0]):
+            yield {"key": source_item[0], "status": "missing_in_target", "source": source_item[1]}
+            source_item = next(source_iter, None)
+        elif source_item is None or target_item[0] < source_item[0]:
+            yield {"key": target_item[0], "status": "missing_in_source", "target": target_item[1]}
+            target_item = next(target_iter, None)
+        else:
+            entity_key, source_entity = source_item
+            target_entity = target_item[1]
+            source_fingerprints = entity_fingerprints(source_entity)
+            target_fingerprints = entity_fingerprints(target_entity)
+            if source_fingerprints != target_fingerprints:
+                # Only entities whose fingerprints differ are compared field by field
+                changed = sorted(
+                    name for name in set(source_fingerprints) | set(target_fingerprints)
+                    if source_fingerprints.get(name) != target_fingerprints.get(name)
+                )
+                source_aspects = entity_aspects(source_entity)
+                target_aspects = entity_aspects(target_entity)
+                differences = []
+                for name in changed:
+                    differences.extend(field_differences(source_aspects.get(name), target_aspects.get(name), name))
+                yield {
+                    "key": entity_key,
+                    "status": "different",
+                    "aspects": changed,
+                    "differences": differences,
+                    "source": source_entity,
+                    "target": target_entity,
+                }
+            source_item = next(source_iter, None)
+            target_item = next(target_iter, None)
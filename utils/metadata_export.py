@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Concurrent, streaming writer for metadata exports.
+
+Sections (domains, glossary nodes, tags, ...) are fetched concurrently. In the
+JSON Lines formats each section is written to its own file as soon as it has
+been fetched, one entity per line (optionally gzip-compressed), and a small
+manifest lists the section files with their entity counts. The JSON format
+writes the single document layout used by earlier exports.
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+EXPORT_FORMATS = ("json", "jsonl", "jsonl.gz")
+DEFAULT_EXPORT_WORKERS = 4
+EXPORT_VERSION = "1.0"
+
+# Sections nested under "glossary" in the JSON document layout
+GLOSSARY_SECTIONS = {"glossary_nodes": "nodes", "glossary_terms": "terms"}
+
+
+def section_path(manifest_path: str, section: str, fmt: str) -> Path:
+    """
+    Path of a section file, next to the manifest (export.json -> export.tags.jsonl)
+
+    Args:
+        manifest_path: Path of the manifest
+        section: Section name
+        fmt: Export format (jsonl or jsonl.gz)
+
+    Returns:
+        Path of the section file
+    """
+    manifest = Path(manifest_path)
+    return manifest.with_name(f"{manifest.stem}.{section}.{fmt}")
+
+
+def _open_section(path: Path, fmt: str, mode: str = "w"):
+    """Open a section file for writing ("w") or reading ("r") as text"""
+    if fmt == "jsonl.gz":
+        return gzip.open(path, f"{mode}t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def write_section(path: Path, entities: Iterable[Dict[str, Any]], fmt: str) -> Dict[str, Any]:
+    """
+    Write the entities of a section, one JSON document per line
+
+    Args:
+        path: Section file path
+        entities: Entities of the section
+        fmt: jsonl or jsonl.gz
+
+    Returns:
+        Manifest entry of the section (file name, entity count and SHA-256 of the lines)
+    """
+    digest = hashlib.sha256()
+    count = 0
+    temp_path = path.with_name(path.name + ".tmp")
+    with _open_section(temp_path, fmt) as f:
+        for entity in entities:
+            line = json.dumps(entity, separators=(",", ":")) + "\n"
+            f.write(line)
+            digest.update(line.encode("utf-8"))
+            count += 1
+    os.replace(temp_path, path)
+    return {"file": path.name, "count": count, "sha256": digest.hexdigest()}
+
+
+def export_sections(
+    fetchers: Dict[str, Callable[[], Iterable[Dict[str, Any]]]],
+    output_file: str,
+    fmt: str = "json",
+    max_workers: int = DEFAULT_EXPORT_WORKERS,
+    indent: Optional[int] = None,
+    metadata: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Fetch sections concurrently and write them to disk
+
+    Args:
+        fetchers: Callables returning the entities of each section, by section name
+        output_file: JSON document (json) or manifest path (jsonl, jsonl.gz)
+        fmt: One of EXPORT_FORMATS
+        max_workers: Number of sections fetched concurrently
+        indent: JSON indentation of the json format document
+        metadata: Extra fields stored in the document or manifest
+
+    Returns:
+        Manifest with per-section counts and durations
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {fmt}")
+
+    manifest = {
+        "version": EXPORT_VERSION,
+        "exported_at": datetime.now().isoformat(),
+        "format": fmt,
+        **(metadata or {}),
+        "sections": {},
+    }
+    documents: Dict[str, Any] = {}
+
+    def export_section(section: str) -> Dict[str, Any]:
+        started = time.time()
+        entities = fetchers[section]()
+        if fmt == "json":
+            documents[section] = list(entities)
+            entry = {"count": len(documents[section])}
+        else:
+            # Written as soon as the section is fetched, so finished sections are not held in memory
+            entry = write_section(section_path(output_file, section, fmt), entities, fmt)
+        entry["seconds"] = round(time.time() - started, 3)
+        logger.info(f"Exported {entry['count']} {section} in {entry['seconds']}s")
+        return entry
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(fetchers) or 1))) as executor:
+        futures = {executor.submit(export_section, section): section for section in fetchers}
+        for future in as_completed(futures):
+            manifest["sections"][futures[future]] = future.result()
+
+    # Keep the section order stable regardless of completion order
+    manifest["sections"] = {section: manifest["sections"][section] for section in fetchers}
+
+    if fmt == "json":
+        document = {key: value for key, value in manifest.items() if key not in ("format", "sections")}
+        for section in fetchers:
+            if section in GLOSSARY_SECTIONS:
+                document.setdefault("glossary", {})[GLOSSARY_SECTIONS[section]] = documents[section]
+            else:
+                document[section] = documents[section]
+        with open(output_file, "w") as f:
+            json.dump(document, f, indent=indent)
+    else:
+        with open(output_file, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def iter_exported_section(manifest_path: str, section: str) -> Iterable[Dict[str, Any]]:
+    """
+    Read back the entities of one section of a JSON Lines export
+
+    Args:
+        manifest_path: Path of the export manifest
+        section: Section name
+
+    Yields:
+        Entities of the section
+    """
+    with open(manifest_path, "r") as f:
+        manifest = json.load(f)
+    entry = manifest["sections"][section]
+    path = Path(manifest_path).with_name(entry["file"])
+    with _open_section(path, manifest.get("format", "jsonl"), "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
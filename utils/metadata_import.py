@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Dependency-levelled import of exported metadata.
+
+Exported entities (domains, data products, glossary nodes and terms, tags,
+structured properties, tests) are turned into MCPs and arranged in a dependency
+DAG: parent domains before child domains, domains before their data products,
+glossary nodes before the nodes and terms they contain, and structured property
+definitions before the entities that carry values for them. The DAG is split
+into topological levels; every level is written with the batched, concurrent
+MCP emitter, so the number of round trips grows with the depth of the
+hierarchies rather than with the number of entities. When an entity fails, only
+the entities that depend on it are skipped and the other branches carry on.
+"""
+
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+from datahub.metadata.schema_classes import (
+    DataProductPropertiesClass,
+    DomainPropertiesClass,
+    DomainsClass,
+    GlossaryNodeInfoClass,
+    GlossaryTermInfoClass,
+    OwnerClass,
+    OwnershipClass,
+    OwnershipTypeClass,
+    PropertyValueClass,
+    StructuredPropertiesClass,
+    StructuredPropertyDefinitionClass,
+    StructuredPropertyValueAssignmentClass,
+    TagPropertiesClass,
+    TestDefinitionClass,
+    TestInfoClass,
+)
+
+from utils.mcp_emitter import BatchMcpEmitter
+from utils.metadata_export import GLOSSARY_SECTIONS, iter_exported_section
+from utils.relationship_graph import RelationshipGraph
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_EXISTS_WORKERS = 8
+
+# Relation of the import graph: entity -> entity that must be imported first
+DEPENDS_ON = "dependsOn"
+
+# Sections read for each import type of scripts/import_metadata.py
+IMPORT_TYPE_SECTIONS = {
+    "domains": ("domains", "data_products"),
+    "glossary": ("glossary_nodes", "glossary_terms"),
+    "tags": ("tags",),
+    "properties": ("structured_properties",),
+    "tests": ("tests",),
+}
+IMPORT_SECTIONS = tuple(section for sections in IMPORT_TYPE_SECTIONS.values() for section in sections)
+
+OWNERSHIP_TYPES = {
+    value for name, value in vars(OwnershipTypeClass).items() if name.isupper() and isinstance(value, str)
+}
+
+
+@dataclass
+class ImportItem:
+    """One entity to import: its MCPs and the URNs it depends on"""
+    urn: str
+    kind: str
+    mcps: List[MetadataChangeProposalWrapper] = field(default_factory=list)
+    depends_on: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class ImportResult:
+    """Outcome of a levelled import"""
+    imported: List[str] = field(default_factory=list)
+    existing: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)
+    skipped: Dict[str, str] = field(default_factory=dict)
+    levels: int = 0
+    mcps_emitted: int = 0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed and not self.skipped
+
+
+def load_import_sections(input_file: str, sections: Optional[Iterable[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Read the sections of an export, in the JSON document layout or as a JSON Lines manifest
+
+    Args:
+        input_file: Export document or manifest
+        sections: Section names to read (default: IMPORT_SECTIONS)
+
+    Returns:
+        Dictionary mapping section name to its entities (missing sections are left out)
+    """
+    sections = tuple(sections or IMPORT_SECTIONS)
+    with open(input_file, "r") as f:
+        document = json.load(f)
+
+    if isinstance(document.get("sections"), dict) and document.get("format") != "json":
+        return {
+            section: list(iter_exported_section(input_file, section))
+            for section in sections
+            if section in document["sections"]
+        }
+
+    loaded = {}
+    glossary = document.get("glossary") or {}
+    for section in sections:
+        if section in GLOSSARY_SECTIONS:
+            if GLOSSARY_SECTIONS[section] in glossary:
+                loaded[section] = glossary[GLOSSARY_SECTIONS[section]] or []
+        elif section in document:
+            loaded[section] = document[section] or []
+    return loaded
+
+
+def _first_urn(entity: Dict[str, Any], container: str, key: str) -> Optional[str]:
+    """URN of the first entry of a GraphQL list field, e.g. parentDomains.domains[0].urn"""
+    entries = (entity.get(container) or {}).get(key) or []
+    return entries[0].get("urn") if entries and entries[0] else None
+
+
+def _properties(entity: Dict[str, Any]) -> Dict[str, Any]:
+    return entity.get("properties") or {}
+
+
+def _mcp(urn: str, aspect: Any) -> MetadataChangeProposalWrapper:
+    return MetadataChangeProposalWrapper(entityUrn=urn, aspect=aspect)
+
+
+def _ownership_aspect(entity: Dict[str, Any]) -> Optional[OwnershipClass]:
+    """Ownership aspect from the exported owners, if any"""
+    owners = []
+    for owner in (entity.get("ownership") or {}).get("owners") or []:
+        owner_urn = (owner.get("owner") or {}).get("urn")
+        if not owner_urn:
+            continue
+        type_urn = (owner.get("ownershipType") or {}).get("urn")
+        if owner.get("type") in OWNERSHIP_TYPES:
+            owners.append(OwnerClass(owner=owner_urn, type=owner["type"], typeUrn=type_urn))
+        elif type_urn:
+            owners.append(OwnerClass(owner=owner_urn, type=OwnershipTypeClass.CUSTOM, typeUrn=type_urn))
+        else:
+            owners.append(OwnerClass(owner=owner_urn, type=OwnershipTypeClass.TECHNICAL_OWNER))
+    return OwnershipClass(owners=owners) if owners else None
+
+
+def _structured_properties_aspect(entity: Dict[str, Any]) -> Optional[StructuredPropertiesClass]:
+    """Structured property values of an entity, if any"""
+    assignments = []
+    for prop in (entity.get("structuredProperties") or {}).get("properties") or []:
+        property_urn = (prop.get("structuredProperty") or {}).get("urn")
+        values = [
+            value.get("stringValue", value.get("numberValue"))
+            for value in prop.get("values") or []
+            if value
+        ]
+        if property_urn and values:
+            assignments.append(StructuredPropertyValueAssignmentClass(propertyUrn=property_urn, values=values))
+    return StructuredPropertiesClass(properties=assignments) if assignments else None
+
+
+def _item(urn: str, kind: str, entity: Dict[str, Any], aspect: Any, depends_on: Iterable[Optional[str]] = ()) -> ImportItem:
+    """Item with the main aspect plus the ownership and structured property values of the entity"""
+    item = ImportItem(urn=urn, kind=kind, mcps=[_mcp(urn, aspect)])
+    item.depends_on.update(dep for dep in depends_on if dep and dep != urn)
+
+    ownership = _ownership_aspect(entity)
+    if ownership:
+        item.mcps.append(_mcp(urn, ownership))
+
+    values = _structured_properties_aspect(entity)
+    if values:
+        item.mcps.append(_mcp(urn, values))
+        # Property definitions must exist before values are written for them
+        item.depends_on.update(assignment.propertyUrn for assignment in values.properties)
+    return item
+
+
+def domain_item(entity: Dict[str, Any]) -> ImportItem:
+    """Import item of an exported domain, depending on its parent domain"""
+    props = _properties(entity)
+    parent = _first_urn(entity, "parentDomains", "domains")
+    aspect = DomainPropertiesClass(
+        name=props.get("name") or entity.get("id") or entity["urn"].split(":")[-1],
+        description=props.get("description"),
+        parentDomain=parent,
+    )
+    return _item(entity["urn"], "domain", entity, aspect, [parent])
+
+
+def data_product_item(entity: Dict[str, Any]) -> ImportItem:
+    """Import item of an exported data product, depending on its domain"""
+    props = _properties(entity)
+    domain = ((entity.get("domain") or {}).get("domain") or {}).get("urn")
+    aspect = DataProductPropertiesClass(name=props.get("name"), description=props.get("description"))
+    item = _item(entity["urn"], "dataProduct", entity, aspect, [domain])
+    if domain:
+        item.mcps.append(_mcp(entity["urn"], DomainsClass(domains=[domain])))
+    return item
+
+
+def glossary_term_item(entity: Dict[str, Any], parent: Optional[str] = None) -> ImportItem:
+    """Import item of an exported glossary term, depending on its parent node"""
+    props = _properties(entity)
+    parent = parent or entity.get("parent_node_urn") or _first_urn(entity, "parentNodes", "nodes")
+    aspect = GlossaryTermInfoClass(
+        definition=props.get("description") or "",
+        termSource=props.get("termSource") or "INTERNAL",
+        name=props.get("name") or entity.get("name"),
+        parentNode=parent,
+    )
+    return _item(entity["urn"], "glossaryTerm", entity, aspect, [parent])
+
+
+def glossary_node_items(entity: Dict[str, Any], parent: Optional[str] = None) -> List[ImportItem]:
+    """
+    Import items of an exported glossary node and of the nodes and terms listed as its children
+
+    Args:
+        entity: Glossary node, optionally with its "children" relationships
+        parent: Parent node URN, when not given by the entity itself
+
+    Returns:
+        The item of the node followed by the items of its children
+    """
+    props = _properties(entity)
+    urn = entity["urn"]
+    parent = parent or entity.get("parent_node_urn") or _first_urn(entity, "parentNodes", "nodes")
+    aspect = GlossaryNodeInfoClass(
+        definition=props.get("description") or "",
+        name=props.get("name"),
+        parentNode=parent,
+    )
+    items = [_item(urn, "glossaryNode", entity, aspect, [parent])]
+
+    for relationship in (entity.get("children") or {}).get("relationships") or []:
+        child = relationship.get("entity") or {}
+        if not child.get("urn"):
+            continue
+        if child.get("type") == "GLOSSARY_NODE":
+            items.extend(glossary_node_items(child, parent=urn))
+        elif child.get("type") == "GLOSSARY_TERM":
+            items.append(glossary_term_item(child, parent=urn))
+    return items
+
+
+def tag_item(entity: Dict[str, Any]) -> ImportItem:
+    """Import item of an exported tag"""
+    props = _properties(entity)
+    aspect = TagPropertiesClass(
+        name=props.get("name") or entity.get("name") or entity["urn"].split(":")[-1],
+        description=entity.get("description") or props.get("description"),
+        colorHex=props.get("colorHex"),
+    )
+    return _item(entity["urn"], "tag", entity, aspect)
+
+
+def structured_property_item(entity: Dict[str, Any]) -> ImportItem:
+    """Import item of an exported structured property definition"""
+    definition = entity.get("definition") or {}
+    allowed_types = [
+        allowed.get("urn")
+        for allowed in (definition.get("typeQualifier") or {}).get("allowedTypes") or []
+        if allowed.get("urn")
+    ]
+    allowed_values = [
+        PropertyValueClass(
+            value=(allowed.get("value") or {}).get("stringValue", (allowed.get("value") or {}).get("numberValue")),
+            description=allowed.get("description"),
+        )
+        for allowed in definition.get("allowedValues") or []
+    ]
+    aspect = StructuredPropertyDefinitionClass(
+        qualifiedName=definition.get("qualifiedName") or entity["urn"].split(":")[-1],
+        valueType=(definition.get("valueType") or {}).get("urn"),
+        entityTypes=[t.get("urn") for t in definition.get("entityTypes") or [] if t.get("urn")],
+        displayName=definition.get("displayName"),
+        description=definition.get("description"),
+        cardinality=definition.get("cardinality"),
+        immutable=definition.get("immutable"),
+        typeQualifier={"allowedTypes": allowed_types} if allowed_types else None,
+        allowedValues=allowed_values or None,
+    )
+    return _item(entity["urn"], "structuredProperty", entity, aspect)
+
+
+def metadata_test_item(entity: Dict[str, Any]) -> ImportItem:
+    """Import item of an exported metadata test"""
+    definition = (entity.get("definition") or {}).get("json") or entity.get("params") or "{}"
+    if not isinstance(definition, str):
+        definition = json.dumps(definition)
+    aspect = TestInfoClass(
+        name=entity.get("name") or entity["urn"].split(":")[-1],
+        category=entity.get("category") or "",
+        description=entity.get("description"),
+        definition=TestDefinitionClass(type="JSON", json=definition),
+    )
+    return _item(entity["urn"], "test", entity, aspect)
+
+
+def build_import_plan(sections: Dict[str, List[Dict[str, Any]]]) -> Dict[str, ImportItem]:
+    """
+    Import items of all exported entities, keyed by URN
+
+    Entities listed in a section take precedence over the same entities found
+    as children of a glossary node.
+
+    Args:
+        sections: Entities by section name, as returned by load_import_sections
+
+    Returns:
+        Dictionary mapping URN to import item
+    """
+    builders = {
+        "structured_properties": structured_property_item,
+        "domains": domain_item,
+        "data_products": data_product_item,
+        "glossary_terms": glossary_term_item,
+        "tags": tag_item,
+        "tests": metadata_test_item,
+    }
+    plan: Dict[str, ImportItem] = {}
+    for section, builder in builders.items():
+        for entity in sections.get(section) or []:
+            if entity and entity.get("urn"):
+                plan[entity["urn"]] = builder(entity)
+
+    for entity in sections.get("glossary_nodes") or []:
+        if not entity or not entity.get("urn"):
+            continue
+        node, *children = glossary_node_items(entity)
+        plan[node.urn] = node
+        for child in children:
+            plan.setdefault(child.urn, child)
+    return plan
+
+
+def topological_levels(plan: Dict[str, ImportItem]) -> Tuple[List[List[str]], List[str]]:
+    """
+    Split the plan into levels whose entities only depend on earlier levels
+
+    Dependencies outside the plan are assumed to exist in the target already.
+
+    Args:
+        plan: Import items keyed by URN
+
+    Returns:
+        Tuple of (levels of URNs, URNs that are part of or depend on a cycle)
+    """
+    graph = RelationshipGraph()
+    for urn in plan:
+        graph.add_node(urn)
+    for urn, item in plan.items():
+        for dep in item.depends_on:
+            graph.add_edge(urn, DEPENDS_ON, dep)
+    return graph.topological_levels([DEPENDS_ON])
+
+
+class LevelledImporter:
+    """Import a plan level by level, emitting each level in concurrent batches"""
+
+    def __init__(
+        self,
+        emitter: BatchMcpEmitter,
+        exists: Optional[Callable[[str], bool]] = None,
+        exists_workers: int = DEFAULT_EXISTS_WORKERS,
+    ):
+        """
+        Initialize the importer
+
+        Args:
+            emitter: Batched emitter connected to the target DataHub
+            exists: Callable telling whether a URN exists in the target. When given,
+                existing entities are left untouched (no overwrite)
+            exists_workers: Number of existence checks run concurrently
+        """
+        self.emitter = emitter
+        self.exists = exists
+        self.exists_workers = max(1, exists_workers)
+
+    def _existing(self, urns: List[str]) -> Set[str]:
+        """URNs of a level that already exist in the target"""
+        if not self.exists or not urns:
+            return set()
+
+        def check(urn: str) -> bool:
+            try:
+                return bool(self.exists(urn))
+            except Exception as e:
+                logger.warning(f"Could not check whether {urn} exists, importing it: {str(e)}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(self.exists_workers, len(urns))) as executor:
+            return {urn for urn, found in zip(urns, executor.map(check, urns)) if found}
+
+    def run(self, plan: Dict[str, ImportItem]) -> ImportResult:
+        """
+        Import every item of the plan
+
+        Args:
+            plan: Import items keyed by URN
+
+        Returns:
+            ImportResult with the imported, existing, failed and skipped URNs
+        """
+        levels, cyclic = topological_levels(plan)
+        result = ImportResult(levels=len(levels))
+        for urn in cyclic:
+            result.failed[urn] = "dependency cycle"
+        if cyclic:
+            logger.error(f"{len(cyclic)} entities are part of (or depend on) a dependency cycle")
+
+        unavailable = set(cyclic)
+        for number, level in enumerate(levels, start=1):
+            ready = []
+            for urn in level:
+                blocked = sorted(dep for dep in plan[urn].depends_on if dep in unavailable)
+                if blocked:
+                    # Descendants of a failed entity are skipped; other branches continue
+                    result.skipped[urn] = f"depends on {blocked[0]}"
+                    unavailable.add(urn)
+                else:
+                    ready.append(urn)
+
+            existing = self._existing(ready)
+            result.existing.extend(urn for urn in ready if urn in existing)
+            to_import = [urn for urn in ready if urn not in existing]
+
+            mcps = [mcp for urn in to_import for mcp in plan[urn].mcps]
+            logger.info(
+                f"Level {number}/{len(levels)}: importing {len(to_import)} entities ({len(mcps)} MCPs), "
+                f"{len(existing)} already exist, {len(level) - len(ready)} skipped"
+            )
+            emit_result = self.emitter.emit(mcps)
+            result.mcps_emitted += emit_result.emitted
+
+            errors = {}
+            for failure in emit_result.failures:
+                errors.setdefault(failure["mcp"].get("entityUrn"), failure.get("error", "emit failed"))
+            for urn in to_import:
+                if urn in errors:
+                    result.failed[urn] = errors[urn]
+                    unavailable.add(urn)
+                else:
+                    result.imported.append(urn)
+
+        logger.info(
+            f"Imported {len(result.imported)} entities in {result.levels} levels "
+            f"({len(result.existing)} already existed, {len(result.failed)} failed, {len(result.skipped)} skipped)"
+        )
+        return result
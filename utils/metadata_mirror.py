@@ -0,0 +1,711 @@
+#!/usr/bin/env python3
+"""
+Local SQLite mirror of the metadata of a DataHub instance.
+
+A sync job scrolls through the governance entities (domains, glossary nodes
+and terms, tags, data products, structured properties, tests) and the entities
+associated with them (datasets, dashboards, ... with tags, glossary terms or a
+domain) and stores each entity as JSON along with its association edges. Later
+syncs only rewrite the entities whose content changed and drop the ones that
+disappeared, so the mirror can be refreshed often.
+
+Read-heavy code (metadata tests, comparisons, the remote views of the web UI)
+can then query the mirror instead of crawling DataHub:
+
+    mirror = MetadataMirror(mirror_path(DEFAULT_MIRROR_DIR, server_url))
+    mirror.entities("GLOSSARY_TERM")
+    mirror.entities_with_tag("urn:li:tag:pii")
+    mirror.children("urn:li:glossaryNode:finance")
+    mirror.entities_in_domain("urn:li:domain:sales")
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from utils.sync_watermark import entity_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MIRROR_DIR = ".cache/metadata_mirror"
+DEFAULT_SCROLL_SIZE = 500
+DEFAULT_MIRROR_WORKERS = 4
+
+OWNERSHIP_FIELDS = """
+      ownership {
+        owners {
+          owner {
+            ... on CorpUser { urn username properties { displayName } }
+            ... on CorpGroup { urn name properties { displayName } }
+          }
+          type
+          ownershipType { urn }
+        }
+      }
+"""
+
+STRUCTURED_PROPERTIES_FIELDS = """
+      structuredProperties {
+        properties {
+          structuredProperty { urn }
+          values {
+            ... on StringValue { stringValue }
+            ... on NumberValue { numberValue }
+          }
+        }
+      }
+"""
+
+DISPLAY_PROPERTIES_FIELDS = """
+      displayProperties {
+        colorHex
+        icon { name style iconLibrary }
+      }
+"""
+
+# GraphQL fields mirrored (and compared) for each entity type: every aspect the manager pushes
+ENTITY_FIELDS = {
+    "DOMAIN": """
+    ... on Domain {
+      properties { name description }
+      parentDomains { domains { urn } }
+      institutionalMemory { elements { url label } }
+""" + OWNERSHIP_FIELDS + STRUCTURED_PROPERTIES_FIELDS + DISPLAY_PROPERTIES_FIELDS + """
+    }
+""",
+    "GLOSSARY_NODE": """
+    ... on GlossaryNode {
+      properties { name description }
+      parentNodes { nodes { urn } }
+""" + OWNERSHIP_FIELDS + STRUCTURED_PROPERTIES_FIELDS + DISPLAY_PROPERTIES_FIELDS + """
+    }
+""",
+    "GLOSSARY_TERM": """
+    ... on GlossaryTerm {
+      properties {
+        name
+        description
+        termSource
+        sourceRef
+        sourceUrl
+        customProperties { key value }
+      }
+      parentNodes { nodes { urn } }
+      domain { domain { urn } }
+      deprecation { deprecated note }
+      institutionalMemory { elements { url label } }
+      relationships(input: {types: ["IsA", "HasA", "HasValue", "RelatedTo"], direction: OUTGOING, start: 0, count: 1000}) {
+        relationships {
+          type
+          entity { urn }
+        }
+      }
+""" + OWNERSHIP_FIELDS + STRUCTURED_PROPERTIES_FIELDS + """
+    }
+""",
+    "TAG": """
+    ... on Tag {
+      name
+      description
+      properties { name description colorHex }
+""" + OWNERSHIP_FIELDS + STRUCTURED_PROPERTIES_FIELDS + """
+    }
+""",
+    "STRUCTURED_PROPERTY": """
+    ... on StructuredPropertyEntity {
+      definition {
+        displayName
+        qualifiedName
+        description
+        cardinality
+        immutable
+        valueType { urn }
+        entityTypes { urn }
+        typeQualifier { allowedTypes { urn } }
+        allowedValues {
+          value {
+            ... on StringValue { stringValue }
+            ... on NumberValue { numberValue }
+          }
+          description
+        }
+      }
+      settings {
+        isHidden
+        showInSearchFilters
+        showAsAssetBadge
+        showInAssetSummary
+        showInColumnsTable
+      }
+    }
+""",
+    "DATA_PRODUCT": """
+    ... on DataProduct {
+      properties { name description externalUrl }
+      domain { domain { urn } }
+      institutionalMemory { elements { url label } }
+""" + OWNERSHIP_FIELDS + STRUCTURED_PROPERTIES_FIELDS + """
+    }
+""",
+    "TEST": """
+    ... on Test {
+      name
+      description
+      category
+      definition { json }
+    }
+""",
+}
+
+MIRROR_QUERY = """
+query mirrorEntities($input: ScrollAcrossEntitiesInput!) {
+  scrollAcrossEntities(input: $input) {
+    nextScrollId
+    count
+    total
+    searchResults {
+      entity {
+        urn
+        type
+        %s
+      }
+    }
+  }
+}
+"""
+
+# Entity types mirrored with all their fields
+MIRROR_ENTITY_TYPES = tuple(ENTITY_FIELDS)
+
+# Entity types whose tag, glossary term and domain associations are mirrored
+ASSOCIATED_ENTITY_TYPES = {
+    "DATASET": "Dataset",
+    "CHART": "Chart",
+    "DASHBOARD": "Dashboard",
+    "DATA_JOB": "DataJob",
+    "DATA_FLOW": "DataFlow",
+    "CONTAINER": "Container",
+}
+
+ASSOCIATION_FIELDS = """
+      properties { name }
+      tags { tags { tag { urn } } }
+      glossaryTerms { terms { term { urn } } }
+      domain { domain { urn } }
+"""
+
+# Only entities with at least one association are mirrored
+ASSOCIATION_FILTERS = [
+    {"and": [{"field": field, "condition": "EXISTS"}]}
+    for field in ("tags", "glossaryTerms", "domains")
+]
+
+# Name of the sync_state row of the associated entities
+ASSOCIATIONS = "ASSOCIATIONS"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entities (
+    urn TEXT PRIMARY KEY,
+    entity_type TEXT NOT NULL,
+    name TEXT,
+    fingerprint TEXT NOT NULL,
+    data TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entities_by_type ON entities (entity_type, urn);
+CREATE TABLE IF NOT EXISTS edges (
+    source_urn TEXT NOT NULL,
+    relation TEXT NOT NULL,
+    target_urn TEXT NOT NULL,
+    PRIMARY KEY (source_urn, relation, target_urn)
+);
+CREATE INDEX IF NOT EXISTS edges_by_target ON edges (relation, target_urn);
+CREATE TABLE IF NOT EXISTS sync_state (
+    entity_type TEXT PRIMARY KEY,
+    synced_at REAL NOT NULL,
+    total INTEGER NOT NULL,
+    changed INTEGER NOT NULL,
+    removed INTEGER NOT NULL
+);
+"""
+
+
+def mirror_path(mirror_dir: str, server_url: str) -> Path:
+    """
+    Path of the mirror of a DataHub instance (e.g. datahub-gms-8080.sqlite3)
+
+    Args:
+        mirror_dir: Directory holding the mirrors
+        server_url: DataHub server URL
+
+    Returns:
+        Path of the mirror database
+    """
+    slug = re.sub(r"[^A-Za-z0-9]+", "-", re.sub(r"^\w+://", "", server_url)).strip("-")
+    return Path(mirror_dir) / f"{slug}.sqlite3"
+
+
+def entity_name(entity: Dict[str, Any]) -> Optional[str]:
+    """Display name of a mirrored entity"""
+    properties = entity.get("properties") or {}
+    definition = entity.get("definition") or {}
+    return (
+        properties.get("name")
+        or entity.get("name")
+        or definition.get("displayName")
+        or definition.get("qualifiedName")
+    )
+
+
+def _owner_name(owner: Dict[str, Any]) -> str:
+    """Display name of an owner (user or group), falling back to the id in its URN"""
+    return (
+        (owner.get("properties") or {}).get("displayName")
+        or owner.get("username")
+        or owner.get("name")
+        or (owner.get("urn") or "").split(":")[-1]
+    )
+
+
+def entity_edges(entity: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Association edges of an entity
+
+    Args:
+        entity: Entity as returned by the mirror query
+
+    Returns:
+        (relation, target URN) pairs; relations are tag, glossaryTerm, domain,
+        parentNode, parentDomain and owner
+    """
+    def urns(container: Any, key: str, inner: Optional[str] = None) -> List[str]:
+        items = (container or {}).get(key) or []
+        found = []
+        for item in items:
+            target = (item or {}).get(inner) if inner else item
+            if isinstance(target, dict) and target.get("urn"):
+                found.append(target["urn"])
+        return found
+
+    edges = []
+    edges += [("tag", urn) for urn in urns(entity.get("tags"), "tags", "tag")]
+    edges += [("glossaryTerm", urn) for urn in urns(entity.get("glossaryTerms"), "terms", "term")]
+    edges += [("parentNode", urn) for urn in urns(entity.get("parentNodes"), "nodes")]
+    edges += [("parentDomain", urn) for urn in urns(entity.get("parentDomains"), "domains")]
+    edges += [("owner", urn) for urn in urns(entity.get("ownership"), "owners", "owner")]
+    domain = ((entity.get("domain") or {}).get("domain") or {}).get("urn")
+    if domain:
+        edges.append(("domain", domain))
+    return sorted(set(edges))
+
+
+def scroll_entities(
+    client: Any,
+    entity_types: Iterable[str],
+    fields: str,
+    page_size: int = DEFAULT_SCROLL_SIZE,
+    or_filters: Optional[List[Dict[str, Any]]] = None,
+    sort_by_urn: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Scroll through all entities of some types
+
+    Unlike start/count search paging, scrolling is not capped at 10,000 results.
+
+    Args:
+        client: Anything with execute_graphql (e.g. DataHubRestClient)
+        entity_types: GraphQL entity types (e.g. GLOSSARY_TERM)
+        fields: GraphQL fields selected on each entity
+        page_size: Number of entities per request
+        or_filters: Search filters (optional)
+        sort_by_urn: Ask the server to return the entities sorted by URN
+
+    Yields:
+        Entity dictionaries
+    """
+    query = MIRROR_QUERY % fields
+    scroll_id = None
+    while True:
+        variables = {"input": {"types": list(entity_types), "query": "*", "count": page_size}}
+        if scroll_id:
+            variables["input"]["scrollId"] = scroll_id
+        if or_filters:
+            variables["input"]["orFilters"] = or_filters
+        if sort_by_urn:
+            variables["input"]["sortInput"] = {
+                "sortCriterion": {"field": "urn", "sortOrder": "ASCENDING"}
+            }
+
+        result = client.execute_graphql(query, variables)
+        if not result or result.get("errors"):
+            errors = [error.get("message", "Unknown error") for error in (result or {}).get("errors", [])]
+            raise RuntimeError(
+                f"Failed to scroll {', '.join(entity_types)} entities: {', '.join(errors) or 'no response'}"
+            )
+
+        scroll = (result.get("data") or {}).get("scrollAcrossEntities") or {}
+        entities = [item.get("entity") for item in scroll.get("searchResults") or [] if item.get("entity")]
+        yield from entities
+
+        scroll_id = scroll.get("nextScrollId")
+        if not entities or not scroll_id:
+            return
+
+
+def _batches(items: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Consecutive lists of up to size items, consuming the iterable lazily"""
+    iterator = iter(items)
+    while True:
+        batch = list(islice(iterator, max(1, size)))
+        if not batch:
+            return
+        yield batch
+
+
+class MetadataMirror:
+    """SQLite mirror of the metadata of one DataHub instance"""
+
+    def __init__(self, path: str):
+        """
+        Open (and create if needed) a mirror
+
+        Args:
+            path: Path of the SQLite database
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        """Close the database"""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _query(self, sql: str, params: Iterable[Any] = ()) -> List[Tuple]:
+        with self._lock:
+            return self._db.execute(sql, tuple(params)).fetchall()
+
+    # Sync
+
+    def sync(
+        self,
+        client: Any,
+        entity_types: Optional[Iterable[str]] = None,
+        associations: bool = True,
+        page_size: int = DEFAULT_SCROLL_SIZE,
+        max_workers: int = DEFAULT_MIRROR_WORKERS,
+    ) -> Dict[str, Dict[str, int]]:
+        """
+        Refresh the mirror from DataHub
+
+        The entity types are fetched concurrently, each one written to the
+        database page by page as it is scrolled through, so memory does not
+        grow with the size of the catalog. Only the changed entities are
+        rewritten; the ones no longer listed are removed once a listing is complete.
+
+        Args:
+            client: Anything with execute_graphql (e.g. DataHubRestClient)
+            entity_types: Entity types to refresh (default: MIRROR_ENTITY_TYPES)
+            associations: Also refresh the entities associated with tags, terms and domains
+            page_size: Number of entities per scroll request
+            max_workers: Number of entity types fetched concurrently
+
+        Returns:
+            {entity type: {"total", "changed", "removed"}}, plus an "errors" entry
+            mapping the entity types that failed to their error
+        """
+        jobs = {entity_type: (entity_type,) for entity_type in (entity_types or MIRROR_ENTITY_TYPES)}
+        if associations:
+            jobs[ASSOCIATIONS] = tuple(ASSOCIATED_ENTITY_TYPES)
+
+        def fetch(name: str) -> Dict[str, int]:
+            if name == ASSOCIATIONS:
+                fields = "\n".join(
+                    f"... on {graphql_type} {{{ASSOCIATION_FIELDS}}}"
+                    for graphql_type in ASSOCIATED_ENTITY_TYPES.values()
+                )
+                entities = scroll_entities(client, jobs[name], fields, page_size, ASSOCIATION_FILTERS)
+            else:
+                entities = scroll_entities(client, jobs[name], ENTITY_FIELDS[name], page_size)
+            return self.replace_entities(name, jobs[name], entities, batch_size=page_size)
+
+        report: Dict[str, Any] = {}
+        errors = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(jobs)))) as executor:
+            futures = {executor.submit(fetch, name): name for name in jobs}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    report[name] = future.result()
+                except Exception as e:
+                    logger.error(f"Error fetching {name} for the mirror: {str(e)}")
+                    errors[name] = str(e)
+                    continue
+                logger.info(
+                    f"Mirrored {report[name]['total']} {name} entities: "
+                    f"{report[name]['changed']} changed, {report[name]['removed']} removed"
+                )
+
+        if errors:
+            report["errors"] = errors
+        return report
+
+    def replace_entities(
+        self,
+        name: str,
+        entity_types: Iterable[str],
+        entities: Iterable[Dict[str, Any]],
+        batch_size: int = DEFAULT_SCROLL_SIZE,
+    ) -> Dict[str, int]:
+        """
+        Make the mirrored entities of some types match a complete listing
+
+        The listing is consumed and written in batches of batch_size entities,
+        each in its own transaction, so it can be a generator over the scroll
+        requests. The URNs listed so far are kept in a temporary table rather
+        than in memory. If the listing fails part way, the batches written are
+        kept but nothing is removed and the sync is not recorded.
+
+        Args:
+            name: Name the sync is recorded under (entity type or ASSOCIATIONS)
+            entity_types: Entity types the listing covers
+            entities: All entities of the types
+            batch_size: Number of entities written per transaction
+
+        Returns:
+            {"total", "changed", "removed"} counts
+        """
+        entity_types = tuple(entity_types)
+        placeholders = ", ".join("?" for _ in entity_types)
+        now = time.time()
+        changed = 0
+
+        with self._lock, self._db:
+            self._db.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS listed (name TEXT NOT NULL, urn TEXT NOT NULL, PRIMARY KEY (name, urn))"
+            )
+            self._db.execute("DELETE FROM listed WHERE name = ?", (name,))
+
+        try:
+            for batch in _batches(entities, batch_size):
+                with self._lock, self._db:
+                    changed += self._write_batch(name, entity_types, batch, now)
+
+            with self._lock, self._db:
+                total = self._db.execute("SELECT COUNT(*) FROM listed WHERE name = ?", (name,)).fetchone()[0]
+                removed = self._db.execute(
+                    f"SELECT urn FROM entities WHERE entity_type IN ({placeholders}) "
+                    "AND urn NOT IN (SELECT urn FROM listed WHERE name = ?)",
+                    entity_types + (name,),
+                ).fetchall()
+                self._db.executemany("DELETE FROM entities WHERE urn = ?", removed)
+                self._db.executemany("DELETE FROM edges WHERE source_urn = ?", removed)
+                self._db.execute(
+                    "INSERT OR REPLACE INTO sync_state (entity_type, synced_at, total, changed, removed) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (name, now, total, changed, len(removed)),
+                )
+        finally:
+            with self._lock, self._db:
+                self._db.execute("DELETE FROM listed WHERE name = ?", (name,))
+
+        return {"total": total, "changed": changed, "removed": len(removed)}
+
+    def _write_batch(
+        self, name: str, entity_types: Tuple[str, ...], entities: List[Dict[str, Any]], now: float
+    ) -> int:
+        """Write the changed entities of one batch of a listing (lock and transaction held by the caller)"""
+        urns = list(dict.fromkeys(entity.get("urn") for entity in entities if entity.get("urn")))
+        known = dict(self._db.execute(
+            f"SELECT urn, fingerprint FROM entities WHERE urn IN ({', '.join('?' for _ in urns)})", urns
+        ).fetchall()) if urns else {}
+
+        changed = 0
+        for entity in entities:
+            urn = entity.get("urn")
+            if not urn:
+                continue
+            # Skip URNs already listed in this or an earlier batch
+            if self._db.execute("INSERT OR IGNORE INTO listed (name, urn) VALUES (?, ?)", (name, urn)).rowcount == 0:
+                continue
+            fingerprint = entity_fingerprint(entity)
+            if known.get(urn) == fingerprint:
+                continue
+
+            changed += 1
+            self._db.execute(
+                "INSERT OR REPLACE INTO entities (urn, entity_type, name, fingerprint, data, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (urn, entity.get("type") or entity_types[0], entity_name(entity), fingerprint,
+                 json.dumps(entity, sort_keys=True), now),
+            )
+            self._db.execute("DELETE FROM edges WHERE source_urn = ?", (urn,))
+            self._db.executemany(
+                "INSERT INTO edges (source_urn, relation, target_urn) VALUES (?, ?, ?)",
+                [(urn, relation, target) for relation, target in entity_edges(entity)],
+            )
+        return changed
+
+    # Queries
+
+    def status(self) -> Dict[str, Dict[str, Any]]:
+        """Last sync of each entity type: {entity type: {"synced_at", "total", "changed", "removed"}}"""
+        return {
+            entity_type: {"synced_at": synced_at, "total": total, "changed": changed, "removed": removed}
+            for entity_type, synced_at, total, changed, removed in self._query(
+                "SELECT entity_type, synced_at, total, changed, removed FROM sync_state ORDER BY entity_type"
+            )
+        }
+
+    def is_fresh(self, entity_type: str, max_age_seconds: float) -> bool:
+        """Whether an entity type was synced less than max_age_seconds ago"""
+        rows = self._query("SELECT synced_at FROM sync_state WHERE entity_type = ?", (entity_type,))
+        return bool(rows) and time.time() - rows[0][0] <= max_age_seconds
+
+    def get(self, urn: str) -> Optional[Dict[str, Any]]:
+        """Mirrored entity with the given URN, or None"""
+        rows = self._query("SELECT data FROM entities WHERE urn = ?", (urn,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def iter_entities(self, entity_type: str, page_size: int = DEFAULT_SCROLL_SIZE) -> Iterator[Dict[str, Any]]:
+        """Mirrored entities of a type, sorted by URN, read page by page"""
+        last_urn = ""
+        while True:
+            rows = self._query(
+                "SELECT urn, data FROM entities WHERE entity_type = ? AND urn > ? ORDER BY urn LIMIT ?",
+                (entity_type, last_urn, page_size),
+            )
+            for last_urn, data in rows:
+                yield json.loads(data)
+            if len(rows) < page_size:
+                return
+
+    def entities(self, entity_type: str) -> List[Dict[str, Any]]:
+        """Mirrored entities of a type, sorted by URN"""
+        return list(self.iter_entities(entity_type))
+
+    def changed_since(self, timestamp: float, entity_type: Optional[str] = None) -> List[str]:
+        """
+        URNs of the entities that changed in syncs after a time
+
+        Args:
+            timestamp: Epoch seconds
+            entity_type: Only entities of this type (optional)
+
+        Returns:
+            Sorted list of URNs
+        """
+        sql = "SELECT urn FROM entities WHERE updated_at > ?"
+        params: List[Any] = [timestamp]
+        if entity_type:
+            sql += " AND entity_type = ?"
+            params.append(entity_type)
+        return [urn for (urn,) in self._query(sql + " ORDER BY urn", params)]
+
+    def related(self, relation: str, target_urn: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Mirrored entities with an edge to a target
+
+        Args:
+            relation: Edge relation (tag, glossaryTerm, domain, parentNode, parentDomain, owner)
+            target_urn: URN the edge points to
+            entity_type: Only entities of this type (optional)
+
+        Returns:
+            Entities sorted by URN
+        """
+        sql = (
+            "SELECT e.data FROM edges AS r JOIN entities AS e ON e.urn = r.source_urn "
+            "WHERE r.relation = ? AND r.target_urn = ?"
+        )
+        params: List[Any] = [relation, target_urn]
+        if entity_type:
+            sql += " AND e.entity_type = ?"
+            params.append(entity_type)
+        return [json.loads(data) for (data,) in self._query(sql + " ORDER BY e.urn", params)]
+
+    def entities_with_tag(self, tag_urn: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entities tagged with a tag"""
+        return self.related("tag", tag_urn, entity_type)
+
+    def entities_with_glossary_term(self, term_urn: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entities with a glossary term"""
+        return self.related("glossaryTerm", term_urn, entity_type)
+
+    def entities_in_domain(self, domain_urn: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Entities in a domain (not including its subdomains)"""
+        return self.related("domain", domain_urn, entity_type)
+
+    def children(self, node_urn: str) -> List[Dict[str, Any]]:
+        """Glossary nodes and terms directly under a glossary node"""
+        return self.related("parentNode", node_urn)
+
+    # Read methods of the DataHub clients, so the mirror can stand in for a client
+
+    def list_domains(self) -> List[Dict[str, Any]]:
+        return self.entities("DOMAIN")
+
+    def list_glossary_nodes(self) -> List[Dict[str, Any]]:
+        return self.entities("GLOSSARY_NODE")
+
+    def list_glossary_terms(self) -> List[Dict[str, Any]]:
+        return self.entities("GLOSSARY_TERM")
+
+    def list_data_products(self) -> List[Dict[str, Any]]:
+        return self.entities("DATA_PRODUCT")
+
+    def list_tags(self, query: str = "*") -> List[Dict[str, Any]]:
+        """
+        Mirrored tags in the shape of DataHubRestClient.list_tags
+
+        Args:
+            query: Case-insensitive text matched against the tag name and URN ("*" for all)
+
+        Returns:
+            Tags with name, description, colorHex, owners_count and owner_names
+        """
+        needle = "" if query in (None, "", "*") else query.strip("*").lower()
+        tags = []
+        for entity in self.iter_entities("TAG"):
+            properties = entity.get("properties") or {}
+            name = properties.get("name") or entity.get("name")
+            if needle and needle not in (name or "").lower() and needle not in entity["urn"].lower():
+                continue
+            owners = (entity.get("ownership") or {}).get("owners") or []
+            tags.append(dict(
+                entity,
+                name=name,
+                description=properties.get("description") or entity.get("description"),
+                colorHex=properties.get("colorHex"),
+                owners_count=len(owners),
+                owner_names=[_owner_name(owner.get("owner") or {}) for owner in owners if owner],
+            ))
+        return tags
+
+    def export_domain(self, urn: str) -> Optional[Dict[str, Any]]:
+        return self.get(urn)
+
+    def export_glossary_node(self, urn: str) -> Optional[Dict[str, Any]]:
+        return self.get(urn)
+
+    def export_glossary_term(self, urn: str) -> Optional[Dict[str, Any]]:
+        return self.get(urn)
+
+    def export_tag(self, urn: str) -> Optional[Dict[str, Any]]:
+        return self.get(urn)
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+Catalog of the data platforms and platform instances of a DataHub instance.
+
+The platforms, platform instances and entity counts per type are read from the
+aggregateAcrossEntities facets of DataHub search in one request, instead of
+scanning search results:
+
+    catalog = fetch_platform_catalog(client, entity_type="DATASET")
+    catalog.platform_names()
+    catalog.instance_names("snowflake")
+
+PlatformCatalogCache keeps one catalog per connection and entity type in
+memory. A catalog older than refresh_after is still served while a background
+thread fetches a new one, so filter dropdowns never wait on DataHub once the
+catalog has been fetched.
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.usage_counts import DEFAULT_MAX_AGG_VALUES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REFRESH_SECONDS = 300
+DEFAULT_MAX_AGE_SECONDS = 3600
+
+PLATFORM_FACET = "platform"
+INSTANCE_FACET = "platformInstance"
+ENTITY_TYPE_FACET = "_entityType"
+
+PLATFORM_CATALOG_QUERY = """
+query platformCatalog($input: AggregateAcrossEntitiesInput!) {
+  aggregateAcrossEntities(input: $input) {
+    facets {
+      field
+      aggregations {
+        value
+        count
+        entity {
+          urn
+          ... on DataPlatform {
+            name
+            properties {
+              displayName
+            }
+          }
+          ... on DataPlatformInstance {
+            instanceId
+            platform {
+              name
+            }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+
+def parse_platform_urn(urn: str) -> str:
+    """Platform name of a data platform URN (urn:li:dataPlatform:snowflake -> snowflake)"""
+    return urn.split("urn:li:dataPlatform:", 1)[-1]
+
+
+def parse_instance_urn(urn: str) -> Optional[Tuple[str, str]]:
+    """
+    Platform name and instance id of a platform instance URN
+
+    urn:li:dataPlatformInstance:(urn:li:dataPlatform:snowflake,prod) -> ("snowflake", "prod")
+    """
+    prefix = "urn:li:dataPlatformInstance:("
+    if not urn.startswith(prefix) or not urn.endswith(")"):
+        return None
+    platform_urn, _, instance_id = urn[len(prefix):-1].partition(",")
+    if not instance_id:
+        return None
+    return parse_platform_urn(platform_urn), instance_id
+
+
+@dataclass
+class PlatformCatalog:
+    """Platforms, platform instances and entity counts of one entity type (or all types)"""
+    entity_type: Optional[str] = None
+    # Platform name -> number of entities
+    platforms: Dict[str, int] = field(default_factory=dict)
+    # Platform name -> instance id -> number of entities
+    instances: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    # Entity type -> number of entities
+    entity_types: Dict[str, int] = field(default_factory=dict)
+    fetched_at: float = field(default_factory=time.time)
+
+    def age(self) -> float:
+        """Seconds since the catalog was fetched"""
+        return time.time() - self.fetched_at
+
+    def platform_names(self) -> List[str]:
+        """Sorted names of the platforms"""
+        return sorted(self.platforms)
+
+    def instance_names(self, platform: Optional[str] = None) -> List[str]:
+        """Sorted ids of the instances of a platform (case-insensitive), or of all platforms"""
+        names = set()
+        for platform_name, instances in self.instances.items():
+            if platform is None or platform_name.lower() == platform.lower():
+                names.update(instances)
+        return sorted(names)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serialisable form of the catalog"""
+        return {
+            "entity_type": self.entity_type,
+            "platforms": self.platforms,
+            "instances": self.instances,
+            "entity_types": self.entity_types,
+            "fetched_at": self.fetched_at,
+        }
+
+
+def fetch_platform_catalog(
+    client: Any,
+    entity_type: Optional[str] = None,
+    max_values: int = DEFAULT_MAX_AGG_VALUES,
+) -> PlatformCatalog:
+    """
+    Fetch the platform catalog of an entity type in one request
+
+    Args:
+        client: Anything with execute_graphql (e.g. DataHubRestClient)
+        entity_type: Only count entities of this type (default: all)
+        max_values: Maximum number of values returned per facet
+
+    Returns:
+        The catalog
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    aggregate_input: Dict[str, Any] = {
+        "query": "*",
+        "facets": [PLATFORM_FACET, INSTANCE_FACET, ENTITY_TYPE_FACET],
+        "searchFlags": {"maxAggValues": max_values, "skipCache": False},
+    }
+    if entity_type:
+        aggregate_input["types"] = [entity_type]
+
+    result = client.execute_graphql(PLATFORM_CATALOG_QUERY, {"input": aggregate_input})
+    aggregation = ((result or {}).get("data") or {}).get("aggregateAcrossEntities")
+    if aggregation is None:
+        errors = [error.get("message", "Unknown error") for error in (result or {}).get("errors") or []]
+        raise ValueError(f"Unexpected response to platform catalog query: {', '.join(errors) or result}")
+
+    catalog = PlatformCatalog(entity_type=entity_type)
+    for facet in aggregation.get("facets") or []:
+        facet_field = (facet or {}).get("field")
+        for agg in facet.get("aggregations") or []:
+            value = (agg or {}).get("value")
+            if not value:
+                continue
+            count = int(agg.get("count") or 0)
+            entity = agg.get("entity") or {}
+
+            if facet_field == PLATFORM_FACET:
+                name = entity.get("name") or parse_platform_urn(value)
+                catalog.platforms[name] = catalog.platforms.get(name, 0) + count
+            elif facet_field == INSTANCE_FACET:
+                parsed = parse_instance_urn(value)
+                if entity.get("instanceId") and (entity.get("platform") or {}).get("name"):
+                    parsed = (entity["platform"]["name"], entity["instanceId"])
+                if parsed:
+                    platform_name, instance_id = parsed
+                    catalog.instances.setdefault(platform_name, {})[instance_id] = count
+            elif facet_field == ENTITY_TYPE_FACET:
+                catalog.entity_types[value.upper()] = count
+
+    return catalog
+
+
+class PlatformCatalogCache:
+    """
+    In-memory platform catalogs per DataHub server and entity type
+
+    A missing catalog, or one older than max_age, is fetched before returning.
+    A catalog older than refresh_after is returned as is while a background
+    thread replaces it. If a fetch fails the previous catalog is kept.
+    """
+
+    def __init__(self, refresh_after: float = DEFAULT_REFRESH_SECONDS, max_age: float = DEFAULT_MAX_AGE_SECONDS):
+        self.refresh_after = refresh_after
+        self.max_age = max_age
+        self._catalogs: Dict[Tuple[str, str], PlatformCatalog] = {}
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def get(self, client: Any, entity_type: Optional[str] = None, force_refresh: bool = False) -> Optional[PlatformCatalog]:
+        """
+        Get the catalog of an entity type for the client's server
+
+        Args:
+            client: DataHub client (must have server_url and execute_graphql)
+            entity_type: Entity type of the catalog (default: all types)
+            force_refresh: Fetch the catalog even if a recent one is cached
+
+        Returns:
+            The catalog, or None if it could not be fetched and none is cached
+        """
+        key = (str(client.server_url), entity_type or "")
+        with self._lock:
+            catalog = self._catalogs.get(key)
+
+        if catalog is None or force_refresh or catalog.age() > self.max_age:
+            return self._refresh(client, key, entity_type) or catalog
+        if catalog.age() > self.refresh_after:
+            self._refresh_in_background(client, key, entity_type)
+        return catalog
+
+    def clear(self) -> None:
+        """Drop all cached catalogs"""
+        with self._lock:
+            self._catalogs.clear()
+
+    def _refresh(self, client: Any, key: Tuple[str, str], entity_type: Optional[str]) -> Optional[PlatformCatalog]:
+        try:
+            catalog = fetch_platform_catalog(client, entity_type)
+        except Exception as e:
+            logger.warning(f"Error fetching platform catalog of {key[0]} ({entity_type or 'all types'}): {str(e)}")
+            return None
+
+        with self._lock:
+            self._catalogs[key] = catalog
+        logger.debug(
+            f"Fetched platform catalog of {key[0]} ({entity_type or 'all types'}): "
+            f"{len(catalog.platforms)} platforms, {sum(len(i) for i in catalog.instances.values())} instances"
+        )
+        return catalog
+
+    def _refresh_in_background(self, client: Any, key: Tuple[str, str], entity_type: Optional[str]) -> None:
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def refresh():
+            try:
+                self._refresh(client, key, entity_type)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=refresh, name="platform-catalog-refresh", daemon=True).start()
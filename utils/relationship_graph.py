@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+In-memory index of the relationships between DataHub entities.
+
+The graph is built once from a flat list of entities (as returned by the
+DataHub clients, the metadata mirror or an export) and keeps adjacency lists in
+both directions for each relation:
+
+- parentNode: glossary node or term -> its parent glossary node
+- parentDomain: domain -> its parent domain
+- domain: entity -> the domain it belongs to
+- isA, hasA, relatedTo: glossary term -> related glossary term
+
+Lookups of parents, children, members and related terms are dictionary
+lookups, and hierarchy queries (depth, subtree, orphans, cycles, dependency
+levels) are linear in the size of the graph, so hierarchy checks on large
+glossaries don't need nested loops over the entity lists.
+"""
+
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PARENT_NODE = "parentNode"
+PARENT_DOMAIN = "parentDomain"
+DOMAIN = "domain"
+IS_A = "isA"
+HAS_A = "hasA"
+RELATED_TO = "relatedTo"
+
+# Relationship types of the DataHub graph, as returned by the relationships field
+TERM_RELATIONSHIP_TYPES = {
+    "isa": IS_A,
+    "hasa": HAS_A,
+    "relatedto": RELATED_TO,
+}
+
+
+def _urn_of(value: Any) -> Optional[str]:
+    """URN of a reference given as a string or as a {"urn": ...} dictionary"""
+    if isinstance(value, str):
+        return value or None
+    if isinstance(value, dict):
+        return value.get("urn")
+    return None
+
+
+def _urns_of(container: Any, key: str) -> List[str]:
+    """URNs of a GraphQL list field, e.g. parentNodes {nodes {urn}} or a plain list of references"""
+    if isinstance(container, dict):
+        container = container.get(key)
+    if not isinstance(container, list):
+        return []
+    return [urn for urn in (_urn_of(item) for item in container) if urn]
+
+
+def entity_type_of(urn: str) -> Optional[str]:
+    """Entity type of a URN (e.g. glossaryTerm for urn:li:glossaryTerm:...)"""
+    parts = urn.split(":", 3) if urn else []
+    return parts[2] if len(parts) > 3 and parts[0] == "urn" else None
+
+
+def parent_node_urn(entity: Dict[str, Any]) -> Optional[str]:
+    """
+    Parent glossary node of a glossary node or term
+
+    Accepts the formats returned by the different clients and views:
+    parentNodes {nodes [...]}, a parentNodes list, parentNode {urn},
+    parent_node_urn and parent_urn.
+    """
+    parents = _urns_of(entity.get("parentNodes"), "nodes")
+    if parents:
+        return parents[0]
+    return (
+        _urn_of(entity.get("parentNode"))
+        or entity.get("parent_node_urn")
+        or entity.get("parent_urn")
+        or None
+    )
+
+
+def parent_domain_urn(entity: Dict[str, Any]) -> Optional[str]:
+    """
+    Parent domain of a domain
+
+    Accepts parentDomain (URN or {urn}), parentDomains {domains [...]},
+    parent_domain_urn and incoming ParentOf/Contains relationships from a domain.
+    """
+    parent = _urn_of(entity.get("parentDomain"))
+    if parent:
+        return parent
+    parents = _urns_of(entity.get("parentDomains"), "domains")
+    if parents:
+        return parents[0]
+    if entity.get("parent_domain_urn"):
+        return entity["parent_domain_urn"]
+    for relationship in (entity.get("parentRelationships") or {}).get("relationships") or []:
+        if relationship and relationship.get("type") in ("ParentOf", "Contains"):
+            related = relationship.get("entity") or {}
+            if related.get("type") == "DOMAIN" and related.get("urn"):
+                return related["urn"]
+    return None
+
+
+def domain_urns(entity: Dict[str, Any]) -> List[str]:
+    """
+    Domains an entity belongs to
+
+    Accepts domain {domain {urn}}, domain {urn}, domains {domains [...]} and
+    domains {domain {urn}}.
+    """
+    found = []
+    domain = entity.get("domain")
+    if isinstance(domain, dict):
+        found.append(_urn_of(domain.get("domain")) or domain.get("urn"))
+    domains = entity.get("domains")
+    if isinstance(domains, dict):
+        found.extend(_urns_of(domains, "domains"))
+        found.append(_urn_of(domains.get("domain")))
+    return list(dict.fromkeys(urn for urn in found if urn))
+
+
+def term_relationships(entity: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Outgoing isA, hasA and relatedTo relationships of a glossary term
+
+    Accepts the relationships field (as a {relationships [...]} structure or
+    an already processed list) and the isRelatedTerms/hasRelatedTerms aliases.
+
+    Returns:
+        (relation, related term URN) pairs
+    """
+    edges = []
+    relationships = entity.get("relationships")
+    if isinstance(relationships, dict):
+        relationships = relationships.get("relationships")
+    for relationship in relationships or []:
+        if not isinstance(relationship, dict) or relationship.get("direction") == "INCOMING":
+            continue
+        relation = TERM_RELATIONSHIP_TYPES.get(str(relationship.get("type", "")).lower())
+        target = _urn_of(relationship.get("entity"))
+        if relation and target:
+            edges.append((relation, target))
+
+    for field, relation in (("isRelatedTerms", IS_A), ("hasRelatedTerms", HAS_A)):
+        for relationship in (entity.get(field) or {}).get("relationships") or []:
+            target = _urn_of((relationship or {}).get("entity"))
+            if target:
+                edges.append((relation, target))
+    return list(dict.fromkeys(edges))
+
+
+def entity_relationships(entity: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    All indexed relationships of an entity
+
+    Args:
+        entity: Entity dictionary with an urn
+
+    Returns:
+        (relation, target URN) pairs
+    """
+    urn = entity.get("urn")
+    entity_type = entity_type_of(urn) if urn else None
+    edges = []
+    if entity_type == "domain":
+        parent = parent_domain_urn(entity)
+        if parent:
+            edges.append((PARENT_DOMAIN, parent))
+    else:
+        if entity_type in ("glossaryNode", "glossaryTerm"):
+            parent = parent_node_urn(entity)
+            if parent:
+                edges.append((PARENT_NODE, parent))
+        edges.extend((DOMAIN, domain) for domain in domain_urns(entity))
+    if entity_type == "glossaryTerm":
+        edges.extend(term_relationships(entity))
+    return edges
+
+
+class RelationshipGraph:
+    """Adjacency lists of entity relationships, in both directions"""
+
+    def __init__(self):
+        self._entities: Dict[str, Optional[Dict[str, Any]]] = {}
+        # relation -> source URN -> target URNs, and relation -> target URN -> source URNs
+        self._targets: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        self._sources: Dict[str, Dict[str, List[str]]] = defaultdict(lambda: defaultdict(list))
+        self._depths: Dict[Tuple[str, str], int] = {}
+
+    @classmethod
+    def from_entities(cls, entities: Iterable[Dict[str, Any]]) -> "RelationshipGraph":
+        """
+        Index the relationships of a list of entities
+
+        Args:
+            entities: Entity dictionaries (GraphQL wrappers {"entity": ...} are unwrapped)
+
+        Returns:
+            The graph
+        """
+        graph = cls()
+        for entity in entities:
+            graph.add_entity(entity)
+        return graph
+
+    def add_node(self, urn: str, entity: Optional[Dict[str, Any]] = None) -> None:
+        """Add an entity to the graph without indexing its relationships"""
+        if entity is not None or urn not in self._entities:
+            self._entities[urn] = entity
+
+    def add_entity(self, entity: Dict[str, Any]) -> None:
+        """Add an entity and index its relationships"""
+        if isinstance(entity, dict) and isinstance(entity.get("entity"), dict):
+            entity = entity["entity"]
+        if not isinstance(entity, dict) or not entity.get("urn"):
+            return
+        self.add_node(entity["urn"], entity)
+        for relation, target in entity_relationships(entity):
+            self.add_edge(entity["urn"], relation, target)
+
+    def add_edge(self, source: str, relation: str, target: str) -> None:
+        """Add a relationship from source to target"""
+        if target in self._targets[relation][source]:
+            return
+        self._targets[relation][source].append(target)
+        self._sources[relation][target].append(source)
+        self._depths.clear()
+
+    def __contains__(self, urn: str) -> bool:
+        return urn in self._entities
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+    def urns(self, entity_type: Optional[str] = None) -> List[str]:
+        """URNs of the entities in the graph, optionally only those of a type (e.g. glossaryTerm)"""
+        if entity_type is None:
+            return list(self._entities)
+        return [urn for urn in self._entities if entity_type_of(urn) == entity_type]
+
+    def entity(self, urn: str) -> Optional[Dict[str, Any]]:
+        """Entity dictionary of a URN, if it was added with one"""
+        return self._entities.get(urn)
+
+    def name(self, urn: str) -> Optional[str]:
+        """Display name of an entity (properties.name, then name)"""
+        entity = self._entities.get(urn) or {}
+        return (entity.get("properties") or {}).get("name") or entity.get("name")
+
+    def targets(self, urn: str, relation: str) -> List[str]:
+        """URNs an entity points to through a relation (e.g. the terms it isA)"""
+        return list(self._targets[relation].get(urn, ()))
+
+    def sources(self, urn: str, relation: str) -> List[str]:
+        """URNs pointing to an entity through a relation (e.g. the children of a node)"""
+        return list(self._sources[relation].get(urn, ()))
+
+    def parent(self, urn: str, relation: str = PARENT_NODE) -> Optional[str]:
+        """Parent of an entity in a hierarchy (parentNode or parentDomain)"""
+        parents = self._targets[relation].get(urn)
+        return parents[0] if parents else None
+
+    def children(self, urn: str, relation: str = PARENT_NODE) -> List[str]:
+        """Direct children of an entity in a hierarchy"""
+        return self.sources(urn, relation)
+
+    def members(self, domain_urn: str) -> List[str]:
+        """Entities that belong to a domain (not including its subdomains)"""
+        return self.sources(domain_urn, DOMAIN)
+
+    def roots(self, relation: str = PARENT_NODE, entity_type: Optional[str] = None) -> List[str]:
+        """Entities without a parent in a hierarchy"""
+        return [urn for urn in self.urns(entity_type) if not self._targets[relation].get(urn)]
+
+    def ancestors(self, urn: str, relation: str = PARENT_NODE) -> List[str]:
+        """Parents of an entity up to its root, nearest first (stops at a cycle)"""
+        ancestors = []
+        seen = {urn}
+        parent = self.parent(urn, relation)
+        while parent and parent not in seen:
+            ancestors.append(parent)
+            seen.add(parent)
+            parent = self.parent(parent, relation)
+        return ancestors
+
+    def depth(self, urn: str, relation: str = PARENT_NODE) -> int:
+        """Number of ancestors of an entity (0 for a root)"""
+        key = (relation, urn)
+        if key not in self._depths:
+            ancestors = self.ancestors(urn, relation)
+            # Depths along the chain are known too, as long as the chain has no cycle
+            if not ancestors or self.parent(ancestors[-1], relation) is None:
+                for index, ancestor in enumerate([urn] + ancestors):
+                    self._depths[(relation, ancestor)] = len(ancestors) - index
+            else:
+                self._depths[key] = len(ancestors)
+        return self._depths[key]
+
+    def subtree(self, urn: str, relation: str = PARENT_NODE) -> List[str]:
+        """All descendants of an entity, breadth first"""
+        descendants = []
+        seen = {urn}
+        queue = [urn]
+        while queue:
+            next_queue = []
+            for current in queue:
+                for child in self._sources[relation].get(current, ()):
+                    if child not in seen:
+                        seen.add(child)
+                        descendants.append(child)
+                        next_queue.append(child)
+            queue = next_queue
+        return descendants
+
+    def orphans(self, relation: str = PARENT_NODE) -> List[Tuple[str, str]]:
+        """(entity, target) pairs of the relationships whose target is not in the graph"""
+        return [
+            (source, target)
+            for source, targets in self._targets[relation].items()
+            for target in targets
+            if target not in self._entities
+        ]
+
+    def cycles(self, relation: str = PARENT_NODE) -> List[List[str]]:
+        """
+        Cycles of a relation, e.g. glossary nodes that are their own ancestor
+
+        Returns:
+            One list of URNs per cycle, in relationship order (a self reference is a one-entry cycle)
+        """
+        state: Dict[str, int] = {}  # 1 = on the current path, 2 = done
+        cycles = []
+        targets = self._targets[relation]
+        for start in list(targets):
+            if start in state:
+                continue
+            path: List[str] = []
+            stack = [(start, iter(targets.get(start, ())))]
+            state[start] = 1
+            path.append(start)
+            while stack:
+                urn, remaining = stack[-1]
+                for target in remaining:
+                    if state.get(target) == 1:
+                        cycles.append(path[path.index(target):])
+                    elif target not in state:
+                        state[target] = 1
+                        path.append(target)
+                        stack.append((target, iter(targets.get(target, ()))))
+                        break
+                else:
+                    stack.pop()
+                    path.pop()
+                    state[urn] = 2
+        return cycles
+
+    def topological_levels(self, relations: Iterable[str]) -> Tuple[List[List[str]], List[str]]:
+        """
+        Split the entities into levels that only point to entities of earlier levels
+
+        Relationships to entities outside the graph are ignored, so e.g. a term
+        whose parent node is not in the graph is in the first level.
+
+        Args:
+            relations: Relations followed, e.g. (PARENT_NODE,) for parents before children
+
+        Returns:
+            Tuple of (levels of URNs, URNs that are part of or depend on a cycle)
+        """
+        relations = tuple(relations)
+        remaining: Dict[str, int] = {}
+        for urn in self._entities:
+            remaining[urn] = len({
+                target
+                for relation in relations
+                for target in self._targets[relation].get(urn, ())
+                if target in self._entities and target != urn
+            })
+
+        level = sorted(urn for urn, count in remaining.items() if count == 0)
+        levels = []
+        while level:
+            levels.append(level)
+            next_level = []
+            for urn in level:
+                del remaining[urn]
+                dependents = {
+                    source
+                    for relation in relations
+                    for source in self._sources[relation].get(urn, ())
+                    if source in remaining and source != urn
+                }
+                for dependent in dependents:
+                    remaining[dependent] -= 1
+                    if remaining[dependent] == 0:
+                        next_level.append(dependent)
+            level = sorted(next_level)
+        return levels, sorted(remaining)
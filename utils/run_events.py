@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Helpers for assertion and metadata test run histories.
+
+DataHub returns assertion run events as one nested structure
+(runEvents { total, failed, succeeded, runEvents [...] }). These helpers turn it
+into flat, time-ordered run records that can be stored one row per run, shrink
+the structure to the summary worth keeping on the entity itself, and select the
+runs that retention and downsampling should remove from a history.
+"""
+
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_DAYS = 90
+DEFAULT_DOWNSAMPLE_AFTER_DAYS = 14
+
+
+def millis_to_datetime(timestamp_millis: Any) -> Optional[datetime]:
+    """
+    Convert epoch milliseconds to a timezone-aware UTC datetime
+
+    Args:
+        timestamp_millis: Epoch milliseconds (int, float or numeric string)
+
+    Returns:
+        The datetime, or None if the timestamp is missing or invalid
+    """
+    try:
+        return datetime.fromtimestamp(int(timestamp_millis) / 1000, tz=timezone.utc)
+    except (TypeError, ValueError, OverflowError, OSError):
+        return None
+
+
+def parse_run_events(run_events_data: Any) -> List[Dict[str, Any]]:
+    """
+    Flatten DataHub assertion run events into run records
+
+    Args:
+        run_events_data: runEvents structure of an assertion as returned by DataHub
+
+    Returns:
+        List of {"run_at", "status", "details"} dictionaries, most recent first;
+        events without a valid timestamp are skipped
+    """
+    if not isinstance(run_events_data, dict):
+        return []
+
+    records = []
+    for event in run_events_data.get("runEvents") or []:
+        if not isinstance(event, dict):
+            continue
+        run_at = millis_to_datetime(event.get("timestampMillis"))
+        if run_at is None:
+            continue
+        result = event.get("result") if isinstance(event.get("result"), dict) else {}
+        details = {
+            item["key"]: item["value"]
+            for item in result.get("nativeResults") or []
+            if isinstance(item, dict) and "key" in item and "value" in item
+        }
+        if result.get("externalUrl"):
+            details["externalUrl"] = result["externalUrl"]
+        records.append({
+            "run_at": run_at,
+            "status": result.get("type") or event.get("status") or "UNKNOWN",
+            "details": details,
+        })
+
+    records.sort(key=lambda record: record["run_at"], reverse=True)
+    return records
+
+
+def compact_run_events(run_events_data: Any) -> Dict[str, Any]:
+    """
+    Reduce a runEvents structure to the summary kept on the assertion row
+
+    The counts are kept as they are and only the most recent event is kept, so
+    the row stays the same size however long the history grows.
+
+    Args:
+        run_events_data: runEvents structure of an assertion as returned by DataHub
+
+    Returns:
+        The runEvents structure with at most one (the latest) event
+    """
+    if not isinstance(run_events_data, dict):
+        return {}
+
+    events = [
+        event for event in run_events_data.get("runEvents") or []
+        if isinstance(event, dict) and millis_to_datetime(event.get("timestampMillis"))
+    ]
+    latest = max(events, key=lambda event: int(event["timestampMillis"]), default=None)
+    compact = {key: value for key, value in run_events_data.items() if key != "runEvents"}
+    compact["runEvents"] = [latest] if latest else []
+    return compact
+
+
+def select_runs_to_prune(
+    runs: Iterable[Tuple[Any, Any, datetime]],
+    now: datetime,
+    retention_days: int = DEFAULT_RETENTION_DAYS,
+    downsample_after_days: int = DEFAULT_DOWNSAMPLE_AFTER_DAYS,
+) -> Set[Any]:
+    """
+    Select the runs that retention and downsampling remove from a history
+
+    Runs older than the retention are removed. Runs older than the downsampling
+    age are reduced to the most recent run of each owner and (UTC) day. Recent
+    runs are always kept.
+
+    Args:
+        runs: (run id, owner id, run time) tuples, e.g. (result id, assertion id, run_at)
+        now: Current time
+        retention_days: Age in days after which runs are removed (0 keeps runs forever)
+        downsample_after_days: Age in days after which runs are downsampled (0 disables downsampling)
+
+    Returns:
+        Set of the ids of the runs to remove
+    """
+    retention_cutoff = now - timedelta(days=retention_days) if retention_days > 0 else None
+    downsample_cutoff = now - timedelta(days=downsample_after_days) if downsample_after_days > 0 else None
+
+    to_prune = set()
+    kept_days = set()
+    for run_id, owner_id, run_at in sorted(runs, key=lambda run: run[2], reverse=True):
+        if retention_cutoff and run_at < retention_cutoff:
+            to_prune.add(run_id)
+        elif downsample_cutoff and run_at < downsample_cutoff:
+            day = (owner_id, run_at.astimezone(timezone.utc).date())
+            if day in kept_days:
+                to_prune.add(run_id)
+            else:
+                kept_days.add(day)
+    return to_prune
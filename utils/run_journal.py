@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Append-only JSON Lines journal of a long-running, resumable job.
+
+Each line is one event ({"event": ..., "at": ..., ...}). Events are flushed and
+fsynced as they are recorded, so a journal is consistent up to the last
+completed step even when the process is killed. Replaying the journal gives
+the run parameters, the completed chunks with their summaries, the stored
+per-chunk results (e.g. a resolved match table) and the acknowledged batch ids.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+
+def new_run_id() -> str:
+    """Generate a sortable, unique run id (e.g. 20240102-150405-1a2b3c)"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:6]}"
+
+
+class RunJournal:
+    """Journal of one run, stored as <journal_dir>/<run_id>.jsonl"""
+
+    def __init__(self, journal_dir: str, run_id: str):
+        """
+        Initialize the journal and replay any events already recorded
+
+        Args:
+            journal_dir: Directory holding the journals
+            run_id: Id of the run
+        """
+        self.run_id = run_id
+        self.path = Path(journal_dir) / f"{run_id}.jsonl"
+        self._lock = threading.Lock()
+
+        self.params: Dict[str, Any] = {}
+        self.completed_chunks: Dict[int, Dict[str, Any]] = {}
+        self.chunk_results: Dict[int, Dict[str, Any]] = {}
+        self.acked_batches: Set[str] = set()
+        self.completed = False
+        self._replay()
+
+    @classmethod
+    def start(cls, journal_dir: str, run_id: Optional[str] = None, **params: Any) -> "RunJournal":
+        """
+        Start the journal of a new run
+
+        Args:
+            journal_dir: Directory holding the journals
+            run_id: Id of the run (generated if not given)
+            **params: Run parameters, stored so a resumed run can check them
+
+        Returns:
+            The new journal
+        """
+        journal = cls(journal_dir, run_id or new_run_id())
+        if journal.path.exists():
+            raise ValueError(f"Run {journal.run_id} already exists; resume it instead")
+        journal.path.parent.mkdir(parents=True, exist_ok=True)
+        journal.record("run_started", params=params)
+        return journal
+
+    @classmethod
+    def resume(cls, journal_dir: str, run_id: str) -> "RunJournal":
+        """
+        Open the journal of an earlier run
+
+        Args:
+            journal_dir: Directory holding the journals
+            run_id: Id of the run to resume
+
+        Returns:
+            The journal, with the recorded progress replayed
+        """
+        journal = cls(journal_dir, run_id)
+        if not journal.path.exists():
+            available = ", ".join(cls.list_runs(journal_dir)) or "none"
+            raise ValueError(f"No journal found for run {run_id} in {journal_dir} (available runs: {available})")
+        logger.info(
+            f"Resuming run {run_id}: {len(journal.completed_chunks)} chunks completed, "
+            f"{len(journal.acked_batches)} batches acknowledged"
+        )
+        return journal
+
+    def _replay(self):
+        """Rebuild the run state from the recorded events"""
+        if not self.path.exists():
+            return
+        with open(self.path, "r") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # A line cut short by a crash is the last one; everything before it is valid
+                    logger.warning(f"Ignoring incomplete journal line {line_number} in {self.path}")
+                    continue
+                self._apply(event)
+
+    def _apply(self, event: Dict[str, Any]):
+        kind = event.get("event")
+        if kind == "run_started":
+            self.params = event.get("params") or {}
+        elif kind == "chunk_result":
+            self.chunk_results[event["chunk"]] = event.get("result")
+        elif kind == "batch_acked":
+            self.acked_batches.add(event["batch_id"])
+        elif kind == "chunk_completed":
+            self.completed_chunks[event["chunk"]] = event.get("summary") or {}
+        elif kind == "run_completed":
+            self.completed = True
+
+    def record(self, event: str, **data: Any):
+        """
+        Append an event to the journal and apply it to the run state
+
+        Args:
+            event: Event name (run_started, chunk_result, batch_acked, chunk_completed, run_completed)
+            **data: Event data
+        """
+        entry = {"event": event, "at": time.time(), **data}
+        line = json.dumps(entry, default=str)
+        with self._lock:
+            with open(self.path, "a") as f:
+                f.write(line + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            self._apply(entry)
+
+    def ack_batch(self, batch_id: str, mcp_count: int):
+        """Record that a batch of MCPs was accepted by the server"""
+        self.record("batch_acked", batch_id=batch_id, mcps=mcp_count)
+
+    @staticmethod
+    def list_runs(journal_dir: str) -> List[str]:
+        """Ids of the runs journaled in a directory, oldest first"""
+        directory = Path(journal_dir)
+        if not directory.exists():
+            return []
+        return sorted(path.stem for path in directory.glob("*.jsonl"))
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Paginated, filtered access to the schema fields of wide datasets.
+
+Tables with thousands of columns make a response carrying every field slow to
+build, send and render. Instead, the entity header and the schema fields are
+fetched separately, and the fields are served in pages:
+
+    version_key, editable = fetch_schema_state(client, urn)
+    version_key, fields = fetch_schema_fields(client, urn)  # cacheable under version_key
+    page = page_fields(apply_editable(fields, editable), version_key, count=100, has_tags=False)
+    page["next_cursor"]  # pass back as cursor to get the next page
+
+The parsed fields only change with the schemaMetadata aspect, so they can be
+cached under its version key. The version key and the field edits
+(editableSchemaMetadata) are small and fetched on every request; the edits are
+then laid over the cached fields.
+"""
+
+import base64
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+_TAGS_FIELDS = """
+            tags {
+              tags {
+                tag {
+                  urn
+                  properties {
+                    name
+                  }
+                }
+              }
+            }
+            glossaryTerms {
+              terms {
+                term {
+                  urn
+                }
+              }
+            }"""
+
+ENTITY_HEADER_QUERY = """
+query entityHeader($urn: String!) {
+  entity(urn: $urn) {
+    urn
+    type
+    ... on Dataset {
+      name
+      platform {
+        name
+      }
+      properties {
+        name
+        description
+      }
+      editableProperties {
+        name
+        description
+      }
+      schemaMetadata {
+        version
+        hash
+        createdAt
+      }
+    }
+    ... on Container {
+      properties {
+        name
+        description
+      }
+      editableProperties {
+        description
+      }
+    }
+    ... on Chart {
+      properties {
+        name
+        description
+      }
+      editableProperties {
+        description
+      }
+    }
+    ... on Dashboard {
+      properties {
+        name
+        description
+      }
+      editableProperties {
+        description
+      }
+    }
+    ... on DataFlow {
+      properties {
+        name
+        description
+      }
+      editableProperties {
+        description
+      }
+    }
+    ... on DataJob {
+      properties {
+        name
+        description
+      }
+      editableProperties {
+        description
+      }
+    }
+  }
+}
+"""
+
+SCHEMA_FIELDS_QUERY = """
+query schemaFields($urn: String!) {
+  dataset(urn: $urn) {
+    schemaMetadata {
+      version
+      hash
+      createdAt
+      fields {
+        fieldPath
+        type
+        nativeDataType
+        description
+        nullable
+        isPartOfKey""" + _TAGS_FIELDS + """
+      }
+    }
+  }
+}
+"""
+
+SCHEMA_STATE_QUERY = """
+query schemaState($urn: String!) {
+  dataset(urn: $urn) {
+    schemaMetadata {
+      version
+      hash
+      createdAt
+    }
+    editableSchemaMetadata {
+      editableSchemaFieldInfo {
+        fieldPath
+        description""" + _TAGS_FIELDS + """
+      }
+    }
+  }
+}
+"""
+
+
+def _execute(client: Any, query: str, urn: str, key: str) -> Optional[Dict[str, Any]]:
+    """Run a query on one URN and return data[key] (None if the entity does not exist)"""
+    result = client.execute_graphql(query, {"urn": urn})
+    data = (result or {}).get("data")
+    if data is None:
+        errors = [error.get("message", "Unknown error") for error in (result or {}).get("errors") or []]
+        raise ValueError(f"Unexpected response for {urn}: {', '.join(errors) or result}")
+    return data.get(key)
+
+
+def schema_version_key(schema_metadata: Optional[Dict[str, Any]]) -> str:
+    """Key identifying one version of a schemaMetadata aspect"""
+    schema_metadata = schema_metadata or {}
+    return ":".join(
+        str(schema_metadata.get(name) or "") for name in ("version", "hash", "createdAt")
+    )
+
+
+def _tag_names(container: Optional[Dict[str, Any]]) -> List[str]:
+    names = []
+    for association in ((container or {}).get("tags") or []):
+        tag = (association or {}).get("tag") or {}
+        name = (tag.get("properties") or {}).get("name") or (tag.get("urn") or "").split("urn:li:tag:", 1)[-1]
+        if name:
+            names.append(name)
+    return names
+
+
+def _term_urns(container: Optional[Dict[str, Any]]) -> List[str]:
+    return [
+        ((association or {}).get("term") or {}).get("urn")
+        for association in ((container or {}).get("terms") or [])
+        if ((association or {}).get("term") or {}).get("urn")
+    ]
+
+
+def parse_field(field: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten a schema field into the form served to the UI"""
+    return {
+        "fieldPath": field.get("fieldPath"),
+        "type": field.get("type"),
+        "nativeDataType": field.get("nativeDataType"),
+        "nullable": bool(field.get("nullable")),
+        "isPartOfKey": bool(field.get("isPartOfKey")),
+        "description": field.get("description") or "",
+        "originalDescription": field.get("description") or "",
+        "tags": _tag_names(field.get("tags")),
+        "glossaryTerms": _term_urns(field.get("glossaryTerms")),
+        "edited": False,
+    }
+
+
+def fetch_entity_header(client: Any, urn: str) -> Optional[Dict[str, Any]]:
+    """
+    Fetch the header of an entity: name, descriptions, platform and schema version, without fields
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    entity = _execute(client, ENTITY_HEADER_QUERY, urn, "entity")
+    if entity and entity.get("schemaMetadata") is not None:
+        entity["schemaVersion"] = schema_version_key(entity["schemaMetadata"])
+    return entity
+
+
+def fetch_schema_fields(client: Any, urn: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Fetch and parse the schema fields of a dataset
+
+    Returns:
+        Version key of the schema and the parsed fields (empty if the dataset has no schema)
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    dataset = _execute(client, SCHEMA_FIELDS_QUERY, urn, "dataset") or {}
+    schema_metadata = dataset.get("schemaMetadata") or {}
+    fields = [parse_field(field) for field in schema_metadata.get("fields") or [] if field]
+    return schema_version_key(schema_metadata), fields
+
+
+def fetch_schema_state(client: Any, urn: str) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Fetch the version key of the schema of a dataset and its field edits
+    (editableSchemaMetadata), without the schema fields
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    dataset = _execute(client, SCHEMA_STATE_QUERY, urn, "dataset") or {}
+    editable = ((dataset.get("editableSchemaMetadata") or {}).get("editableSchemaFieldInfo")) or []
+    return schema_version_key(dataset.get("schemaMetadata")), editable
+
+
+def apply_editable(fields: List[Dict[str, Any]], editable_fields: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Lay field edits over parsed fields, without modifying them
+
+    An edited description replaces the original one; edited tags and terms are
+    added to the original ones.
+    """
+    edits = {info.get("fieldPath"): info for info in editable_fields or [] if info and info.get("fieldPath")}
+    if not edits:
+        return fields
+
+    merged = []
+    for field in fields:
+        info = edits.get(field["fieldPath"])
+        if info is None:
+            merged.append(field)
+            continue
+        field = dict(field, edited=True)
+        if info.get("description"):
+            field["description"] = info["description"]
+        field["tags"] = list(dict.fromkeys(field["tags"] + _tag_names(info.get("tags"))))
+        field["glossaryTerms"] = list(dict.fromkeys(field["glossaryTerms"] + _term_urns(info.get("glossaryTerms"))))
+        merged.append(field)
+    return merged
+
+
+def filter_fields(
+    fields: List[Dict[str, Any]],
+    query: Optional[str] = None,
+    has_description: Optional[bool] = None,
+    has_tags: Optional[bool] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Filter fields by name (case-insensitive substring of the field path) and by
+    whether they have a description and tags or glossary terms
+    """
+    query = (query or "").strip().lower()
+    matching = []
+    for field in fields:
+        if query and query not in (field.get("fieldPath") or "").lower():
+            continue
+        if has_description is not None and bool(field.get("description")) != has_description:
+            continue
+        if has_tags is not None and bool(field.get("tags") or field.get("glossaryTerms")) != has_tags:
+            continue
+        matching.append(field)
+    return matching
+
+
+def encode_cursor(version_key: str, offset: int) -> str:
+    """Opaque cursor of a position in one version of a schema"""
+    return base64.urlsafe_b64encode(f"{offset}|{version_key}".encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: Optional[str], version_key: str) -> int:
+    """
+    Offset of a cursor
+
+    Raises:
+        ValueError: If the cursor is invalid or was issued for another version of the schema
+    """
+    if not cursor:
+        return 0
+    try:
+        offset, _, cursor_version = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8").partition("|")
+        offset = int(offset)
+    except Exception:
+        raise ValueError("Invalid schema field cursor")
+    if cursor_version != version_key or offset < 0:
+        raise ValueError("The schema changed since the cursor was issued")
+    return offset
+
+
+def page_fields(
+    fields: List[Dict[str, Any]],
+    version_key: str,
+    cursor: Optional[str] = None,
+    count: int = DEFAULT_PAGE_SIZE,
+    query: Optional[str] = None,
+    has_description: Optional[bool] = None,
+    has_tags: Optional[bool] = None,
+) -> Dict[str, Any]:
+    """
+    One page of the fields matching some filters
+
+    Args:
+        fields: Parsed fields (with edits applied)
+        version_key: Version key of the schema
+        cursor: Cursor returned with the previous page (default: first page)
+        count: Number of fields per page (capped at MAX_PAGE_SIZE)
+        query, has_description, has_tags: Filters (see filter_fields)
+
+    Returns:
+        Dictionary with the page fields, their offset, the total and matching
+        field counts, and the cursor of the next page (None on the last page)
+
+    Raises:
+        ValueError: If the cursor is invalid or out of date
+    """
+    count = max(1, min(int(count), MAX_PAGE_SIZE))
+    offset = decode_cursor(cursor, version_key)
+    matching = filter_fields(fields, query, has_description, has_tags)
+    end = offset + count
+    return {
+        "version": version_key,
+        "fields": matching[offset:end],
+        "offset": offset,
+        "total": len(fields),
+        "matched": len(matching),
+        "next_cursor": encode_cursor(version_key, end) if end < len(matching) else None,
+    }
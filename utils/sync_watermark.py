@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Per-source change watermark for incremental metadata syncs.
+
+The watermark stores, for every entity type, the content fingerprint of each
+source entity as it was last synced successfully. On the next run only the
+entities whose fingerprint changed (or that are new) need to be synced.
+Fingerprints ignore audit stamp times and GraphQL __typename fields, so an
+entity that was merely re-read is not considered changed.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple
+
+from utils.mcp_fingerprint import aspect_fingerprint
+from utils.metadata_diff import entity_aspects
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WATERMARK_DIR = ".cache/sync_watermarks"
+
+
+def entity_fingerprint(entity: Dict[str, Any]) -> str:
+    """
+    Content fingerprint of a source entity
+
+    Args:
+        entity: Entity dictionary as exported from the source
+
+    Returns:
+        Hex digest of the canonical entity aspects
+    """
+    return aspect_fingerprint(entity_aspects(entity))
+
+
+def watermark_path(watermark_dir: str, source_url: str, target_url: str) -> Path:
+    """
+    Path of the watermark of a source/target pair (e.g. dev-datahub-8080__prod-datahub-8080.json)
+
+    Args:
+        watermark_dir: Directory holding the watermarks
+        source_url: Source DataHub server URL
+        target_url: Target DataHub server URL
+
+    Returns:
+        Path of the watermark file
+    """
+    def slug(url: str) -> str:
+        return re.sub(r"[^A-Za-z0-9]+", "-", re.sub(r"^\w+://", "", url)).strip("-")
+
+    return Path(watermark_dir) / f"{slug(source_url)}__{slug(target_url)}.json"
+
+
+class SyncWatermark:
+    """Fingerprints of the entities synced from one source, stored as a JSON file"""
+
+    def __init__(self, path: str):
+        """
+        Initialize the watermark, loading it if the file exists
+
+        Args:
+            path: Path of the watermark file
+        """
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self.updated_at = None
+        self.entities: Dict[str, Dict[str, str]] = {}
+
+        if self.path.exists():
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                self.entities = data.get("entities", {})
+                self.updated_at = data.get("updated_at")
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable watermark {self.path}: {str(e)}")
+
+    def changed(
+        self, entity_type: str, entities: Iterable[Dict[str, Any]]
+    ) -> Tuple[List[Tuple[Dict[str, Any], str]], int]:
+        """
+        Select the entities that changed since they were last synced
+
+        Entities of the type that are no longer listed are forgotten, so they are
+        synced again if they reappear.
+
+        Args:
+            entity_type: Entity type (glossaryTerm, glossaryNode, tag, domain)
+            entities: All source entities of the type
+
+        Returns:
+            Tuple of ([(entity, fingerprint)] of the changed entities, number of unchanged entities)
+        """
+        with self._lock:
+            known = self.entities.setdefault(entity_type, {})
+            listed = set()
+            changed = []
+            unchanged = 0
+            for entity in entities:
+                urn = entity.get("urn")
+                if not urn:
+                    continue
+                listed.add(urn)
+                fingerprint = entity_fingerprint(entity)
+                if known.get(urn) == fingerprint:
+                    unchanged += 1
+                else:
+                    changed.append((entity, fingerprint))
+
+            for urn in set(known) - listed:
+                del known[urn]
+            return changed, unchanged
+
+    def record(self, entity_type: str, urn: str, fingerprint: str):
+        """
+        Record an entity as synced with the given fingerprint
+
+        Args:
+            entity_type: Entity type
+            urn: Source URN of the entity
+            fingerprint: Fingerprint of the synced content
+        """
+        with self._lock:
+            self.entities.setdefault(entity_type, {})[urn] = fingerprint
+
+    def reset(self):
+        """Forget every fingerprint, so the next run syncs everything"""
+        with self._lock:
+            self.entities = {}
+
+    def save(self):
+        """Write the watermark atomically"""
+        with self._lock:
+            self.updated_at = datetime.now().isoformat()
+            data = {"updated_at": self.updated_at, "entities": self.entities}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_name(self.path.name + ".tmp")
+            with open(temp_path, "w") as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+            os.replace(temp_path, self.path)
+        logger.info(f"Saved sync watermark to {self.path}")
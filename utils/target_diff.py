@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Pre-emit diff of proposed MCPs against the current state of the target DataHub.
+
+The current aspects of the proposed entities are fetched in batches (one batchGet
+request per entity type and batch of URNs) and compared with the proposed
+aspects by content fingerprint. MCPs that would write an identical aspect are
+dropped, so re-running a migration only sends real changes.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence, Tuple
+
+from datahub.emitter.mcp import MetadataChangeProposalWrapper
+
+from utils.mcp_fingerprint import aspect_fingerprint
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DIFF_BATCH_SIZE = 100
+DEFAULT_DIFF_MAX_WORKERS = 4
+
+
+@dataclass
+class DiffResult:
+    """Outcome of diffing proposed MCPs against the target"""
+    changed: List[MetadataChangeProposalWrapper] = field(default_factory=list)
+    unchanged: int = 0
+    unchecked: int = 0
+
+    @property
+    def reduction_ratio(self) -> float:
+        """Share of the proposed MCPs that were dropped as no-ops"""
+        total = len(self.changed) + self.unchanged
+        return self.unchanged / total if total else 0.0
+
+
+class TargetStateDiff:
+    """Drop MCPs whose aspect is already present, unchanged, in the target"""
+
+    def __init__(
+        self,
+        graph: Any,
+        batch_size: int = DEFAULT_DIFF_BATCH_SIZE,
+        max_workers: int = DEFAULT_DIFF_MAX_WORKERS,
+    ):
+        """
+        Initialize the diff
+
+        Args:
+            graph: DataHubGraph connected to the target environment
+            batch_size: Number of entities fetched per batchGet request
+            max_workers: Number of batchGet requests run concurrently
+        """
+        self.graph = graph
+        self.batch_size = max(1, batch_size)
+        self.max_workers = max(1, max_workers)
+
+    def _fetch(self, entity_type: str, urns: List[str], aspect_names: List[str]) -> Dict[Tuple[str, str], str]:
+        """Fetch current aspects of a batch of entities, returning their fingerprints by (urn, aspect name)"""
+        entities = self.graph.get_entities(entity_type, urns, aspect_names)
+        fingerprints = {}
+        for urn, aspects in entities.items():
+            for aspect_name, (aspect, _) in aspects.items():
+                if aspect is not None:
+                    fingerprints[(urn, aspect_name)] = aspect_fingerprint(aspect.to_obj())
+        return fingerprints
+
+    def _fetch_batch(self, request: Tuple[str, List[str], List[str]]) -> Tuple[Dict[Tuple[str, str], str], List[str]]:
+        """Fetch one batch, returning the fingerprints and the URNs whose state is unknown"""
+        entity_type, urns, aspect_names = request
+        try:
+            return self._fetch(entity_type, urns, aspect_names), []
+        except Exception as e:
+            # Without the current state the MCPs cannot be proven redundant, so they are kept
+            logger.warning(f"Could not fetch the current {entity_type} aspects of {len(urns)} entities: {e}")
+            return {}, urns
+
+    def diff(self, mcps: Sequence[MetadataChangeProposalWrapper]) -> DiffResult:
+        """
+        Split proposed MCPs into those that change the target and those that do not
+
+        Args:
+            mcps: Proposed UPSERT MCPs
+
+        Returns:
+            DiffResult with the MCPs to emit and the number of no-op MCPs dropped
+        """
+        result = DiffResult()
+
+        # Group the entities to fetch by entity type, with the aspects proposed for each type
+        by_type: Dict[str, Dict[str, None]] = {}
+        aspects_by_type: Dict[str, set] = {}
+        for mcp in mcps:
+            by_type.setdefault(mcp.entityType, {})[mcp.entityUrn] = None
+            aspects_by_type.setdefault(mcp.entityType, set()).add(mcp.aspectName)
+
+        requests = []
+        for entity_type, urns in by_type.items():
+            urns = list(urns)
+            aspect_names = sorted(aspects_by_type[entity_type])
+            for i in range(0, len(urns), self.batch_size):
+                requests.append((entity_type, urns[i:i + self.batch_size], aspect_names))
+
+        current: Dict[Tuple[str, str], str] = {}
+        unknown = set()
+        if requests:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(requests))) as executor:
+                for fingerprints, unknown_urns in executor.map(self._fetch_batch, requests):
+                    current.update(fingerprints)
+                    unknown.update(unknown_urns)
+
+        for mcp in mcps:
+            if mcp.entityUrn in unknown:
+                result.unchecked += 1
+                result.changed.append(mcp)
+            elif current.get((mcp.entityUrn, mcp.aspectName)) == aspect_fingerprint(mcp.aspect.to_obj()):
+                result.unchanged += 1
+            else:
+                result.changed.append(mcp)
+
+        logger.info(
+            f"Target diff: {len(result.changed)} of {len(mcps)} MCPs change the target, "
+            f"{result.unchanged} dropped as no-ops ({result.reduction_ratio:.0%} reduction)"
+        )
+        return result
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Usage counts of tags, glossary terms, domains and structured properties.
+
+The number of entities that carry a tag (or term, or domain) is read from the
+aggregateAcrossEntities facet of the matching search field, which returns the
+count of every value in one request, instead of running one search per URN:
+
+    facets = fetch_facet_counts(client, ["tags", "glossaryTerms"])
+    facets["tags"].get("urn:li:tag:pii")
+    usage_counts(client, "domains", domain_urns)
+
+Facets are capped at max_values values. When a facet was cut off, the values it
+did not return are counted with a second request restricted to the entities
+that carry one of them. Cached facets are never modified: completing one with
+such counts returns a copy.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field, replace
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_AGG_VALUES = 10000
+
+# Search field holding the references to each entity type
+USAGE_FACETS = {
+    "tag": "tags",
+    "glossaryTerm": "glossaryTerms",
+    "domain": "domains",
+}
+
+USAGE_COUNTS_QUERY = """
+query usageCounts($input: AggregateAcrossEntitiesInput!) {
+  aggregateAcrossEntities(input: $input) {
+    facets {
+      field
+      aggregations {
+        value
+        count
+      }
+    }
+  }
+}
+"""
+
+ENTITY_COUNT_QUERY = """
+query usageEntityCount($input: SearchAcrossEntitiesInput!) {
+  searchAcrossEntities(input: $input) {
+    total
+  }
+}
+"""
+
+
+@dataclass
+class FacetCounts:
+    """Entity counts of the values of one facet"""
+    field: str
+    counts: Dict[str, int] = field(default_factory=dict)
+    # Whether the facet returned all of its values (a missing value then has no entities)
+    complete: bool = True
+    fetched_at: float = field(default_factory=time.time)
+
+    def get(self, value: str) -> Optional[int]:
+        """Count of a value, 0 if the complete facet does not have it, None if unknown"""
+        if value in self.counts:
+            return self.counts[value]
+        return 0 if self.complete else None
+
+
+def structured_property_facet(qualified_name: str) -> str:
+    """Search field of the values of a structured property"""
+    return f"structuredProperties.{qualified_name}"
+
+
+def _aggregate(
+    client: Any,
+    fields: List[str],
+    max_values: int,
+    or_filters: Optional[List[Dict[str, Any]]] = None,
+    entity_types: Optional[List[str]] = None,
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Run one aggregateAcrossEntities request
+
+    Returns:
+        Dictionary mapping each returned facet field to its aggregations
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    aggregate_input: Dict[str, Any] = {
+        "query": "*",
+        "facets": fields,
+        "searchFlags": {"maxAggValues": max_values, "skipCache": False},
+    }
+    if or_filters:
+        aggregate_input["orFilters"] = or_filters
+    if entity_types:
+        aggregate_input["types"] = entity_types
+
+    result = client.execute_graphql(USAGE_COUNTS_QUERY, {"input": aggregate_input})
+    aggregation = ((result or {}).get("data") or {}).get("aggregateAcrossEntities")
+    if aggregation is None:
+        errors = [error.get("message", "Unknown error") for error in (result or {}).get("errors") or []]
+        raise ValueError(f"Unexpected response to usage count query: {', '.join(errors) or result}")
+
+    return {
+        facet.get("field"): facet.get("aggregations") or []
+        for facet in aggregation.get("facets") or []
+        if facet and facet.get("field")
+    }
+
+
+def fetch_facet_counts(
+    client: Any,
+    fields: Iterable[str],
+    max_values: int = DEFAULT_MAX_AGG_VALUES,
+    entity_types: Optional[List[str]] = None,
+) -> Dict[str, FacetCounts]:
+    """
+    Entity counts of every value of some facets, in one request
+
+    Args:
+        client: Anything with execute_graphql (e.g. DataHubRestClient)
+        fields: Facet fields (e.g. "tags", "domains", structured_property_facet(...))
+        max_values: Maximum number of values returned per facet
+        entity_types: Only count entities of these types (default: all)
+
+    Returns:
+        Dictionary mapping each field to its counts
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    fields = list(dict.fromkeys(fields))
+    if not fields:
+        return {}
+    aggregations = _aggregate(client, fields, max_values, entity_types=entity_types)
+
+    facets = {}
+    for facet_field in fields:
+        values = aggregations.get(facet_field, [])
+        facets[facet_field] = FacetCounts(
+            field=facet_field,
+            counts={
+                aggregation["value"]: int(aggregation.get("count") or 0)
+                for aggregation in values
+                if aggregation and aggregation.get("value")
+            },
+            complete=len(values) < max_values,
+        )
+    return facets
+
+
+def fetch_value_counts(
+    client: Any,
+    facet_field: str,
+    values: Iterable[str],
+    entity_types: Optional[List[str]] = None,
+) -> Dict[str, int]:
+    """
+    Entity counts of some values of a facet, in one request
+
+    The aggregation is restricted to the entities carrying at least one of the
+    values, so the counts of the requested values are exact even for facets
+    with more values than can be returned at once.
+
+    Args:
+        client: Anything with execute_graphql (e.g. DataHubRestClient)
+        facet_field: Facet field (e.g. "tags")
+        values: Values to count (e.g. tag URNs)
+        entity_types: Only count entities of these types (default: all)
+
+    Returns:
+        Dictionary mapping each value to its count (0 when no entity carries it)
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    values = list(dict.fromkeys(value for value in values if value))
+    if not values:
+        return {}
+    or_filters = [{"and": [{"field": facet_field, "condition": "EQUAL", "values": values}]}]
+    aggregations = _aggregate(
+        client, [facet_field], max(DEFAULT_MAX_AGG_VALUES, len(values)), or_filters, entity_types
+    )
+    found = {
+        aggregation["value"]: int(aggregation.get("count") or 0)
+        for aggregation in aggregations.get(facet_field, [])
+        if aggregation and aggregation.get("value")
+    }
+    return {value: found.get(value, 0) for value in values}
+
+
+def fetch_entity_count(client: Any, facet_field: str) -> int:
+    """
+    Number of entities with any value of a facet, in one request
+
+    Args:
+        client: Anything with execute_graphql (e.g. DataHubRestClient)
+        facet_field: Facet field (e.g. structured_property_facet(...))
+
+    Returns:
+        Number of matching entities
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    search_input = {
+        "query": "*",
+        "start": 0,
+        "count": 0,
+        "orFilters": [{"and": [{"field": facet_field, "condition": "EXISTS"}]}],
+        "searchFlags": {"skipCache": False},
+    }
+    result = client.execute_graphql(ENTITY_COUNT_QUERY, {"input": search_input})
+    search = ((result or {}).get("data") or {}).get("searchAcrossEntities")
+    if search is None:
+        errors = [error.get("message", "Unknown error") for error in (result or {}).get("errors") or []]
+        raise ValueError(f"Unexpected response to entity count query: {', '.join(errors) or result}")
+    return int(search.get("total") or 0)
+
+
+def with_value_counts(client: Any, facet: FacetCounts, values: Iterable[str]) -> FacetCounts:
+    """
+    Facet completed with the counts of the values it does not know
+
+    Args:
+        client: Anything with execute_graphql (e.g. DataHubRestClient)
+        facet: Counts of the facet, left unchanged
+        values: Values whose counts are needed
+
+    Returns:
+        The facet itself if it knows every value, otherwise a copy with their counts
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    unknown = [value for value in dict.fromkeys(values) if value and facet.get(value) is None]
+    if not unknown:
+        return facet
+    counts = dict(facet.counts)
+    counts.update(fetch_value_counts(client, facet.field, unknown))
+    return replace(facet, counts=counts)
+
+
+def usage_counts(
+    client: Any,
+    facet_field: str,
+    urns: Iterable[str],
+    facet: Optional[FacetCounts] = None,
+) -> Dict[str, int]:
+    """
+    Number of entities referencing each of some URNs
+
+    Args:
+        client: Anything with execute_graphql (e.g. DataHubRestClient)
+        facet_field: Facet field holding the references (see USAGE_FACETS)
+        urns: URNs to count the usage of
+        facet: Counts of the facet fetched earlier (e.g. from a cache); fetched if not given
+
+    Returns:
+        Dictionary mapping each URN to its usage count
+
+    Raises:
+        ValueError: If a response is not in the expected format
+    """
+    urns = list(dict.fromkeys(urn for urn in urns if urn))
+    if facet is None:
+        facet = fetch_facet_counts(client, [facet_field])[facet_field]
+
+    facet = with_value_counts(client, facet, urns)
+    return {urn: facet.get(urn) or 0 for urn in urns}
+
+
+def structured_property_usage(
+    client: Any,
+    qualified_names: Iterable[str],
+    max_values: int = DEFAULT_MAX_AGG_VALUES,
+) -> Dict[str, int]:
+    """
+    Number of entity values assigned for each of some structured properties, in one request
+
+    An entity with several values of a property is counted once per value. When a
+    property has more values than a facet returns, the entities with the property
+    are counted with a second request; the usage is then the larger of that count
+    and the sum of the returned values, a lower bound for multi-valued properties.
+
+    Args:
+        client: Anything with execute_graphql (e.g. DataHubRestClient)
+        qualified_names: Qualified names of the structured properties
+        max_values: Maximum number of values returned per property
+
+    Returns:
+        Dictionary mapping each qualified name to its usage count
+
+    Raises:
+        ValueError: If the response is not in the expected format
+    """
+    qualified_names = list(dict.fromkeys(name for name in qualified_names if name))
+    facets = fetch_facet_counts(
+        client, [structured_property_facet(name) for name in qualified_names], max_values=max_values
+    )
+
+    usage = {}
+    for name in qualified_names:
+        facet = facets[structured_property_facet(name)]
+        usage[name] = sum(facet.counts.values())
+        if not facet.complete:
+            logger.info(f"Structured property {name} has too many values for one facet, counting its entities")
+            usage[name] = max(usage[name], fetch_entity_count(client, facet.field))
+    return usage
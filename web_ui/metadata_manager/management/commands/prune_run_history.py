@@ -0,0 +1,53 @@
+from django.core.management.base import BaseCommand
+from metadata_manager.models import AssertionResult, TestResult
+from metadata_manager.run_history import prune_run_history
+
+
+class Command(BaseCommand):
+    help = 'Apply retention and downsampling to the assertion and test run history'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--retention-days',
+            type=int,
+            help='Remove runs older than this many days (default: RUN_HISTORY_RETENTION_DAYS, 0 keeps all)'
+        )
+        parser.add_argument(
+            '--downsample-after-days',
+            type=int,
+            help='Keep only the last run of each day once runs are older than this many days '
+                 '(default: RUN_HISTORY_DOWNSAMPLE_AFTER_DAYS, 0 disables downsampling)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Show what would be deleted without actually deleting'
+        )
+
+    def handle(self, *args, **options):
+        dry_run = options['dry_run']
+
+        pruned = prune_run_history(
+            retention_days=options['retention_days'],
+            downsample_after_days=options['downsample_after_days'],
+            dry_run=dry_run,
+        )
+
+        if dry_run:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"DRY RUN: Would delete {pruned['assertion_results']} assertion runs and {pruned['test_results']} test runs"
+                )
+            )
+            return
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Successfully deleted {pruned['assertion_results']} assertion runs and {pruned['test_results']} test runs"
+            )
+        )
+
+        # Show current counts
+        self.stdout.write(
+            f'Remaining: {AssertionResult.objects.count()} assertion runs, {TestResult.objects.count()} test runs'
+        )
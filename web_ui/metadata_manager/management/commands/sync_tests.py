@@ -11,6 +11,7 @@ sys.path.append(
 
 from utils.datahub_utils import test_datahub_connection
 from metadata_manager.models import Test
+from metadata_manager.run_history import record_test_results
 
 logger = logging.getLogger(__name__)
 
@@ -72,6 +73,8 @@ class Command(BaseCommand):
                     )
 
                     if created:
+                        if record_test_results(local_test, remote_test.get('results')):
+                            local_test.save()
                         synced_count += 1
                         self.stdout.write(f"Synced new test: {test_name}")
                     elif options['force'] or local_test.sync_status != 'SYNCED':
@@ -81,13 +84,10 @@ class Command(BaseCommand):
                         local_test.category = remote_test.get('category', '')
                         local_test.definition_json = remote_test.get('definition_json', {})
                         
-                        # Update results if available
+                        # Update results if available and append the run to the test's history
                         results = remote_test.get('results', {})
                         if results:
-                            local_test.passing_count = results.get('passingCount', 0)
-                            local_test.failing_count = results.get('failingCount', 0)
-                            local_test.last_run_timestamp = results.get('lastRunTimestampMillis')
-                            local_test.results_data = results
+                            record_test_results(local_test, results)
 
                         local_test.sync_status = 'SYNCED'
                         local_test.last_synced = timezone.now()
@@ -0,0 +1,93 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("metadata_manager", "0026_add_platform_fields_to_test"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="assertion",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="datacontract",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="dataproduct",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="domain",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="glossarynode",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="glossaryterm",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="structuredproperty",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="tag",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="test",
+            name="aspect_snapshot",
+            field=models.JSONField(
+                blank=True,
+                help_text="Field values at the last staging, used to regenerate only changed aspects",
+                null=True,
+            ),
+        ),
+    ]
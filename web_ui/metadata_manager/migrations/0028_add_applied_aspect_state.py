@@ -0,0 +1,56 @@
+# Generated by Django 5.2.18 on 2026-10-18 20:55
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("metadata_manager", "0027_add_aspect_snapshot"),
+        ("web_ui", "0016_remove_platform_instance_field"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AppliedAspectState",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("entity_urn", models.CharField(max_length=500)),
+                ("aspect_name", models.CharField(max_length=100)),
+                (
+                    "fingerprint",
+                    models.CharField(
+                        help_text="Content fingerprint of the applied aspect",
+                        max_length=64,
+                    ),
+                ),
+                ("applied_at", models.DateTimeField(auto_now=True)),
+                (
+                    "connection",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="applied_aspects",
+                        to="web_ui.connection",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Applied Aspect State",
+                "verbose_name_plural": "Applied Aspect States",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("connection", "entity_urn", "aspect_name"),
+                        name="unique_applied_aspect_per_connection",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:22
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("metadata_manager", "0028_add_applied_aspect_state"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AssertionBatchRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("RUNNING", "Running"),
+                            ("COMPLETED", "Completed"),
+                            ("FAILED", "Failed"),
+                        ],
+                        default="RUNNING",
+                        max_length=20,
+                    ),
+                ),
+                ("total_assets", models.IntegerField(default=0)),
+                ("completed_assets", models.IntegerField(default=0)),
+                ("failed_assets", models.IntegerField(default=0)),
+                ("total_assertions", models.IntegerField(default=0)),
+                ("succeeded", models.IntegerField(default=0)),
+                ("failed", models.IntegerField(default=0)),
+                ("max_workers", models.IntegerField(default=4)),
+                ("errors", models.JSONField(blank=True, default=list)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                ("finished_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Assertion Batch Run",
+                "verbose_name_plural": "Assertion Batch Runs",
+                "ordering": ["-created_at"],
+            },
+        ),
+        migrations.AddField(
+            model_name="assertionresult",
+            name="batch_run",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="results",
+                to="metadata_manager.assertionbatchrun",
+            ),
+        ),
+    ]
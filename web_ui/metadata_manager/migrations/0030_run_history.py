@@ -0,0 +1,109 @@
+# Generated by Django 5.2.18 on 2026-10-18 21:27
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+from utils.run_events import compact_run_events, millis_to_datetime, parse_run_events
+
+
+def move_run_events_to_history(apps, schema_editor):
+    """
+    Move the run events stored on assertion rows into the run history, keeping only
+    a compact summary on the row, and record the last known run of each test
+    """
+    Assertion = apps.get_model("metadata_manager", "Assertion")
+    AssertionResult = apps.get_model("metadata_manager", "AssertionResult")
+    Test = apps.get_model("metadata_manager", "Test")
+    TestResult = apps.get_model("metadata_manager", "TestResult")
+
+    for assertion in Assertion.objects.exclude(run_events_data__isnull=True).iterator():
+        records = parse_run_events(assertion.run_events_data)
+        AssertionResult.objects.bulk_create([
+            AssertionResult(
+                assertion=assertion,
+                run_at=record["run_at"],
+                status=record["status"],
+                details=record["details"],
+            )
+            for record in records
+        ])
+        assertion.run_events_data = compact_run_events(assertion.run_events_data)
+        if isinstance(assertion.config, dict) and isinstance(assertion.config.get("raw_data"), dict):
+            assertion.config["raw_data"].pop("runEvents", None)
+        if records and (assertion.last_run is None or records[0]["run_at"] >= assertion.last_run):
+            assertion.last_run = records[0]["run_at"]
+            assertion.last_status = records[0]["status"]
+        assertion.save(update_fields=["run_events_data", "config", "last_run", "last_status"])
+
+    for test in Test.objects.exclude(last_run_timestamp__isnull=True).iterator():
+        run_at = millis_to_datetime(test.last_run_timestamp)
+        if run_at:
+            TestResult.objects.create(
+                test=test,
+                run_at=run_at,
+                passing_count=test.passing_count,
+                failing_count=test.failing_count,
+                details=test.results_data,
+            )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("metadata_manager", "0029_add_assertion_batch_run"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="TestResult",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("run_at", models.DateTimeField(default=django.utils.timezone.now)),
+                ("passing_count", models.IntegerField(default=0)),
+                ("failing_count", models.IntegerField(default=0)),
+                ("details", models.JSONField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "Test Result",
+                "verbose_name_plural": "Test Results",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="assertionresult",
+            index=models.Index(
+                fields=["assertion", "run_at"], name="metadata_ma_asserti_a693ad_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="assertionresult",
+            index=models.Index(fields=["run_at"], name="metadata_ma_run_at_0d78bc_idx"),
+        ),
+        migrations.AddField(
+            model_name="testresult",
+            name="test",
+            field=models.ForeignKey(
+                on_delete=django.db.models.deletion.CASCADE,
+                related_name="results",
+                to="metadata_manager.test",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="testresult",
+            index=models.Index(
+                fields=["test", "run_at"], name="metadata_ma_test_id_a71b49_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="testresult",
+            index=models.Index(fields=["run_at"], name="metadata_ma_run_at_e25918_idx"),
+        ),
+        migrations.RunPython(move_run_events_to_history, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,4 @@
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.utils import timezone
 import uuid
@@ -44,6 +45,17 @@ class BaseMetadataModel(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    # Tracked field values at the last time this entity was staged, keyed by environment
+    aspect_snapshot = models.JSONField(
+        blank=True,
+        null=True,
+        help_text="Field values at the last staging, used to regenerate only changed aspects",
+    )
+
+    # Maps each tracked model field to the DataHub aspects generated from it.
+    # Models without a map always regenerate every aspect.
+    FIELD_ASPECT_MAP = {}
+
     class Meta:
         abstract = True
         constraints = [
@@ -73,6 +85,61 @@ class BaseMetadataModel(models.Model):
         self.sync_status = "NOT_SYNCED"
         self.save(update_fields=["sync_status"])
 
+    def get_aspect_field_values(self):
+        """Get the JSON-serializable values of the fields listed in FIELD_ASPECT_MAP"""
+        values = {}
+        for field_name in self.FIELD_ASPECT_MAP:
+            # Use the column attribute so foreign keys compare by id without a query
+            values[field_name] = getattr(self, self._meta.get_field(field_name).attname)
+        return json.loads(json.dumps(values, cls=DjangoJSONEncoder))
+
+    def get_changed_fields(self, environment):
+        """
+        Get the tracked fields that changed since this entity was last staged for an
+        environment. Returns None when there is no usable snapshot (never staged,
+        URN changed or no field map), meaning everything must be regenerated.
+        """
+        if not self.FIELD_ASPECT_MAP:
+            return None
+        snapshot = (self.aspect_snapshot or {}).get(environment)
+        if not snapshot or snapshot.get("urn") != self.urn:
+            return None
+
+        staged_values = snapshot.get("fields") or {}
+        return [
+            field_name
+            for field_name, value in self.get_aspect_field_values().items()
+            if field_name not in staged_values or staged_values[field_name] != value
+        ]
+
+    def get_dirty_aspects(self, environment):
+        """
+        Get the names of the aspects affected by changes since this entity was last
+        staged for an environment, or None if every aspect must be regenerated
+        """
+        changed_fields = self.get_changed_fields(environment)
+        if changed_fields is None:
+            return None
+        aspects = set()
+        for field_name in changed_fields:
+            aspects.update(self.FIELD_ASPECT_MAP[field_name])
+        return aspects
+
+    def mark_aspects_staged(self, environment):
+        """Record the current tracked field values as staged for an environment"""
+        snapshots = dict(self.aspect_snapshot or {})
+        snapshots[environment] = {"urn": self.urn, "fields": self.get_aspect_field_values()}
+        self.aspect_snapshot = snapshots
+        self.save(update_fields=["aspect_snapshot"])
+
+    def get_deploy_aspects(self):
+        """Get the aspect content a deploy sends to DataHub, keyed by aspect name"""
+        return {}
+
+    def get_undeployed_aspects(self, connection):
+        """Get fingerprints of the deploy aspects that differ from what was last applied to a connection"""
+        return AppliedAspectState.get_changed_aspects(connection, self.urn, self.get_deploy_aspects())
+
 
 class Tag(BaseMetadataModel):
     """Model representing a DataHub tag"""
@@ -82,6 +149,13 @@ class Tag(BaseMetadataModel):
     # Store ownership data
     ownership_data = models.JSONField(blank=True, null=True)
 
+    FIELD_ASPECT_MAP = {
+        "name": ["tagProperties"],
+        "description": ["tagProperties"],
+        "color": ["tagProperties"],
+        "ownership_data": ["ownership"],
+    }
+
     class Meta:
         ordering = ["name"]
         verbose_name = "Tag"
@@ -145,6 +219,15 @@ class GlossaryNode(BaseMetadataModel):
     # Store ownership data
     ownership_data = models.JSONField(blank=True, null=True)
 
+    FIELD_ASPECT_MAP = {
+        "name": ["glossaryNodeInfo"],
+        "description": ["glossaryNodeInfo"],
+        "parent": ["glossaryNodeInfo"],
+        "color_hex": ["displayProperties"],
+        "deprecated": ["deprecation"],
+        "ownership_data": ["ownership"],
+    }
+
     class Meta:
         verbose_name = "Glossary Node"
         verbose_name_plural = "Glossary Nodes"
@@ -232,24 +315,36 @@ class GlossaryNode(BaseMetadataModel):
         
         return node
 
+    def get_deploy_data(self):
+        """Build the node data sent to DataHub on deploy"""
+        node_data = {
+            "properties": {
+                "name": self.name,
+                "description": self.description or "",
+            }
+        }
+        
+        # Add parent node if exists
+        if self.parent and self.parent.urn:
+            node_data["parentNode"] = {"urn": self.parent.urn}
+        
+        # Add ownership data if exists
+        if self.ownership_data:
+            node_data["ownership"] = {"owners": self.ownership_data}
+        return node_data
+
+    def get_deploy_aspects(self):
+        """Get the aspect content a deploy sends to DataHub, keyed by aspect name"""
+        node_data = self.get_deploy_data()
+        return {
+            "glossaryNodeInfo": {key: value for key, value in node_data.items() if key != "ownership"},
+            "ownership": node_data.get("ownership", {}),
+        }
+
     def deploy_to_datahub(self, client, connection=None):
         """Deploy this glossary node to DataHub"""
         try:
-            # Prepare node data for deployment
-            node_data = {
-                "properties": {
-                    "name": self.name,
-                    "description": self.description or "",
-                }
-            }
-            
-            # Add parent node if exists
-            if self.parent and self.parent.urn:
-                node_data["parentNode"] = {"urn": self.parent.urn}
-            
-            # Add ownership data if exists
-            if self.ownership_data:
-                node_data["ownership"] = {"owners": self.ownership_data}
+            node_data = self.get_deploy_data()
             
             # Deploy using the client
             result_urn = client.import_glossary_node(node_data)
@@ -270,6 +365,9 @@ class GlossaryNode(BaseMetadataModel):
                     self.datahub_id = result_urn.split(':')[-1]
                 
                 self.save()
+                AppliedAspectState.record_applied(
+                    connection, result_urn, AppliedAspectState.fingerprint_aspects(self.get_deploy_aspects())
+                )
                 return True
             
             return False
@@ -311,6 +409,18 @@ class GlossaryTerm(BaseMetadataModel):
     # Store relationships data
     relationships_data = models.JSONField(blank=True, null=True)
 
+    FIELD_ASPECT_MAP = {
+        "name": ["glossaryTermInfo"],
+        "description": ["glossaryTermInfo"],
+        "parent_node": ["glossaryTermInfo"],
+        "term_source": ["glossaryTermInfo"],
+        "domain": ["domains"],
+        "domain_urn": ["domains"],
+        "deprecated": ["deprecation"],
+        "ownership_data": ["ownership"],
+        "relationships_data": ["glossaryRelatedTerms"],
+    }
+
     class Meta:
         verbose_name = "Glossary Term"
         verbose_name_plural = "Glossary Terms"
@@ -413,28 +523,40 @@ class GlossaryTerm(BaseMetadataModel):
         
         return term
 
+    def get_deploy_data(self):
+        """Build the term data sent to DataHub on deploy"""
+        term_data = {
+            "properties": {
+                "name": self.name,
+                "description": self.description or "",
+            }
+        }
+        
+        # Add term source if exists
+        if self.term_source:
+            term_data["properties"]["termSource"] = self.term_source
+        
+        # Add parent node if exists
+        if self.parent_node and self.parent_node.urn:
+            term_data["parentNode"] = {"urn": self.parent_node.urn}
+        
+        # Add ownership data if exists
+        if self.ownership_data:
+            term_data["ownership"] = {"owners": self.ownership_data}
+        return term_data
+
+    def get_deploy_aspects(self):
+        """Get the aspect content a deploy sends to DataHub, keyed by aspect name"""
+        term_data = self.get_deploy_data()
+        return {
+            "glossaryTermInfo": {key: value for key, value in term_data.items() if key != "ownership"},
+            "ownership": term_data.get("ownership", {}),
+        }
+
     def deploy_to_datahub(self, client, connection=None):
         """Deploy this glossary term to DataHub"""
         try:
-            # Prepare term data for deployment
-            term_data = {
-                "properties": {
-                    "name": self.name,
-                    "description": self.description or "",
-                }
-            }
-            
-            # Add term source if exists
-            if self.term_source:
-                term_data["properties"]["termSource"] = self.term_source
-            
-            # Add parent node if exists
-            if self.parent_node and self.parent_node.urn:
-                term_data["parentNode"] = {"urn": self.parent_node.urn}
-            
-            # Add ownership data if exists
-            if self.ownership_data:
-                term_data["ownership"] = {"owners": self.ownership_data}
+            term_data = self.get_deploy_data()
             
             # Deploy using the client
             result_urn = client.import_glossary_term(term_data)
@@ -455,6 +577,9 @@ class GlossaryTerm(BaseMetadataModel):
                     self.datahub_id = result_urn.split(':')[-1]
                 
                 self.save()
+                AppliedAspectState.record_applied(
+                    connection, result_urn, AppliedAspectState.fingerprint_aspects(self.get_deploy_aspects())
+                )
                 return True
             
             return False
@@ -493,6 +618,18 @@ class Domain(BaseMetadataModel):
     # Store raw GraphQL data for comprehensive details
     raw_data = models.JSONField(blank=True, null=True)
 
+    FIELD_ASPECT_MAP = {
+        "name": ["domainProperties"],
+        "description": ["domainProperties"],
+        "parent_domain_urn": ["domainProperties"],
+        "color_hex": ["displayProperties"],
+        "icon_name": ["displayProperties"],
+        "icon_style": ["displayProperties"],
+        "icon_library": ["displayProperties"],
+        "ownership_data": ["ownership"],
+        "raw_data": ["structuredProperties"],
+    }
+
     class Meta:
         verbose_name = "Domain"
         verbose_name_plural = "Domains"
@@ -653,6 +790,59 @@ class Assertion(BaseMetadataModel):
         return "Unknown Entity"
 
 
+class AssertionBatchRun(models.Model):
+    """Progress of a batch run of many assertions, grouped by asset"""
+
+    STATUS_CHOICES = [
+        ("RUNNING", "Running"),
+        ("COMPLETED", "Completed"),
+        ("FAILED", "Failed"),
+    ]
+
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default="RUNNING")
+    total_assets = models.IntegerField(default=0)
+    completed_assets = models.IntegerField(default=0)
+    failed_assets = models.IntegerField(default=0)
+    total_assertions = models.IntegerField(default=0)
+    succeeded = models.IntegerField(default=0)
+    failed = models.IntegerField(default=0)
+    max_workers = models.IntegerField(default=4)
+    errors = models.JSONField(default=list, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        verbose_name = "Assertion Batch Run"
+        verbose_name_plural = "Assertion Batch Runs"
+        ordering = ["-created_at"]
+
+    def __str__(self):
+        return f"Assertion batch {self.id} ({self.status})"
+
+    @property
+    def percentage(self):
+        """Share of the assets completed, in percent"""
+        return (self.completed_assets / max(self.total_assets, 1)) * 100
+
+    def to_dict(self):
+        """Convert the batch run to a dictionary for the progress endpoint"""
+        return {
+            "id": self.id,
+            "status": self.status,
+            "total_assets": self.total_assets,
+            "completed_assets": self.completed_assets,
+            "failed_assets": self.failed_assets,
+            "total_assertions": self.total_assertions,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "percentage": self.percentage,
+            "errors": self.errors,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
 class AssertionResult(models.Model):
     """Represents a result of running an assertion"""
 
@@ -662,6 +852,13 @@ class AssertionResult(models.Model):
     run_at = models.DateTimeField(default=timezone.now)
     status = models.CharField(max_length=20)
     details = models.JSONField(null=True, blank=True)
+    batch_run = models.ForeignKey(
+        AssertionBatchRun,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="results",
+    )
 
     def __str__(self):
         return f"{self.assertion.name} - {self.run_at}"
@@ -669,6 +866,10 @@ class AssertionResult(models.Model):
     class Meta:
         verbose_name = "Assertion Result"
         verbose_name_plural = "Assertion Results"
+        indexes = [
+            models.Index(fields=["assertion", "run_at"]),
+            models.Index(fields=["run_at"]),
+        ]
 
 
 class SyncConfig(models.Model):
@@ -785,6 +986,20 @@ class DataProduct(BaseMetadataModel):
     # Store institutional memory data
     institutional_memory_data = models.JSONField(blank=True, null=True)
 
+    FIELD_ASPECT_MAP = {
+        "name": ["dataProductProperties"],
+        "description": ["dataProductProperties"],
+        "external_url": ["dataProductProperties"],
+        "properties_data": ["dataProductProperties"],
+        "removed": ["status"],
+        "ownership_data": ["ownership"],
+        "domain_urn": ["domains"],
+        "tags_data": ["globalTags"],
+        "glossary_terms_data": ["glossaryTerms"],
+        "structured_properties_data": ["structuredProperties"],
+        "institutional_memory_data": ["institutionalMemory"],
+    }
+
     class Meta:
         verbose_name = "Data Product"
         verbose_name_plural = "Data Products"
@@ -1046,6 +1261,27 @@ class Test(BaseMetadataModel):
         return None
 
 
+class TestResult(models.Model):
+    """Represents the result of one run of a metadata test"""
+
+    test = models.ForeignKey(Test, on_delete=models.CASCADE, related_name="results")
+    run_at = models.DateTimeField(default=timezone.now)
+    passing_count = models.IntegerField(default=0)
+    failing_count = models.IntegerField(default=0)
+    details = models.JSONField(null=True, blank=True)
+
+    def __str__(self):
+        return f"{self.test.name} - {self.run_at}"
+
+    class Meta:
+        verbose_name = "Test Result"
+        verbose_name_plural = "Test Results"
+        indexes = [
+            models.Index(fields=["test", "run_at"]),
+            models.Index(fields=["run_at"]),
+        ]
+
+
 class SearchResultCache(models.Model):
     """Cache for search results tied to user sessions"""
     session_key = models.CharField(max_length=40, db_index=True)
@@ -1339,3 +1575,87 @@ class SearchProgress(models.Model):
             return cls.objects.get(session_key=session_key, cache_key=cache_key)
         except cls.DoesNotExist:
             return None
+
+
+class AppliedAspectState(models.Model):
+    """
+    Manifest of the aspect content last successfully pushed to a DataHub connection.
+    Pushes compare content fingerprints against it and skip aspects DataHub already holds.
+    """
+
+    connection = models.ForeignKey(
+        "web_ui.Connection", on_delete=models.CASCADE, related_name="applied_aspects"
+    )
+    entity_urn = models.CharField(max_length=500)
+    aspect_name = models.CharField(max_length=100)
+    fingerprint = models.CharField(max_length=64, help_text="Content fingerprint of the applied aspect")
+    applied_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "Applied Aspect State"
+        verbose_name_plural = "Applied Aspect States"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["connection", "entity_urn", "aspect_name"],
+                name="unique_applied_aspect_per_connection",
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.entity_urn} {self.aspect_name}"
+
+    @staticmethod
+    def fingerprint_aspects(aspects):
+        """Fingerprint a dict of aspect name -> intended aspect content"""
+        from utils.mcp_fingerprint import aspect_fingerprint
+        return {aspect_name: aspect_fingerprint(content) for aspect_name, content in aspects.items()}
+
+    @classmethod
+    def get_changed_aspects(cls, connection, entity_urn, aspects):
+        """
+        Get the aspects whose intended content differs from what was last applied.
+
+        Args:
+            connection: web_ui.Connection being pushed to (None disables skipping)
+            entity_urn: URN of the entity in DataHub (None for entities not yet created)
+            aspects: Dict of aspect name -> intended aspect content
+
+        Returns:
+            Dict of aspect name -> fingerprint for the aspects that need to be pushed
+        """
+        fingerprints = cls.fingerprint_aspects(aspects)
+        if connection is None or not entity_urn:
+            return fingerprints
+
+        applied = dict(
+            cls.objects.filter(
+                connection=connection, entity_urn=entity_urn, aspect_name__in=list(fingerprints)
+            ).values_list("aspect_name", "fingerprint")
+        )
+        return {
+            aspect_name: fingerprint
+            for aspect_name, fingerprint in fingerprints.items()
+            if applied.get(aspect_name) != fingerprint
+        }
+
+    @classmethod
+    def record_applied(cls, connection, entity_urn, fingerprints):
+        """Record aspect fingerprints that were successfully pushed to a connection"""
+        if connection is None or not entity_urn or not fingerprints:
+            return
+        cls.objects.bulk_create(
+            [
+                cls(connection=connection, entity_urn=entity_urn, aspect_name=aspect_name, fingerprint=fingerprint)
+                for aspect_name, fingerprint in fingerprints.items()
+            ],
+            update_conflicts=True,
+            unique_fields=["connection", "entity_urn", "aspect_name"],
+            update_fields=["fingerprint", "applied_at"],
+        )
+
+    @classmethod
+    def forget(cls, connection, entity_urn):
+        """Drop the manifest entries of an entity, forcing its next push to send everything"""
+        if connection is None or not entity_urn:
+            return
+        cls.objects.filter(connection=connection, entity_urn=entity_urn).delete()
@@ -0,0 +1,213 @@
+"""
+Run history of assertions and metadata tests.
+
+Every run is a row of AssertionResult or TestResult, indexed by (assertion/test,
+run time). The entity rows only keep the latest status (Assertion.last_run and
+last_status, Test.passing_count, failing_count and last_run_timestamp) and a
+compact summary of the run events, so list views never load the history.
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from utils.run_events import (
+    DEFAULT_DOWNSAMPLE_AFTER_DAYS,
+    DEFAULT_RETENTION_DAYS,
+    compact_run_events,
+    millis_to_datetime,
+    parse_run_events,
+    select_runs_to_prune,
+)
+
+from .models import AssertionResult, TestResult
+
+logger = logging.getLogger(__name__)
+
+# Heavy JSON fields that list views defer; they hold run events and raw DataHub responses
+ASSERTION_LIST_DEFERRED_FIELDS = ("run_events_data", "config")
+TEST_LIST_DEFERRED_FIELDS = ("results_data",)
+
+DELETE_BATCH_SIZE = 500
+
+
+def without_run_events(assertion_data):
+    """Copy of raw assertion data from DataHub without its run events, for storing in config"""
+    if not isinstance(assertion_data, dict):
+        return assertion_data
+    return {key: value for key, value in assertion_data.items() if key != "runEvents"}
+
+
+def record_assertion_run_events(assertion, run_events_data):
+    """
+    Append the DataHub run events of an assertion to its history
+
+    Events already in the history are skipped. The latest event becomes the
+    assertion's last_run/last_status and only a compact summary of the events
+    is kept in run_events_data.
+
+    Args:
+        assertion: Saved Assertion
+        run_events_data: runEvents structure of the assertion as returned by DataHub
+
+    Returns:
+        Number of runs added to the history
+    """
+    records = parse_run_events(run_events_data)
+    new_results = []
+    if records:
+        known = set(
+            AssertionResult.objects.filter(
+                assertion=assertion, run_at__in=[record["run_at"] for record in records]
+            ).values_list("run_at", flat=True)
+        )
+        new_results = [
+            AssertionResult(
+                assertion=assertion,
+                run_at=record["run_at"],
+                status=record["status"],
+                details=record["details"],
+            )
+            for record in records
+            if record["run_at"] not in known
+        ]
+        AssertionResult.objects.bulk_create(new_results)
+
+        latest = records[0]
+        if assertion.last_run is None or latest["run_at"] >= assertion.last_run:
+            assertion.last_run = latest["run_at"]
+            assertion.last_status = latest["status"]
+
+    assertion.run_events_data = compact_run_events(run_events_data)
+    assertion.save(update_fields=["run_events_data", "last_run", "last_status"])
+    return len(new_results)
+
+
+def record_test_results(test, results):
+    """
+    Append the latest DataHub results of a metadata test to its history
+
+    Args:
+        test: Saved Test (the caller saves the updated counts)
+        results: results structure of the test (passingCount, failingCount, lastRunTimestampMillis)
+
+    Returns:
+        True if a new run was added to the history
+    """
+    if not isinstance(results, dict):
+        return False
+
+    test.passing_count = results.get("passingCount", 0)
+    test.failing_count = results.get("failingCount", 0)
+    test.last_run_timestamp = results.get("lastRunTimestampMillis")
+    test.results_data = results
+
+    run_at = millis_to_datetime(test.last_run_timestamp)
+    if run_at is None or TestResult.objects.filter(test=test, run_at=run_at).exists():
+        return False
+
+    TestResult.objects.create(
+        test=test,
+        run_at=run_at,
+        passing_count=test.passing_count,
+        failing_count=test.failing_count,
+        details=results,
+    )
+    return True
+
+
+def parse_history_time(value):
+    """
+    Parse a since/until query parameter given as epoch milliseconds or an ISO datetime
+
+    Args:
+        value: Query parameter value (may be empty)
+
+    Returns:
+        Timezone-aware datetime, or None if the value is empty
+
+    Raises:
+        ValueError: If the value is not a valid time
+    """
+    if not value:
+        return None
+    if value.isdigit():
+        return millis_to_datetime(value)
+    parsed = parse_datetime(value)
+    if parsed is None:
+        raise ValueError(f"Invalid time: {value}")
+    return parsed if timezone.is_aware(parsed) else timezone.make_aware(parsed)
+
+
+def run_history(results, since=None, until=None, limit=100):
+    """
+    Time-range query over a run history, most recent first
+
+    Args:
+        results: Related results manager (assertion.results or test.results)
+        since: Only runs at or after this datetime (optional)
+        until: Only runs before this datetime (optional)
+        limit: Maximum number of runs
+
+    Returns:
+        List of results
+    """
+    queryset = results.all()
+    if since:
+        queryset = queryset.filter(run_at__gte=since)
+    if until:
+        queryset = queryset.filter(run_at__lt=until)
+    return list(queryset.order_by("-run_at")[:limit])
+
+
+def prune_run_history(retention_days=None, downsample_after_days=None, dry_run=False):
+    """
+    Apply retention and downsampling to the assertion and test run histories
+
+    Args:
+        retention_days: Remove runs older than this (defaults to RUN_HISTORY_RETENTION_DAYS)
+        downsample_after_days: Keep one run per day once runs are older than this
+            (defaults to RUN_HISTORY_DOWNSAMPLE_AFTER_DAYS)
+        dry_run: Only count the runs that would be removed
+
+    Returns:
+        Dictionary with the number of runs removed per history
+    """
+    if retention_days is None:
+        retention_days = getattr(settings, "RUN_HISTORY_RETENTION_DAYS", DEFAULT_RETENTION_DAYS)
+    if downsample_after_days is None:
+        downsample_after_days = getattr(
+            settings, "RUN_HISTORY_DOWNSAMPLE_AFTER_DAYS", DEFAULT_DOWNSAMPLE_AFTER_DAYS
+        )
+
+    now = timezone.now()
+    # Runs more recent than this are always kept, so only older runs are read
+    intact_days = [days for days in (retention_days, downsample_after_days) if days > 0]
+
+    pruned = {}
+    for name, model, owner_field in (
+        ("assertion_results", AssertionResult, "assertion_id"),
+        ("test_results", TestResult, "test_id"),
+    ):
+        if not intact_days:
+            pruned[name] = 0
+            continue
+
+        runs = model.objects.filter(
+            run_at__lt=now - timedelta(days=min(intact_days))
+        ).values_list("id", owner_field, "run_at")
+        to_prune = sorted(
+            select_runs_to_prune(runs.iterator(), now, retention_days, downsample_after_days)
+        )
+        pruned[name] = len(to_prune)
+
+        if not dry_run:
+            for start in range(0, len(to_prune), DELETE_BATCH_SIZE):
+                model.objects.filter(id__in=to_prune[start:start + DELETE_BATCH_SIZE]).delete()
+
+        logger.info(f"{'Would remove' if dry_run else 'Removed'} {len(to_prune)} {name} from the run history")
+
+    return pruned
@@ -383,6 +383,11 @@ urlpatterns = [
         views_glossary.GlossaryRemoteAddToStagedChangesView.as_view(),
         name="glossary_remote_add_to_staged_changes",
     ),
+    path(
+        "glossary/bulk/stage_changes/",
+        views_glossary.GlossaryBulkAddToStagedChangesView.as_view(),
+        name="glossary_bulk_add_to_staged_changes",
+    ),
 
     # Domains
     path("domains/", views_domains.DomainListView.as_view(), name="domain_list"),
@@ -580,6 +585,11 @@ urlpatterns = [
         views_data_products.add_data_product_to_staged_changes,
         name="data_product_add_to_staged_changes",
     ),
+    path(
+        "data-products/bulk/stage_changes/",
+        views_data_products.bulk_add_data_products_to_staged_changes,
+        name="data_product_bulk_add_to_staged_changes",
+    ),
     path(
         "data-products/remote/stage_changes/",
         views_data_products.DataProductRemoteAddToStagedChangesView.as_view(),
@@ -621,6 +631,11 @@ urlpatterns = [
         views_assertions.AssertionDetailView.as_view(),
         name="assertion_detail",
     ),
+    path(
+        "assertions/<uuid:assertion_id>/history/",
+        views_assertions.assertion_run_history,
+        name="assertion_run_history",
+    ),
     path(
         "assertions/<uuid:assertion_id>/run/",
         views_assertions.AssertionRunView.as_view(),
@@ -631,6 +646,16 @@ urlpatterns = [
         views_assertions.AssertionDeleteView.as_view(),
         name="assertion_delete",
     ),
+    path(
+        "assertions/run-batch/",
+        views_assertions.run_assertions_batch,
+        name="run_assertions_batch",
+    ),
+    path(
+        "assertions/run-batch/<int:batch_run_id>/",
+        views_assertions.assertion_batch_progress,
+        name="assertion_batch_progress",
+    ),
     # New assertion action endpoints
     path(
         "assertions/run-remote/",
@@ -688,6 +713,11 @@ urlpatterns = [
         views_tests.TestDetailView.as_view(),
         name="test_detail",
     ),
+    path(
+        "tests/<str:test_id>/history/",
+        views_tests.TestRunHistoryView.as_view(),
+        name="test_run_history",
+    ),
     path(
         "tests/<str:test_id>/delete/",
         views_tests.TestDeleteView.as_view(),
@@ -18,7 +18,12 @@ project_root = os.path.dirname(
 sys.path.append(project_root)
 
 # Import the deterministic URN utilities
-from utils.datahub_utils import get_datahub_client, test_datahub_connection, get_datahub_client_from_request
+from utils.datahub_utils import (
+    get_datahub_client,
+    test_datahub_connection,
+    get_datahub_client_from_request,
+    get_platform_catalog,
+)
 from utils.datahub_rest_client import DataHubRestClient
 from .models import Tag, GlossaryNode, GlossaryTerm, Domain, Assertion, Environment, StructuredProperty, SearchResultCache, SearchProgress
 
@@ -225,60 +230,21 @@ def get_platform_instances(client, platform, entity_type=None):
         list: List of platform instance identifiers
     """
     try:
-        # This could use the DataHub client's GraphQL capabilities to fetch distinct instances
-        # For now, we'll return a simpler approach by querying with the platform name and analyzing results
-
-        # Build a query that just looks for this platform
-        query = f"platform:{platform}"
-        if entity_type:
-            query += f" AND type:{entity_type}"
-
-        # Fetch a small sample to identify instances
-        result = client.get_editable_entities(
-            start=0,
-            count=100,  # Sample size - balance between getting enough instances without too much overhead
-            query=query,
-            entity_type=entity_type,
-        )
-
-        if result is None or "searchResults" not in result:
-            logger.warning(f"No results found for platform {platform}")
+        catalog = get_platform_catalog(client, entity_type)
+        if catalog is None:
+            logger.warning(f"No platform catalog available for platform {platform}")
             return []
 
-        # Extract instance identifiers from URNs
-        instances = set()
-        for search_result in result.get("searchResults", []):
-            entity = search_result.get("entity", {})
-            urn = entity.get("urn", "")
-
-            # Parse URN to extract instance identifier
-            # Format is typically: urn:li:dataset:(urn:li:dataPlatform:platform, instance.database.schema.table, env)
-            try:
-                if "urn:li:dataset:" in urn or "urn:li:container:" in urn:
-                    parts = urn.split(",")
-                    if len(parts) >= 2:
-                        # The second part may contain instance.database format
-                        instance_part = parts[1].strip()
-                        # Extract just the instance part
-                        instance_id = instance_part.split(".")[0].strip()
-                        if instance_id and len(instance_id) > 0:
-                            instances.add(instance_id)
-            except Exception as e:
-                # Reduce verbose logging - only log unique errors
-                if "Error parsing URN" not in str(e):
-                    logger.debug(f"Error parsing URN {urn}: {str(e)}")
-                continue
-
+        instances = catalog.instance_names(platform)
         logger.info(
             f"Found {len(instances)} instances for platform {platform}: {instances}"
         )
-        return list(instances)
+        return instances
     except Exception as e:
         logger.error(f"Error getting platform instances: {str(e)}")
         return []
 
 
-# Extend the existing get_platform_list function to include known instances
 def get_platform_list(client, entity_type):
     """
     Get a list of platforms for the given entity type to use for pagination.
@@ -291,8 +257,11 @@ def get_platform_list(client, entity_type):
         list: List of platform names
     """
     try:
-        # This could use the DataHub client's GraphQL capabilities to fetch distinct platforms
-        # For now, return a hardcoded list of common platforms
+        catalog = get_platform_catalog(client, entity_type)
+        if catalog and catalog.platforms:
+            return catalog.platform_names()
+
+        # Fall back to common platforms when the catalog cannot be fetched
         if entity_type == "DATASET":
             return [
                 "postgres",
@@ -1244,7 +1213,7 @@ from .views_sync import *
 
 @require_http_methods(["GET"])
 def get_entity_details(request, urn):
-    """Get details of a specific entity."""
+    """Get the header of a specific entity (schema fields are served by get_entity_schema)."""
     try:
         # Get DataHub client using connection system
         client = get_client_from_session(request)
@@ -1253,8 +1222,9 @@ def get_entity_details(request, urn):
                 {"success": False, "error": "No active connection configured"}
             )
         
-        # Get entity details
-        entity = client.get_entity(urn)
+        # Get entity header
+        from utils.schema_fields import fetch_entity_header
+        entity = fetch_entity_header(client, urn)
         
         if not entity:
             return JsonResponse({"success": False, "error": "Entity not found"})
@@ -1268,7 +1238,15 @@ def get_entity_details(request, urn):
 
 @require_http_methods(["GET"])
 def get_entity_schema(request, urn):
-    """Get schema details for a dataset entity."""
+    """
+    Get one page of the schema fields of a dataset entity.
+
+    Query parameters:
+        cursor: next_cursor of the previous page (default: first page)
+        count: Number of fields per page
+        query: Only fields whose path contains this text
+        has_description, has_tags: "true" or "false" to filter on descriptions and tags/terms
+    """
     try:
         # Get DataHub client using connection system
         client = get_client_from_session(request)
@@ -1277,13 +1255,35 @@ def get_entity_schema(request, urn):
                 {"success": False, "error": "No active connection configured"}
             )
         
-        # Get schema details
-        schema = client.get_schema(urn)
+        from utils.datahub_utils import get_schema_fields
+        from utils.schema_fields import DEFAULT_PAGE_SIZE, page_fields
+        
+        def flag(name):
+            value = request.GET.get(name, "").lower()
+            return {"true": True, "false": False}.get(value)
         
-        if not schema:
+        # Get schema fields (parsed fields are cached per schema version)
+        version_key, fields = get_schema_fields(
+            client, urn, force_refresh=request.GET.get("refresh") == "true"
+        )
+        
+        if not fields:
             return JsonResponse({"success": False, "error": "Schema not found"})
         
-        return JsonResponse({"success": True, "schema": schema})
+        try:
+            page = page_fields(
+                fields,
+                version_key,
+                cursor=request.GET.get("cursor"),
+                count=int(request.GET.get("count", DEFAULT_PAGE_SIZE)),
+                query=request.GET.get("query"),
+                has_description=flag("has_description"),
+                has_tags=flag("has_tags"),
+            )
+        except ValueError as e:
+            return JsonResponse({"success": False, "error": str(e)}, status=400)
+        
+        return JsonResponse({"success": True, "schema": dict(page, urn=urn)})
         
     except Exception as e:
         logger.error(f"Error getting schema details: {str(e)}")
@@ -1978,44 +1978,20 @@ def get_platforms(request):
         
         entity_type = request.GET.get("entity_type")
         
-        # Fast platform discovery using DataHub's aggregation API
+        # Platforms of the cached platform catalog (facet aggregations, refreshed in the background)
         platforms = set()
+        platform_counts = {}
         
         try:
-            logger.info(f"Starting fast platform discovery using aggregation API for entity_type='{entity_type}'")
-            
-            # Use DataHub's aggregateAcrossEntities GraphQL query for efficient platform discovery
-            result = client.aggregate_across_entities(
-                facets=["platform"],
-                query="*",
-                entity_types=[entity_type] if entity_type else None,
-                max_agg_values=1000  # Get up to 1000 platforms - increased from 100
-            )
+            catalog = get_platform_catalog(client, entity_type)
             
-            if result and result.get("success") and "data" in result:
-                facets = result["data"].get("facets", [])
-                
-                for facet in facets:
-                    if facet.get("field") == "platform":
-                        aggregations = facet.get("aggregations", [])
-                        logger.info(f"Found {len(aggregations)} platform aggregations from GraphQL API")
-                        
-                        for agg in aggregations:
-                            entity = agg.get("entity", {})
-                            if entity.get("type") == "DATA_PLATFORM":
-                                platform_name = entity.get("name")
-                                if platform_name:
-                                    platforms.add(platform_name)
-                                    logger.debug(f"Added platform: {platform_name}")
-                            else:
-                                logger.debug(f"Skipped non-DATA_PLATFORM entity: {entity.get('type', 'unknown')}")
-                
-                logger.info(f"Fast platform discovery completed: found {len(platforms)} platforms using aggregation API")
-                if len(platforms) >= 1000:
-                    logger.warning("Platform discovery may have hit the 1000 platform limit - some platforms might be missing")
+            if catalog is not None:
+                platforms.update(catalog.platforms)
+                platform_counts = catalog.platforms
+                logger.info(f"Platform catalog lookup completed: found {len(platforms)} platforms")
                 
             else:
-                logger.warning("Aggregation API failed or returned no data, falling back to entity search")
+                logger.warning("Platform catalog unavailable, falling back to entity search")
                 # Fallback to a single search if aggregation fails
                 logger.info(f"Platform aggregation fallback - querying for platforms with entity_type: {entity_type}, count: 10000")
                 result = client.get_editable_entities(
@@ -2100,6 +2076,7 @@ def get_platforms(request):
         return JsonResponse({
             "success": True, 
             "platforms": platform_list,
+            "platform_counts": platform_counts,
             "entity_type": entity_type
         })
         
@@ -2402,11 +2379,21 @@ def export_entities_with_mutations(request):
 
 @require_http_methods(["GET"])
 def get_all_platform_instances(request):
-    """Get list of all platform instances from cached search results."""
+    """Get list of all platform instances from the platform catalog, or from cached search results."""
     try:
         entity_type = request.GET.get("entity_type")
         platform = request.GET.get("platform")  # Optional platform filter
         
+        # Instances of the cached platform catalog (facet aggregations, refreshed in the background)
+        catalog = get_platform_catalog(get_datahub_client_from_request(request), entity_type)
+        if catalog is not None:
+            return JsonResponse({
+                "success": True,
+                "platform_instances": catalog.instance_names(platform),
+                "entity_type": entity_type,
+                "platform": platform
+            })
+        
         logger.info(f"Getting platform instances from cache for entity_type='{entity_type}', platform='{platform}'")
         
         # Get session key
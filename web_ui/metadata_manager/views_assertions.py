@@ -24,7 +24,15 @@ sys.path.append(project_root)
 from utils.urn_utils import get_full_urn_from_name, generate_mutated_urn, get_mutation_config_for_environment
 from utils.datahub_utils import test_datahub_connection, get_datahub_client, get_datahub_client_from_request
 from utils.datahub_rest_client import DataHubRestClient
-from .models import Assertion, AssertionResult, Domain, Environment
+from .models import Assertion, AssertionBatchRun, AssertionResult, Domain, Environment
+from .run_history import (
+    ASSERTION_LIST_DEFERRED_FIELDS,
+    compact_run_events,
+    parse_history_time,
+    record_assertion_run_events,
+    run_history,
+    without_run_events,
+)
 from web_ui.models import Environment as DjangoEnvironment
 
 # Optional git integration imports
@@ -50,7 +58,7 @@ class AssertionListView(View):
             logger.info("Starting AssertionListView.get")
             
             # Get all local assertions and domains for domain assertions
-            local_assertions = Assertion.objects.all().order_by("name")
+            local_assertions = Assertion.objects.defer(*ASSERTION_LIST_DEFERRED_FIELDS).order_by("name")
             domains = Domain.objects.all().order_by("name")
 
             logger.debug(
@@ -418,7 +426,7 @@ class AssertionListView(View):
     def get(self, request):
         """Display list of SQL assertions"""
         try:
-            assertions = Assertion.objects.all().order_by("-updated_at")
+            assertions = Assertion.objects.defer(*ASSERTION_LIST_DEFERRED_FIELDS).order_by("-updated_at")
             
             # Check connection to DataHub
             connected, client = test_datahub_connection(request)
@@ -851,7 +859,7 @@ def get_remote_assertions_data(request):
         logger.debug(f"Using connection: {current_connection.name if current_connection else 'None'}")
 
         # Get all local assertions
-        local_assertions = Assertion.objects.all().order_by("name")
+        local_assertions = Assertion.objects.defer(*ASSERTION_LIST_DEFERRED_FIELDS).order_by("name")
 
         # Initialize data structures
         synced_items = []
@@ -1223,6 +1231,212 @@ def run_remote_assertion(request):
         return JsonResponse({"success": False, "error": str(e)})
 
 
+def _record_asset_results(batch_run_id, assertions_by_urn, asset_result):
+    """Persist the results of one asset of a batch run with bulk writes and update its progress"""
+    from django.db.models import F
+    from scripts.assertions.assertion_utils import format_assertion_result
+
+    now = timezone.now()
+    results = []
+    updated_assertions = []
+    for assertion_urn, raw_result in asset_result.results.items():
+        assertion = assertions_by_urn.get(assertion_urn)
+        if assertion is None:
+            continue
+        formatted = format_assertion_result(raw_result)
+        status = formatted.get("status", "UNKNOWN")
+        results.append(
+            AssertionResult(
+                assertion=assertion,
+                run_at=now,
+                status=status,
+                details=formatted.get("details", {}),
+                batch_run_id=batch_run_id,
+            )
+        )
+        assertion.last_run = now
+        assertion.last_status = status
+        updated_assertions.append(assertion)
+
+    AssertionResult.objects.bulk_create(results)
+    Assertion.objects.bulk_update(updated_assertions, ["last_run", "last_status"])
+
+    succeeded = sum(1 for result in results if result.status == "SUCCESS")
+    AssertionBatchRun.objects.filter(id=batch_run_id).update(
+        completed_assets=F("completed_assets") + 1,
+        failed_assets=F("failed_assets") + (1 if asset_result.error else 0),
+        succeeded=F("succeeded") + succeeded,
+        failed=F("failed") + len(results) - succeeded,
+        updated_at=now,
+    )
+    if asset_result.error:
+        batch_run = AssertionBatchRun.objects.get(id=batch_run_id)
+        batch_run.errors = batch_run.errors + [
+            {"asset_urn": asset_result.asset_urn, "error": asset_result.error}
+        ]
+        batch_run.save(update_fields=["errors"])
+
+
+def _run_assertion_batch(batch_run_id, assets, assertions_by_urn, metadata_client, max_workers):
+    """Run a batch of assertions in the background, recording results as each asset completes"""
+    from django.db import connection
+    from utils.assertion_batch import BatchAssertionRunner
+
+    try:
+        runner = BatchAssertionRunner(metadata_client, max_workers=max_workers)
+        runner.run(
+            assets,
+            on_asset_done=lambda asset_result: _record_asset_results(
+                batch_run_id, assertions_by_urn, asset_result
+            ),
+        )
+        AssertionBatchRun.objects.filter(id=batch_run_id).update(
+            status="COMPLETED", finished_at=timezone.now()
+        )
+    except Exception as e:
+        logger.error(f"Error running assertion batch {batch_run_id}: {str(e)}")
+        AssertionBatchRun.objects.filter(id=batch_run_id).update(
+            status="FAILED", finished_at=timezone.now()
+        )
+    finally:
+        connection.close()
+
+
+@require_http_methods(["POST"])
+def run_assertions_batch(request):
+    """
+    Run many local assertions in the background, grouped by asset with one
+    runAssertionsForAsset request per asset and several assets at a time.
+    Progress and results are available from assertion_batch_progress.
+    """
+    try:
+        import json
+        import threading
+        from utils.assertion_batch import DEFAULT_ASSERTION_WORKERS, group_by_asset
+        from utils.datahub_metadata_api import DataHubMetadataApiClient
+
+        data = json.loads(request.body or "{}")
+        assertion_ids = data.get("assertion_ids")
+        max_workers = max(1, int(data.get("max_workers", DEFAULT_ASSERTION_WORKERS)))
+
+        assertions = Assertion.objects.filter(
+            removed=False, urn__isnull=False, entity_urn__isnull=False
+        ).exclude(urn="")
+        if assertion_ids:
+            assertions = assertions.filter(id__in=assertion_ids)
+        assertions_by_urn = {assertion.urn: assertion for assertion in assertions}
+        if not assertions_by_urn:
+            return JsonResponse({"success": False, "error": "No assertions to run"})
+
+        # Check connection to DataHub
+        connected, client = test_datahub_connection(request)
+        if not connected or not client:
+            return JsonResponse({"success": False, "error": "Not connected to DataHub"})
+
+        metadata_client = DataHubMetadataApiClient(
+            server_url=client.server_url,
+            token=client.token,
+            verify_ssl=client.verify_ssl
+        )
+
+        groups = group_by_asset(
+            (assertion.urn, assertion.entity_urn) for assertion in assertions_by_urn.values()
+        )
+        batch_run = AssertionBatchRun.objects.create(
+            total_assets=len(groups),
+            total_assertions=sum(len(urns) for urns in groups.values()),
+            max_workers=max_workers,
+        )
+
+        batch_thread = threading.Thread(
+            target=_run_assertion_batch,
+            args=(batch_run.id, dict(groups), assertions_by_urn, metadata_client, max_workers),
+        )
+        batch_thread.daemon = True
+        batch_thread.start()
+
+        return JsonResponse({"success": True, "batch_run": batch_run.to_dict()})
+
+    except Exception as e:
+        logger.error(f"Error starting assertion batch: {str(e)}")
+        return JsonResponse({"success": False, "error": str(e)})
+
+
+@require_http_methods(["GET"])
+def assertion_batch_progress(request, batch_run_id):
+    """
+    Progress of an assertion batch run, with the results recorded so far.
+    Pass ?after=<result id> to only get the results recorded since a previous poll.
+    """
+    try:
+        batch_run = get_object_or_404(AssertionBatchRun, id=batch_run_id)
+        results = batch_run.results.select_related("assertion").order_by("id")
+        after = request.GET.get("after")
+        if after:
+            results = results.filter(id__gt=int(after))
+
+        return JsonResponse({
+            "success": True,
+            "batch_run": batch_run.to_dict(),
+            "results": [
+                {
+                    "id": result.id,
+                    "assertion_id": str(result.assertion.id),
+                    "assertion_urn": result.assertion.urn,
+                    "entity_urn": result.assertion.entity_urn,
+                    "status": result.status,
+                    "details": result.details,
+                    "run_at": result.run_at.isoformat(),
+                }
+                for result in results[:1000]
+            ],
+        })
+
+    except Exception as e:
+        logger.error(f"Error getting assertion batch progress: {str(e)}")
+        return JsonResponse({"success": False, "error": str(e)})
+
+
+@require_http_methods(["GET"])
+def assertion_run_history(request, assertion_id):
+    """
+    Run history of an assertion, most recent first.
+    Optional ?since= and ?until= (epoch millis or ISO datetime) and ?limit= (default 100).
+    """
+    try:
+        assertion = get_object_or_404(Assertion.objects.only("id", "name", "urn", "last_run", "last_status"), id=assertion_id)
+        limit = min(int(request.GET.get("limit", 100)), 1000)
+        results = run_history(
+            assertion.results,
+            since=parse_history_time(request.GET.get("since")),
+            until=parse_history_time(request.GET.get("until")),
+            limit=limit,
+        )
+
+        return JsonResponse({
+            "success": True,
+            "assertion_id": str(assertion.id),
+            "urn": assertion.urn,
+            "last_run": assertion.last_run.isoformat() if assertion.last_run else None,
+            "last_status": assertion.last_status,
+            "runs": [
+                {
+                    "run_at": result.run_at.isoformat(),
+                    "status": result.status,
+                    "details": result.details,
+                    "batch_run_id": result.batch_run_id,
+                }
+                for result in results
+            ],
+        })
+
+    except ValueError as e:
+        return JsonResponse({"success": False, "error": str(e)}, status=400)
+    except Exception as e:
+        logger.error(f"Error getting assertion run history: {str(e)}")
+        return JsonResponse({"success": False, "error": str(e)})
+
+
 @require_http_methods(["POST"])
 def sync_assertion_to_local(request):
     """Sync a remote assertion to local storage with comprehensive data"""
@@ -1457,7 +1671,7 @@ def sync_assertion_to_local(request):
             existing_assertion.info_data = info
             existing_assertion.ownership_data = ownership_data
             existing_assertion.relationships_data = relationships_data
-            existing_assertion.run_events_data = run_events_data
+            existing_assertion.run_events_data = compact_run_events(run_events_data)
             existing_assertion.tags_data = tags_data
             existing_assertion.monitor_data = monitor_data
             
@@ -1470,7 +1684,7 @@ def sync_assertion_to_local(request):
             existing_assertion.config.update({
                 "synced_from_datahub": True,
                 "datahub_urn": assertion_urn,
-                "raw_data": assertion_data
+                "raw_data": without_run_events(assertion_data)
             })
             
             existing_assertion.save()
@@ -1486,7 +1700,7 @@ def sync_assertion_to_local(request):
                 config={
                     "synced_from_datahub": True,
                     "datahub_urn": assertion_urn,
-                    "raw_data": assertion_data
+                    "raw_data": without_run_events(assertion_data)
                 },
                 
                 # URN tracking
@@ -1510,7 +1724,7 @@ def sync_assertion_to_local(request):
                 info_data=info,
                 ownership_data=ownership_data,
                 relationships_data=relationships_data,
-                run_events_data=run_events_data,
+                run_events_data=compact_run_events(run_events_data),
                 tags_data=tags_data,
                 monitor_data=monitor_data,
                 
@@ -1519,6 +1733,9 @@ def sync_assertion_to_local(request):
             )
             action = "created"
         
+        # Append the run events to the assertion's run history
+        record_assertion_run_events(assertion, run_events_data)
+        
         logger.info(f"Successfully {action} assertion: {assertion_urn}")
         return JsonResponse({
             "success": True,
@@ -1791,7 +2008,7 @@ def resync_assertion(request, assertion_id):
         assertion.info_data = info
         assertion.ownership_data = ownership_data
         assertion.relationships_data = relationships_data
-        assertion.run_events_data = run_events_data
+        assertion.run_events_data = compact_run_events(run_events_data)
         assertion.tags_data = tags_data
         assertion.monitor_data = monitor_data
         
@@ -1800,7 +2017,7 @@ def resync_assertion(request, assertion_id):
         
         # Update config and sync status
         assertion.config = assertion.config or {}
-        assertion.config["raw_data"] = assertion_data
+        assertion.config["raw_data"] = without_run_events(assertion_data)
         assertion.config["last_synced"] = timezone.now().isoformat()
         assertion.sync_status = "SYNCED"
         assertion.last_synced = timezone.now()
@@ -1810,6 +2027,7 @@ def resync_assertion(request, assertion_id):
             assertion.last_status = latest_run_status
         
         assertion.save()
+        record_assertion_run_events(assertion, run_events_data)
         
         logger.info(f"Successfully resynced assertion: {assertion_id} with {assertion_urn}")
         return JsonResponse({
@@ -2943,7 +3161,7 @@ def pull_assertions(request):
                             'info_data': info,
                             'ownership_data': assertion_data.get("ownership"),
                             'relationships_data': assertion_data.get("relationships"),
-                            'run_events_data': assertion_data.get("runEvents"),
+                            'run_events_data': compact_run_events(assertion_data.get("runEvents")),
                             'tags_data': assertion_data.get("tags"),
                             'monitor_data': assertion_data.get("monitor"),
                         }
@@ -2959,11 +3177,12 @@ def pull_assertions(request):
                         assertion.info_data = info
                         assertion.ownership_data = assertion_data.get("ownership")
                         assertion.relationships_data = assertion_data.get("relationships")
-                        assertion.run_events_data = assertion_data.get("runEvents")
+                        assertion.run_events_data = compact_run_events(assertion_data.get("runEvents"))
                         assertion.tags_data = assertion_data.get("tags")
                         assertion.monitor_data = assertion_data.get("monitor")
                         assertion.save()
                     
+                    record_assertion_run_events(assertion, assertion_data.get("runEvents"))
                     synced_count += 1
                     
             except Exception as e:
@@ -21,7 +21,7 @@ sys.path.append(project_root)
 
 from utils.datahub_utils import test_datahub_connection, get_datahub_client
 from utils.urn_utils import get_full_urn_from_name, generate_mutated_urn, get_mutation_config_for_environment
-from .models import DataProduct, Environment
+from .models import DataProduct, Environment, AppliedAspectState
 
 logger = logging.getLogger(__name__)
 
@@ -950,11 +950,6 @@ def push_data_product_to_datahub(request, data_product_id):
         
         logger.info(f"Pushing data product {data_product.name} to DataHub")
         
-        # Get DataHub connection
-        connected, client = test_datahub_connection(request)
-        if not connected or not client:
-            return JsonResponse({"success": False, "error": "Not connected to DataHub"})
-        
         # Prepare data product data for creation/update
         data_product_data = {
             "name": data_product.name,
@@ -972,6 +967,31 @@ def push_data_product_to_datahub(request, data_product_id):
         if data_product.entity_urns:
             data_product_data["entity_urns"] = data_product.entity_urns
         
+        # Skip the push when this connection already holds the same data product
+        from web_ui.views import get_current_connection
+        current_connection = get_current_connection(request)
+        aspects = {
+            "dataProductProperties": {key: value for key, value in data_product_data.items() if key != "urn"}
+        }
+        if request.POST.get("force") == "true":
+            changed = AppliedAspectState.fingerprint_aspects(aspects)
+        else:
+            changed = AppliedAspectState.get_changed_aspects(current_connection, data_product.urn, aspects)
+        
+        if not changed:
+            logger.info(f"Data product {data_product.name} is already up to date in DataHub, skipping push")
+            return JsonResponse({
+                "success": True,
+                "message": f"Data product '{data_product.name}' is already up to date in DataHub",
+                "datahub_urn": data_product.urn,
+                "skipped": True,
+            })
+        
+        # Get DataHub connection
+        connected, client = test_datahub_connection(request)
+        if not connected or not client:
+            return JsonResponse({"success": False, "error": "Not connected to DataHub"})
+        
         # Determine if this is an update or create operation
         if data_product.urn:
             # Update existing data product
@@ -989,6 +1009,7 @@ def push_data_product_to_datahub(request, data_product_id):
             data_product.sync_status = "SYNCED"
             data_product.last_synced = timezone.now()
             data_product.save()
+            AppliedAspectState.record_applied(current_connection, data_product.urn, changed)
             
             logger.info(f"Successfully pushed data product to DataHub: {data_product.name}")
             return JsonResponse({
@@ -1504,6 +1525,100 @@ def get_data_products(request):
         }, status=500)
 
 
+def _data_product_staging_data(data_product):
+    """Build the data product dictionary used to create staged MCPs from a local data product"""
+    # Extract custom properties from properties_data if available
+    # Custom properties can be stored in different formats:
+    # 1. As a dictionary in properties_data.customProperties
+    # 2. As an array of {key, value} objects in properties_data.customProperties
+    custom_properties = {}
+    if data_product.properties_data and isinstance(data_product.properties_data, dict):
+        stored_custom_props = data_product.properties_data.get("customProperties")
+        if stored_custom_props:
+            if isinstance(stored_custom_props, dict):
+                # Format 1: Dictionary
+                custom_properties = stored_custom_props
+            elif isinstance(stored_custom_props, list):
+                # Format 2: Array of {key, value} objects
+                for prop in stored_custom_props:
+                    if isinstance(prop, dict) and 'key' in prop and 'value' in prop:
+                        custom_properties[prop['key']] = prop['value']
+
+    # Extract other metadata from stored JSON fields
+    owners = []
+    if data_product.ownership_data and isinstance(data_product.ownership_data, dict):
+        ownership_list = data_product.ownership_data.get("owners", [])
+        for owner_info in ownership_list:
+            owner_urn = owner_info.get("owner")
+            if owner_urn:
+                owners.append(owner_urn)
+
+    tags = []
+    if data_product.tags_data and isinstance(data_product.tags_data, dict):
+        tag_list = data_product.tags_data.get("tags", [])
+        for tag_info in tag_list:
+            tag_urn = tag_info.get("tag")
+            if tag_urn:
+                tags.append(tag_urn)
+
+    terms = []
+    if data_product.glossary_terms_data and isinstance(data_product.glossary_terms_data, dict):
+        terms_list = data_product.glossary_terms_data.get("terms", [])
+        for term_info in terms_list:
+            term_urn = term_info.get("urn")
+            if term_urn:
+                terms.append(term_urn)
+
+    structured_properties = []
+    if data_product.structured_properties_data and isinstance(data_product.structured_properties_data, dict):
+        props_list = data_product.structured_properties_data.get("properties", [])
+        for prop in props_list:
+            prop_urn = prop.get("structuredProperty", {}).get("urn")
+            values = prop.get("values", [])
+            if prop_urn and values:
+                structured_properties.append({
+                    "propertyUrn": prop_urn,
+                    "values": values
+                })
+
+    links = []
+    if data_product.institutional_memory_data and isinstance(data_product.institutional_memory_data, dict):
+        elements = data_product.institutional_memory_data.get("elements", [])
+        for element in elements:
+            url = element.get("url")
+            description = element.get("description", "")
+            if url:
+                links.append({
+                    "url": url,
+                    "description": description
+                })
+
+    domains = []
+    if data_product.domain_urn:
+        domains.append(data_product.domain_urn)
+
+    # Prepare comprehensive data product data
+    return {
+        "id": str(data_product.id),
+        "name": data_product.name,
+        "description": data_product.description,
+        "urn": data_product.urn,
+        "external_url": data_product.external_url,
+        "domain_urn": data_product.domain_urn,
+        "entity_urns": data_product.entity_urns or [],
+        "entities_count": len(data_product.entity_urns or []),
+        "sync_status": data_product.sync_status,
+        # Add extracted metadata for MCP creation
+        "custom_properties": custom_properties,
+        "owners": owners,
+        "tags": tags,
+        "terms": terms,
+        "domains": domains,
+        "links": links,
+        "structured_properties": structured_properties,
+    }
+
+
 @method_decorator(require_POST)
 def add_data_product_to_staged_changes(request, data_product_id):
     """Add a data product to staged changes by creating comprehensive MCP files"""
@@ -1530,104 +1645,18 @@ def add_data_product_to_staged_changes(request, data_product_id):
                 "error": f"Data product with id {data_product_id} not found"
             }, status=404)
         
-        # Extract custom properties from properties_data if available
-        # Custom properties can be stored in different formats:
-        # 1. As a dictionary in properties_data.customProperties
-        # 2. As an array of {key, value} objects in properties_data.customProperties
-        custom_properties = {}
-        if data_product.properties_data and isinstance(data_product.properties_data, dict):
-            stored_custom_props = data_product.properties_data.get("customProperties")
-            if stored_custom_props:
-                if isinstance(stored_custom_props, dict):
-                    # Format 1: Dictionary
-                    custom_properties = stored_custom_props
-                elif isinstance(stored_custom_props, list):
-                    # Format 2: Array of {key, value} objects
-                    for prop in stored_custom_props:
-                        if isinstance(prop, dict) and 'key' in prop and 'value' in prop:
-                            custom_properties[prop['key']] = prop['value']
-        
-        # Extract other metadata from stored JSON fields
-        owners = []
-        if data_product.ownership_data and isinstance(data_product.ownership_data, dict):
-            ownership_list = data_product.ownership_data.get("owners", [])
-            for owner_info in ownership_list:
-                owner_urn = owner_info.get("owner")
-                if owner_urn:
-                    owners.append(owner_urn)
-        
-        tags = []
-        if data_product.tags_data and isinstance(data_product.tags_data, dict):
-            tag_list = data_product.tags_data.get("tags", [])
-            for tag_info in tag_list:
-                tag_urn = tag_info.get("tag")
-                if tag_urn:
-                    tags.append(tag_urn)
-        
-        terms = []
-        if data_product.glossary_terms_data and isinstance(data_product.glossary_terms_data, dict):
-            terms_list = data_product.glossary_terms_data.get("terms", [])
-            for term_info in terms_list:
-                term_urn = term_info.get("urn")
-                if term_urn:
-                    terms.append(term_urn)
-        
-        structured_properties = []
-        if data_product.structured_properties_data and isinstance(data_product.structured_properties_data, dict):
-            props_list = data_product.structured_properties_data.get("properties", [])
-            for prop in props_list:
-                prop_urn = prop.get("structuredProperty", {}).get("urn")
-                values = prop.get("values", [])
-                if prop_urn and values:
-                    structured_properties.append({
-                        "propertyUrn": prop_urn,
-                        "values": values
-                    })
-        
-        links = []
-        if data_product.institutional_memory_data and isinstance(data_product.institutional_memory_data, dict):
-            elements = data_product.institutional_memory_data.get("elements", [])
-            for element in elements:
-                url = element.get("url")
-                description = element.get("description", "")
-                if url:
-                    links.append({
-                        "url": url,
-                        "description": description
-                    })
-        
-        domains = []
-        if data_product.domain_urn:
-            domains.append(data_product.domain_urn)
-        
-        # Prepare comprehensive data product data
-        data_product_data = {
-            "id": str(data_product.id),
-            "name": data_product.name,
-            "description": data_product.description,
-            "urn": data_product.urn,
-            "external_url": data_product.external_url,
-            "domain_urn": data_product.domain_urn,
-            "entity_urns": data_product.entity_urns or [],
-            "entities_count": len(data_product.entity_urns or []),
-            "sync_status": data_product.sync_status,
-            # Add extracted metadata for MCP creation
-            "custom_properties": custom_properties,
-            "owners": owners,
-            "tags": tags,
-            "terms": terms,
-            "domains": domains,
-            "links": links,
-            "structured_properties": structured_properties,
-        }
+        data_product_data = _data_product_staging_data(data_product)
         
         # Create staged changes (using new single MCP file approach)
         result = add_data_product_mcps(
             data_product_data=data_product_data,
             environment="dev",
             owner=request.user.username if request.user.is_authenticated else "admin",
-            base_dir="metadata-manager"
+            base_dir="metadata-manager",
+            # Only regenerate the aspects whose fields changed since the last staging
+            aspects=data_product.get_dirty_aspects("dev")
         )
+        data_product.mark_aspects_staged("dev")
         
         return JsonResponse({
             "success": True,
@@ -1647,6 +1676,56 @@ def add_data_product_to_staged_changes(request, data_product_id):
         }) 
 
 
+@require_POST
+def bulk_add_data_products_to_staged_changes(request):
+    """Add many local data products to staged changes, writing the staged MCP file once"""
+    try:
+        from scripts.mcps.data_product_actions import bulk_add_data_products_to_staged_changes as bulk_add_data_product_mcps
+        
+        data = json.loads(request.body)
+        environment = data.get("environment") or "dev"
+        data_product_ids = data.get("data_product_ids", [])
+        
+        data_products = list(DataProduct.objects.filter(id__in=data_product_ids))
+        if not data_products:
+            return JsonResponse({
+                "success": False,
+                "error": "No data products found to add to staged changes"
+            }, status=400)
+        
+        result = bulk_add_data_product_mcps(
+            data_products_data=[_data_product_staging_data(data_product) for data_product in data_products],
+            environment=environment,
+            owner=request.user.username if request.user.is_authenticated else "admin",
+            mutation_name=data.get("mutation_name"),
+        )
+        
+        # Record the staged field values so later single stagings only regenerate changed aspects
+        for index in result["staged_indexes"]:
+            data_products[index].mark_aspects_staged(environment)
+        
+        errors = result["errors"]
+        message = f"Add to staged changes completed: {result['success_count']} data products processed, {result['mcps_created']} MCPs created, {result['error_count']} failed"
+        if errors:
+            message += f". Errors: {'; '.join(errors[:5])}"  # Show first 5 errors
+            if len(errors) > 5:
+                message += f" and {len(errors) - 5} more..."
+        
+        return JsonResponse({
+            "success": True,
+            "message": message,
+            "success_count": result["success_count"],
+            "error_count": result["error_count"],
+            "mcps_created_count": result["mcps_created"],
+            "errors": errors,
+            "files_created": [result["mcp_file"]] if result["mcp_file"] else []
+        })
+        
+    except Exception as e:
+        logger.error(f"Error bulk adding data products to staged changes: {str(e)}")
+        return JsonResponse({"success": False, "error": str(e)}, status=500)
+
+
 @method_decorator(csrf_exempt, name="dispatch")
 class DataProductRemoteAddToStagedChangesView(View):
     """API endpoint to add a remote data product to staged changes without syncing to local first"""
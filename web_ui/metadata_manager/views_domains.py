@@ -18,9 +18,17 @@ sys.path.append(
 
 # Import the deterministic URN utilities
 from utils.urn_utils import get_full_urn_from_name, generate_mutated_urn, get_mutation_config_for_environment
-from utils.datahub_utils import get_datahub_client, test_datahub_connection, get_datahub_client_from_request
+from utils.datahub_utils import (
+    get_datahub_client,
+    test_datahub_connection,
+    get_datahub_client_from_request,
+    get_metadata_mirror,
+    get_usage_counts,
+)
+from utils.relationship_graph import parent_domain_urn
+from utils.usage_counts import fetch_value_counts
 from utils.token_utils import get_token_from_env
-from .models import Domain
+from .models import Domain, AppliedAspectState
 from web_ui.models import GitSettings
 
 # Import git integration
@@ -700,12 +708,10 @@ class DomainPullView(View):
                             
                             # Update entities count
                             try:
-                                entities_result = client.find_entities_with_domain(domain_urn, count=1)
-                                if entities_result:
-                                    existing_domain.entities_count = entities_result.get("total", 0)
+                                entity_counts = fetch_value_counts(client, "domains", [domain_urn])
+                                existing_domain.entities_count = entity_counts.get(domain_urn, 0)
                             except Exception as e:
-                                logger.warning(f"Error getting entities count for domain {domain_urn}: {str(e)}")
-                                existing_domain.entities_count = 0
+                                logger.warning(f"Error counting entities of domain {domain_urn}: {str(e)}")
                             
                             # Store raw GraphQL data
                             existing_domain.raw_data = domain_data
@@ -841,14 +847,8 @@ class DomainPullView(View):
                                 relationships = domain_data.get("relationships", {})
                                 existing_domain.relationships_count = len(relationships.get("relationships", [])) if relationships else 0
                                 
-                                # Update entities count
-                                try:
-                                    entities_result = client.find_entities_with_domain(domain_urn, count=1)
-                                    if entities_result:
-                                        existing_domain.entities_count = entities_result.get("total", 0)
-                                except Exception as e:
-                                    logger.warning(f"Error getting entities count for domain {domain_urn}: {str(e)}")
-                                    existing_domain.entities_count = 0
+                                # Update entities count (filled by list_domains from one facet request)
+                                existing_domain.entities_count = domain_data.get("entities_count", 0)
                                 
                                 # Store raw GraphQL data
                                 existing_domain.raw_data = domain_data
@@ -881,14 +881,8 @@ class DomainPullView(View):
                                 relationships = domain_data.get("relationships", {})
                                 relationships_count = len(relationships.get("relationships", [])) if relationships else 0
                                 
-                                # Get entities count
-                                entities_count = 0
-                                try:
-                                    entities_result = client.find_entities_with_domain(domain_urn, count=1)
-                                    if entities_result:
-                                        entities_count = entities_result.get("total", 0)
-                                except Exception as e:
-                                    logger.warning(f"Error getting entities count for domain {domain_urn}: {str(e)}")
+                                # Get entities count (filled by list_domains from one facet request)
+                                entities_count = domain_data.get("entities_count", 0)
                                 
                                 Domain.objects.create(
                                     name=domain_data.get("name"),
@@ -1050,9 +1044,19 @@ def get_remote_domains_data(request):
             if datahub_url.endswith("/api/gms"):
                 datahub_url = datahub_url[:-8]  # Remove /api/gms to get base URL
 
-            # Get all remote domains from DataHub with enhanced data
-            remote_domains = client.list_domains(count=1000)
+            # Get all remote domains, from the local metadata mirror when it is fresh
+            mirror = get_metadata_mirror(client, "DOMAIN")
+            if mirror:
+                with mirror:
+                    remote_domains = mirror.list_domains()
+            else:
+                remote_domains = client.list_domains(count=1000, include_entity_counts=False)
             remote_domains_count = len(remote_domains) if remote_domains else 0
+
+            # Entity counts of all domains, from the cached domains facet
+            entity_counts = get_usage_counts(
+                client, "domains", [domain.get("urn") for domain in remote_domains or [] if domain]
+            )
             logger.debug(f"Fetched {remote_domains_count} remote domains")
             
             if remote_domains_count == 0:
@@ -1073,41 +1077,8 @@ def get_remote_domains_data(request):
                     properties = domain.get("properties") or {}
                     
                     # Extract parent domain information from multiple sources
-                    parent_urn = None
-                    
-                    # Try parentDomain first
-                    parent_domain = domain.get("parentDomain")
-                    if parent_domain:
-                        if isinstance(parent_domain, dict):
-                            parent_urn = parent_domain.get("urn") if parent_domain else None
-                        else:
-                            parent_urn = parent_domain
-                    
-                    # If not found, try parentDomains structure
-                    if not parent_urn:
-                        parent_domains = domain.get("parentDomains")
-                        if parent_domains and isinstance(parent_domains, dict) and parent_domains.get("domains"):
-                            domains_list = parent_domains["domains"]
-                            if domains_list and len(domains_list) > 0:
-                                parent_domain = domains_list[0]
-                                if isinstance(parent_domain, dict):
-                                    parent_urn = parent_domain.get("urn") if parent_domain else None
-                                else:
-                                    parent_urn = parent_domain
-                    
-                    # If still not found, try incoming parent relationships
-                    if not parent_urn:
-                        parent_relationships = domain.get("parentRelationships", {})
-                        if parent_relationships and parent_relationships.get("relationships"):
-                            relationships_list = parent_relationships["relationships"]
-                            for rel in relationships_list:
-                                if rel and rel.get("type") in ["ParentOf", "Contains"] and rel.get("entity"):
-                                    parent_entity = rel["entity"]
-                                    if parent_entity.get("type") == "DOMAIN":
-                                        parent_urn = parent_entity.get("urn")
-                                        break
-                    
-                    
+                    parent_urn = parent_domain_urn(domain)
+
                     enhanced_domain = {
                         "urn": domain_urn,
                         "name": properties.get("name", ""),
@@ -1160,13 +1131,8 @@ def get_remote_domains_data(request):
                     
                     # Domains don't have relationships like tags do
                     
-                    # Get entities count from GraphQL response
-                    entities_data = domain.get("entities")
-                    if entities_data and isinstance(entities_data, dict):
-                        enhanced_domain["entities_count"] = entities_data.get("total", 0)
-                    else:
-                        # Fallback to direct entities_count field if available
-                        enhanced_domain["entities_count"] = domain.get("entities_count", 0)
+                    # Get entities count from the domains facet
+                    enhanced_domain["entities_count"] = entity_counts.get(domain_urn, domain.get("entities_count", 0))
                     
                     # Process structured properties
                     structured_props = domain.get("structuredProperties", {})
@@ -1762,6 +1728,84 @@ def resync_domain(request, domain_id):
         return JsonResponse({"success": False, "error": str(e)})
 
 
+def get_domain_push_aspects(domain):
+    """
+    Get the aspect content a push sends to DataHub for a domain, keyed by aspect name.
+    Used to compare against the last applied state of the current connection, so it
+    only holds what push_domain_to_datahub writes.
+    """
+    aspects = {
+        "domainProperties": {
+            "name": domain.name,
+            "description": domain.description or "",
+            "parentDomain": domain.parent_domain_urn or None,
+        },
+    }
+
+    if domain.color_hex or domain.icon_name:
+        aspects["displayProperties"] = {
+            "colorHex": domain.color_hex or None,
+            "icon": {"name": domain.icon_name, "style": domain.icon_style or None} if domain.icon_name else None,
+        }
+
+    if getattr(domain, 'ownership_data', None) and domain.ownership_data.get('owners'):
+        owners = [
+            {
+                "owner": owner_info.get('owner_urn'),
+                "type": owner_info.get('ownership_type_urn', 'urn:li:ownershipType:__system__business_owner'),
+            }
+            for owner_info in domain.ownership_data['owners']
+            if owner_info.get('owner_urn')
+        ]
+        if owners:
+            aspects["ownership"] = {"owners": owners}
+
+    return aspects
+
+
+def get_domain_remote_drift(aspects, remote_domain):
+    """
+    Get the names of the push aspects whose content DataHub does not hold, from the
+    domain as returned by get_domain (every aspect if the domain does not exist).
+    Catches changes made outside this app, which the applied aspect manifest cannot see.
+    """
+    if not remote_domain:
+        return set(aspects)
+
+    drifted = set()
+    properties = aspects["domainProperties"]
+    if (
+        remote_domain.get("name") != properties["name"]
+        or (remote_domain.get("description") or "") != properties["description"]
+        or (remote_domain.get("parentDomain") or None) != properties["parentDomain"]
+    ):
+        drifted.add("domainProperties")
+
+    display = aspects.get("displayProperties")
+    if display:
+        remote_display = remote_domain.get("displayProperties") or {}
+        remote_icon = remote_display.get("icon") or {}
+        icon = display["icon"] or {}
+        if (
+            (display["colorHex"] and remote_display.get("colorHex") != display["colorHex"])
+            or (icon.get("name") and remote_icon.get("name") != icon["name"])
+            or (icon.get("style") and remote_icon.get("style") != icon["style"])
+        ):
+            drifted.add("displayProperties")
+
+    ownership = aspects.get("ownership")
+    if ownership:
+        # Pushes only add owners, so DataHub holds the aspect if it has every local owner
+        remote_owners = {
+            ((owner.get("owner") or {}).get("urn"), (owner.get("ownershipType") or {}).get("urn"))
+            for owner in ((remote_domain.get("ownership") or {}).get("owners") or [])
+        }
+        if any((owner["owner"], owner["type"]) not in remote_owners for owner in ownership["owners"]):
+            drifted.add("ownership")
+
+    return drifted
+
+
 @require_POST
 def push_domain_to_datahub(request, domain_id):
     """AJAX endpoint to push a domain to DataHub"""
@@ -1771,11 +1815,6 @@ def push_domain_to_datahub(request, domain_id):
         # Get the domain
         domain = get_object_or_404(Domain, id=domain_id)
         
-        # Test DataHub connection
-        connected, client = test_datahub_connection(request)
-        if not connected or not client:
-            return JsonResponse({"success": False, "error": "Not connected to DataHub"})
-
         # Use the original DataHub URN for pushing if domain has datahub_id, otherwise use deterministic URN
         if hasattr(domain, 'datahub_id') and domain.datahub_id:
             # For synced domains, use the original DataHub URN
@@ -1784,16 +1823,48 @@ def push_domain_to_datahub(request, domain_id):
             # For local-only domains, use the deterministic URN
             target_urn = domain.urn
         
+        # Test DataHub connection
+        connected, client = test_datahub_connection(request)
+        if not connected or not client:
+            return JsonResponse({"success": False, "error": "Not connected to DataHub"})
+
         try:
+            # Check if domain exists in DataHub, and what it holds
+            existing_domain = client.get_domain(target_urn)
+            
+            # Skip aspects this connection already holds, unless a full push is forced
+            from web_ui.views import get_current_connection
+            current_connection = get_current_connection(request)
+            aspects = get_domain_push_aspects(domain)
+            fingerprints = AppliedAspectState.fingerprint_aspects(aspects)
+            if request.POST.get("force") == "true":
+                changed = fingerprints
+            else:
+                changed = AppliedAspectState.get_changed_aspects(current_connection, target_urn, aspects)
+                # The manifest only knows what this app pushed: also push what DataHub no longer holds
+                drifted = get_domain_remote_drift(aspects, existing_domain)
+                if drifted - set(changed):
+                    logger.info(f"Domain '{domain.name}' changed in DataHub ({', '.join(sorted(drifted - set(changed)))})")
+                changed.update({aspect_name: fingerprints[aspect_name] for aspect_name in drifted})
+            
+            if not changed:
+                logger.info(f"Domain '{domain.name}' is already up to date in DataHub, skipping push")
+                domain.sync_status = "SYNCED"
+                domain.last_synced = timezone.now()
+                domain.save(update_fields=["sync_status", "last_synced"])
+                return JsonResponse({
+                    "success": True,
+                    "message": f"Domain '{domain.name}' is already up to date in DataHub",
+                    "applied": [],
+                    "skipped": sorted(aspects),
+                })
+
             logger.debug(f"Pushing domain to DataHub: {domain.name} with URN: {target_urn}")
             
-            # Track what needs to be updated
+            # Track what needs to be updated, and the aspects actually written
             updates_needed = []
             update_success = True
-            domain_created = False
-            
-            # First, check if domain exists in DataHub
-            existing_domain = client.get_domain(target_urn)
+            applied = {}
             
             if not existing_domain:
                 # Domain doesn't exist, create it first
@@ -1802,40 +1873,58 @@ def push_domain_to_datahub(request, domain_id):
                 # Extract domain ID from URN for creation
                 domain_id = target_urn.split(":")[-1]
                 
-                # Get parent domain URN if exists
-                parent_domain_urn = None
-                if hasattr(domain, 'parent_urn') and domain.parent_urn:
-                    parent_domain_urn = domain.parent_urn
-                
                 # Create domain
                 created_urn = client.create_domain(
                     domain_id=domain_id,
                     name=domain.name,
                     description=domain.description or "",
-                    parent_domain_urn=parent_domain_urn
+                    parent_domain_urn=domain.parent_domain_urn or None
                 )
                 
                 if created_urn:
                     logger.info(f"Successfully created domain in DataHub: {created_urn}")
                     target_urn = created_urn  # Use the returned URN
                     updates_needed.append("created")
-                    domain_created = True
+                    # A newly created domain needs every aspect; creation writes its properties
+                    changed = fingerprints
+                    applied["domainProperties"] = fingerprints["domainProperties"]
                 else:
                     logger.error(f"Failed to create domain {domain.name} in DataHub")
                     return JsonResponse({"success": False, "error": f"Failed to create domain {domain.name} in DataHub"})
-            else:
+            elif "domainProperties" in changed:
                 logger.debug(f"Domain {target_urn} already exists in DataHub, updating properties")
-            
-            # Update description if it exists and domain wasn't just created (creation includes description)
-            if domain.description and not domain_created:
-                if client.update_domain_description(target_urn, domain.description):
-                    updates_needed.append("description")
+                properties = aspects["domainProperties"]
+                properties_success = True
+                
+                if existing_domain.get("name") != properties["name"]:
+                    if client.update_domain_name(target_urn, properties["name"]):
+                        updates_needed.append("name")
+                    else:
+                        properties_success = False
+                        logger.error(f"Failed to update name for domain {domain.name}")
+                
+                # An empty description clears the one in DataHub
+                if (existing_domain.get("description") or "") != properties["description"]:
+                    if client.update_domain_description(target_urn, properties["description"]):
+                        updates_needed.append("description")
+                    else:
+                        properties_success = False
+                        logger.error(f"Failed to update description for domain {domain.name}")
+                
+                if (existing_domain.get("parentDomain") or None) != properties["parentDomain"]:
+                    if client.move_domain(target_urn, properties["parentDomain"]):
+                        updates_needed.append("parent domain")
+                    else:
+                        properties_success = False
+                        logger.error(f"Failed to move domain {domain.name}")
+                
+                if properties_success:
+                    applied["domainProperties"] = changed["domainProperties"]
                 else:
                     update_success = False
-                    logger.error(f"Failed to update description for domain {domain.name}")
             
             # Update display properties if they exist
-            if domain.color_hex or domain.icon_name:
+            if "displayProperties" in changed:
                 color_hex = domain.color_hex if domain.color_hex else None
                 icon_data = None
                 
@@ -1848,31 +1937,31 @@ def push_domain_to_datahub(request, domain_id):
                 
                 if client.update_domain_display_properties(target_urn, color_hex=color_hex, icon=icon_data):
                     updates_needed.append("display properties")
+                    applied["displayProperties"] = changed["displayProperties"]
                 else:
                     update_success = False
                     logger.error(f"Failed to update display properties for domain {domain.name}")
             
             # Update ownership if it exists
-            if hasattr(domain, 'ownership_data') and domain.ownership_data and domain.ownership_data.get('owners'):
-                for owner_info in domain.ownership_data['owners']:
-                    owner_urn = owner_info.get('owner_urn')
-                    ownership_type_urn = owner_info.get('ownership_type_urn', 'urn:li:ownershipType:__system__business_owner')
-                    
-                    if owner_urn:
-                        if client.add_domain_owner(target_urn, owner_urn, ownership_type_urn):
-                            if "ownership" not in updates_needed:
-                                updates_needed.append("ownership")
-                        else:
-                            update_success = False
-                            logger.error(f"Failed to add owner {owner_urn} to domain {domain.name}")
+            if "ownership" in changed:
+                ownership_success = True
+                for owner in aspects["ownership"]["owners"]:
+                    if client.add_domain_owner(target_urn, owner["owner"], owner["type"]):
+                        if "ownership" not in updates_needed:
+                            updates_needed.append("ownership")
+                    else:
+                        ownership_success = False
+                        logger.error(f"Failed to add owner {owner['owner']} to domain {domain.name}")
+                if ownership_success:
+                    applied["ownership"] = changed["ownership"]
+                else:
+                    update_success = False
+            
+            # Only record the aspects that were really written
+            AppliedAspectState.record_applied(current_connection, target_urn, applied)
             
             if update_success:
                 # Update domain status
-                
-                # Get current connection to set on domain
-                from web_ui.views import get_current_connection
-                current_connection = get_current_connection(request)
-                
                 domain.sync_status = "SYNCED"
                 domain.last_synced = timezone.now()
                 if current_connection:
@@ -1888,6 +1977,8 @@ def push_domain_to_datahub(request, domain_id):
                 return JsonResponse({
                     "success": True,
                     "message": f"Domain '{domain.name}' pushed to DataHub successfully{updates_msg}",
+                    "applied": sorted(changed),
+                    "skipped": sorted(set(aspects) - set(changed)),
                 })
             else:
                 return JsonResponse({"success": False, "error": "Some domain updates failed"})
@@ -2297,96 +2388,80 @@ def bulk_add_domains_to_staged_changes(request):
         
         # Import the domain actions module
         sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-        from scripts.mcps.domain_actions import add_domain_to_staged_changes
-        
-        success_count = 0
-        error_count = 0
-        files_created_count = 0
-        files_skipped_count = 0
-        errors = []
-        all_created_files = []
+        from scripts.mcps.domain_actions import bulk_add_domains_to_staged_changes
         
+        domains_kwargs = []
         for domain in domains:
-            try:
-                # Extract domain ID from URN or use database ID
-                domain_id = domain.datahub_id or domain.urn.split(":")[-1] if domain.urn else str(domain.id)
-                
-                # Prepare ownership data
-                owners = []
-                if domain.ownership_data and isinstance(domain.ownership_data, dict):
-                    ownership_list = domain.ownership_data.get("owners", [])
-                    for owner_info in ownership_list:
-                        owner_urn = owner_info.get("owner_urn")
-                        if owner_urn:
-                            owners.append(owner_urn)
-                
-                # Prepare display properties
-                display_properties = {}
-                if domain.color_hex:
-                    display_properties["colorHex"] = domain.color_hex
-                if domain.icon_name:
-                    display_properties["icon"] = {
-                        "name": domain.icon_name,
-                        "style": domain.icon_style or "solid",
-                        "iconLibrary": domain.icon_library or "MATERIAL"
-                    }
-                
-                # Prepare structured properties from raw_data if available
-                structured_properties = []
-                if domain.raw_data and isinstance(domain.raw_data, dict):
-                    structured_props = domain.raw_data.get("structuredProperties", {})
-                    if structured_props and structured_props.get("properties"):
-                        for prop in structured_props["properties"]:
-                            prop_urn = prop.get("structuredProperty", {}).get("urn")
-                            values = prop.get("values", [])
-                            if prop_urn and values:
-                                structured_properties.append({
-                                    "propertyUrn": prop_urn,
-                                    "values": values
-                                })
-                
-                # Add domain to staged changes with comprehensive aspects
-                result = add_domain_to_staged_changes(
-                    domain_id=domain_id,
-                    name=domain.name,
-                    description=domain.description,
-                    owners=owners if owners else None,
-                    tags=None,  # TODO: Extract tags if stored
-                    terms=None,  # TODO: Extract glossary terms if stored
-                    links=None,  # TODO: Extract institutional memory if stored
-                    custom_properties=None,  # Domains typically don't have custom properties
-                    structured_properties=structured_properties if structured_properties else None,
-                    forms=None,  # TODO: Extract forms if stored
-                    test_results=None,  # TODO: Extract test results if stored
-                    display_properties=display_properties if display_properties else None,
-                    parent_domain=domain.parent_domain_urn,
-                    include_all_aspects=True,
-                    environment=environment,
-                    owner="system",  # Default owner
-                    base_dir="metadata",
-                    # Pass existing URN if domain has one (for proper NEW vs EXISTING handling)
-                    existing_urn=domain.urn if domain.urn else None
-                )
-                
-                if result.get("success"):
-                    success_count += 1
-                    files_created = result.get("files_saved", [])
-                    files_created_count += len(files_created)
-                    all_created_files.extend(files_created)
-                else:
-                    error_count += 1
-                    errors.append(f"Domain {domain.name}: {result.get('message', 'Unknown error')}")
-                
-            except Exception as e:
-                error_count += 1
-                errors.append(f"Domain {domain.name}: {str(e)}")
-                logger.error(f"Error adding domain {domain.name} to staged changes: {str(e)}")
+            # Extract domain ID from URN or use database ID
+            domain_id = domain.datahub_id or domain.urn.split(":")[-1] if domain.urn else str(domain.id)
+            
+            # Prepare ownership data
+            owners = []
+            if domain.ownership_data and isinstance(domain.ownership_data, dict):
+                ownership_list = domain.ownership_data.get("owners", [])
+                for owner_info in ownership_list:
+                    owner_urn = owner_info.get("owner_urn")
+                    if owner_urn:
+                        owners.append(owner_urn)
+            
+            # Prepare display properties
+            display_properties = {}
+            if domain.color_hex:
+                display_properties["colorHex"] = domain.color_hex
+            if domain.icon_name:
+                display_properties["icon"] = {
+                    "name": domain.icon_name,
+                    "style": domain.icon_style or "solid",
+                    "iconLibrary": domain.icon_library or "MATERIAL"
+                }
+            
+            # Prepare structured properties from raw_data if available
+            structured_properties = []
+            if domain.raw_data and isinstance(domain.raw_data, dict):
+                structured_props = domain.raw_data.get("structuredProperties", {})
+                if structured_props and structured_props.get("properties"):
+                    for prop in structured_props["properties"]:
+                        prop_urn = prop.get("structuredProperty", {}).get("urn")
+                        values = prop.get("values", [])
+                        if prop_urn and values:
+                            structured_properties.append({
+                                "propertyUrn": prop_urn,
+                                "values": values
+                            })
+            
+            domains_kwargs.append({
+                "domain_id": domain_id,
+                "name": domain.name,
+                "description": domain.description,
+                "owners": owners if owners else None,
+                "structured_properties": structured_properties if structured_properties else None,
+                "display_properties": display_properties if display_properties else None,
+                "parent_domain": domain.parent_domain_urn,
+                "include_all_aspects": True,
+                # Pass existing URN if domain has one (for proper NEW vs EXISTING handling)
+                "existing_urn": domain.urn if domain.urn else None,
+            })
         
-        # Calculate total files that could have been created
-        total_possible_files = success_count * 1  # Assuming 1 file per domain
-        files_skipped_count = total_possible_files - files_created_count
+        # Generate MCPs for all domains and write the staged file once
+        result = bulk_add_domains_to_staged_changes(
+            domains=domains_kwargs,
+            environment=environment,
+            owner="system",  # Default owner
+            mutation_name=mutation_name
+        )
+        
+        # Record the staged field values so later single stagings only regenerate changed aspects
+        for index in result["staged_indexes"]:
+            domains[index].mark_aspects_staged(environment)
+        
+        success_count = result["success_count"]
+        error_count = result["error_count"]
+        errors = result["errors"]
+        all_created_files = [result["mcp_file"]] if result["mcp_file"] else []
+        files_created_count = len(all_created_files)
+        files_skipped_count = 0
         
-        message = f"Add to staged changes completed: {success_count} domains processed, {files_created_count} files created, {files_skipped_count} files skipped (unchanged), {error_count} failed"
+        message = f"Add to staged changes completed: {success_count} domains processed, {result['mcps_created']} MCPs created, {files_created_count} files saved, {error_count} failed"
         if errors:
             message += f". Errors: {'; '.join(errors[:5])}"  # Show first 5 errors
             if len(errors) > 5:
@@ -2399,6 +2474,7 @@ def bulk_add_domains_to_staged_changes(request):
             'error_count': error_count,
             'files_created_count': files_created_count,
             'files_skipped_count': files_skipped_count,
+            'mcps_created_count': result['mcps_created'],
             'errors': errors,
             'files_created': all_created_files
         })
@@ -2508,11 +2584,14 @@ def add_domain_to_staged_changes(request, domain_id):
             environment=environment,
             owner=request.user.username if request.user.is_authenticated else "admin",
             base_dir="metadata-manager",
+            # Only regenerate the aspects whose fields changed since the last staging
+            aspects=domain.get_dirty_aspects(environment),
             # Pass existing URN if domain has one (for proper NEW vs EXISTING handling)
             existing_urn=domain.urn if domain.urn else None
         )
         
         if result.get("success"):
+            domain.mark_aspects_staged(environment)
             files_created = result.get("files_saved", [])
             return JsonResponse({
                 "status": "success",
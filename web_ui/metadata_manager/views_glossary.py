@@ -20,8 +20,14 @@ sys.path.append(
 
 # Import the deterministic URN utilities
 from utils.urn_utils import get_full_urn_from_name, get_parent_path, generate_mutated_urn, get_mutation_config_for_environment
-from utils.datahub_utils import get_datahub_client, test_datahub_connection, get_datahub_client_from_request
+from utils.datahub_utils import (
+    get_datahub_client,
+    test_datahub_connection,
+    get_datahub_client_from_request,
+    get_usage_counts,
+)
 from utils.data_sanitizer import sanitize_api_response
+from utils.relationship_graph import PARENT_NODE, RelationshipGraph, parent_node_urn
 from web_ui.models import Environment as DjangoEnvironment
 from web_ui.models import GitSettings, GitIntegration
 from .models import GlossaryNode, GlossaryTerm, Environment, Domain
@@ -220,48 +226,8 @@ class GlossaryListView(View):
             # Store in lookup dictionary
             nodes_by_urn[node_urn] = node_obj
 
-            # Check for parent node relationship
-            parent_urn = None
-            
-            # Try multiple ways to find the parent node URN:
-
-            # 1. Try parentNode (singular) for backward compatibility
-            parent_node = node.get("parentNode", {})
-            if parent_node:
-                if isinstance(parent_node, dict):
-                    parent_urn = parent_node.get("urn")
-                    logger.debug(
-                        f"Found parent node (singular dict) for node {name}: {parent_urn}"
-                    )
-                else:
-                    logger.debug(f"parentNode is not a dict, but: {type(parent_node)}")
-
-            # 2. Try parentNodes (plural) which is the newer format
-            if not parent_urn and "parentNodes" in node:
-                parent_nodes = node.get("parentNodes", {})
-
-                # Handle different formats
-                if isinstance(parent_nodes, dict) and "nodes" in parent_nodes:
-                    nodes_list = parent_nodes.get("nodes", [])
-                    if nodes_list and len(nodes_list) > 0:
-                        first_parent = nodes_list[0]
-                        if isinstance(first_parent, dict):
-                            parent_urn = first_parent.get("urn")
-                            logger.debug(
-                                f"Found parent node (plural/nodes) for node {name}: {parent_urn}"
-                            )
-                elif isinstance(parent_nodes, list) and len(parent_nodes) > 0:
-                    first_parent = parent_nodes[0]
-                    if isinstance(first_parent, dict):
-                        parent_urn = first_parent.get("urn")
-                        logger.debug(
-                            f"Found parent node (plural/list) for node {name}: {parent_urn}"
-                        )
-
-            # 3. Try parent_urn directly
-            if not parent_urn and "parent_urn" in node:
-                parent_urn = node.get("parent_urn")
-                logger.debug(f"Found parent_urn directly in node {name}: {parent_urn}")
+            # Check for parent node relationship (parentNodes, parentNode or parent_urn)
+            parent_urn = parent_node_urn(node)
 
             if parent_urn:
                 node_obj["parent_urn"] = parent_urn
@@ -441,59 +407,17 @@ class GlossaryListView(View):
             # Store in lookup dictionary
             terms_by_urn[term_urn] = term_obj
 
-            # Check for parent node relationship
-            parent_node_urn = None
-
-            # Try multiple ways to find the parent node URN:
-
-            # 1. Try parentNode (singular) for backward compatibility
-            parent_node = term.get("parentNode", {})
-            if parent_node:
-                if isinstance(parent_node, dict):
-                    parent_node_urn = parent_node.get("urn")
-                    logger.debug(
-                        f"Found parent node (singular dict) for term {name}: {parent_node_urn}"
-                    )
-            else:
-                logger.debug(f"parentNode is not a dict, but: {type(parent_node)}")
-
-            # 2. Try parentNodes (plural) which is the newer format
-            if not parent_node_urn and "parentNodes" in term:
-                parent_nodes = term.get("parentNodes", {})
-
-                # Handle different formats
-                if isinstance(parent_nodes, dict) and "nodes" in parent_nodes:
-                    nodes_list = parent_nodes.get("nodes", [])
-                    if nodes_list and len(nodes_list) > 0:
-                        first_parent = nodes_list[0]
-                        if isinstance(first_parent, dict):
-                            parent_node_urn = first_parent.get("urn")
-                            logger.debug(
-                                f"Found parent node (plural/nodes) for term {name}: {parent_node_urn}"
-                            )
-                elif isinstance(parent_nodes, list) and len(parent_nodes) > 0:
-                    first_parent = parent_nodes[0]
-                    if isinstance(first_parent, dict):
-                        parent_node_urn = first_parent.get("urn")
-                        logger.debug(
-                            f"Found parent node (plural/list) for term {name}: {parent_node_urn}"
-                        )
-
-            # 3. Try parent_node_urn directly (our custom format)
-            if not parent_node_urn and "parent_node_urn" in term:
-                parent_node_urn = term.get("parent_node_urn")
-                logger.debug(
-                    f"Found parent_node_urn directly in term {name}: {parent_node_urn}"
-                )
+            # Check for parent node relationship (parentNodes, parentNode or parent_node_urn)
+            term_parent_urn = parent_node_urn(term)
 
-            if parent_node_urn:
-                term_obj["parent_node_urn"] = parent_node_urn
+            if term_parent_urn:
+                term_obj["parent_node_urn"] = term_parent_urn
 
                 # Group terms by parent node for easier lookup
-                if parent_node_urn not in terms_by_parent_node:
-                    terms_by_parent_node[parent_node_urn] = []
-                terms_by_parent_node[parent_node_urn].append(term_obj)
-                logger.debug(f"Added term '{name}' to parent node '{parent_node_urn}'")
+                if term_parent_urn not in terms_by_parent_node:
+                    terms_by_parent_node[term_parent_urn] = []
+                terms_by_parent_node[term_parent_urn].append(term_obj)
+                logger.debug(f"Added term '{name}' to parent node '{term_parent_urn}'")
             else:
                 # No parent means this is a root term - add to special "root_terms" key
                 if "root_terms" not in terms_by_parent_node:
@@ -625,6 +549,7 @@ class GlossaryListView(View):
             
             # Track success/failure counts
             success_count = 0
+            skipped_count = 0
             failed_count = 0
             
             # Push nodes first
@@ -632,6 +557,9 @@ class GlossaryListView(View):
                 try:
                     node = GlossaryNode.objects.get(id=node_id)
                     if node.can_deploy:
+                        if not node.get_undeployed_aspects(current_connection):
+                            skipped_count += 1
+                            continue
                         success = node.deploy_to_datahub(client, connection=current_connection)
                         if success:
                             success_count += 1
@@ -648,6 +576,9 @@ class GlossaryListView(View):
                 try:
                     term = GlossaryTerm.objects.get(id=term_id)
                     if hasattr(term, "can_deploy") and term.can_deploy:
+                        if not term.get_undeployed_aspects(current_connection):
+                            skipped_count += 1
+                            continue
                         success = term.deploy_to_datahub(client, connection=current_connection)
                         if success:
                             success_count += 1
@@ -665,6 +596,11 @@ class GlossaryListView(View):
                     request,
                     f"Successfully deployed {success_count} glossary items to DataHub",
                 )
+            if skipped_count > 0:
+                messages.info(
+                    request,
+                    f"Skipped {skipped_count} glossary items already up to date in DataHub",
+                )
             if failed_count > 0:
                 messages.warning(
                     request, f"Failed to deploy {failed_count} glossary items"
@@ -703,12 +639,16 @@ class GlossaryListView(View):
             
             # Track success/failure counts
             success_count = 0
+            skipped_count = 0
             failed_count = 0
             
             # Push nodes first
             for node in nodes:
                 try:
                     if node.can_deploy:
+                        if not node.get_undeployed_aspects(current_connection):
+                            skipped_count += 1
+                            continue
                         success = node.deploy_to_datahub(client, connection=current_connection)
                         if success:
                             success_count += 1
@@ -722,6 +662,9 @@ class GlossaryListView(View):
             for term in terms:
                 try:
                     if hasattr(term, "can_deploy") and term.can_deploy:
+                        if not term.get_undeployed_aspects(current_connection):
+                            skipped_count += 1
+                            continue
                         success = term.deploy_to_datahub(client, connection=current_connection)
                         if success:
                             success_count += 1
@@ -737,6 +680,11 @@ class GlossaryListView(View):
                     request,
                     f"Successfully deployed {success_count} glossary items to DataHub",
                 )
+            if skipped_count > 0:
+                messages.info(
+                    request,
+                    f"Skipped {skipped_count} glossary items already up to date in DataHub",
+                )
             if failed_count > 0:
                 messages.warning(
                     request, f"Failed to deploy {failed_count} glossary items"
@@ -927,29 +875,25 @@ class GlossaryListView(View):
                     if node.id in nodes_by_id:
                         root_nodes.append(nodes_by_id[node.id])
         
-        # Third pass: Add terms to each node
-        for node in nodes:
-            if hasattr(node, "terms"):
-                node_terms = []
-                terms_qs = node.terms.filter(sync_status="LOCAL_ONLY")
-                logger.debug(f"Node {node.name} has {terms_qs.count()} local terms")
-                
-                for term in terms_qs:
-                    term_obj = {
-                        "id": term.id,
-                        "name": term.name,
-                        "description": term.description,
-                        "sync_status": term.sync_status,
-                        "can_deploy": term.can_deploy
-                        if hasattr(term, "can_deploy")
-                        else True,
-                    }
-                    node_terms.append(term_obj)
-                
-                if node.id in nodes_by_id:
-                    nodes_by_id[node.id]["terms"] = node_terms
-                    # Flag to indicate this node has terms (needed for UI expansion)
-                    nodes_by_id[node.id]["has_terms"] = len(node_terms) > 0
+        # Third pass: Add terms to each node, fetched in one query for all nodes
+        terms_by_node_id = {}
+        for term in GlossaryTerm.objects.filter(parent_node_id__in=list(nodes_by_id), sync_status="LOCAL_ONLY"):
+            terms_by_node_id.setdefault(term.parent_node_id, []).append({
+                "id": term.id,
+                "name": term.name,
+                "description": term.description,
+                "sync_status": term.sync_status,
+                "can_deploy": term.can_deploy
+                if hasattr(term, "can_deploy")
+                else True,
+            })
+
+        for node_id, node_obj in nodes_by_id.items():
+            node_terms = terms_by_node_id.get(node_id, [])
+            logger.debug(f"Node {node_obj['name']} has {len(node_terms)} local terms")
+            node_obj["terms"] = node_terms
+            # Flag to indicate this node has terms (needed for UI expansion)
+            node_obj["has_terms"] = len(node_terms) > 0
 
         # Fourth pass: Add root terms (terms without a parent node)
         root_terms = []
@@ -1381,6 +1325,18 @@ class GlossaryNodeDeployView(View):
                     "error": f"Node '{node.name}' cannot be deployed"
                 })
             
+            # Get current connection to set on deployed node
+            from web_ui.views import get_current_connection
+            current_connection = get_current_connection(request)
+            
+            # Skip the deploy when this connection already holds the same node
+            if request.POST.get("force") != "true" and not node.get_undeployed_aspects(current_connection):
+                return JsonResponse({
+                    "success": True,
+                    "message": f"Node '{node.name}' is already up to date in DataHub",
+                    "skipped": True
+                })
+            
             # Get DataHub client
             connected, client = test_datahub_connection(request)
             if not connected or not client:
@@ -1389,10 +1345,6 @@ class GlossaryNodeDeployView(View):
                     "error": "Could not connect to DataHub"
                 })
             
-            # Get current connection to set on deployed node
-            from web_ui.views import get_current_connection
-            current_connection = get_current_connection(request)
-            
             # Deploy the node
             success = node.deploy_to_datahub(client, connection=current_connection)
             if success:
@@ -1627,6 +1579,18 @@ class GlossaryTermDeployView(View):
                     "error": f"Term '{term.name}' cannot be deployed"
                 })
             
+            # Get current connection to set on deployed term
+            from web_ui.views import get_current_connection
+            current_connection = get_current_connection(request)
+            
+            # Skip the deploy when this connection already holds the same term
+            if request.POST.get("force") != "true" and not term.get_undeployed_aspects(current_connection):
+                return JsonResponse({
+                    "success": True,
+                    "message": f"Term '{term.name}' is already up to date in DataHub",
+                    "skipped": True
+                })
+            
             # Get DataHub client
             connected, client = test_datahub_connection(request)
             if not connected or not client:
@@ -1635,10 +1599,6 @@ class GlossaryTermDeployView(View):
                     "error": "Could not connect to DataHub"
                 })
             
-            # Get current connection to set on deployed term
-            from web_ui.views import get_current_connection
-            current_connection = get_current_connection(request)
-            
             # Deploy the term
             success = term.deploy_to_datahub(client, connection=current_connection)
             if success:
@@ -1772,8 +1732,8 @@ def get_remote_glossary_data(request):
             return JsonResponse({"success": False, "error": "Not connected to DataHub"})
 
         # Get all local nodes and terms
-        local_nodes = GlossaryNode.objects.all().order_by("name")
-        local_terms = GlossaryTerm.objects.all().order_by("name")
+        local_nodes = GlossaryNode.objects.select_related("parent").order_by("name")
+        local_terms = GlossaryTerm.objects.select_related("parent_node").order_by("name")
 
         # Initialize data structures
         synced_nodes = []
@@ -1809,6 +1769,17 @@ def get_remote_glossary_data(request):
         # Create URN mappings for quick lookup
         remote_nodes_dict = {node.get("urn"): node for node in remote_nodes if node and node.get("urn")}
         remote_terms_dict = {term.get("urn"): term for term in remote_terms if term and term.get("urn")}
+        remote_graph = RelationshipGraph.from_entities(list(remote_nodes_dict.values()) + list(remote_terms_dict.values()))
+
+        # Number of entities carrying each term, from the cached glossaryTerms facet (one request for all terms)
+        term_usage = get_usage_counts(client, "glossaryTerms", list(remote_terms_dict))
+
+        # Local nodes with child nodes or terms, in two queries instead of two per node
+        local_parent_ids = set(
+            GlossaryNode.objects.filter(parent__isnull=False).values_list("parent_id", flat=True)
+        ) | set(
+            GlossaryTerm.objects.filter(parent_node__isnull=False).values_list("parent_node_id", flat=True)
+        )
         
         # Categorize items
         synced_items = []
@@ -1835,7 +1806,7 @@ def get_remote_glossary_data(request):
                 "sync_status_display": local_node.get_sync_status_display(),
                 "parent_urn": str(local_node.parent.urn) if local_node.parent and local_node.parent.urn else None,
                 "parent_id": str(local_node.parent.id) if local_node.parent else None,
-                "has_children": local_node.children.exists() or local_node.terms.exists(),
+                "has_children": local_node.id in local_parent_ids,
                 # Initialize empty ownership and relationships for local-only items
                 "owners_count": 0,
                 "owner_names": [],
@@ -1949,6 +1920,7 @@ def get_remote_glossary_data(request):
                 # Domain information for terms
                 "domain_urn": local_term.domain_urn if hasattr(local_term, 'domain_urn') else None,
                 "domain_name": local_term.domain.name if hasattr(local_term, 'domain') and local_term.domain else None,
+                "usage_count": term_usage.get(term_urn, 0),
                 # Initialize empty ownership and relationships for local-only items
                 "owners_count": 0,
                 "owner_names": [],
@@ -2076,8 +2048,8 @@ def get_remote_glossary_data(request):
                     "type": "node",
                     "sync_status": "REMOTE_ONLY",
                     "sync_status_display": "Remote Only",
-                    "parent_urn": remote_node.get("parentNodes", [{}])[0].get("urn") if remote_node.get("parentNodes") else None,
-                    "has_children": False,  # Simplified for remote-only
+                    "parent_urn": remote_graph.parent(node_urn, PARENT_NODE),
+                    "has_children": bool(remote_graph.children(node_urn, PARENT_NODE)),
                     "owners_count": processed_data["owners_count"],
                     "owner_names": processed_data["owner_names"],
                     "relationships_count": processed_data["relationships_count"],
@@ -2125,10 +2097,11 @@ def get_remote_glossary_data(request):
                     "type": "term",
                     "sync_status": "REMOTE_ONLY",
                     "sync_status_display": "Remote Only",
-                    "parent_node_urn": remote_term.get("parentNodes", [{}])[0].get("urn") if remote_term.get("parentNodes") else None,
+                    "parent_node_urn": remote_graph.parent(term_urn, PARENT_NODE),
                     "term_source": remote_term.get("termSource", "INTERNAL"),
                     "domain_urn": domain_urn,
                     "domain_name": domain_name,
+                    "usage_count": term_usage.get(term_urn, 0),
                     "owners_count": processed_data["owners_count"],
                     "owner_names": processed_data["owner_names"],
                     "relationships_count": processed_data["relationships_count"],
@@ -2815,6 +2788,74 @@ class GlossaryTermResyncView(View):
             })
 
 
+def _glossary_node_staging_data(node):
+    """Build the entity data dictionary used to stage a glossary node"""
+    node_data = {
+        "id": str(node.id),
+        "name": node.name,
+        "description": node.description,
+        "urn": node.urn,
+        "parent_id": str(node.parent.id) if node.parent else None,
+        "parent_urn": node.parent.urn if node.parent else None,
+        "deprecated": node.deprecated,
+        "color_hex": node.color_hex,
+        "sync_status": node.sync_status,
+        "datahub_id": node.datahub_id,
+        "last_synced": node.last_synced.isoformat() if node.last_synced else None,
+        "created_at": node.created_at.isoformat(),
+        "updated_at": node.updated_at.isoformat(),
+    }
+    
+    # Add ownership data if available
+    if node.ownership_data:
+        node_data["ownership_data"] = node.ownership_data
+    
+    return node_data
+
+
+def _glossary_term_staging_data(term):
+    """Build the entity data dictionary used to stage a glossary term"""
+    term_data = {
+        "id": str(term.id),
+        "name": term.name,
+        "description": term.description,
+        "urn": term.urn,
+        "parent_id": str(term.parent_node.id) if term.parent_node else None,
+        "parent_urn": term.parent_node.urn if term.parent_node else None,
+        "term_source": term.term_source,
+        "domain_urn": term.domain_urn,
+        "deprecated": term.deprecated,
+        "sync_status": term.sync_status,
+        "datahub_id": term.datahub_id,
+        "last_synced": term.last_synced.isoformat() if term.last_synced else None,
+        "created_at": term.created_at.isoformat(),
+        "updated_at": term.updated_at.isoformat(),
+    }
+    
+    # Add ownership data if available
+    if term.ownership_data:
+        term_data["ownership_data"] = term.ownership_data
+    
+    # Add relationships data if available
+    if term.relationships_data:
+        term_data["relationships_data"] = term.relationships_data
+    
+    # Add domain information if available
+    if term.domain:
+        term_data["domain"] = {
+            "id": str(term.domain.id),
+            "name": term.domain.name,
+            "urn": term.domain.urn,
+            "description": term.domain.description,
+            "color_hex": term.domain.color_hex,
+            "icon_name": term.domain.icon_name,
+            "icon_style": term.domain.icon_style,
+            "icon_library": term.domain.icon_library,
+        }
+    
+    return term_data
+
+
 @method_decorator(csrf_exempt, name="dispatch")
 class GlossaryNodeAddToStagedChangesView(View):
     """API endpoint to add a glossary node to staged changes"""
@@ -2854,25 +2895,7 @@ class GlossaryNodeAddToStagedChangesView(View):
             owner = request.user.username if request.user.is_authenticated else "admin"
             
             # Create comprehensive node data dictionary with all available fields
-            node_data = {
-                "id": str(node.id),
-                "name": node.name,
-                "description": node.description,
-                "urn": node.urn,
-                "parent_id": str(node.parent.id) if node.parent else None,
-                "parent_urn": node.parent.urn if node.parent else None,
-                "deprecated": node.deprecated,
-                "color_hex": node.color_hex,
-                "sync_status": node.sync_status,
-                "datahub_id": node.datahub_id,
-                "last_synced": node.last_synced.isoformat() if node.last_synced else None,
-                "created_at": node.created_at.isoformat(),
-                "updated_at": node.updated_at.isoformat(),
-            }
-            
-            # Add ownership data if available
-            if node.ownership_data:
-                node_data["ownership_data"] = node.ownership_data
+            node_data = _glossary_node_staging_data(node)
             
             # Add any additional data that might be available
             # Note: GlossaryNode doesn't have relationships_data, domains, or other complex fields
@@ -2885,8 +2908,11 @@ class GlossaryNodeAddToStagedChangesView(View):
                 environment=environment_name,
                 owner=owner,
                 base_dir=None,  # Let the function determine the base directory
-                mutation_name=mutation_name
+                mutation_name=mutation_name,
+                # Only regenerate the aspects whose fields changed since the last staging
+                aspects=node.get_dirty_aspects(environment_name)
             )
+            node.mark_aspects_staged(environment_name)
             
             # Provide feedback about files created
             files_created = list(result.values())
@@ -2955,43 +2981,7 @@ class GlossaryTermAddToStagedChangesView(View):
             owner = request.user.username if request.user.is_authenticated else "admin"
             
             # Create comprehensive term data dictionary with all available fields
-            term_data = {
-                "id": str(term.id),
-                "name": term.name,
-                "description": term.description,
-                "urn": term.urn,
-                "parent_id": str(term.parent_node.id) if term.parent_node else None,
-                "parent_urn": term.parent_node.urn if term.parent_node else None,
-                "term_source": term.term_source,
-                "domain_urn": term.domain_urn,
-                "deprecated": term.deprecated,
-                "sync_status": term.sync_status,
-                "datahub_id": term.datahub_id,
-                "last_synced": term.last_synced.isoformat() if term.last_synced else None,
-                "created_at": term.created_at.isoformat(),
-                "updated_at": term.updated_at.isoformat(),
-            }
-            
-            # Add ownership data if available
-            if term.ownership_data:
-                term_data["ownership_data"] = term.ownership_data
-            
-            # Add relationships data if available
-            if term.relationships_data:
-                term_data["relationships_data"] = term.relationships_data
-            
-            # Add domain information if available
-            if term.domain:
-                term_data["domain"] = {
-                    "id": str(term.domain.id),
-                    "name": term.domain.name,
-                    "urn": term.domain.urn,
-                    "description": term.domain.description,
-                    "color_hex": term.domain.color_hex,
-                    "icon_name": term.domain.icon_name,
-                    "icon_style": term.domain.icon_style,
-                    "icon_library": term.domain.icon_library,
-                }
+            term_data = _glossary_term_staging_data(term)
             
             # Add any additional data that might be available
             # Note: GlossaryTerm has more complex relationships than nodes
@@ -3003,8 +2993,11 @@ class GlossaryTermAddToStagedChangesView(View):
                 environment=environment_name,
                 owner=owner,
                 base_dir=None,  # Let the function determine the base directory
-                mutation_name=mutation_name
+                mutation_name=mutation_name,
+                # Only regenerate the aspects whose fields changed since the last staging
+                aspects=term.get_dirty_aspects(environment_name)
             )
+            term.mark_aspects_staged(environment_name)
             
             # Provide feedback about files created
             files_created = list(result.values())
@@ -3139,3 +3132,91 @@ class GlossaryRemoteAddToStagedChangesView(View):
 
 
 
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class GlossaryBulkAddToStagedChangesView(View):
+    """API endpoint to add many glossary nodes and terms to staged changes in one pass"""
+    
+    def post(self, request):
+        try:
+            import json
+            import os
+            import sys
+            
+            # Add project root to path to import our Python modules
+            sys.path.append(
+                os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+            )
+            
+            from scripts.mcps.glossary_actions import bulk_add_glossary_to_staged_changes
+            
+            data = json.loads(request.body)
+            environment_name = data.get('environment', 'dev')
+            mutation_name = data.get('mutation_name')
+            node_ids = data.get('node_ids', [])
+            term_ids = data.get('term_ids', [])
+            
+            # Get current user as owner
+            owner = request.user.username if request.user.is_authenticated else "admin"
+            
+            # Stage everything when no explicit selection is given
+            if node_ids or term_ids:
+                nodes = GlossaryNode.objects.filter(id__in=node_ids)
+                terms = GlossaryTerm.objects.filter(id__in=term_ids)
+            else:
+                nodes = GlossaryNode.objects.all()
+                terms = GlossaryTerm.objects.all()
+            
+            nodes = list(nodes.select_related("parent"))
+            terms = list(terms.select_related("parent_node", "domain"))
+            
+            # Nodes first so parents precede children in the staged file
+            entities = [
+                {"entity_type": "node", "entity_data": _glossary_node_staging_data(node)}
+                for node in nodes
+            ] + [
+                {"entity_type": "term", "entity_data": _glossary_term_staging_data(term)}
+                for term in terms
+            ]
+            
+            if not entities:
+                return JsonResponse({
+                    "success": False,
+                    "status": "error",
+                    "error": "No glossary items found to add to staged changes"
+                }, status=400)
+            
+            result = bulk_add_glossary_to_staged_changes(
+                entities=entities,
+                environment=environment_name,
+                owner=owner,
+                mutation_name=mutation_name
+            )
+            
+            # Record the staged field values so later single stagings only regenerate changed aspects
+            staged_objects = nodes + terms
+            for index in result["staged_indexes"]:
+                staged_objects[index].mark_aspects_staged(environment_name)
+            
+            errors = result["errors"]
+            message = f"Add to staged changes completed: {result['success_count']} glossary items processed, {result['mcps_created']} MCPs created, {result['error_count']} failed"
+            if errors:
+                message += f". Errors: {'; '.join(errors[:5])}"  # Show first 5 errors
+                if len(errors) > 5:
+                    message += f" and {len(errors) - 5} more..."
+            
+            return JsonResponse({
+                "success": True,
+                "status": "success",
+                "message": message,
+                "success_count": result["success_count"],
+                "error_count": result["error_count"],
+                "mcps_created_count": result["mcps_created"],
+                "errors": errors,
+                "files_created": [result["mcp_file"]] if result["mcp_file"] else []
+            })
+            
+        except Exception as e:
+            logger.error(f"Error bulk adding glossary items to staged changes: {str(e)}")
+            return JsonResponse({"success": False, "status": "error", "error": str(e)}, status=500)
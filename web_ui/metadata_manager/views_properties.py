@@ -19,7 +19,12 @@ sys.path.append(
 
 # Import the deterministic URN utilities
 from utils.urn_utils import get_full_urn_from_name, generate_mutated_urn, get_mutation_config_for_environment
-from utils.datahub_utils import get_datahub_client, test_datahub_connection, get_datahub_client_from_request
+from utils.datahub_utils import (
+    get_datahub_client,
+    test_datahub_connection,
+    get_datahub_client_from_request,
+    get_structured_property_usage,
+)
 from web_ui.models import GitSettings
 from .models import StructuredProperty
 # Git integration imports - handle gracefully if not available
@@ -345,6 +350,11 @@ class PropertyListView(View):
             # Get local property URNs for comparison
             local_property_urns = set(local_properties_dict.keys())
             
+            # Number of values assigned for each remote property (one facet request for all properties)
+            property_usage = get_structured_property_usage(client, [
+                (remote_prop.get('definition') or {}).get('qualifiedName') for remote_prop in remote_properties_dict.values()
+            ]) if connected else {}
+            
             # Categorize properties
             synced_properties = []
             local_only_properties = []
@@ -392,6 +402,7 @@ class PropertyListView(View):
                     'immutable': local_prop.immutable,
                     'sync_status': local_prop.sync_status,
                     'sync_status_display': local_prop.get_sync_status_display(),
+                    'usage_count': property_usage.get(local_prop.qualified_name, 0) if remote_match else 0,
                     # Add connection context for frontend action determination
                     'connection_context': connection_context,
                     'has_remote_match': bool(remote_match),
@@ -649,6 +660,7 @@ class PropertyListView(View):
                         'show_in_columns_table': settings.get('showInColumnsTable', False),
                         'is_hidden': settings.get('isHidden', False),
                         'immutable': definition.get('immutable', False),
+                        'usage_count': property_usage.get(qualified_name, 0),
                         'status': 'remote_only',
                         'sync_status': 'REMOTE_ONLY',
                         'sync_status_display': 'Remote Only',
@@ -1956,45 +1968,34 @@ class PropertyAddAllToStagedChangesView(View):
             
             # Import the property actions module
             sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            from scripts.mcps.structured_property_actions import add_structured_property_to_staged_changes
+            from scripts.mcps.structured_property_actions import bulk_add_structured_properties_to_staged_changes
             
-            success_count = 0
-            error_count = 0
-            files_created_count = 0
-            mcps_created_count = 0
-            errors = []
-            all_created_files = []
+            # Generate MCPs for all properties and write the staged file once
+            result = bulk_add_structured_properties_to_staged_changes(
+                properties=[
+                    {
+                        "property_id": str(prop.id),
+                        "qualified_name": prop.qualified_name,
+                        "display_name": prop.name,
+                        "description": prop.description,
+                        "value_type": prop.value_type,
+                        "cardinality": prop.cardinality,
+                        "allowedValues": prop.allowed_values or [],
+                        "entity_types": prop.entity_types or [],
+                    }
+                    for prop in properties
+                ],
+                environment=environment,
+                owner="system",  # Default owner
+                mutation_name=mutation_name
+            )
             
-            for prop in properties:
-                try:
-                    # Add property to staged changes - pass only supported parameters
-                    result = add_structured_property_to_staged_changes(
-                        property_id=str(prop.id),
-                        qualified_name=prop.qualified_name,
-                        display_name=prop.name,
-                        description=prop.description,
-                        value_type=prop.value_type,
-                        cardinality=prop.cardinality,
-                        allowedValues=prop.allowed_values or [],
-                        entity_types=prop.entity_types or [],
-                        environment=environment,
-                        owner="system"  # Default owner
-                        # base_dir will be automatically calculated to metadata-manager/{environment}/structured_properties
-                    )
-                    
-                    if result.get("success"):
-                        success_count += 1
-                        files_created_count += len(result.get("files_saved", []))
-                        mcps_created_count += result.get("mcps_created", 0)
-                        all_created_files.extend(result.get("files_saved", []))
-                    else:
-                        error_count += 1
-                        errors.append(f"Property {prop.name}: {result.get('message', 'Unknown error')}")
-                    
-                except Exception as e:
-                    error_count += 1
-                    errors.append(f"Property {prop.name}: {str(e)}")
-                    logger.error(f"Error adding property {prop.name} to staged changes: {str(e)}")
+            success_count = result["success_count"]
+            error_count = result["error_count"]
+            errors = result["errors"]
+            mcps_created_count = result["mcps_created"]
+            all_created_files = [result["mcp_file"]] if result["mcp_file"] else []
+            files_created_count = len(all_created_files)
             
             message = f"Add all to staged changes completed: {success_count} properties processed, {mcps_created_count} MCPs created, {files_created_count} files saved, {error_count} failed"
             if errors:
@@ -22,10 +22,15 @@ sys.path.append(
 
 # Import the deterministic URN utilities
 from utils.urn_utils import get_full_urn_from_name, generate_mutated_urn, get_mutation_config_for_environment
-from utils.datahub_utils import get_datahub_client, test_datahub_connection, get_datahub_client_from_request
+from utils.datahub_utils import (
+    get_datahub_client,
+    test_datahub_connection,
+    get_datahub_client_from_request,
+    get_usage_counts,
+)
 from utils.data_sanitizer import sanitize_api_response
 from web_ui.models import GitSettings, Environment, GitIntegration
-from .models import Tag
+from .models import Tag, AppliedAspectState
 
 logger = logging.getLogger(__name__)
 
@@ -156,6 +161,55 @@ def find_tag_by_flexible_id(tag_id):
                     logger.error(f"Tag not found with any ID format: {tag_id}")
                     return None
 
+def get_tag_push_aspects(tag):
+    """
+    Get the aspect content a push sends to DataHub for a tag, keyed by aspect name.
+    Used to compare against the last applied state of the current connection, so it
+    only holds what a push writes: the name of an existing tag is never updated.
+    """
+    owners = []
+    if tag.ownership_data and isinstance(tag.ownership_data, dict):
+        for owner in tag.ownership_data.get("owners", []):
+            owner_urn = owner.get("owner_urn") or owner.get("owner")
+            if owner_urn:
+                ownership_type = owner.get("ownership_type_urn") or owner.get("type", "urn:li:ownershipType:__system__technical_owner")
+                owners.append({"owner": owner_urn, "type": ownership_type})
+
+    # The default color is never pushed
+    color = tag.color.strip() if tag.color and tag.color.strip() and tag.color != "#0d6efd" else None
+
+    return {
+        "tagProperties": {"description": tag.description or "", "color": color},
+        "ownership": {"owners": owners},
+    }
+
+def get_tag_remote_drift(aspects, remote_tag):
+    """
+    Get the names of the push aspects whose content DataHub does not hold, from the
+    tag as returned by get_tag (every aspect if the tag does not exist).
+    Catches changes made outside this app, which the applied aspect manifest cannot see.
+    """
+    if not remote_tag:
+        return set(aspects)
+
+    drifted = set()
+    properties = aspects["tagProperties"]
+    remote_color = (remote_tag.get("properties") or {}).get("colorHex")
+    if (remote_tag.get("description") or "") != properties["description"] or (
+        properties["color"] and (remote_color or "").lower() != properties["color"].lower()
+    ):
+        drifted.add("tagProperties")
+
+    # Pushes only add owners, so DataHub holds the aspect if it has every local owner
+    remote_owners = {
+        ((owner.get("owner") or {}).get("urn"), (owner.get("ownershipType") or {}).get("urn"))
+        for owner in ((remote_tag.get("ownership") or {}).get("owners") or [])
+    }
+    if any((owner["owner"], owner["type"]) not in remote_owners for owner in aspects["ownership"]["owners"]):
+        drifted.add("ownership")
+
+    return drifted
+
 def check_ownership_data_column_exists():
     """
     Check if the ownership_data column exists in the metadata_manager_tag table.
@@ -1544,8 +1598,14 @@ def get_remote_tags_data(request):
         # Create a mapping of urns to Tag IDs for quick lookup
         local_urn_to_id_map = {str(tag.urn): str(tag.id) for tag in local_tags}
         
-        # Get remote tags with enhanced data
-        remote_tags_result = client.get_remote_tags_data(query=query, start=0, count=1000)
+        # Get remote tags with enhanced data, from the local metadata mirror when it is fresh
+        from utils.datahub_utils import get_metadata_mirror
+        mirror = get_metadata_mirror(client, "TAG")
+        if mirror:
+            with mirror:
+                remote_tags_result = {"success": True, "data": {"tags": mirror.list_tags(query=query)}}
+        else:
+            remote_tags_result = client.get_remote_tags_data(query=query, start=0, count=1000)
         
         if not remote_tags_result.get("success"):
             # Fallback if enhanced method fails
@@ -1557,6 +1617,12 @@ def get_remote_tags_data(request):
         
         logger.debug(f"Found {len(remote_tags)} remote tags")
         
+        # Number of entities carrying each tag, from the cached tags facet (one request for all tags)
+        usage = get_usage_counts(client, "tags", list(remote_tags))
+        for tag_urn, remote_tag in remote_tags.items():
+            if tag_urn in usage:
+                remote_tag["relationships_count"] = usage[tag_urn]
+        
         # Categorize tags
         synced_tags = []
         local_only_tags = []
@@ -2213,8 +2279,11 @@ class TagAddToStagedChangesView(View):
                 base_dir=str(base_dir),
                 mutation_name=mutation_name,
                 # Pass existing URN if tag has one (for proper NEW vs EXISTING handling)
-                existing_urn=tag.urn if tag.urn else None
+                existing_urn=tag.urn if tag.urn else None,
+                # Only regenerate the aspects whose fields changed since the last staging
+                aspects=tag.get_dirty_aspects(environment_name)
             )
+            tag.mark_aspects_staged(environment_name)
             
             # Provide feedback about deduplication
             files_created = list(result.values())
@@ -2578,6 +2647,13 @@ class TagPushToDataHubView(View):
                     "error": f"Cannot push tag with status '{tag.sync_status}'. Only MODIFIED or SYNCED tags can be pushed."
                 }, status=400)
 
+            # For pushing, we should use the existing URN to update the tag
+            if not tag.urn:
+                return JsonResponse({
+                    "success": False,
+                    "error": "Cannot push tag without URN. This tag may not be properly synced."
+                }, status=400)
+
             # Get DataHub client
             client = get_datahub_client_from_request(request)
             if not client:
@@ -2593,32 +2669,68 @@ class TagPushToDataHubView(View):
                     "error": "Could not connect to DataHub. Check your connection settings."
                 }, status=500)
 
-            # For pushing, we should use the existing URN to update the tag
-            if not tag.urn:
+            remote_tag = client.get_tag(tag.urn)
+            if not remote_tag:
                 return JsonResponse({
                     "success": False,
-                    "error": "Cannot push tag without URN. This tag may not be properly synced."
-                }, status=400)
+                    "error": f"Tag '{tag.name}' no longer exists in DataHub. Resync or recreate it before pushing."
+                }, status=404)
+
+            # Skip aspects this connection already holds, unless a full push is forced
+            from web_ui.views import get_current_connection
+            current_connection = get_current_connection(request)
+            aspects = get_tag_push_aspects(tag)
+            fingerprints = AppliedAspectState.fingerprint_aspects(aspects)
+            if request.GET.get("force") == "true":
+                changed = fingerprints
+            else:
+                changed = AppliedAspectState.get_changed_aspects(current_connection, tag.urn, aspects)
+                # The manifest only knows what this app pushed: also push what DataHub no longer holds
+                changed.update({
+                    aspect_name: fingerprints[aspect_name]
+                    for aspect_name in get_tag_remote_drift(aspects, remote_tag)
+                })
 
-            # Update the tag description if it's different
-            if tag.description:
-                success = client.update_tag_description(tag.urn, tag.description)
+            if not changed:
+                tag.sync_status = "SYNCED"
+                tag.last_synced = timezone.now()
+                tag.save()
+                return JsonResponse({
+                    "success": True,
+                    "message": f"Tag '{tag.name}' is already up to date in DataHub",
+                    "tag_urn": tag.urn,
+                    "applied": [],
+                    "skipped": sorted(aspects),
+                })
+
+            # Only the aspects that were really written are recorded as applied
+            applied = {}
+
+            if "tagProperties" in changed:
+                # Update the tag description, an empty one clears it in DataHub
+                success = client.update_tag_description(tag.urn, aspects["tagProperties"]["description"])
                 if not success:
+                    AppliedAspectState.record_applied(current_connection, tag.urn, applied)
                     return JsonResponse({
                         "success": False,
                         "error": f"Failed to update tag description in DataHub"
                     }, status=500)
 
-            # Set color if specified and not empty
-            if tag.color and tag.color.strip() and tag.color != "#0d6efd":
-                try:
-                    client.set_tag_color(tag.urn, tag.color)
-                except Exception as e:
-                    logger.warning(f"Failed to set tag color: {str(e)}")
+                # Set color if specified and not empty
+                color_set = True
+                if aspects["tagProperties"]["color"]:
+                    try:
+                        color_set = client.set_tag_color(tag.urn, aspects["tagProperties"]["color"])
+                    except Exception as e:
+                        color_set = False
+                        logger.warning(f"Failed to set tag color: {str(e)}")
+                if color_set:
+                    applied["tagProperties"] = changed["tagProperties"]
 
             # Handle ownership - ensure only intended owners are set
             intended_owners = []
-            if tag.ownership_data and isinstance(tag.ownership_data, dict):
+            owners_added = True
+            if "ownership" in changed and tag.ownership_data and isinstance(tag.ownership_data, dict):
                 owners = tag.ownership_data.get("owners", [])
                 for owner in owners:
                     try:
@@ -2627,53 +2739,62 @@ class TagPushToDataHubView(View):
                         ownership_type = owner.get("ownership_type_urn") or owner.get("type", "urn:li:ownershipType:__system__technical_owner")
                         
                         if owner_urn:
-                            client.add_tag_owner(tag.urn, owner_urn, ownership_type)
+                            if not client.add_tag_owner(tag.urn, owner_urn, ownership_type):
+                                owners_added = False
                             intended_owners.append((owner_urn, ownership_type))
                     except Exception as e:
+                        owners_added = False
                         logger.warning(f"Failed to add owner {owner_urn}: {str(e)}")
+            if "ownership" in changed and owners_added:
+                applied["ownership"] = changed["ownership"]
 
             # Remove the sync user from ownership if they're not in the intended owners list
-            try:
-                current_user = client.get_current_user()
+            if "ownership" in changed:
+                try:
+                    current_user = client.get_current_user()
                 
-                if current_user and current_user.get("urn"):
-                    sync_user_urn = current_user["urn"]
+                    if current_user and current_user.get("urn"):
+                        sync_user_urn = current_user["urn"]
                     
-                    # Check if sync user is in intended owners
-                    sync_user_in_intended = any(owner_urn == sync_user_urn for owner_urn, _ in intended_owners)
+                        # Check if sync user is in intended owners
+                        sync_user_in_intended = any(owner_urn == sync_user_urn for owner_urn, _ in intended_owners)
                     
-                    if not sync_user_in_intended:
-                        logger.debug(f"Removing sync user {sync_user_urn} from tag '{tag.name}' ownership")
-                        # Remove sync user with common ownership types
-                        common_ownership_types = [
-                            "urn:li:ownershipType:__system__technical_owner",
-                            "urn:li:ownershipType:__system__business_owner",
-                            "urn:li:ownershipType:__system__data_steward"
-                        ]
+                        if not sync_user_in_intended:
+                            logger.debug(f"Removing sync user {sync_user_urn} from tag '{tag.name}' ownership")
+                            # Remove sync user with common ownership types
+                            common_ownership_types = [
+                                "urn:li:ownershipType:__system__technical_owner",
+                                "urn:li:ownershipType:__system__business_owner",
+                                "urn:li:ownershipType:__system__data_steward"
+                            ]
                         
-                        for ownership_type in common_ownership_types:
-                            try:
-                                client.remove_tag_owner(tag.urn, sync_user_urn, ownership_type)
-                                logger.debug(f"Removed sync user {sync_user_urn} with ownership type {ownership_type}")
-                            except Exception as e:
-                                # It's normal for this to fail if the user doesn't have this ownership type
-                                logger.debug(f"Could not remove sync user with ownership type {ownership_type}: {str(e)}")
+                            for ownership_type in common_ownership_types:
+                                try:
+                                    client.remove_tag_owner(tag.urn, sync_user_urn, ownership_type)
+                                    logger.debug(f"Removed sync user {sync_user_urn} with ownership type {ownership_type}")
+                                except Exception as e:
+                                    # It's normal for this to fail if the user doesn't have this ownership type
+                                    logger.debug(f"Could not remove sync user with ownership type {ownership_type}: {str(e)}")
+                        else:
+                            logger.debug(f"Sync user {sync_user_urn} is in intended owners list, keeping them")
                     else:
-                        logger.debug(f"Sync user {sync_user_urn} is in intended owners list, keeping them")
-                else:
-                    logger.debug(f"Could not get current user information from DataHub for ownership cleanup")
-            except Exception as e:
-                logger.warning(f"Failed to handle sync user ownership cleanup: {str(e)}")
+                        logger.debug(f"Could not get current user information from DataHub for ownership cleanup")
+                except Exception as e:
+                    logger.warning(f"Failed to handle sync user ownership cleanup: {str(e)}")
 
             # Update tag sync status
             tag.sync_status = "SYNCED"
             tag.last_synced = timezone.now()
             tag.save()
+            AppliedAspectState.record_applied(current_connection, tag.urn, applied)
 
             return JsonResponse({
                 "success": True,
                 "message": f"Tag '{tag.name}' successfully pushed to DataHub",
-                "tag_urn": tag.urn
+                "tag_urn": tag.urn,
+                "applied": sorted(applied),
+                "failed": sorted(set(changed) - set(applied)),
+                "skipped": sorted(set(aspects) - set(changed)),
             })
 
         except Exception as e:
@@ -2715,7 +2836,13 @@ class TagBulkSyncToDataHubView(View):
                     "error": "Could not connect to DataHub. Check your connection settings."
                 }, status=500)
 
+            # Get current connection from request session
+            from web_ui.views import get_current_connection
+            current_connection = get_current_connection(request)
+            force = data.get("force", False)
+
             success_count = 0
+            skipped_count = 0
             error_count = 0
             errors = []
 
@@ -2734,6 +2861,19 @@ class TagBulkSyncToDataHubView(View):
                         error_count += 1
                         continue
 
+                    # Skip tags whose aspects this connection already holds
+                    aspects = get_tag_push_aspects(tag)
+                    if (
+                        not force
+                        and not AppliedAspectState.get_changed_aspects(current_connection, tag.urn, aspects)
+                        and not get_tag_remote_drift(aspects, client.get_tag(tag.urn))
+                    ):
+                        tag.sync_status = "SYNCED"
+                        tag.last_synced = timezone.now()
+                        tag.save()
+                        skipped_count += 1
+                        continue
+
                     # Create or update the tag in DataHub
                     result = client.create_or_update_tag(
                         tag_id=tag_id_portion, 
@@ -2746,15 +2886,27 @@ class TagBulkSyncToDataHubView(View):
                         error_count += 1
                         continue
 
+                    fingerprints = AppliedAspectState.fingerprint_aspects(aspects)
+                    applied = {}
+
+                    # An existing tag keeps its description unless it is set explicitly, even when cleared
+                    properties_set = client.update_tag_description(result, aspects["tagProperties"]["description"])
+                    if not properties_set:
+                        logger.warning(f"Failed to update description for tag '{tag.name}'")
+
                     # Set color if specified and not empty
-                    if tag.color and tag.color.strip() and tag.color != "#0d6efd":
+                    if properties_set and aspects["tagProperties"]["color"]:
                         try:
-                            client.set_tag_color(result, tag.color)
+                            properties_set = client.set_tag_color(result, aspects["tagProperties"]["color"])
                         except Exception as e:
+                            properties_set = False
                             logger.warning(f"Failed to set color for tag '{tag.name}': {str(e)}")
+                    if properties_set:
+                        applied["tagProperties"] = fingerprints["tagProperties"]
 
                     # Handle ownership - ensure only intended owners are set
                     intended_owners = []
+                    owners_added = True
                     if tag.ownership_data and isinstance(tag.ownership_data, dict):
                         owners = tag.ownership_data.get("owners", [])
                         for owner in owners:
@@ -2764,10 +2916,14 @@ class TagBulkSyncToDataHubView(View):
                                 ownership_type = owner.get("ownership_type_urn") or owner.get("type", "urn:li:ownershipType:__system__technical_owner")
                                 
                                 if owner_urn:
-                                    client.add_tag_owner(result, owner_urn, ownership_type)
+                                    if not client.add_tag_owner(result, owner_urn, ownership_type):
+                                        owners_added = False
                                     intended_owners.append((owner_urn, ownership_type))
                             except Exception as e:
+                                owners_added = False
                                 logger.warning(f"Failed to add owner {owner_urn} to tag '{tag.name}': {str(e)}")
+                    if owners_added:
+                        applied["ownership"] = fingerprints["ownership"]
 
                     # Remove the sync user from ownership if they're not in the intended owners list
                     try:
@@ -2800,10 +2956,6 @@ class TagBulkSyncToDataHubView(View):
                     except Exception as e:
                         logger.warning(f"Failed to handle sync user ownership cleanup for tag '{tag.name}': {str(e)}")
 
-                    # Get current connection from request session
-                    from web_ui.views import get_current_connection
-                    current_connection = get_current_connection(request)
-                    
                     # Update tag with remote info
                     tag.urn = result  # Store the DataHub URN
                     tag.datahub_id = tag_id_portion
@@ -2812,6 +2964,7 @@ class TagBulkSyncToDataHubView(View):
                     if current_connection:
                         tag.connection = current_connection
                     tag.save()
+                    AppliedAspectState.record_applied(current_connection, tag.urn, applied)
 
                     success_count += 1
 
@@ -2825,9 +2978,11 @@ class TagBulkSyncToDataHubView(View):
             return JsonResponse({
                 "success": True,
                 "synced": success_count,
+                "applied": success_count,
+                "skipped": skipped_count,
                 "errors": error_count,
                 "error_details": errors,
-                "message": f"Bulk sync completed: {success_count} synced, {error_count} errors"
+                "message": f"Bulk sync completed: {success_count} synced, {skipped_count} already up to date, {error_count} errors"
             })
 
         except Exception as e:
@@ -3436,58 +3591,44 @@ class TagAddAllToStagedChangesView(View):
             
             # Import the tag actions module
             sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-            from scripts.mcps.tag_actions import add_tag_to_staged_changes
-            
-            success_count = 0
-            error_count = 0
-            files_created_count = 0
-            files_skipped_count = 0
-            errors = []
-            all_created_files = []
+            from scripts.mcps.tag_actions import bulk_add_tags_to_staged_changes
             
-            for tag in tags:
-                try:
-                    # Convert tag to dictionary format
-                    tag_data = {
-                        "urn": tag.urn,
+            # Convert tags to dictionary format
+            tags_data = [
+                {
+                    "urn": tag.urn,
+                    "name": tag.name,
+                    "description": tag.description,
+                    "properties": {
                         "name": tag.name,
                         "description": tag.description,
-                        "properties": {
-                            "name": tag.name,
-                            "description": tag.description,
-                            "colorHex": tag.color
-                        }
+                        "colorHex": tag.color
                     }
-                    
-                    # Add tag to staged changes
-                    created_files = add_tag_to_staged_changes(
-                        tag_data=tag_data,
-                        environment=environment,
-                        owner="system",  # Default owner
-                        mutation_name=mutation_name,
-                        # Pass existing URN if tag has one (for proper NEW vs EXISTING handling)
-                        existing_urn=tag.urn if tag.urn else None
-                    )
-                    
-                    success_count += 1
-                    files_created_count += len(created_files)
-                    all_created_files.extend(list(created_files.values()))
-                    
-                    # Log deduplication info for individual tags
-                    if not created_files:
-                        files_skipped_count += 1  # All files were skipped due to deduplication
-                    
-                except Exception as e:
-                    error_count += 1
-                    errors.append(f"Tag {tag.name}: {str(e)}")
-                    logger.error(f"Error adding tag {tag.name} to staged changes: {str(e)}")
+                }
+                for tag in tags
+            ]
+            
+            # Generate MCPs for all tags and write the staged file once
+            result = bulk_add_tags_to_staged_changes(
+                tags_data=tags_data,
+                environment=environment,
+                owner="system",  # Default owner
+                mutation_name=mutation_name
+            )
             
-            # Calculate total files that could have been created (now 1 combined MCP file per tag)
-            total_possible_files = success_count * 1  # single combined MCP file for each tag
+            # Record the staged field values so later single stagings only regenerate changed aspects
+            tags = list(tags)
+            for index in result["staged_indexes"]:
+                tags[index].mark_aspects_staged(environment)
             
-            files_skipped_count = total_possible_files - files_created_count
+            success_count = result["success_count"]
+            error_count = result["error_count"]
+            errors = result["errors"]
+            all_created_files = [result["mcp_file"]] if result["mcp_file"] else []
+            files_created_count = len(all_created_files)
+            files_skipped_count = 0
             
-            message = f"Add all to staged changes completed: {success_count} tags processed, {files_created_count} files created, {files_skipped_count} files skipped (unchanged), {error_count} failed"
+            message = f"Add all to staged changes completed: {success_count} tags processed, {result['mcps_created']} MCPs created, {files_created_count} files saved, {error_count} failed"
             if errors:
                 message += f". Errors: {'; '.join(errors[:5])}"  # Show first 5 errors
                 if len(errors) > 5:
@@ -3500,6 +3641,7 @@ class TagAddAllToStagedChangesView(View):
                 'error_count': error_count,
                 'files_created_count': files_created_count,
                 'files_skipped_count': files_skipped_count,
+                'mcps_created_count': result['mcps_created'],
                 'errors': errors,
                 'files_created': all_created_files
             })
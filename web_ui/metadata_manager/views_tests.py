@@ -24,6 +24,7 @@ from web_ui.models import (
     GitIntegration,
 )  # Import for GitHub integration and environment
 from metadata_manager.models import Test
+from metadata_manager.run_history import TEST_LIST_DEFERRED_FIELDS, parse_history_time, run_history
 
 logger = logging.getLogger(__name__)
 
@@ -214,7 +215,7 @@ class TestListView(View):
             current_connection = get_current_connection(request)
             
             # Get local tests from database
-            local_tests = Test.objects.all()
+            local_tests = Test.objects.defer(*TEST_LIST_DEFERRED_FIELDS)
             
 
             
@@ -399,7 +400,7 @@ def get_remote_tests_data(request):
         logger.debug(f"Using connection: {current_connection.name if current_connection else 'None'}")
         
         # Get local tests from database
-        local_tests = Test.objects.all()
+        local_tests = Test.objects.defer(*TEST_LIST_DEFERRED_FIELDS)
         logger.debug(f"Found {local_tests.count()} local tests")
         
         # Get remote tests from DataHub
@@ -1655,6 +1656,53 @@ class TestSyncToDataHubView(View):
             }, status=500)
 
 
+class TestRunHistoryView(View):
+    """View to get the run history of a test"""
+
+    def get(self, request, test_id):
+        """
+        Run history of a test, most recent first.
+        Optional ?since= and ?until= (epoch millis or ISO datetime) and ?limit= (default 100).
+        """
+        try:
+            test = Test.objects.only('id', 'name', 'urn').get(id=test_id)
+            limit = min(int(request.GET.get('limit', 100)), 1000)
+            results = run_history(
+                test.results,
+                since=parse_history_time(request.GET.get('since')),
+                until=parse_history_time(request.GET.get('until')),
+                limit=limit,
+            )
+
+            return JsonResponse({
+                'success': True,
+                'test_id': str(test.id),
+                'urn': test.urn,
+                'runs': [
+                    {
+                        'run_at': result.run_at.isoformat(),
+                        'passing_count': result.passing_count,
+                        'failing_count': result.failing_count,
+                    }
+                    for result in results
+                ],
+            })
+
+        except Test.DoesNotExist:
+            return JsonResponse({
+                'success': False,
+                'error': 'Test not found'
+            }, status=404)
+        except ValueError as e:
+            return JsonResponse({'success': False, 'error': str(e)}, status=400)
+        except Exception as e:
+            logger.error(f"Error getting test run history: {str(e)}")
+            return JsonResponse({
+                'success': False,
+                'error': f'Error getting test run history: {str(e)}'
+            }, status=500)
+
+
 class TestResyncView(View):
     """View to resync a test from DataHub"""
     
@@ -799,6 +799,7 @@ function generateTableHTMLWithPagination(rootItems, tabType, totalItems, current
                         <th class="text-start" width="160">Description</th>
                         <th class="sortable-header text-center" data-sort="domain" width="120">Domain</th>
                         <th class="sortable-header text-center" data-sort="owners_count" width="70">Owners</th>
+                        <th class="sortable-header text-center" data-sort="usage_count" width="70">Usage</th>
                         <th class="sortable-header text-center" data-sort="custom_properties_count" width="120">Custom<br/>Properties</th>
                         <th class="sortable-header text-center" data-sort="structured_properties_count" width="80">Structured<br/>Properties</th>
                         <th class="sortable-header text-center" data-sort="deprecated" width="80">Deprecated</th>
@@ -1154,6 +1155,12 @@ function renderGlossaryRow(item, tabType, level = 0, hasChildren = false) {
             <td class="text-center">
                 ${(item.owners_count || 0) > 0 ? `<i class="fas fa-users text-info me-1"></i><span class="badge bg-info">${item.owners_count}</span>` : '<span class="text-muted">None</span>'}
             </td>
+            <td class="text-center" ${entityType === 'glossaryTerm' ? `title="${item.usage_count || 0} entities with this term"` : ''}>
+                ${entityType === 'glossaryTerm' ?
+                    ((item.usage_count || 0) > 0 ? `<span class="badge bg-secondary">${item.usage_count}</span>` : '<span class="text-muted">0</span>') :
+                    '<span class="text-muted">N/A</span>'
+                }
+            </td>
             <td class="text-center">
                 <span class="badge bg-secondary">${item.custom_properties_count || 0}</span>
             </td>
@@ -1340,7 +1347,7 @@ function getActionButtons(item, tabType) {
 
 function getEmptyStateHTML(tabType, hasSearch) {
     // Determine the correct colspan based on the number of columns shown
-    const colspan = tabType === 'synced' ? '10' : '9'; // checkbox + name + description + domain + owners + custom props + structured props + deprecated + urn + (sync status for synced) + actions
+    const colspan = tabType === 'synced' ? '11' : '10'; // checkbox + name + description + domain + owners + usage + custom props + structured props + deprecated + urn + (sync status for synced) + actions
     
     if (hasSearch) {
         return `
@@ -3773,6 +3780,8 @@ function getSortValue(item, column) {
             return (itemData.domain_name || itemData.domain || '').toLowerCase();
         case 'owners_count':
             return itemData.owners_count || 0;
+        case 'usage_count':
+            return itemData.usage_count || 0;
         case 'custom_properties_count':
             return itemData.custom_properties_count || 0;
         case 'structured_properties_count':
@@ -4593,109 +4602,77 @@ async function bulkAddToPR(tabType) {
         return;
     }
     
-    // Process each item sequentially to avoid race conditions on the same MCP file
+    // Get current environment and mutation from global state or settings
+    const currentEnvironment = window.currentEnvironment || { name: 'dev' };
+    const mutationName = currentEnvironment.mutation_name || null;
+    
+    // Local items are staged together in one request; remote-only items have no local ID
+    const localItems = selectedItems.filter(item => item.id && item.sync_status !== 'REMOTE_ONLY');
+    const remoteItems = selectedItems.filter(item => !localItems.includes(item));
+    
     let successCount = 0;
     let errorCount = 0;
     
     showNotification('info', `Starting to add ${selectedItems.length} items to staged changes...`);
     
-    for (const item of selectedItems) {
+    if (localItems.length > 0) {
         try {
-            // Convert the synchronous-looking addToStagedChanges to return a promise
-            await new Promise((resolve, reject) => {
-                const itemType = item.type === 'node' ? 'Node' : 'Term';
-                const itemName = item.name || 'Unknown';
-                
-                // Check if this is a remote-only item that needs to be staged directly
-                if (item.sync_status === 'REMOTE_ONLY' || !item.id) {
-                    console.log(`Item "${itemName}" is remote-only, staging directly...`);
-                    
-                    // Get current environment and mutation from global state or settings
-                    const currentEnvironment = window.currentEnvironment || { name: 'dev' };
-                    const mutationName = currentEnvironment.mutation_name || null;
-                    
-                    // Use the remote staging endpoint
-                    fetch('/metadata/glossary/remote/stage_changes/', {
-                        method: 'POST',
-                        headers: {
-                            'Content-Type': 'application/json',
-                            'X-CSRFToken': getCsrfToken()
-                        },
-                        body: JSON.stringify({
-                            item_data: item,
-                            environment: currentEnvironment.name,
-                            mutation_name: mutationName
-                        })
-                    })
-                    .then(response => {
-                        if (!response.ok) {
-                            throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-                        }
-                        return response.json();
-                    })
-                    .then(data => {
-                        console.log('Add remote to staged changes response:', data);
-                        if (data.status === 'success') {
-                            resolve(data);
-                        } else {
-                            reject(new Error(data.error || 'Unknown error occurred'));
-                        }
-                    })
-                    .catch(error => {
-                        console.error('Error adding remote item to staged changes:', error);
-                        reject(error);
-                    });
-                    return;
-                }
-                
-                if (!item.id) {
-                    console.error('Cannot add item to staged changes without an ID:', item);
-                    reject(new Error('Missing item ID'));
-                    return;
-                }
-                
-                // Get current environment and mutation from global state or settings
-                const currentEnvironment = window.currentEnvironment || { name: 'dev' };
-                const mutationName = currentEnvironment.mutation_name || null;
-                
-                // Use the staged changes endpoint
-                const stageUrl = item.type === 'node' ? 
-                    `/metadata/glossary/nodes/${item.id}/stage_changes/` : 
-                    `/metadata/glossary/terms/${item.id}/stage_changes/`;
-                
-                fetch(stageUrl, {
-                    method: 'POST',
-                    headers: {
-                        'Content-Type': 'application/json',
-                        'X-CSRFToken': getCsrfToken()
-                    },
-                    body: JSON.stringify({
-                        environment: currentEnvironment.name,
-                        mutation_name: mutationName
-                    })
+            const response = await fetch('/metadata/glossary/bulk/stage_changes/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': getCsrfToken()
+                },
+                body: JSON.stringify({
+                    node_ids: localItems.filter(item => item.type === 'node').map(item => item.id),
+                    term_ids: localItems.filter(item => item.type !== 'node').map(item => item.id),
+                    environment: currentEnvironment.name,
+                    mutation_name: mutationName
                 })
-                .then(response => {
-                    if (!response.ok) {
-                        throw new Error(`HTTP ${response.status}: ${response.statusText}`);
-                    }
-                    return response.json();
-                })
-                .then(data => {
-                    console.log('Add to staged changes response:', data);
-                    if (data.status === 'success') {
-                        resolve(data);
-                    } else {
-                        reject(new Error(data.error || 'Unknown error occurred'));
-                    }
+            });
+            const data = await response.json();
+            console.log('Bulk add to staged changes response:', data);
+            
+            if (data.status === 'success') {
+                successCount += data.success_count;
+                errorCount += data.error_count;
+            } else {
+                console.error('Error bulk adding items to staged changes:', data.error);
+                errorCount += localItems.length;
+            }
+        } catch (error) {
+            console.error('Error bulk adding items to staged changes:', error);
+            errorCount += localItems.length;
+        }
+    }
+    
+    // Process remote-only items sequentially to avoid race conditions on the same MCP file
+    for (const item of remoteItems) {
+        try {
+            console.log(`Item "${item.name || 'Unknown'}" is remote-only, staging directly...`);
+            
+            const response = await fetch('/metadata/glossary/remote/stage_changes/', {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': getCsrfToken()
+                },
+                body: JSON.stringify({
+                    item_data: item,
+                    environment: currentEnvironment.name,
+                    mutation_name: mutationName
                 })
-                .catch(error => {
-                    console.error('Error adding item to staged changes:', error);
-                    reject(error);
-                });
             });
+            if (!response.ok) {
+                throw new Error(`HTTP ${response.status}: ${response.statusText}`);
+            }
+            const data = await response.json();
+            console.log('Add remote to staged changes response:', data);
+            if (data.status !== 'success') {
+                throw new Error(data.error || 'Unknown error occurred');
+            }
             
             successCount++;
-            console.log(`Successfully added ${item.name} to staged changes (${successCount}/${selectedItems.length})`);
         } catch (error) {
             console.error(`Error adding item ${item.name} to staged changes:`, error);
             errorCount++;
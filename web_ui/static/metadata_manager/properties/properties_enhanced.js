@@ -772,6 +772,7 @@ function generateTableHTML(items, tabType) {
                         <th class="sortable-header" data-sort="value_type" width="120">Value Type</th>
                         <th class="sortable-header" data-sort="cardinality" width="100">Cardinality</th>
                         <th class="sortable-header" data-sort="allowedValues" width="100">Allowed Values</th>
+                        <th class="sortable-header" data-sort="usage" width="70">Usage</th>
                         <th width="${urnWidth}">URN</th>
                         ${showSyncStatus ? '<th class="sortable-header" data-sort="sync_status" width="100">Sync Status</th>' : ''}
                         <th width="${actionsWidth}">Actions</th>
@@ -788,7 +789,7 @@ function generateTableHTML(items, tabType) {
 }
 
 function getEmptyStateHTML(tabType, hasSearch) {
-    const colSpan = tabType === 'synced' ? '10' : '9';
+    const colSpan = tabType === 'synced' ? '11' : '10';
     return `
         <tr>
             <td colspan="${colSpan}" class="text-center py-4 text-muted">
@@ -903,6 +904,8 @@ function getSortValue(property, column) {
             return (property.cardinality || '').toLowerCase();
         case 'allowedValues':
             return (property.allowed_values || []).length;
+        case 'usage':
+            return property.usage_count || 0;
         case 'sync_status':
             const syncStatus = property.sync_status || 'UNKNOWN';
             const statusOrder = {
@@ -985,6 +988,7 @@ function renderPropertiesTable(properties, tabType, container) {
                         <th width="120px">Value Type</th>
                         <th width="100px">Cardinality</th>
                         <th width="100px">Allowed Values</th>
+                        <th width="70px">Usage</th>
                         <th width="${urnWidth}px">URN</th>
                         ${showSyncStatus ? '<th class="sortable-header" data-sort="sync_status" width="100px">Sync Status</th>' : ''}
                         <th width="${actionsWidth}px">Actions</th>
@@ -1178,6 +1182,9 @@ function renderPropertyRow(property, tabType) {
             <td>
                 <span class="badge bg-secondary">${property.allowedValuesCount || 0}</span>
             </td>
+            <td class="text-center" title="${property.usage_count || 0} values assigned">
+                ${(property.usage_count || 0) > 0 ? `<span class="badge bg-secondary">${property.usage_count}</span>` : '<span class="text-muted">0</span>'}
+            </td>
             <td title="${escapeHtml(propertyUrn)}">
                 <code class="small">${escapeHtml(truncateUrn(propertyUrn, 30))}</code>
             </td>
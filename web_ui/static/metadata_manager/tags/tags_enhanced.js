@@ -683,6 +683,7 @@ function generateTableHTML(items, tabType) {
                         <th width="${descriptionWidth}">Description</th>
                         <th class="sortable-header" data-sort="color" width="80">Color</th>
                         <th class="sortable-header" data-sort="owners" width="60">Owners</th>
+                        <th class="sortable-header" data-sort="usage" width="60">Usage</th>
                         <th width="${urnWidth}">URN</th>
                         ${showSyncStatus ? '<th class="sortable-header" data-sort="sync_status" width="80">Sync Status</th>' : ''}
                         <th width="${actionsWidth}">Actions</th>
@@ -723,6 +724,7 @@ function renderTagRow(tag, tabType) {
     const color = originalColor || '#6c757d'; // For display purposes (background)
     const displayColor = originalColor || 'null'; // For text display
     const urn = tagData.urn || '';
+    const usageCount = tagData.relationships_count || 0;
     
     // Get owners information
     const owners = tagData.owner_names || [];
@@ -800,6 +802,9 @@ function renderTagRow(tag, tabType) {
             <td title="${ownersTitle}" class="text-center">
                 ${ownersCount > 0 ? `<i class="fas fa-users text-info me-1"></i><span class="badge bg-info">${ownersCount}</span>` : '<span class="text-muted">None</span>'}
             </td>
+            <td title="${usageCount} entities tagged" class="text-center">
+                ${usageCount > 0 ? `<span class="badge bg-secondary">${usageCount}</span>` : '<span class="text-muted">0</span>'}
+            </td>
             <td title="${escapeHtml(urn)}">
                 <code class="small">${escapeHtml(urn)}</code>
             </td>
@@ -835,9 +840,9 @@ function renderTagRow(tag, tabType) {
 
 function getEmptyStateHTML(tabType, hasSearch) {
     // Determine the correct colspan based on the number of columns shown
-    // Synced: checkbox + name + description + color + owners + urn + sync status + actions = 8
-    // Local/Remote: checkbox + name + description + color + owners + urn + actions = 7
-    const colspan = tabType === 'synced' ? '8' : '7';
+    // Synced: checkbox + name + description + color + owners + usage + urn + sync status + actions = 9
+    // Local/Remote: checkbox + name + description + color + owners + usage + urn + actions = 8
+    const colspan = tabType === 'synced' ? '9' : '8';
     
     if (hasSearch) {
     return `
@@ -1230,6 +1235,8 @@ function getSortValue(tag, column) {
                 ownersCount = tagData.owner_names.length;
             }
             return ownersCount;
+        case 'usage':
+            return tagData.relationships_count || 0;
 
         case 'sync_status':
             const syncStatus = tagData.sync_status || 'UNKNOWN';
@@ -135,4 +135,124 @@ class MetadataManagerUtilityAPITestCase(TestCase):
         """Test structured properties API."""
         self.client.force_login(self.user)
         response = self.client.get('/metadata/structured-properties/')
-        self.assertIn(response.status_code, [200, 404]) 
\ No newline at end of file
+        self.assertIn(response.status_code, [200, 404]) 
+
+class AspectTrackingTestCase(TestCase):
+    """Test dirty-aspect tracking on metadata models."""
+
+    def setUp(self):
+        from metadata_manager.models import Tag
+        self.tag = Tag.objects.create(name="pii", description="Personal data", urn="urn:li:tag:pii")
+
+    def test_unstaged_entity_regenerates_all_aspects(self):
+        """An entity never staged for an environment has no partial aspect set."""
+        self.assertIsNone(self.tag.get_dirty_aspects("dev"))
+
+    def test_changed_field_marks_its_aspect(self):
+        """Only the aspects mapped to changed fields are dirty."""
+        self.tag.mark_aspects_staged("dev")
+        self.assertEqual(self.tag.get_dirty_aspects("dev"), set())
+
+        self.tag.description = "Personally identifiable data"
+        self.tag.save()
+        self.tag.refresh_from_db()
+        self.assertEqual(self.tag.get_dirty_aspects("dev"), {"tagProperties"})
+
+    def test_snapshots_are_per_environment(self):
+        """Staging for one environment does not mark another as staged."""
+        self.tag.mark_aspects_staged("dev")
+        self.assertIsNone(self.tag.get_dirty_aspects("prod"))
+
+    def test_urn_change_regenerates_all_aspects(self):
+        """A new URN means the entity is staged under a different identity."""
+        self.tag.mark_aspects_staged("dev")
+        self.tag.urn = "urn:li:tag:pii-v2"
+        self.assertIsNone(self.tag.get_dirty_aspects("dev"))
+
+
+class AppliedAspectStateTestCase(TestCase):
+    """Test the per-connection manifest of applied aspects."""
+
+    def setUp(self):
+        from web_ui.models import Connection
+        self.connection = Connection.objects.create(name="dev", datahub_url="http://localhost:8080")
+        self.other_connection = Connection.objects.create(name="prod", datahub_url="http://localhost:9090")
+        self.aspects = {
+            "tagProperties": {"name": "pii", "description": "Personal data"},
+            "ownership": {"owners": []},
+        }
+
+    def test_unapplied_aspects_are_changed(self):
+        """Aspects never applied to a connection all need pushing."""
+        from metadata_manager.models import AppliedAspectState
+        changed = AppliedAspectState.get_changed_aspects(self.connection, "urn:li:tag:pii", self.aspects)
+        self.assertEqual(set(changed), {"tagProperties", "ownership"})
+
+    def test_applied_aspects_are_skipped_per_connection(self):
+        """Only aspects whose content differs from the last push are changed."""
+        from metadata_manager.models import AppliedAspectState
+        changed = AppliedAspectState.get_changed_aspects(self.connection, "urn:li:tag:pii", self.aspects)
+        AppliedAspectState.record_applied(self.connection, "urn:li:tag:pii", changed)
+
+        self.assertEqual(AppliedAspectState.get_changed_aspects(self.connection, "urn:li:tag:pii", self.aspects), {})
+        self.assertEqual(
+            len(AppliedAspectState.get_changed_aspects(self.other_connection, "urn:li:tag:pii", self.aspects)), 2
+        )
+
+        self.aspects["tagProperties"]["description"] = "Personally identifiable data"
+        changed = AppliedAspectState.get_changed_aspects(self.connection, "urn:li:tag:pii", self.aspects)
+        self.assertEqual(set(changed), {"tagProperties"})
+
+        # Recording again updates the existing manifest entry
+        AppliedAspectState.record_applied(self.connection, "urn:li:tag:pii", changed)
+        self.assertEqual(AppliedAspectState.objects.filter(connection=self.connection).count(), 2)
+
+    def test_forget_forces_full_push(self):
+        """Forgetting an entity makes every aspect changed again."""
+        from metadata_manager.models import AppliedAspectState
+        AppliedAspectState.record_applied(
+            self.connection, "urn:li:tag:pii", AppliedAspectState.fingerprint_aspects(self.aspects)
+        )
+        AppliedAspectState.forget(self.connection, "urn:li:tag:pii")
+        self.assertEqual(
+            len(AppliedAspectState.get_changed_aspects(self.connection, "urn:li:tag:pii", self.aspects)), 2
+        )
+
+
+class RemoteDriftTestCase(TestCase):
+    """Test detecting push aspects that DataHub no longer holds."""
+
+    def setUp(self):
+        self.aspects = {
+            "tagProperties": {"description": "Personal data", "color": "#ff0000"},
+            "ownership": {"owners": [{"owner": "urn:li:corpuser:jdoe", "type": "urn:li:ownershipType:owner"}]},
+        }
+        self.remote_tag = {
+            "urn": "urn:li:tag:pii",
+            "description": "Personal data",
+            "properties": {"name": "pii", "colorHex": "#FF0000"},
+            "ownership": {"owners": [
+                {"owner": {"urn": "urn:li:corpuser:jdoe"}, "ownershipType": {"urn": "urn:li:ownershipType:owner"}},
+                {"owner": {"urn": "urn:li:corpuser:admin"}, "ownershipType": {"urn": "urn:li:ownershipType:owner"}},
+            ]},
+        }
+
+    def test_tag_held_by_datahub_has_no_drift(self):
+        from metadata_manager.views_tags import get_tag_remote_drift
+        self.assertEqual(get_tag_remote_drift(self.aspects, self.remote_tag), set())
+
+    def test_tag_changed_or_deleted_in_datahub_drifts(self):
+        from metadata_manager.views_tags import get_tag_remote_drift
+        self.remote_tag["description"] = "Edited in DataHub"
+        self.remote_tag["ownership"] = None
+        self.assertEqual(get_tag_remote_drift(self.aspects, self.remote_tag), {"tagProperties", "ownership"})
+        self.assertEqual(get_tag_remote_drift(self.aspects, None), {"tagProperties", "ownership"})
+
+    def test_domain_rename_and_move_drift(self):
+        from metadata_manager.views_domains import get_domain_remote_drift
+        aspects = {"domainProperties": {"name": "Finance", "description": "", "parentDomain": None}}
+        remote_domain = {"name": "Finance", "description": None, "parentDomain": None}
+        self.assertEqual(get_domain_remote_drift(aspects, remote_domain), set())
+
+        remote_domain["parentDomain"] = "urn:li:domain:corporate"
+        self.assertEqual(get_domain_remote_drift(aspects, remote_domain), {"domainProperties"})
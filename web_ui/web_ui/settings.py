@@ -180,6 +180,30 @@ TEMPLATES_DIR = os.path.join(BASE_DIR.parent, "templates")
 RECIPES_DIR = os.path.join(BASE_DIR.parent, "recipes")
 POLICIES_DIR = os.path.join(BASE_DIR.parent, "policies")
 
+# Assertion and metadata test run history: delete runs older than the retention
+# and keep only the last run of each day once runs are older than the downsampling age
+RUN_HISTORY_RETENTION_DAYS = 90
+RUN_HISTORY_DOWNSAMPLE_AFTER_DAYS = 14
+
+# Local metadata mirror (see scripts/mirror_metadata.py): set to the mirror directory
+# to let the remote views read tags and domains from it while it is fresh enough
+METADATA_MIRROR_DIR = None
+METADATA_MIRROR_MAX_AGE_SECONDS = 3600
+
+# Usage counts of tags, glossary terms and domains (one facet request per connection)
+# are cached for this many seconds
+USAGE_COUNTS_CACHE_SECONDS = 300
+
+# Platform catalog (platforms and platform instances of the filter dropdowns):
+# refreshed in the background after PLATFORM_CATALOG_REFRESH_SECONDS, and
+# fetched again before use after PLATFORM_CATALOG_MAX_AGE_SECONDS
+PLATFORM_CATALOG_REFRESH_SECONDS = 300
+PLATFORM_CATALOG_MAX_AGE_SECONDS = 3600
+
+# Parsed schema fields of datasets, cached per schema version for the paginated
+# schema field endpoint
+SCHEMA_FIELDS_CACHE_SECONDS = 3600
+
 # Logging Configuration
 LOGGING = {
     "version": 1,